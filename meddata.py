@@ -8,17 +8,59 @@
 from __future__ import annotations
 
 import argparse
+import fnmatch
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
 import subprocess
 import re
 
-from scripts.utils.printer import printer
+from scripts.utils.printer import LOG_FORMAT_ENV, printer
 from scripts.utils.subprocess_handler import subprocess_handler
 from scripts.utils.config_manager import config_manager
+from scripts.utils.dispatcher import script_dispatcher
+from scripts.utils.dataset_stats import STATS_FILE
+from scripts.utils.file_writer import file_writer
+from scripts.utils.pipeline import Pipeline, Stage, StageResult
 
 # Define module exports
-__all__ = ["main", "create_parser"]
+__all__ = ["main", "create_parser", "run_batch"]
+
+
+def _run_script(args: argparse.Namespace, script: str, function: str,
+                call_args: list, cli_args: list[str]) -> Any:
+    """
+    Run a MedData script in-process, or in a subprocess when isolation is requested.
+
+    Args:
+        args: Command line arguments (``args.isolate`` selects subprocess mode)
+        script: File name of the script in the scripts directory
+        function: Entry function to call when running in-process
+        call_args: Positional arguments for the entry function
+        cli_args: Command line arguments for the script when run as a subprocess
+
+    Returns:
+        The entry function's return value (None in subprocess mode)
+
+    Raises:
+        subprocess.CalledProcessError: If the script fails in either mode
+    """
+    script_path = str(config_manager.paths.project_root / "scripts" / script)
+    if args.isolate:
+        # Keep buffered JSON events ahead of the script's own output
+        printer.flush()
+        profile = getattr(args, "profile", None)
+        if profile:
+            # Profile inside the child, where the work actually happens
+            runner = config_manager.paths.project_root / "scripts" / "utils" / "profiling.py"
+            subprocess_handler.run_python_script(str(runner), [profile, script_path] + cli_args, check=True)
+        else:
+            subprocess_handler.run_python_script(script_path, cli_args, check=True)
+        return None
+    return script_dispatcher.call(script_path, function, *call_args)
 
 
 def _copy_template_file(dataset_id: str, dataset_dir: Path, relative_path: Path) -> None:
@@ -35,10 +77,9 @@ def _copy_template_file(dataset_id: str, dataset_dir: Path, relative_path: Path)
         return
 
     target_path = dataset_dir / relative_path
-    target_path.parent.mkdir(parents=True, exist_ok=True)
     content = template_path.read_text(encoding="utf-8")
     content = re.sub(r"example", dataset_id, content, flags=re.IGNORECASE)
-    target_path.write_text(content, encoding="utf-8")
+    file_writer.write(target_path, content)
     printer.file_path(str(target_path))
 
 
@@ -52,13 +93,10 @@ def init_dataset(args: argparse.Namespace) -> None:
     try:
         printer.header(f"Initializing dataset: {args.id}")
 
-        # Use subprocess handler to run the create-dataset.py script
-        cmd = [str(config_manager.paths.project_root / "scripts" / "create-dataset.py"), args.id, args.name,
-               args.description]
-        subprocess_handler.run_python_script(
-            cmd[0], cmd[1:],
-            check=True
-        )
+        # Run the create-dataset.py script
+        _run_script(args, "create-dataset.py", "create_dataset",
+                    [args.id, args.name, args.description],
+                    [args.id, args.name, args.description])
 
         # Optionally generate documentation files
         doc_flags = {
@@ -73,8 +111,10 @@ def init_dataset(args: argparse.Namespace) -> None:
         if to_generate:
             printer.header("Generating selected documentation templates")
             dataset_dir = config_manager.paths.project_root / "dataset" / args.id
-            for rel in to_generate:
-                _copy_template_file(args.id, dataset_dir, rel)
+            with file_writer.track() as written:
+                for rel in to_generate:
+                    _copy_template_file(args.id, dataset_dir, rel)
+            printer.print(f"Documentation templates: {written}", "info")
 
         printer.success(f"Dataset '{args.id}' initialized successfully!")
     except subprocess.CalledProcessError as e:
@@ -82,35 +122,43 @@ def init_dataset(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
-def process_dataset(args: argparse.Namespace) -> None:
+def process_dataset(args: argparse.Namespace) -> Any:
     """
     Process a dataset.
     
     Args:
         args: Command line arguments containing dataset id
+
+    Returns:
+        Processing statistics when run in-process, otherwise None
     """
     try:
         printer.header(f"Processing dataset: {args.id}")
 
-        # Use subprocess handler to run the process-dataset.py script
-        subprocess_handler.run_python_script(
-            str(config_manager.paths.project_root / "scripts" / "process-dataset.py"),
-            [args.id],
-            check=True
-        )
+        # Run the process-dataset.py script
+        call_args, cli_args = [args.id], [args.id]
+        profile_workers = getattr(args, "profile_workers", None)
+        if profile_workers:
+            call_args.append(profile_workers)
+            cli_args += ["--profile-workers", str(profile_workers)]
+        stats = _run_script(args, "process-dataset.py", "process_dataset", call_args, cli_args)
 
         printer.success(f"Dataset '{args.id}' processed successfully!")
+        return stats
     except subprocess.CalledProcessError as e:
         printer.error(f"Failed to process dataset '{args.id}'", e)
         sys.exit(1)
 
 
-def publish_dataset(args: argparse.Namespace) -> None:
+def publish_dataset(args: argparse.Namespace) -> Any:
     """
     Publish a dataset.
     
     Args:
         args: Command line arguments containing dataset id, token, and platforms
+
+    Returns:
+        Mapping of platform to published URL when run in-process, otherwise None
     """
     try:
         printer.header(f"Publishing dataset: {args.id}")
@@ -126,14 +174,12 @@ def publish_dataset(args: argparse.Namespace) -> None:
         if args.platforms:
             cmd_args.extend(["--platforms"] + args.platforms)
 
-        # Use subprocess handler to run the publish-dataset.py script
-        subprocess_handler.run_python_script(
-            str(config_manager.paths.project_root / "scripts" / "publish-dataset.py"),
-            cmd_args,
-            check=True
-        )
+        # Run the publish-dataset.py script
+        urls = _run_script(args, "publish-dataset.py", "publish_dataset",
+                           [args.id, args.token, args.platforms], cmd_args)
 
         printer.success(f"Dataset '{args.id}' published successfully!")
+        return urls
     except subprocess.CalledProcessError as e:
         printer.error(f"Failed to publish dataset '{args.id}'", e)
         sys.exit(1)
@@ -157,12 +203,9 @@ def generate_assets(args: argparse.Namespace) -> None:
         if args.dataset_id:
             cmd_args.append(args.dataset_id)
 
-        # Use subprocess handler to run the generate-assets.py script
-        subprocess_handler.run_python_script(
-            str(config_manager.paths.project_root / "scripts" / "generate-assets.py"),
-            cmd_args,
-            check=True
-        )
+        # Run the generate-assets.py script; only logos whose inputs changed are regenerated
+        _run_script(args, "generate-assets.py", "main",
+                    [[args.dataset_id] if args.dataset_id else None], cmd_args)
 
         printer.success("Assets generated successfully!")
     except subprocess.CalledProcessError as e:
@@ -170,35 +213,102 @@ def generate_assets(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
-def generate_docs(args: argparse.Namespace) -> None:
+def generate_docs(args: argparse.Namespace) -> Any:
     """
     Generate documentation for a dataset.
     
     Args:
         args: Command line arguments containing dataset id
+
+    Returns:
+        Mapping of document type to generated path when run in-process, otherwise None
     """
     try:
         printer.header(f"Generating documentation for dataset: {args.id}")
 
-        # Use subprocess handler to run the generate-docs.py script
-        subprocess_handler.run_python_script(
-            str(config_manager.paths.project_root / "scripts" / "generate-docs.py"),
-            [args.id],
-            check=True
-        )
+        # Run the generate-docs.py script
+        paths = _run_script(args, "generate-docs.py", "generate_dataset_docs", [args.id], [args.id])
 
         printer.success(f"Documentation for dataset '{args.id}' generated successfully!")
+        return paths
     except subprocess.CalledProcessError as e:
         printer.error(f"Failed to generate documentation for dataset '{args.id}'", e)
         sys.exit(1)
 
 
+def generate_docs_all(args: argparse.Namespace, dataset_ids: list[str]) -> int:
+    """
+    Generate the documentation of many datasets on one worker pool.
+
+    Args:
+        args: Command line arguments with ``jobs`` and ``isolate``
+        dataset_ids: Datasets to document
+
+    Returns:
+        Exit code (0 if every document was generated, 1 otherwise)
+    """
+    if not dataset_ids:
+        printer.error(f"No datasets match '{args.id or '*'}' in {config_manager.paths.datasets_dir}")
+        return 1
+
+    cli_args = list(dataset_ids) + (["--jobs", str(args.jobs)] if args.jobs else [])
+    try:
+        _run_script(args, "generate-docs.py", "generate_all_docs", [dataset_ids, args.jobs], cli_args)
+    except subprocess.CalledProcessError as e:
+        printer.error("Failed to generate documentation", e)
+        return 1
+    return 0
+
+
+def _run_concurrently(commands: dict[str, list[str]], jobs: Optional[int]) -> None:
+    """
+    Run commands side by side, streaming their output, and exit if any fails.
+
+    Args:
+        commands: Mapping of a short name (used as output prefix) to the command
+        jobs: Most commands running at once (defaults to the number of CPUs)
+    """
+    printer.flush()
+    callback = None
+    if printer.json_mode:
+        # Scripts emit their own JSON events; a prefix would break them
+        def callback(_name: str, line: str, is_stderr: bool) -> None:
+            (sys.stderr if is_stderr else sys.stdout).write(line)
+
+    results = subprocess_handler.run_many(commands, max_concurrency=jobs, fail_fast=True, callback=callback)
+    failed = [f"{name} (exit status {result.returncode})"
+              for name, result in results.items() if result.returncode and result.returncode > 0]
+    if failed:
+        printer.error(f"Failed: {', '.join(failed)}")
+        sys.exit(1)
+
+
+def _site_refresh_commands() -> dict[str, list[str]]:
+    """
+    Commands regenerating the assets and the docs of every dataset for the site.
+
+    Returns:
+        Mapping of a short name to the command
+    """
+    from scripts.utils.catalog import dataset_catalog
+
+    scripts_dir = config_manager.paths.project_root / "scripts"
+    commands = {"assets": [sys.executable, str(scripts_dir / "generate-assets.py")]}
+    for dataset_id in dataset_catalog.ids():
+        commands[f"docs:{dataset_id}"] = [sys.executable, str(scripts_dir / "generate-docs.py"), dataset_id]
+    return commands
+
+
 def generate_site(args: argparse.Namespace) -> None:
     """
     Generate the static site.
+
+    With ``--refresh``, assets and the docs of every dataset are regenerated
+    first, all at once. When serving, Jekyll starts right away alongside them
+    and picks up the files as they are written.
     
     Args:
-        args: Command line arguments, may contain serve flag
+        args: Command line arguments, may contain serve, refresh and jobs
     """
     try:
         if args.serve:
@@ -208,8 +318,17 @@ def generate_site(args: argparse.Namespace) -> None:
             printer.header("Generating the static site")
             cmd = ["bundle", "exec", "jekyll", "build"]
 
-        # Use subprocess handler to run jekyll
-        subprocess_handler.run(cmd, check=True)
+        if args.refresh:
+            commands = _site_refresh_commands()
+            if args.serve:
+                commands["jekyll"] = cmd
+                _run_concurrently(commands, None if args.jobs is None else args.jobs + 1)
+            else:
+                _run_concurrently(commands, args.jobs)
+                subprocess_handler.run(cmd, check=True)
+        else:
+            # Use subprocess handler to run jekyll
+            subprocess_handler.run(cmd, check=True)
 
         if args.serve:
             printer.success("Site is being served at http://localhost:4000")
@@ -220,93 +339,196 @@ def generate_site(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
+# Files each platform needs in a dataset's docs directory
+HF_REQUIRED_FILES = ["README.md", "dataset-card.md", "CITATION.cff", "LICENSE", "CHANGELOG.md"]
+KAGGLE_REQUIRED_FILES = [".kaggle/README.md", "dataset-card.md", "LICENSE", "CHANGELOG.md"]
+
+# Threads used to stat files concurrently in 'doctor --all'
+DOCTOR_IO_WORKERS = 32
+
+
+def _dataset_dir_candidates(dataset_id: str) -> list[Path]:
+    """Locations that may hold a dataset's docs, in order of preference."""
+    return [
+        config_manager.paths.project_root / "dataset" / dataset_id,
+        config_manager.paths.docs_dir / dataset_id,
+        config_manager.paths.datasets_dir / dataset_id,
+    ]
+
+
+def _required_files(dataset_id: str, dataset_dir: Path, check_hf: bool, check_kg: bool) -> list[Path]:
+    """
+    List the files a dataset needs for the selected platforms, each only once.
+
+    Args:
+        dataset_id: Dataset to check
+        dataset_dir: Directory holding the dataset's docs
+        check_hf: Include Hugging Face requirements
+        check_kg: Include Kaggle requirements
+
+    Returns:
+        Required files in a stable order without duplicates
+    """
+    relative: list[str] = []
+    if check_hf:
+        relative += HF_REQUIRED_FILES
+    if check_kg:
+        relative += KAGGLE_REQUIRED_FILES
+    files = [dataset_dir / rel for rel in dict.fromkeys(relative)]
+
+    # Processed data required for HF
+    if check_hf:
+        files.append(config_manager.paths.processed_data_dir / dataset_id / "data.parquet")
+    return files
+
+
+def _auto_generate_missing_files(ds_id: str, ds_dir: Path, missing_files: list[str]) -> None:
+    """Attempt to populate missing docs using templates located in example-docs.
+    Will skip non-documentation files such as data.parquet.
+    """
+    template_root = config_manager.paths.project_root / "example-docs"
+    generated: list[str] = []
+
+    for abs_fp in missing_files:
+        target = Path(abs_fp)
+        if target.suffix == ".parquet":
+            continue  # cannot auto-generate data file
+
+        # Determine platform template folder that has the file
+        rel_path = target.relative_to(ds_dir)
+        template_path = None
+        for plat in ["huggingface", "kaggle"]:
+            cand = template_root / plat / rel_path
+            if cand.exists():
+                template_path = cand
+                break
+        if not template_path:
+            continue  # no template available
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        content = template_path.read_text(encoding="utf-8")
+        # simple placeholder replacements
+        content = re.sub(r"example", ds_id, content, flags=re.IGNORECASE)
+        target.write_text(content, encoding="utf-8")
+        generated.append(str(target))
+
+    if generated:
+        printer.success("Generated missing files:")
+        for fp in generated:
+            printer.file_path(fp)
+        printer.print("Please review and customise the generated templates before publishing.", "warning")
+    else:
+        printer.warning("No files were auto-generated (either not template found or only non-doc files were missing)")
+
+
+def _check_data_integrity(dataset_id: str, verify: bool = False) -> tuple[list[str], list[str]]:
+    """
+    Check the processed data of a dataset without scanning it.
+
+    Only the Parquet footer is read: the file must have a valid footer whose
+    row groups fit the file, and its columns and row count must match the
+    configuration's ``dataset_details.schema`` and ``stats``. With ``verify``,
+    the files staged by the last publish are also checked against their
+    manifests' checksums. Nothing is printed, so datasets can be checked
+    from several threads.
+
+    Args:
+        dataset_id: Dataset to check
+        verify: Whether to verify publish manifests (hashes the staged files)
+
+    Returns:
+        Tuple of (problems, notes): one message per problem (empty if
+        everything is consistent) and informational messages
+    """
+    import yaml
+
+    from scripts.utils.catalog import dataset_catalog
+    from scripts.utils.parquet_footer import ParquetFooterError, check_stats, compare_schema, read_footer
+
+    problems: list[str] = []
+    notes: list[str] = []
+    data_parquet = config_manager.paths.processed_data_dir / dataset_id / "data.parquet"
+    if data_parquet.exists():
+        start = time.perf_counter()
+        try:
+            footer = read_footer(data_parquet)
+        except ParquetFooterError as e:
+            problems.append(f"{data_parquet}: {e}")
+            footer = None
+        if footer:
+            notes.append(f"data.parquet: {footer.num_rows:,} rows, {footer.num_row_groups} row groups, "
+                         f"{len(footer.columns)} columns (footer checked in "
+                         f"{(time.perf_counter() - start) * 1000:.1f} ms)")
+            try:
+                config = dataset_catalog.load(dataset_id)
+            except (OSError, ValueError, yaml.YAMLError) as e:
+                notes.append(f"Skipped schema and stats checks: {e}")
+                config = {}
+            schema = config.get("dataset_details", {}).get("schema", [])
+            if schema:
+                problems.extend(f"schema: {problem}" for problem in compare_schema(footer, schema))
+            problems.extend(f"stats: {problem}" for problem in check_stats(footer, config.get("stats", [])))
+
+    if verify:
+        from scripts.utils.manifest import load_manifest, verify_manifest
+
+        publish_dir = config_manager.paths.cache_dir / "publish" / dataset_id
+        manifests = [(publish_dir / "github" / "manifest.json", publish_dir / "github"),
+                     (publish_dir / "kaggle-manifest.json", publish_dir / "kaggle")]
+        verified = 0
+        for manifest_path, root in manifests:
+            if manifest_path.exists():
+                verified += 1
+                problems.extend(f"{manifest_path.name}: {problem}"
+                                for problem in verify_manifest(root, load_manifest(manifest_path)))
+        if not verified:
+            notes.append("No publish manifests to verify checksums against")
+
+    return problems, notes
+
+
+def _selected_platforms(args: argparse.Namespace) -> tuple[bool, bool]:
+    """Platforms doctor checks: the one selected, or both if none was passed."""
+    check_hf = args.hf or not (args.hf or args.kg)
+    check_kg = args.kg or not (args.hf or args.kg)
+    return check_hf, check_kg
+
+
 def doctor_dataset(args: argparse.Namespace) -> None:
     """Check dataset files required for publishing to Hugging Face or Kaggle.
 
     This command ensures that all mandatory files exist before attempting to
-    publish a dataset. If files are missing it exits with a non-zero status so
-    that CI/CD pipelines can fail early.
+    publish a dataset, and that the processed Parquet file is intact and
+    matches its configuration (see _check_data_integrity). If anything is
+    wrong it exits with a non-zero status so that CI/CD pipelines can fail
+    early.
     """
     dataset_id = args.id
 
     # Determine selected platforms. If none passed, validate for both
-    check_hf = args.hf or not (args.hf or args.kg)
-    check_kg = args.kg or not (args.hf or args.kg)
+    check_hf, check_kg = _selected_platforms(args)
 
     printer.header(f"Running doctor for dataset: {dataset_id}")
 
-    def _auto_generate_missing_files(ds_id: str, ds_dir: Path, missing_files: list[str]) -> None:
-        """Attempt to populate missing docs using templates located in example-docs.
-        Will skip non-documentation files such as data.parquet.
-        """
-        template_root = config_manager.paths.project_root / "example-docs"
-        generated: list[str] = []
-
-        for abs_fp in missing_files:
-            target = Path(abs_fp)
-            if target.suffix == ".parquet":
-                continue  # cannot auto-generate data file
-
-            # Determine platform template folder that has the file
-            rel_path = target.relative_to(ds_dir)
-            template_path = None
-            for plat in ["huggingface", "kaggle"]:
-                cand = template_root / plat / rel_path
-                if cand.exists():
-                    template_path = cand
-                    break
-            if not template_path:
-                continue  # no template available
-
-            target.parent.mkdir(parents=True, exist_ok=True)
-            content = template_path.read_text(encoding="utf-8")
-            # simple placeholder replacements
-            content = re.sub(r"example", ds_id, content, flags=re.IGNORECASE)
-            target.write_text(content, encoding="utf-8")
-            generated.append(str(target))
-
-        if generated:
-            printer.success("Generated missing files:")
-            for fp in generated:
-                printer.file_path(fp)
-            printer.print("Please review and customise the generated templates before publishing.", "warning")
-        else:
-            printer.warning("No files were auto-generated (either not template found or only non-doc files were missing)")
-
     # Locate dataset directory (docs) – fall back across common locations
-    candidate_dirs = [
-        config_manager.paths.project_root / "dataset" / dataset_id,
-        config_manager.paths.docs_dir / dataset_id,
-        config_manager.paths.datasets_dir / dataset_id,
-    ]
-    dataset_dir = next((p for p in candidate_dirs if p.exists()), None)
+    dataset_dir = next((p for p in _dataset_dir_candidates(dataset_id) if p.exists()), None)
 
     if dataset_dir is None:
         printer.error(f"Dataset directory not found for '{dataset_id}' in expected locations.")
         sys.exit(1)
 
-    missing: list[str] = []  # Store absolute paths of missing files
-
     if check_hf:
         printer.print("Checking Hugging Face requirements", "info")
-        hf_required = ["README.md", "dataset-card.md", "CITATION.cff", "LICENSE", "CHANGELOG.md"]
-        for rel in hf_required:
-            path = dataset_dir / rel
-            if not path.exists():
-                missing.append(str(path))
-
-        # Processed data required for HF
-        data_parquet = config_manager.paths.processed_data_dir / dataset_id / "data.parquet"
-        if not data_parquet.exists():
-            missing.append(str(data_parquet))
-
     if check_kg:
         printer.print("Checking Kaggle requirements", "info")
-        kg_required = [Path(".kaggle") / "README.md", "dataset-card.md", "LICENSE", "CHANGELOG.md"]
-        for rel in kg_required:
-            path = dataset_dir / rel
-            if not path.exists():
-                missing.append(str(path))
+
+    # Store absolute paths of missing files
+    missing = [str(path) for path in _required_files(dataset_id, dataset_dir, check_hf, check_kg)
+               if not path.exists()]
+
+    integrity_problems, notes = _check_data_integrity(dataset_id, getattr(args, "verify", False))
+    for note in notes:
+        printer.print(note, "info")
 
     if missing:
         # Display table of missing files
@@ -322,21 +544,643 @@ def _auto_generate_missing_files(ds_id: str, ds_dir: Path, missing_files: list[s
         else:
             sys.exit(1)
 
+    if integrity_problems:
+        printer.table(["#", "Problem"], [[str(i + 1), p] for i, p in enumerate(integrity_problems)],
+                      title="Data integrity problems")
+        printer.guide("Next steps", [
+            f"Re-run 'python meddata.py process {dataset_id}' if the data file is damaged",
+            f"Update _datasets/{dataset_id}.yml if the schema or stats are out of date",
+        ])
+        sys.exit(1)
+
     printer.success("All required files exist. Dataset is ready for publishing!")
 
 
+def _stat_concurrently(paths: Iterable[Path], workers: int) -> dict[Path, bool]:
+    """
+    Check which paths exist, issuing the stat calls from a thread pool.
+
+    On network filesystems every stat is a round trip, so overlapping them
+    matters far more than the thread overhead.
+
+    Args:
+        paths: Paths to check; duplicates are only checked once
+        workers: Most stat calls in flight at once
+
+    Returns:
+        Mapping of each path to whether it exists
+    """
+    unique = list(dict.fromkeys(paths))
+    if not unique:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(unique)))) as pool:
+        return dict(zip(unique, pool.map(Path.exists, unique)))
+
+
+def _display_path(path: Path) -> str:
+    """Show a path relative to the project root when it is inside it."""
+    try:
+        return str(path.relative_to(config_manager.paths.project_root))
+    except ValueError:
+        return str(path)
+
+
+def doctor_all(args: argparse.Namespace, dataset_ids: list[str]) -> int:
+    """
+    Check many datasets in one pass and print one combined table.
+
+    The required files of every dataset and platform are gathered first and
+    deduplicated, then all of them are stat'ed concurrently, as are the
+    Parquet footers.
+
+    Args:
+        args: Command line arguments with hf, kg, fix, verify and jobs
+        dataset_ids: Datasets to check
+
+    Returns:
+        Exit code (0 if every dataset is ready, 1 otherwise)
+    """
+    if not dataset_ids:
+        printer.error(f"No datasets match '{args.id or '*'}' in {config_manager.paths.datasets_dir}")
+        return 1
+
+    check_hf, check_kg = _selected_platforms(args)
+    workers = args.jobs or DOCTOR_IO_WORKERS
+    printer.header(f"Running doctor for {len(dataset_ids)} datasets")
+
+    candidates = {dataset_id: _dataset_dir_candidates(dataset_id) for dataset_id in dataset_ids}
+    exists = _stat_concurrently((path for paths in candidates.values() for path in paths), workers)
+    dataset_dirs = {dataset_id: next((p for p in paths if exists[p]), None)
+                    for dataset_id, paths in candidates.items()}
+
+    required = {dataset_id: _required_files(dataset_id, dataset_dir, check_hf, check_kg)
+                for dataset_id, dataset_dir in dataset_dirs.items() if dataset_dir is not None}
+    exists.update(_stat_concurrently((path for paths in required.values() for path in paths), workers))
+
+    verify = getattr(args, "verify", False)
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(dataset_ids)))) as pool:
+        integrity = dict(zip(dataset_ids, pool.map(lambda ds_id: _check_data_integrity(ds_id, verify),
+                                                   dataset_ids)))
+
+    rows = []
+    failed = []
+    for dataset_id in dataset_ids:
+        dataset_dir = dataset_dirs[dataset_id]
+        problems, notes = integrity[dataset_id]
+        if dataset_dir is None:
+            missing = ["dataset directory"]
+        else:
+            missing_paths = [path for path in required[dataset_id] if not exists[path]]
+            if missing_paths and args.fix:
+                _auto_generate_missing_files(dataset_id, dataset_dir, [str(path) for path in missing_paths])
+                missing_paths = [path for path in missing_paths if not path.exists()]
+            missing = [_display_path(path) for path in missing_paths]
+
+        ok = not missing and not problems
+        if not ok:
+            failed.append(dataset_id)
+        rows.append([dataset_id, "ok" if ok else "FAILED", "\n".join(missing) or "-",
+                     "\n".join(problems + notes) or "-"])
+
+    printer.table(["Dataset", "Status", "Missing files", "Data"], rows, title="Doctor summary")
+
+    if failed:
+        printer.error(f"{len(failed)} of {len(dataset_ids)} datasets are not ready: {', '.join(failed)}")
+        return 1
+
+    printer.success(f"All {len(dataset_ids)} datasets are ready for publishing!")
+    return 0
+
+
+def _resolve_dataset_ids(args: argparse.Namespace) -> Optional[list[str]]:
+    """
+    Resolve the datasets a batch command should run for.
+
+    Args:
+        args: Command line arguments with ``id`` and ``all``
+
+    Returns:
+        Sorted dataset IDs matching ``--all`` or a glob pattern given as the id,
+        or None when the command targets a single dataset
+    """
+    if getattr(args, "all", False):
+        pattern = "*"
+    elif args.id and any(ch in args.id for ch in "*?["):
+        pattern = args.id
+    else:
+        return None
+
+    return sorted(
+        config_file.stem
+        for config_file in config_manager.paths.datasets_dir.glob("*.yml")
+        if fnmatch.fnmatchcase(config_file.stem, pattern)
+    )
+
+
+def _batch_worker(func: Callable[[argparse.Namespace], Any], args: argparse.Namespace,
+                  log_path: Path) -> tuple[bool, float, str]:
+    """
+    Run one command for one dataset inside a worker process.
+
+    The worker's stdout and stderr (including script subprocesses started with
+    --isolate) are redirected to a per-dataset log file so that the parent can
+    show a single aggregated progress display.
+
+    Args:
+        func: Command function to run
+        args: Command line arguments for this dataset
+        log_path: File receiving the command's output
+
+    Returns:
+        Tuple of (succeeded, elapsed_seconds, error_message)
+    """
+    printer.use_rich = False
+    log_path.parent.mkdir(exist_ok=True, parents=True)
+    start = time.perf_counter()
+    ok, error = True, ""
+
+    with open(log_path, "w", encoding="utf-8") as log:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        saved_fds = os.dup(1), os.dup(2)
+        os.dup2(log.fileno(), 1)
+        os.dup2(log.fileno(), 2)
+        try:
+            _run_profiled(func, args, f"{args.command}-{args.id}")
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                ok, error = False, f"exited with status {e.code}"
+        except Exception as e:
+            ok, error = False, f"{type(e).__name__}: {e}"
+        finally:
+            printer.flush()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved_fds[0], 1)
+            os.dup2(saved_fds[1], 2)
+            os.close(saved_fds[0])
+            os.close(saved_fds[1])
+
+    return ok, time.perf_counter() - start, error
+
+
+def _run_profiled(func: Callable[[argparse.Namespace], Any], args: argparse.Namespace, label: str) -> Any:
+    """
+    Run a command function, under cProfile or tracemalloc if ``--profile`` was given.
+
+    With ``--isolate`` the scripts are profiled inside their subprocesses
+    instead, so the parent, which only waits for them, is not profiled.
+
+    Args:
+        func: Command function to run
+        args: Command line arguments (``args.profile`` selects the profiler)
+        label: Name used for the saved profile file
+
+    Returns:
+        Whatever the command function returns
+    """
+    profile = getattr(args, "profile", None)
+    if not profile or getattr(args, "isolate", False):
+        return func(args)
+
+    from scripts.utils.profiling import profiled
+    with profiled(profile, label):
+        return func(args)
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    """
+    Run a dataset command for every matching dataset on a process pool.
+
+    Args:
+        args: Command line arguments with ``func``, ``command``, ``id``/``all``
+            and ``jobs``
+
+    Returns:
+        Exit code (0 if every dataset succeeded, 1 otherwise)
+    """
+    dataset_ids = _resolve_dataset_ids(args) or []
+    if not dataset_ids:
+        printer.error(f"No datasets match '{args.id or '*'}' in {config_manager.paths.datasets_dir}")
+        return 1
+
+    jobs = max(1, min(args.jobs or os.cpu_count() or 1, len(dataset_ids)))
+    log_dir = config_manager.paths.cache_dir / "logs" / args.command
+    printer.header(f"Running '{args.command}' for {len(dataset_ids)} datasets with {jobs} workers")
+
+    results: dict[str, tuple[bool, float, str]] = {}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {}
+        for dataset_id in dataset_ids:
+            dataset_args = argparse.Namespace(**vars(args))
+            dataset_args.id = dataset_id
+            dataset_args.all = False
+            # Share the CPUs with the other workers instead of each profiling on all of them
+            dataset_args.profile_workers = max(1, (os.cpu_count() or 1) // jobs)
+            futures[pool.submit(_batch_worker, args.func, dataset_args,
+                                log_dir / f"{dataset_id}.log")] = dataset_id
+
+        with printer.progress_context(f"{args.command}: {len(dataset_ids)} datasets") as progress:
+            task = progress.add_task(f"{args.command}: 0/{len(dataset_ids)} done", total=len(dataset_ids))
+            for future in as_completed(futures):
+                dataset_id = futures[future]
+                try:
+                    results[dataset_id] = future.result()
+                except Exception as e:  # Worker process crashed
+                    results[dataset_id] = (False, 0.0, f"{type(e).__name__}: {e}")
+
+                failed = sum(1 for ok, _, _ in results.values() if not ok)
+                progress.update(task, advance=1, description=(
+                    f"{args.command}: {len(results)}/{len(dataset_ids)} done, {failed} failed"
+                ))
+
+    rows = []
+    for dataset_id in dataset_ids:
+        ok, elapsed, error = results[dataset_id]
+        rows.append([dataset_id, "ok" if ok else f"FAILED ({error})", f"{elapsed:.1f}s",
+                     str(log_dir / f"{dataset_id}.log")])
+    printer.table(["Dataset", "Status", "Time", "Log"], rows, title=f"{args.command} summary")
+
+    failed = [dataset_id for dataset_id, (ok, _, _) in results.items() if not ok]
+    if failed:
+        printer.error(f"'{args.command}' failed for {len(failed)} of {len(dataset_ids)} datasets: "
+                      f"{', '.join(sorted(failed))}")
+        return 1
+
+    printer.success(f"'{args.command}' completed for all {len(dataset_ids)} datasets")
+    return 0
+
+
+def _add_dataset_arguments(parser: argparse.ArgumentParser, help_text: str) -> None:
+    """
+    Add the dataset selection arguments shared by batch-capable commands.
+
+    Args:
+        parser: Command parser to add the arguments to
+        help_text: Help text for the positional dataset ID
+    """
+    parser.add_argument("id", nargs="?", help=f"{help_text} (or a glob pattern such as 'med*')")
+    parser.add_argument("--all", action="store_true", help="Run for every dataset in _datasets/")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Number of worker processes for batch runs (default: number of CPUs)")
+
+
+def create_build_pipeline(args: argparse.Namespace) -> Pipeline:
+    """
+    Describe the process → docs/assets → doctor → publish stages for a dataset.
+
+    The docs are rendered from the processed data, so they wait for the process
+    stage and are re-rendered whenever it changes the processed files.
+
+    Args:
+        args: Command line arguments containing the dataset id, ``publish`` and ``isolate``
+
+    Returns:
+        Pipeline whose state is stored under the cache directory
+    """
+    dataset_id = args.id
+    paths = config_manager.paths
+    config_path = paths.datasets_dir / f"{dataset_id}.yml"
+    processed_dir = paths.processed_data_dir / dataset_id
+    docs_dir = paths.docs_dir / dataset_id
+    doc_outputs = [docs_dir / name for name in ["README.md", "dataset-card.md", "CITATION.cff", "LICENSE"]]
+
+    def stage_args(**kwargs: Any) -> argparse.Namespace:
+        return argparse.Namespace(id=dataset_id, isolate=args.isolate, **kwargs)
+
+    pipeline = Pipeline(paths.cache_dir / "build" / f"{dataset_id}.json")
+    pipeline.add(Stage(
+        name="process",
+        action=lambda: process_dataset(stage_args()),
+        inputs=[config_path, paths.raw_data_dir / dataset_id, paths.project_root / "scripts" / "process-dataset.py"],
+        outputs=[processed_dir / "data.parquet"],
+    ))
+    pipeline.add(Stage(
+        name="docs",
+        action=lambda: generate_docs(stage_args()),
+        # The cards describe the processed data: its stats, column profiles and Parquet footer
+        # (profile.json is named literally to keep the profiler's numpy/pandas imports lazy)
+        inputs=[config_path, paths.templates_dir, paths.project_root / "scripts" / "generate-docs.py",
+                processed_dir / STATS_FILE, processed_dir / "profile.json", processed_dir / "data.parquet"],
+        outputs=doc_outputs,
+        deps=["process"],
+    ))
+    pipeline.add(Stage(
+        name="assets",
+        action=lambda: generate_assets(argparse.Namespace(dataset_id=dataset_id, isolate=args.isolate)),
+        inputs=[config_path, paths.project_root / "assets" / "templates",
+                paths.project_root / "scripts" / "generate-assets.py"],
+        outputs=[paths.project_root / "assets" / "images" / f"{dataset_id}-logo.svg"],
+    ))
+    pipeline.add(Stage(
+        name="doctor",
+        action=lambda: doctor_dataset(stage_args(hf=False, kg=False, fix=False)),
+        inputs=[processed_dir / "data.parquet", docs_dir, paths.project_root / "dataset" / dataset_id],
+        deps=["process", "docs"],
+    ))
+    if args.publish:
+        pipeline.add(Stage(
+            name="publish",
+            action=lambda: publish_dataset(stage_args(token=args.token, platforms=args.platforms)),
+            inputs=[config_path, processed_dir, docs_dir],
+            deps=["doctor", "assets"],
+        ))
+    return pipeline
+
+
+def build_dataset(args: argparse.Namespace) -> None:
+    """
+    Build a dataset incrementally: process, docs, assets, doctor and optionally publish.
+
+    Stages whose inputs are unchanged since their last successful run are
+    skipped; assets run alongside processing, docs once processing has
+    finished (they describe the processed data), and doctor after both.
+
+    Args:
+        args: Command line arguments containing dataset id, jobs, force and publish flags
+    """
+    printer.header(f"Building dataset: {args.id}")
+
+    if not (config_manager.paths.datasets_dir / f"{args.id}.yml").exists():
+        printer.error(f"Dataset configuration not found: {config_manager.paths.datasets_dir / f'{args.id}.yml'}")
+        sys.exit(1)
+
+    def report(result: StageResult) -> None:
+        if result.status in ("failed", "blocked"):
+            printer.warning(f"Stage '{result.name}' {result.status}: {result.error}")
+        printer.timing(f"Stage '{result.name}'", result.elapsed, dataset=args.id,
+                       stage=result.name, status=result.status)
+
+    results = create_build_pipeline(args).run(max_workers=args.jobs, force=args.force, on_result=report)
+
+    printer.table(
+        ["Stage", "Status", "Time", "Details"],
+        [[r.name, r.status, f"{r.elapsed:.1f}s", r.error] for r in results.values()],
+        title=f"Build summary: {args.id}"
+    )
+
+    if any(r.status in ("failed", "blocked") for r in results.values()):
+        printer.error(f"Build failed for dataset '{args.id}'")
+        sys.exit(1)
+
+    printer.success(f"Dataset '{args.id}' is up to date!")
+
+
+def _create_build_commands(subparsers) -> None:
+    """
+    Create the build command parser.
+
+    Args:
+        subparsers: Subparser collection to add the command to
+    """
+    build_parser = subparsers.add_parser("build", help="Incrementally run all stages for a dataset")
+    build_parser.add_argument("id", help="Dataset ID to build")
+    build_parser.add_argument("-j", "--jobs", type=int, default=None,
+                              help="Maximum number of stages running at once")
+    build_parser.add_argument("--force", action="store_true", help="Run every stage even if nothing changed")
+    build_parser.add_argument("--publish", action="store_true", help="Also publish the dataset after doctor")
+    build_parser.add_argument("--token", help="API token for publishing (if not provided, will use token from .env)")
+    build_parser.add_argument("--platforms", nargs="+",
+                              help="Specific platforms to publish to (e.g., huggingface kaggle github)")
+    build_parser.set_defaults(func=build_dataset)
+
+
+def plan_watch_rebuild(changed: Iterable[Path]) -> dict[str, set[str]]:
+    """
+    Map changed source files to the artifacts that need regenerating.
+
+    Args:
+        changed: Paths reported by the file watcher
+
+    Returns:
+        Mapping with the dataset IDs whose ``docs``, ``logos`` and ``previews``
+        are stale, and the site-wide ``brand`` images to regenerate
+    """
+    paths = config_manager.paths
+    asset_templates = paths.project_root / "assets" / "templates"
+    dataset_ids = {config_file.stem for config_file in paths.datasets_dir.glob("*.yml")}
+    plan: dict[str, set[str]] = {"docs": set(), "logos": set(), "previews": set(), "brand": set()}
+
+    for path in changed:
+        parent = path.parent.resolve()
+        if parent == paths.datasets_dir.resolve():
+            # Deleted configs only drop out of the preview index
+            if path.suffix == ".yml" and path.stem in dataset_ids:
+                for artifact in ("docs", "logos", "previews"):
+                    plan[artifact].add(path.stem)
+            elif path.suffix == ".yml":
+                plan["previews"].update(dataset_ids)
+        elif parent == paths.templates_dir.resolve():
+            # dataset.yml.template is only used by `init`
+            if path.name.endswith(".template") and path.name != "dataset.yml.template":
+                plan["docs"].update(dataset_ids)
+        elif parent == asset_templates.resolve():
+            if path.name == "dataset-logo.svg":
+                plan["logos"].update(dataset_ids)
+                plan["previews"].update(dataset_ids)
+            elif path.name == "favicon.svg":
+                plan["brand"].update({"favicon.svg", "logo.svg"})
+
+    return plan
+
+
+def _rebuild_watched_artifacts(plan: dict[str, set[str]]) -> int:
+    """
+    Regenerate the artifacts of a watch plan in-process.
+
+    Args:
+        plan: Plan returned by ``plan_watch_rebuild``
+
+    Returns:
+        Number of artifacts that failed to regenerate
+    """
+    scripts_dir = config_manager.paths.project_root / "scripts"
+    assets_script = scripts_dir / "generate-assets.py"
+    failures = 0
+
+    def attempt(description: str, action: Callable[[], Any]) -> None:
+        nonlocal failures
+        try:
+            action()
+        except (Exception, SystemExit) as e:
+            failures += 1
+            printer.error(f"Failed to regenerate {description}", e)
+
+    for dataset_id in sorted(plan["docs"]):
+        attempt(f"docs for '{dataset_id}'", lambda ds=dataset_id: script_dispatcher.call(
+            scripts_dir / "generate-docs.py", "generate_dataset_docs", ds))
+
+    # Assets go through generate-assets' main so their fingerprints and PNG/ICO renders stay current;
+    # a brand change checks every asset, which only regenerates the stale ones
+    if plan["brand"]:
+        attempt("assets", lambda: script_dispatcher.call(assets_script, "main"))
+    elif plan["logos"]:
+        attempt(f"logos for {', '.join(sorted(plan['logos']))}",
+                lambda: script_dispatcher.call(assets_script, "main", sorted(plan["logos"])))
+
+    if plan["previews"] or plan["brand"]:
+        attempt("preview pages", lambda: script_dispatcher.call(
+            scripts_dir / "other" / "preview.py", "generate_preview", sorted(plan["previews"])))
+
+    return failures
+
+
+def watch_datasets(args: argparse.Namespace) -> None:
+    """
+    Watch dataset configs and templates and regenerate only affected artifacts.
+
+    The process stays resident and calls the generators in-process, so a
+    rebuild after an edit does not pay interpreter or import start-up again.
+
+    Args:
+        args: Command line arguments containing ``debounce`` and ``poll``
+    """
+    from scripts.utils.watcher import FileWatcher
+
+    paths = config_manager.paths
+    directories = [paths.datasets_dir, paths.templates_dir, paths.project_root / "assets" / "templates"]
+    watcher = FileWatcher(directories, debounce=args.debounce, force_polling=args.poll)
+
+    printer.header(f"Watching for changes ({watcher.backend})")
+    for directory in watcher.directories:
+        printer.file_path(str(directory))
+    printer.print("Press Ctrl+C to stop.", "info")
+
+    try:
+        for changed in watcher.changes():
+            plan = plan_watch_rebuild(changed)
+            if not any(plan.values()):
+                continue
+
+            start = time.perf_counter()
+            printer.print(f"Changed: {', '.join(sorted(p.name for p in changed))}", "info")
+            with file_writer.track() as written:
+                failures = _rebuild_watched_artifacts(plan)
+            elapsed = time.perf_counter() - start
+            if failures:
+                printer.warning(f"Rebuild finished with {failures} failures in {elapsed:.2f}s ({written})")
+            else:
+                printer.success(f"Rebuilt affected artifacts in {elapsed:.2f}s ({written})")
+    except KeyboardInterrupt:
+        printer.print("Stopped watching.", "info")
+    finally:
+        watcher.close()
+
+
+def _create_watch_commands(subparsers) -> None:
+    """
+    Create the watch command parser.
+
+    Args:
+        subparsers: Subparser collection to add the command to
+    """
+    watch_parser = subparsers.add_parser("watch", help="Regenerate docs, logos and previews when sources change")
+    watch_parser.add_argument("--debounce", type=float, default=0.3,
+                              help="Seconds without further changes before rebuilding (default: 0.3)")
+    watch_parser.add_argument("--poll", action="store_true",
+                              help="Poll for changes instead of using inotify")
+    watch_parser.set_defaults(func=watch_datasets)
+
+
+def run_benchmark_suite(args: argparse.Namespace) -> Any:
+    """
+    Run the fixed benchmark suite and store its results under the current git commit.
+
+    With ``--compare`` the results are checked against an earlier commit's, and
+    the command exits with a non-zero status if throughput dropped or memory
+    grew beyond the tolerances.
+
+    Args:
+        args: Command line arguments containing compare, tolerances and repeat count
+
+    Returns:
+        Benchmark results when run in-process, otherwise None
+    """
+    cli_args = ["--suite", "--tolerance", str(args.max_slowdown),
+                "--memory-tolerance", str(args.max_memory_growth), "--repeat", str(args.repeat)]
+    if args.compare is not None:
+        cli_args += ["--compare"] + ([args.compare] if args.compare else [])
+
+    try:
+        printer.header("Running the benchmark suite")
+        return _run_script(args, "benchmark-pipeline.py", "run_suite",
+                           [args.compare, args.max_slowdown, args.max_memory_growth, args.repeat], cli_args)
+    except subprocess.CalledProcessError as e:
+        printer.error("Benchmark suite failed or found regressions", e)
+        sys.exit(1)
+
+
+def _create_bench_commands(subparsers) -> None:
+    """
+    Create the bench command parser.
+
+    Args:
+        subparsers: Subparser collection to add the command to
+    """
+    bench_parser = subparsers.add_parser(
+        "bench", help="Benchmark processing, docs and asset generation and store the results per git commit")
+    bench_parser.add_argument("--compare", nargs="?", const="", default=None, metavar="REF",
+                              help="Fail if slower or larger than the stored results of REF "
+                                   "(default: the nearest earlier commit with results)")
+    bench_parser.add_argument("--max-slowdown", type=float, default=0.25,
+                              help="Allowed throughput drop per stage (default: 0.25 = 25%%)")
+    bench_parser.add_argument("--max-memory-growth", type=float, default=0.25,
+                              help="Allowed peak memory growth per stage (default: 0.25 = 25%%)")
+    bench_parser.add_argument("--repeat", type=int, default=3,
+                              help="Runs per benchmark; the best of them is kept (default: 3)")
+    bench_parser.set_defaults(func=run_benchmark_suite)
+
+
+def validate_configs(args: argparse.Namespace) -> None:
+    """
+    Validate every dataset configuration against the schema in one pass.
+
+    All problems are reported together; exits with a non-zero status if any
+    configuration is invalid.
+
+    Args:
+        args: Command line arguments (unused)
+    """
+    from scripts.utils.catalog import dataset_catalog
+
+    printer.header("Validating dataset configurations")
+    dataset_ids = dataset_catalog.ids()
+    problems = dataset_catalog.validate()
+
+    if problems:
+        printer.config_errors(problems)
+        printer.error(f"{len(problems)} of {len(dataset_ids)} dataset configurations are invalid")
+        sys.exit(1)
+
+    printer.success(f"All {len(dataset_ids)} dataset configurations are valid!")
+
+
+def _create_validate_commands(subparsers) -> None:
+    """
+    Create the validate command parser.
+
+    Args:
+        subparsers: Subparser collection to add the command to
+    """
+    validate_parser = subparsers.add_parser("validate", help="Check every dataset configuration against the schema")
+    validate_parser.set_defaults(func=validate_configs)
+
+
 def _create_doctor_commands(subparsers) -> None:
     """Create the `doctor` command parser."""
     doctor_parser = subparsers.add_parser("doctor", help="Validate dataset files for publishing")
-    doctor_parser.add_argument("id", help="Dataset ID to validate")
+    _add_dataset_arguments(doctor_parser, "Dataset ID to validate")
 
     platform_group = doctor_parser.add_mutually_exclusive_group(required=False)
     platform_group.add_argument("--hf", action="store_true", help="Check Hugging Face requirements only")
     platform_group.add_argument("--kg", action="store_true", help="Check Kaggle requirements only")
 
     doctor_parser.add_argument("--fix", action="store_true", help="Attempt to create any missing files using templates")
+    doctor_parser.add_argument("--verify", action="store_true",
+                               help="Also verify the checksums of the files staged by the last publish")
 
-    doctor_parser.set_defaults(func=doctor_dataset)
+    # --all and glob patterns check every dataset in one pass instead of one worker per dataset
+    doctor_parser.set_defaults(func=doctor_dataset, batch_func=doctor_all)
 
 
 def setup_env(args: argparse.Namespace) -> None:
@@ -425,7 +1269,7 @@ def _create_process_commands(subparsers) -> None:
         subparsers: Subparser collection to add the command to
     """
     process_parser = subparsers.add_parser("process", help="Process a dataset")
-    process_parser.add_argument("id", help="Dataset ID to process")
+    _add_dataset_arguments(process_parser, "Dataset ID to process")
     process_parser.set_defaults(func=process_dataset)
 
 
@@ -437,10 +1281,10 @@ def _create_publish_commands(subparsers) -> None:
         subparsers: Subparser collection to add the command to
     """
     publish_parser = subparsers.add_parser("publish", help="Publish a dataset")
-    publish_parser.add_argument("id", help="Dataset ID to publish")
+    _add_dataset_arguments(publish_parser, "Dataset ID to publish")
     publish_parser.add_argument("--token", help="API token for publishing (if not provided, will use token from .env)")
     publish_parser.add_argument("--platforms", nargs="+",
-                                help="Specific platforms to publish to (e.g., huggingface github)")
+                                help="Specific platforms to publish to (e.g., huggingface kaggle github)")
     publish_parser.set_defaults(func=publish_dataset)
 
 
@@ -465,8 +1309,8 @@ def _create_docs_commands(subparsers) -> None:
         subparsers: Subparser collection to add the command to
     """
     docs_parser = subparsers.add_parser("docs", help="Generate documentation for a dataset")
-    docs_parser.add_argument("id", help="Dataset ID to generate documentation for")
-    docs_parser.set_defaults(func=generate_docs)
+    _add_dataset_arguments(docs_parser, "Dataset ID to generate documentation for")
+    docs_parser.set_defaults(func=generate_docs, batch_func=generate_docs_all)
 
 
 def _create_site_commands(subparsers) -> None:
@@ -478,6 +1322,10 @@ def _create_site_commands(subparsers) -> None:
     """
     site_parser = subparsers.add_parser("site", help="Generate the static site")
     site_parser.add_argument("--serve", action="store_true", help="Serve the site locally")
+    site_parser.add_argument("--refresh", action="store_true",
+                             help="Regenerate assets and the docs of every dataset concurrently first")
+    site_parser.add_argument("-j", "--jobs", type=int, default=None,
+                             help="Most refresh commands running at once (default: number of CPUs)")
     site_parser.set_defaults(func=generate_site)
 
 
@@ -611,6 +1459,18 @@ def create_commands(subparsers) -> None:
     # doctor command
     _create_doctor_commands(subparsers)
 
+    # validate command
+    _create_validate_commands(subparsers)
+
+    # build command
+    _create_build_commands(subparsers)
+
+    # watch command
+    _create_watch_commands(subparsers)
+
+    # bench command
+    _create_bench_commands(subparsers)
+
     # setup command
     _create_setup_commands(subparsers)
 
@@ -627,6 +1487,13 @@ def create_parser() -> argparse.ArgumentParser:
         Configured argument parser for the MedData CLI
     """
     parser = argparse.ArgumentParser(description="MedData CLI Tool")
+    parser.add_argument("--isolate", action="store_true",
+                        help="Run each script in a separate Python subprocess instead of in-process")
+    parser.add_argument("--log-format", choices=["text", "json"], default=None,
+                        help="Output format: human-readable text (default) or newline-delimited JSON events")
+    parser.add_argument("--profile", choices=["cpu", "memory"], default=None,
+                        help="Profile the command with cProfile (cpu) or tracemalloc (memory) and "
+                             "save the profile under .meddata/profiles")
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
 
     create_commands(subparsers)
@@ -674,6 +1541,11 @@ def main() -> int:
     parser = create_parser()
     args = parser.parse_args()
 
+    # Switch output format; script subprocesses inherit it through the environment
+    if args.log_format:
+        printer.log_format = args.log_format
+        os.environ[LOG_FORMAT_ENV] = args.log_format
+
     # Show logo on startup
     printer.logo()
 
@@ -685,8 +1557,22 @@ def main() -> int:
     if args.command != "setup" and not validate_environment():
         return 1
 
+    # Batch-capable commands need either a dataset ID, a glob pattern or --all
+    if hasattr(args, "all"):
+        if not args.id and not args.all:
+            parser.error(f"{args.command}: a dataset ID, glob pattern or --all is required")
+        dataset_ids = _resolve_dataset_ids(args)
+        if dataset_ids is not None:
+            batch_func = getattr(args, "batch_func", None)
+            if batch_func:
+                # One pass over every dataset in this process, so profile it as a whole
+                return _run_profiled(lambda batch_args: batch_func(batch_args, dataset_ids), args,
+                                     f"{args.command}-all")
+            # Worker processes profile each dataset on their own
+            return run_batch(args)
+
     # Execute the corresponding function
-    args.func(args)
+    _run_profiled(args.func, args, args.command)
     return 0
 
 
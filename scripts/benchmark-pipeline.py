@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+MedData Benchmark Pipeline Script - Benchmarks dataset processing offline.
+
+This script generates synthetic Medium- and Dev.to-shaped sources of a chosen
+size (cached under .meddata/benchmarks/data), runs each through the ingest,
+normalize, dedupe and write functions of process-dataset in a fresh process,
+and reports rows per second and peak memory per stage. Results are compared
+against a stored baseline to catch regressions. No network access is needed.
+
+With --suite, a fixed set of benchmarks (pipeline stages, docs generation and
+asset generation) is run and stored under .meddata/benchmarks/results keyed by
+git commit, and --compare checks it against the results of an earlier commit.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+# Ensure project root is on PYTHONPATH when script executed directly
+project_root = Path(__file__).resolve().parents[1]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.utils.printer import printer
+from scripts.utils.config_manager import config_manager
+from scripts.utils.benchmark import (DEFAULT_TOLERANCE, RESULT_COLUMNS, BenchmarkResult, best_of,
+                                     commit_results_path, compare_results, current_commit,
+                                     find_commit_results, load_baseline, result_rows, run_assets_benchmark,
+                                     run_docs_benchmark, run_isolated, run_pipeline_benchmark, save_baseline)
+from scripts.utils.synthetic import PROFILES, ensure_source
+
+__all__ = ["run_benchmarks", "run_suite"]
+
+DEFAULT_SIZES = [1_000, 10_000]
+
+# Fixed workload of the suite; changing it makes earlier commits' results incomparable
+SUITE_ROWS = 20_000
+SUITE_DOCS_ITERATIONS = 20
+SUITE_ASSETS_ITERATIONS = 200
+
+
+def _benchmarks_dir() -> Path:
+    return config_manager.paths.cache_dir / "benchmarks"
+
+
+def _report_regressions(results: List[BenchmarkResult], baseline: dict, tolerance: float,
+                        memory_tolerance: Optional[float], against: str) -> None:
+    """Print the outcome of a comparison and exit with status 1 on regressions."""
+    memory_tolerance = tolerance if memory_tolerance is None else memory_tolerance
+    regressions = compare_results(results, baseline, tolerance, memory_tolerance)
+    limits = f"{tolerance:.0%} slowdown / {memory_tolerance:.0%} memory growth"
+    if regressions:
+        printer.error(f"{len(regressions)} performance regression(s) beyond {limits} against {against}:")
+        for regression in regressions:
+            printer.print(f"  - {regression}")
+        sys.exit(1)
+
+    printer.success(f"No regressions beyond {limits} against {against}")
+
+
+def run_benchmarks(kinds: Optional[List[str]] = None,
+                   sizes: Optional[List[int]] = None,
+                   file_format: str = "csv",
+                   seed: int = 0,
+                   tolerance: float = DEFAULT_TOLERANCE,
+                   update_baseline: bool = False,
+                   repeat: int = 3,
+                   memory_tolerance: Optional[float] = None) -> List[BenchmarkResult]:
+    """
+    Run the pipeline benchmarks and compare them with the stored baseline.
+
+    Args:
+        kinds: Dataset shapes to benchmark (defaults to all)
+        sizes: Source sizes in rows (defaults to DEFAULT_SIZES)
+        file_format: Source format, 'csv' or 'parquet'
+        seed: Seed for the synthetic data
+        tolerance: Allowed relative throughput drop before failing
+        update_baseline: Store these results as the new baseline
+        repeat: Runs per benchmark; the best reading of each stage is kept
+        memory_tolerance: Allowed relative memory growth (defaults to tolerance)
+
+    Returns:
+        All benchmark results
+
+    Exits with status 1 if any stage regressed beyond the tolerances.
+    """
+    kinds = kinds or list(PROFILES)
+    sizes = sizes or DEFAULT_SIZES
+    baseline_path = _benchmarks_dir() / "baseline.json"
+    baseline = load_baseline(baseline_path)
+
+    results: List[BenchmarkResult] = []
+    for kind in kinds:
+        for rows in sizes:
+            name = f"{kind}-{rows}-{file_format}"
+            printer.header(f"Benchmarking {name}")
+            source = ensure_source(kind, rows, _benchmarks_dir() / "data", file_format, seed)
+            printer.print(f"Source: [path]{source}[/path]")
+            # A fresh process per run keeps memory readings independent
+            runs = [run_isolated(run_pipeline_benchmark, source, name) for _ in range(max(1, repeat))]
+            results.extend(best_of(runs))
+
+    printer.table(RESULT_COLUMNS, result_rows(results, baseline), title="Pipeline benchmarks")
+
+    if update_baseline:
+        save_baseline(baseline_path, results)
+        printer.success(f"Baseline saved to {baseline_path}")
+        return results
+
+    if not baseline:
+        printer.guide("No baseline yet", ["Run with --save-baseline to store these results as the baseline"])
+        return results
+
+    _report_regressions(results, baseline, tolerance, memory_tolerance, "the baseline")
+    return results
+
+
+def run_suite(compare: Optional[str] = None,
+              tolerance: float = DEFAULT_TOLERANCE,
+              memory_tolerance: Optional[float] = None,
+              repeat: int = 3) -> List[BenchmarkResult]:
+    """
+    Run the fixed benchmark suite and store its results under the current git commit.
+
+    The suite covers ingest, normalize_dataframe (normalize and dedupe) and
+    parquet writing for each dataset shape, plus docs and asset generation
+    for every configured dataset. Uncommitted changes to tracked files are
+    stored under '<commit>-dirty', so they never overwrite a commit's results.
+
+    Args:
+        compare: Git revision to compare against; an empty string picks the
+            nearest commit in HEAD's history with stored results, None skips
+            the comparison
+        tolerance: Allowed relative throughput drop before failing
+        memory_tolerance: Allowed relative memory growth (defaults to tolerance)
+        repeat: Runs per benchmark; the best reading of each stage is kept
+
+    Returns:
+        All benchmark results
+
+    Exits with status 1 if a stage regressed beyond the tolerances, or if the
+    requested revision has no stored results.
+    """
+    results_dir = _benchmarks_dir() / "results"
+    commit = current_commit() or "unversioned"
+
+    # Resolve what to compare against before this run stores its own results
+    base_commit, baseline = None, {}
+    if compare is not None:
+        base_commit = find_commit_results(results_dir, compare or None, exclude=commit)
+        if base_commit:
+            baseline = load_baseline(commit_results_path(results_dir, base_commit))
+        elif compare:
+            printer.error(f"No stored benchmark results for '{compare}'")
+            printer.guide("Store results for that revision first", [
+                f"git checkout {compare}",
+                "meddata bench",
+            ])
+            sys.exit(1)
+
+    benchmarks = [
+        (f"{kind}-{SUITE_ROWS}-csv", run_pipeline_benchmark,
+         ensure_source(kind, SUITE_ROWS, _benchmarks_dir() / "data", "csv"))
+        for kind in PROFILES
+    ]
+    benchmarks += [
+        (f"docs-x{SUITE_DOCS_ITERATIONS}", run_docs_benchmark, SUITE_DOCS_ITERATIONS),
+        (f"assets-x{SUITE_ASSETS_ITERATIONS}", run_assets_benchmark, SUITE_ASSETS_ITERATIONS),
+    ]
+
+    results: List[BenchmarkResult] = []
+    for name, benchmark, argument in benchmarks:
+        printer.header(f"Benchmarking {name}")
+        runs = [run_isolated(benchmark, argument, name) for _ in range(max(1, repeat))]
+        results.extend(best_of(runs))
+
+    printer.table(RESULT_COLUMNS, result_rows(results, baseline), title=f"Benchmark suite at {commit[:12]}")
+
+    results_path = commit_results_path(results_dir, commit)
+    save_baseline(results_path, results, commit=commit)
+    printer.print(f"Results saved to [path]{results_path}[/path]")
+
+    if compare is None:
+        return results
+    if not base_commit:
+        printer.guide("Nothing to compare against", [
+            "Run 'meddata bench' on an earlier commit to store its results",
+            "Then run 'meddata bench --compare' again",
+        ])
+        return results
+
+    _report_regressions(results, baseline, tolerance, memory_tolerance, f"commit {base_commit[:12]}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark dataset processing on synthetic data")
+    parser.add_argument("--kinds", nargs="+", choices=list(PROFILES), help="Dataset shapes to benchmark")
+    parser.add_argument("--sizes", nargs="+", type=int,
+                        help=f"Source sizes in rows, 1K to 5M (default: {' '.join(map(str, DEFAULT_SIZES))})")
+    parser.add_argument("--format", dest="file_format", choices=["csv", "parquet"], default="csv",
+                        help="Format of the synthetic sources")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic data")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed throughput drop vs. the baseline (0.25 = 25%%)")
+    parser.add_argument("--memory-tolerance", type=float, default=None,
+                        help="Allowed peak memory growth vs. the baseline (defaults to --tolerance)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark; the best of them is reported")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--suite", action="store_true",
+                        help="Run the fixed benchmark suite and store its results under the git commit")
+    parser.add_argument("--compare", nargs="?", const="", default=None, metavar="REF",
+                        help="With --suite: compare against the stored results of REF "
+                             "(default: the nearest earlier commit with results)")
+
+    args = parser.parse_args()
+    if args.suite:
+        run_suite(args.compare, args.tolerance, args.memory_tolerance, args.repeat)
+    else:
+        run_benchmarks(args.kinds, args.sizes, args.file_format, args.seed, args.tolerance, args.save_baseline,
+                       args.repeat, args.memory_tolerance)
@@ -2,164 +2,356 @@
 """
 MedData Generate Assets Script - Generates visual assets for datasets.
 
-This script creates SVG logos and other visual assets for datasets based on 
+This script creates SVG logos and other visual assets for datasets based on
 their configuration. It handles logo generation with customizable colors,
 text, and shapes, as well as favicon and main logo generation.
+
+Every generated file is fingerprinted by the template and the settings it is
+rendered from; fingerprints are kept under ``.meddata/assets``, and only the
+files whose fingerprint changed (or that are missing) are regenerated, on a
+thread pool. Regenerated SVGs are rendered to PNG at several sizes (and the
+favicon to ICO) by the rasterizer, which caches renders by content hash. A
+run in which nothing changed writes nothing.
 """
 from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 from string import Template
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+# Ensure project root is on PYTHONPATH when script executed directly
+project_root = Path(__file__).resolve().parents[1]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
-import yaml
 from scripts.utils.printer import printer
 from scripts.utils.config_manager import config_manager
+from scripts.utils.catalog import dataset_catalog
+from scripts.utils.file_writer import file_writer
+from scripts.utils.rasterizer import RasterJob, RasterizeError, prune_cache, rasterize
+
+__all__ = ["load_dataset_config", "logo_variables", "asset_fingerprint", "generate_svg_logo",
+           "generate_favicon", "generate_logo", "raster_jobs", "main"]
+
+# Default number of threads rendering logos
+ASSETS_WORKERS = 8
 
-__all__ = ["load_dataset_config", "generate_svg_logo", "generate_favicon",
-           "generate_logo", "main"]
+# Fingerprints of the generated files, in the cache directory
+FINGERPRINTS_FILE = "fingerprints.json"
+
+# Pixel sizes of the PNG renders of every SVG (social cards, Hugging Face thumbnails)
+RASTER_SIZES = (64, 128, 256, 512)
+
+# Pixel sizes held by favicon.ico
+FAVICON_SIZES = (16, 32, 48)
 
 
 def load_dataset_config(dataset_id: str) -> Dict[str, Any]:
     """
     Load dataset configuration from YAML file.
-    
+
     Args:
         dataset_id: ID of the dataset to load
-        
+
     Returns:
         Dictionary containing the dataset configuration
-        
+
     Raises:
         FileNotFoundError: If the configuration file doesn't exist
         yaml.YAMLError: If the configuration file is not valid YAML
+        ConfigValidationError: If the configuration doesn't match the dataset schema
     """
-    config_path = config_manager.paths.datasets_dir / f"{dataset_id}.yml"
-    with open(config_path, 'r', encoding='utf-8') as file:
-        return yaml.safe_load(file)
+    return dataset_catalog.load(dataset_id)
 
 
-def generate_svg_logo(dataset_config: Dict[str, Any]) -> str:
+def _templates_dir() -> Path:
+    return config_manager.paths.project_root / "assets" / "templates"
+
+
+def _images_dir() -> Path:
+    return config_manager.paths.project_root / "assets" / "images"
+
+
+def _report(changed: bool, kind: str, path: Path) -> None:
+    """Report a generated asset, or that it was already up to date."""
+    if changed:
+        printer.success(f"Generated {kind}: {path}")
+    else:
+        printer.print(f"Unchanged {kind}: [path]{path}[/path]")
+
+
+def logo_variables(dataset_config: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Template variables of a dataset's logo.
+
+    Args:
+        dataset_config: Dictionary containing the dataset configuration
+
+    Returns:
+        Values for the placeholders of the logo template
+    """
+    dataset_id = dataset_config['id']
+    logo = dataset_config.get('logo', {})
+    return {
+        "DATASET_ID": dataset_id,
+        "LOGO_TEXT": logo.get('text', dataset_id[0].upper()),
+        "BACKGROUND_SHAPE": logo.get('background', 'circle'),
+        "PRIMARY_COLOR": logo.get('colors', {}).get('primary', '#6366f1'),
+        "SECONDARY_COLOR": logo.get('colors', {}).get('secondary', '#14b8a6'),
+    }
+
+
+def asset_fingerprint(template: str, variables: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Fingerprint of a generated asset.
+
+    Args:
+        template: Text of the template the asset is rendered from
+        variables: Values substituted into the template
+
+    Returns:
+        Hex digest covering the template and the variables
+    """
+    digest = hashlib.sha256(template.encode("utf-8"))
+    digest.update(b"\0" + json.dumps(variables or {}, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _fingerprints_path() -> Path:
+    return config_manager.paths.cache_dir / "assets" / FINGERPRINTS_FILE
+
+
+def _raster_cache_dir() -> Path:
+    return config_manager.paths.cache_dir / "raster"
+
+
+def _load_fingerprints() -> Dict[str, str]:
+    """Load stored fingerprints, ignoring a missing or corrupt file."""
+    try:
+        with open(_fingerprints_path(), 'r', encoding='utf-8') as file:
+            fingerprints = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return fingerprints if isinstance(fingerprints, dict) else {}
+
+
+def generate_svg_logo(dataset_config: Dict[str, Any], template: Optional[str] = None) -> str:
     """
     Generate SVG logo from template and dataset configuration.
-    
+
     Args:
         dataset_config: Dictionary containing the dataset configuration
-        
+        template: Text of the logo template (read from assets/templates if not given)
+
     Returns:
         Path to the generated SVG logo file
-        
+
     Raises:
         FileNotFoundError: If the template file doesn't exist
         KeyError: If required fields are missing from the configuration
     """
     # Load SVG template
-    template_path = config_manager.paths.project_root / "assets" / "templates" / "dataset-logo.svg"
-    with open(template_path, 'r', encoding='utf-8') as file:
-        template = Template(file.read())
-
-    # Extract configuration
-    dataset_id = dataset_config['id']
-    text = dataset_config.get('logo', {}).get('text', dataset_id[0].upper())
-    background = dataset_config.get('logo', {}).get('background', 'circle')
-    primary_color = dataset_config.get('logo', {}).get('colors', {}).get('primary', '#6366f1')
-    secondary_color = dataset_config.get('logo', {}).get('colors', {}).get('secondary', '#14b8a6')
+    if template is None:
+        template = (_templates_dir() / "dataset-logo.svg").read_text(encoding='utf-8')
 
     # Generate SVG content
-    svg_content = template.substitute(
-        DATASET_ID=dataset_id,
-        LOGO_TEXT=text,
-        BACKGROUND_SHAPE=background,
-        PRIMARY_COLOR=primary_color,
-        SECONDARY_COLOR=secondary_color
-    )
+    svg_content = Template(template).substitute(**logo_variables(dataset_config))
 
     # Write SVG file
-    output_dir = config_manager.paths.project_root / "assets" / "images"
-    output_dir.mkdir(exist_ok=True, parents=True)
-    output_path = output_dir / f"{dataset_id}-logo.svg"
-    with open(output_path, 'w', encoding='utf-8') as file:
-        file.write(svg_content)
-
-    printer.success(f"Generated logo: {output_path}")
+    output_path = _images_dir() / f"{dataset_config['id']}-logo.svg"
+    _report(file_writer.write(output_path, svg_content), "logo", output_path)
     return str(output_path)
 
 
 def generate_favicon() -> str:
     """
     Generate favicon from template.
-    
+
     Returns:
         Path to the generated favicon file
-        
+
     Raises:
         FileNotFoundError: If the template file doesn't exist
     """
-    template_path = config_manager.paths.project_root / "assets" / "templates" / "favicon.svg"
-    output_path = config_manager.paths.project_root / "assets" / "images" / "favicon.svg"
-
-    with open(template_path, 'r', encoding='utf-8') as file:
-        content = file.read()
+    template_path = _templates_dir() / "favicon.svg"
+    output_path = _images_dir() / "favicon.svg"
 
-    with open(output_path, 'w', encoding='utf-8') as file:
-        file.write(content)
-
-    printer.success(f"Generated favicon: {output_path}")
+    _report(file_writer.copy(template_path, output_path), "favicon", output_path)
     return str(output_path)
 
 
 def generate_logo() -> str:
     """
     Generate main logo.
-    
+
     Returns:
         Path to the generated logo file
-        
+
     Raises:
         FileNotFoundError: If the template file doesn't exist
     """
     # For simplicity, we'll use a copy of the favicon for the main logo
-    template_path = config_manager.paths.project_root / "assets" / "templates" / "favicon.svg"
-    output_path = config_manager.paths.project_root / "assets" / "images" / "logo.svg"
+    template_path = _templates_dir() / "favicon.svg"
+    output_path = _images_dir() / "logo.svg"
 
-    with open(template_path, 'r', encoding='utf-8') as file:
-        content = file.read()
+    _report(file_writer.copy(template_path, output_path), "logo", output_path)
+    return str(output_path)
 
-    with open(output_path, 'w', encoding='utf-8') as file:
-        file.write(content)
 
-    printer.success(f"Generated logo: {output_path}")
-    return str(output_path)
+def raster_jobs(name: str) -> List[RasterJob]:
+    """
+    PNG renders of an SVG asset, plus favicon.ico for the favicon.
+
+    Args:
+        name: File name of the SVG in assets/images
+
+    Returns:
+        One job per PNG size (written to assets/images/png/<stem>-<size>.png)
+        and, for favicon.svg, one for the multi-size ICO
+    """
+    images_dir = _images_dir()
+    source = images_dir / name
+    jobs = [RasterJob(source, images_dir / "png" / f"{Path(name).stem}-{size}.png", (size,))
+            for size in RASTER_SIZES]
+    if name == "favicon.svg":
+        jobs.append(RasterJob(source, images_dir / "favicon.ico", FAVICON_SIZES))
+    return jobs
 
 
-def main() -> None:
+def main(dataset_ids: Optional[List[str]] = None, workers: Optional[int] = None,
+         force: bool = False, raster: bool = True) -> Dict[str, str]:
     """
     Main execution function.
-    
-    Generates assets for all datasets found in the _datasets directory,
-    including dataset logos, favicon, and main logo.
+
+    Generates the logos of the given datasets, or of all datasets found in
+    the _datasets directory plus the favicon and main logo, and renders them
+    to PNG (and the favicon to ICO). Files whose fingerprint is unchanged
+    since they were last generated are skipped.
+
+    Args:
+        dataset_ids: Datasets to generate logos for (defaults to all, with the site logos)
+        workers: Worker threads (defaults to ASSETS_WORKERS)
+        force: Regenerate every file regardless of its fingerprint
+        raster: Whether to render PNG and ICO files of the SVGs
+
+    Returns:
+        Mapping of generated file name to its fingerprint, for the files
+        regenerated by this run
+
+    Exits with status 1 if a requested dataset can't be loaded or any asset
+    fails to generate or render; the assets that succeeded are kept.
     """
     printer.header("Generating assets...")
 
-    # Ensure output directory exists
-    output_dir = config_manager.paths.project_root / "assets" / "images"
-    output_dir.mkdir(exist_ok=True, parents=True)
+    # Select dataset logos
+    configs: Dict[str, Dict[str, Any]] = {}
+    failures: List[str] = []
+    if dataset_ids is None:
+        problems = dataset_catalog.validate()
+        if problems:
+            printer.config_errors(problems)
+            printer.warning(f"Skipping {len(problems)} datasets with invalid configuration")
+        configs = dict(dataset_catalog.items())
+    else:
+        for dataset_id in dataset_ids:
+            try:
+                configs[dataset_id] = load_dataset_config(dataset_id)
+            except (Exception, SystemExit) as e:
+                printer.error(f"Error processing {dataset_id}", e)
+                failures.append(dataset_id)
+
+    logo_template = (_templates_dir() / "dataset-logo.svg").read_text(encoding='utf-8')
+    tasks: Dict[str, Tuple[str, Callable[[], str]]] = {
+        f"{dataset_id}-logo.svg": (
+            asset_fingerprint(logo_template, logo_variables(config)),
+            lambda config=config: generate_svg_logo(config, logo_template))
+        for dataset_id, config in configs.items()
+    }
+
+    # The favicon and main logo are copies of the favicon template
+    if dataset_ids is None:
+        favicon_fingerprint = asset_fingerprint((_templates_dir() / "favicon.svg").read_text(encoding='utf-8'))
+        tasks["favicon.svg"] = (favicon_fingerprint, generate_favicon)
+        tasks["logo.svg"] = (favicon_fingerprint, generate_logo)
+
+    # Regenerate only files that are missing or whose inputs changed
+    fingerprints = _load_fingerprints()
+    images_dir = _images_dir()
+    stale = {name: task for name, task in tasks.items()
+             if force or fingerprints.get(name) != task[0] or not (images_dir / name).exists()}
 
-    # Generate dataset logos
-    datasets_processed = 0
-    for config_file in config_manager.paths.datasets_dir.glob("*.yml"):
-        dataset_id = config_file.stem  # Remove .yml extension
-        try:
-            config = load_dataset_config(dataset_id)
-            generate_svg_logo(config)
-            datasets_processed += 1
-        except Exception as e:
-            printer.error(f"Error processing {dataset_id}", e)
+    generated: Dict[str, str] = {}
+    with file_writer.track() as written:
+        if stale:
+            with ThreadPoolExecutor(max_workers=min(workers or ASSETS_WORKERS, len(stale))) as pool:
+                futures = {pool.submit(file_writer.bind(generator)): (name, fingerprint)
+                           for name, (fingerprint, generator) in stale.items()}
+                for future in as_completed(futures):
+                    name, fingerprint = futures[future]
+                    try:
+                        future.result()
+                        generated[name] = fingerprint
+                    except Exception as e:
+                        printer.error(f"Error generating {name}", e)
+                        failures.append(name)
 
-    # Generate favicon and main logo
-    generate_favicon()
-    generate_logo()
+        # Render every SVG that exists; unchanged ones come from the cache and leave their
+        # renders alone, while renders left stale by a --no-raster run are rewritten
+        jobs = [job for name in tasks if name in generated or name not in stale
+                for job in raster_jobs(name)] if raster else []
+        if jobs:
+            try:
+                rendered = rasterize(jobs, cache_dir=_raster_cache_dir())
+            except RasterizeError as e:
+                rendered = e.results
+                # Keep the old fingerprints of the failing SVGs so the next run renders them again
+                for job in jobs:
+                    if job.target in e.failures:
+                        printer.error(f"Error rendering {job.target.name}", e.failures[job.target])
+                        failures.append(job.target.name)
+                        generated.pop(job.source.name, None)
+            except Exception as e:
+                printer.error("Error rasterizing assets", e)
+                rendered = {}
+                failures.append("PNG/ICO renders")
+                for job in jobs:
+                    generated.pop(job.source.name, None)
+            if rendered:
+                printer.print(f"Rasterized {len(rendered)} images ({sum(rendered.values())} rendered, "
+                              f"{len(rendered) - sum(rendered.values())} from cache)")
 
-    printer.success(f"Asset generation complete! Processed {datasets_processed} datasets.")
+        # A full run knows every live render; drop cached renders of old logo versions
+        if raster and dataset_ids is None and not failures:
+            removed = prune_cache([job for name in tasks for job in raster_jobs(name)], _raster_cache_dir())
+            if removed:
+                printer.print(f"Removed {removed} stale cached renders")
+
+    if generated:
+        fingerprints.update(generated)
+        file_writer.write(_fingerprints_path(), json.dumps(fingerprints, indent=2, sort_keys=True) + "\n",
+                          report=False)
+
+    if failures:
+        printer.error(f"Asset generation failed for: {', '.join(sorted(failures))}")
+        sys.exit(1)
+
+    printer.success(f"Asset generation complete! Regenerated {len(generated)} of {len(tasks)} assets "
+                    f"for {len(configs)} datasets ({written}).")
+    return generated
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Generate logos and site icons for datasets")
+    parser.add_argument("ids", nargs="*", help="Dataset IDs (default: every dataset and the site logos)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Worker threads rendering logos")
+    parser.add_argument("--force", action="store_true", help="Regenerate assets even if they are up to date")
+    parser.add_argument("--no-raster", dest="raster", action="store_false",
+                        help="Only generate SVGs, without PNG and ICO renders")
+    args = parser.parse_args()
+
+    main(args.ids or None, args.jobs, args.force, args.raster)
@@ -8,19 +8,54 @@
 """
 from __future__ import annotations
 
+import argparse
+import json
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from string import Template
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List, Optional
+
+# Ensure project root is on PYTHONPATH when script executed directly
+project_root = Path(__file__).resolve().parents[1]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
-import yaml
 from scripts.utils.printer import printer
 from scripts.utils.config_manager import config_manager
+from scripts.utils.catalog import dataset_catalog
+from scripts.utils.dataset_schema import ConfigValidationError
+from scripts.utils.dataset_stats import STATS_FILE, format_count, load_stats, size_category as size_category_of
+from scripts.utils.file_writer import file_writer
+from scripts.utils.manifest import load_manifest
+from scripts.utils.metrics import format_bytes
+from scripts.utils.parquet_footer import ParquetFooter, ParquetFooterError, parse_count, read_footer
+from scripts.utils.profiler import load_profile
+from scripts.utils.templates import template_renderer
 
 __all__ = ["load_dataset_config", "ensure_templates_exist", "generate_readme",
+           "format_column_profiles", "describe_fields", "describe_splits", "describe_instances",
            "generate_dataset_card", "generate_citation", "generate_license",
-           "generate_dataset_docs"]
+           "generate_dataset_docs", "generate_all_docs"]
+
+# Worker threads for generating the documentation of several datasets
+DOCS_WORKERS = 8
+
+# Example rows shown under Data Instances, and the characters kept of each text value
+EXAMPLE_ROWS = 3
+EXAMPLE_TEXT_LENGTH = 200
+
+# Read buffer for streaming the example rows, so only the first pages of each column are read
+EXAMPLE_READ_BUFFER = 64 * 1024
+
+# Sections added to the templates since they were first created: template name to
+# (variable the section renders, section text, heading it is inserted before)
+TEMPLATE_SECTIONS = {
+    "dataset-card.md.template": [
+        ("column_profiles", "#### Column Profiles\n\n{{ column_profiles }}\n\n", "#### Data Splits"),
+    ],
+}
 
 
 def load_dataset_config(dataset_id: str) -> Dict[str, Any]:
@@ -42,8 +77,11 @@ def load_dataset_config(dataset_id: str) -> Dict[str, Any]:
         printer.error(f"Dataset configuration not found: {config_path}")
         sys.exit(1)
 
-    with open(config_path, 'r') as file:
-        return yaml.safe_load(file)
+    try:
+        return dataset_catalog.load(dataset_id)
+    except ConfigValidationError as e:
+        printer.config_errors({dataset_id: e.errors})
+        sys.exit(1)
 
 
 def ensure_templates_exist() -> None:
@@ -51,7 +89,8 @@ def ensure_templates_exist() -> None:
     Create documentation templates if they don't exist.
     
     Generates standard templates for README, dataset card, and citation files
-    if they don't already exist.
+    if they don't already exist, and adds sections introduced since to
+    templates created by an earlier version (see TEMPLATE_SECTIONS).
     """
     config_manager.paths.templates_dir.mkdir(exist_ok=True, parents=True)
 
@@ -154,6 +193,10 @@ def ensure_templates_exist() -> None:
 
 {{ data_fields }}
 
+#### Column Profiles
+
+{{ column_profiles }}
+
 #### Data Splits
 
 {{ data_splits }}
@@ -201,6 +244,58 @@ def ensure_templates_exist() -> None:
             with open(template_path, 'w') as file:
                 file.write(content)
             printer.success(f"Created template: {template_path}")
+        else:
+            _add_template_sections(template_path)
+
+
+def _add_template_sections(template_path: Path) -> None:
+    """
+    Insert the sections of TEMPLATE_SECTIONS that an existing template lacks.
+
+    Each section goes before its heading, or at the end if the template no
+    longer has that heading. Templates that already render the section's
+    variable are left alone, so local edits are kept.
+
+    Args:
+        template_path: Existing template file
+    """
+    content = template_path.read_text(encoding='utf-8')
+    added = []
+    for variable, section, before in TEMPLATE_SECTIONS.get(template_path.name, []):
+        if re.search(r"{{\s*" + variable + r"\b", content):
+            continue
+        position = content.find(before)
+        if position < 0:
+            content = content.rstrip("\n") + "\n\n" + section.rstrip("\n") + "\n"
+        else:
+            content = content[:position] + section + content[position:]
+        added.append(variable)
+
+    if added:
+        file_writer.write(template_path, content)
+        printer.success(f"Updated template {template_path} with: {', '.join(added)}")
+
+
+def data_updated(dataset_id: str) -> str:
+    """
+    Date the dataset's processed data was last written.
+
+    Taken from the processed files rather than the clock, so regenerating the
+    docs on another day leaves the README unchanged.
+
+    Args:
+        dataset_id: ID of the dataset
+
+    Returns:
+        Date as YYYY-MM-DD, or "Unknown" if the dataset was never processed
+    """
+    dataset_dir = config_manager.paths.processed_data_dir / dataset_id
+    for name in ("data.parquet", STATS_FILE):
+        try:
+            return datetime.fromtimestamp((dataset_dir / name).stat().st_mtime).strftime("%Y-%m-%d")
+        except OSError:
+            continue
+    return "Unknown"
 
 
 def generate_readme(dataset_id: str, config: Dict[str, Any]) -> Path:
@@ -216,11 +311,6 @@ def generate_readme(dataset_id: str, config: Dict[str, Any]) -> Path:
     """
     printer.header(f"Generating README for {dataset_id}...")
 
-    # Load template
-    template_path = config_manager.paths.templates_dir / "dataset-readme.md.template"
-    with open(template_path, 'r') as file:
-        template = Template(file.read())
-
     # Find Hugging Face and GitHub URLs
     huggingface_url = ""
     github_url = ""
@@ -233,11 +323,15 @@ def generate_readme(dataset_id: str, config: Dict[str, Any]) -> Path:
         elif pub['platform'] == 'github':
             github_url = pub.get('url', f"https://github.com/{pub['repository']}")
 
-    # Prepare template variables
+    # Prepare template variables, preferring the stats computed when the dataset was processed
     size_value = "Unknown"
-    for stat in config.get('stats', []):
-        if stat['label'].lower() in ['articles', 'items', 'entries']:
-            size_value = stat['value']
+    dataset_stats = load_stats(dataset_id)
+    if dataset_stats:
+        size_value = format_count(dataset_stats['rows'])
+    else:
+        for stat in config.get('stats', []):
+            if stat['label'].lower() in ['articles', 'items', 'entries']:
+                size_value = stat['value']
 
     variables = {
         'name': config['name'],
@@ -248,7 +342,7 @@ def generate_readme(dataset_id: str, config: Dict[str, Any]) -> Path:
         'stats': {
             'size': size_value,
             'format': 'Parquet/CSV',
-            'updated': datetime.now().strftime("%Y-%m-%d")
+            'updated': data_updated(dataset_id)
         },
         'features': config.get('features', []),
         'citation': 'Please see CITATION.cff file',
@@ -256,24 +350,152 @@ def generate_readme(dataset_id: str, config: Dict[str, Any]) -> Path:
     }
 
     # Generate README content
-    try:
-        content = template.substitute(**variables)
-    except KeyError as e:
-        printer.warning(f"Missing template variable: {e}")
-        content = template.safe_substitute(**variables)
+    content = template_renderer.render("dataset-readme.md.template", variables)
 
     # Write README file
     output_dir = config_manager.paths.docs_dir / dataset_id
     output_dir.mkdir(exist_ok=True, parents=True)
     output_path = output_dir / "README.md"
 
-    with open(output_path, 'w') as file:
-        file.write(content)
-
-    printer.success(f"Generated README: {output_path}")
+    if file_writer.write(output_path, content):
+        printer.success(f"Generated README: {output_path}")
+    else:
+        printer.print(f"Unchanged README: [path]{output_path}[/path]")
     return output_path
 
 
+def _format_number(value: float) -> str:
+    """Format a profiled number compactly (thousands separators, 3 significant digits below 1,000)."""
+    if abs(value) >= 1000:
+        return f"{value:,.0f}"
+    return f"{value:.3g}"
+
+
+def format_column_profiles(profile: Optional[Dict[str, Any]], dataset_id: str) -> str:
+    """
+    Render column profiles as a Markdown table for the dataset card.
+
+    Args:
+        profile: Profile written when the dataset was processed (None if missing)
+        dataset_id: ID of the dataset
+
+    Returns:
+        Markdown table, or a note on how to compute the profiles
+    """
+    if not profile:
+        return ("Column profiles are computed when the dataset is processed "
+                f"(`python meddata.py process {dataset_id}`).")
+
+    lines = [
+        "| Column | Type | Nulls | Distinct (approx.) | Summary |",
+        "|--------|------|-------|--------------------|---------|",
+    ]
+    for column in profile['columns']:
+        rows = column.get('rows') or 0
+        nulls = f"{column.get('nulls', 0) / rows:.1%}" if rows else "n/a"
+        if 'quantiles' in column:
+            quantiles = column['quantiles']
+            summary = (f"median {_format_number(quantiles['p50'])}, p90 {_format_number(quantiles['p90'])}, "
+                       f"max {_format_number(column['max'])}")
+        elif column.get('top') and column.get('distinct', 0) * 10 <= column.get('items', rows):
+            # Only categorical columns (few distinct values) get their top values
+            summary = "top: " + ", ".join(f"{item['value']} ({item['count']:,})" for item in column['top'][:3])
+        else:
+            summary = ""
+        summary = summary.replace("|", "\\|")
+        lines.append(f"| `{column['name']}` | {column.get('type') or ''} | {nulls} | "
+                     f"{column.get('distinct', 0):,} | {summary} |")
+    return "\n".join(lines)
+
+
+def describe_fields(footer: ParquetFooter, config: Dict[str, Any]) -> str:
+    """
+    Render the processed file's columns as a Markdown table for the dataset card.
+
+    Args:
+        footer: Footer of the processed file
+        config: Dataset configuration dictionary (for field descriptions)
+
+    Returns:
+        Markdown table of field names, types and descriptions
+    """
+    schema = config.get('dataset_details', {}).get('schema', [])
+    descriptions = {field['name']: field.get('description', '') for field in schema}
+    lines = [
+        "| Field | Type | Description |",
+        "|-------|------|-------------|",
+    ]
+    for name, dtype in footer.columns.items():
+        description = str(descriptions.get(name, '')).replace("|", "\\|")
+        lines.append(f"| `{name}` | {dtype} | {description} |")
+    return "\n".join(lines)
+
+
+def describe_splits(dataset_id: str, footer: ParquetFooter) -> str:
+    """
+    Render the dataset's splits as a Markdown table for the dataset card.
+
+    The processed file is published as a single train split. Its size comes
+    from the manifest of the last GitHub publish when there is one (the size
+    users download), otherwise from the local file.
+
+    Args:
+        dataset_id: ID of the dataset
+        footer: Footer of the processed file
+
+    Returns:
+        Markdown table of split names, rows and sizes
+    """
+    manifest_path = config_manager.paths.cache_dir / "publish" / dataset_id / "github" / "manifest.json"
+    entry = load_manifest(manifest_path).get('files', {}).get(f"data/{footer.path.name}")
+    size = entry['size'] if entry else footer.size
+    return "\n".join([
+        "| Split | Rows | Size |",
+        "|-------|------|------|",
+        f"| train | {footer.num_rows:,} | {format_bytes(size)} |",
+    ])
+
+
+def _truncate(value: Any) -> Any:
+    """Shorten long text values for display."""
+    if isinstance(value, str) and len(value) > EXAMPLE_TEXT_LENGTH:
+        return value[:EXAMPLE_TEXT_LENGTH].rstrip() + "..."
+    if isinstance(value, list):
+        return [_truncate(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _truncate(item) for key, item in value.items()}
+    return value
+
+
+def describe_instances(footer: ParquetFooter, rows: int = EXAMPLE_ROWS) -> str:
+    """
+    Render the first rows of the processed file as JSON examples.
+
+    Only the first batch of the first row group is decoded, through a small
+    read buffer, so the cost doesn't grow with the size of the dataset.
+
+    Args:
+        footer: Footer of the processed file
+        rows: Number of example rows
+
+    Returns:
+        Markdown with the example rows in a JSON code block
+    """
+    import pyarrow.parquet as pq
+
+    if not footer.num_rows:
+        return "The dataset has no rows."
+
+    # Closed right away, as the docs of many datasets are generated on a shared thread pool
+    with pq.ParquetFile(footer.path, buffer_size=EXAMPLE_READ_BUFFER, pre_buffer=False) as parquet_file:
+        batch = next(parquet_file.iter_batches(batch_size=rows, row_groups=[0]))
+    examples: List[Dict[str, Any]] = [_truncate(row) for row in batch.to_pylist()[:rows]]
+    content = json.dumps(examples[0] if len(examples) == 1 else examples, indent=2, ensure_ascii=False,
+                         default=str)
+    return (f"Example{'s' if len(examples) > 1 else ''} from the processed data "
+            f"(text shortened to {EXAMPLE_TEXT_LENGTH} characters):\n\n```json\n{content}\n```")
+
+
 def generate_dataset_card(dataset_id: str, config: Dict[str, Any]) -> Path:
     """
     Generate dataset card for Hugging Face.
@@ -287,32 +509,16 @@ def generate_dataset_card(dataset_id: str, config: Dict[str, Any]) -> Path:
     """
     printer.header(f"Generating dataset card for {dataset_id}...")
 
-    # Load template
-    template_path = config_manager.paths.templates_dir / "dataset-card.md.template"
-    with open(template_path, 'r') as file:
-        template = Template(file.read())
-
-    # Determine size category
+    # Determine size category from the processed data, falling back to the configured stats
     size_category = "unknown"
-    for stat in config.get('stats', []):
-        if stat['label'].lower() in ['articles', 'items', 'entries']:
-            size_value = stat['value']
-            if isinstance(size_value, str):
-                if "k+" in size_value.lower() or "thousand" in size_value.lower():
-                    size_category = "10K<n<100K"
-                elif "100k+" in size_value.lower():
-                    size_category = "100K<n<1M"
-                elif "m+" in size_value.lower() or "million" in size_value.lower():
-                    size_category = "1M<n<10M"
-            elif isinstance(size_value, int):
-                if size_value < 10000:
-                    size_category = "n<10K"
-                elif size_value < 100000:
-                    size_category = "10K<n<100K"
-                elif size_value < 1000000:
-                    size_category = "100K<n<1M"
-                else:
-                    size_category = "1M<n<10M"
+    dataset_stats = load_stats(dataset_id)
+    if dataset_stats:
+        size_category = dataset_stats['size_category']
+    else:
+        for stat in config.get('stats', []):
+            parsed = parse_count(stat['value'])
+            if stat['label'].lower() in ['articles', 'items', 'entries'] and parsed:
+                size_category = size_category_of(parsed[0])
 
     # Find repository URL
     repository_url = ""
@@ -321,6 +527,22 @@ def generate_dataset_card(dataset_id: str, config: Dict[str, Any]) -> Path:
             repository_url = pub.get('url', f"https://huggingface.co/datasets/{pub['repository']}")
             break
 
+    # Describe the data from the processed file's footer and first rows, never the whole file
+    data_instances = 'Each instance represents an article with its content and associated metadata.'
+    data_fields = 'The dataset includes fields such as title, content, author, and publication date.'
+    data_splits = 'The dataset is provided as a single train split.'
+    parquet_path = config_manager.paths.processed_data_dir / dataset_id / "data.parquet"
+    try:
+        footer = read_footer(parquet_path)
+    except FileNotFoundError:
+        printer.warning(f"{parquet_path} not found; process the dataset to describe its fields and splits")
+    except ParquetFooterError as e:
+        printer.warning(f"Cannot describe the processed data: {e}")
+    else:
+        data_fields = describe_fields(footer, config)
+        data_splits = describe_splits(dataset_id, footer)
+        data_instances = describe_instances(footer)
+
     # Prepare template variables
     variables = {
         'name': config['name'],
@@ -330,9 +552,10 @@ def generate_dataset_card(dataset_id: str, config: Dict[str, Any]) -> Path:
         'contact': 'Alaamer',
         'tasks': 'This dataset is suitable for text classification, topic analysis, content analysis, and text generation tasks.',
         'structure': 'The dataset contains the full text of articles along with metadata.',
-        'data_instances': 'Each instance represents an article with its content and associated metadata.',
-        'data_fields': 'The dataset includes fields such as title, content, author, and publication date.',
-        'data_splits': 'The dataset is provided as a single train split.',
+        'data_instances': data_instances,
+        'data_fields': data_fields,
+        'column_profiles': format_column_profiles(load_profile(dataset_id), dataset_id),
+        'data_splits': data_splits,
         'dataset_creation': 'The dataset was collected from public web sources and processed for research purposes.',
         'considerations': 'The dataset contains publicly available content. Users should respect copyright and terms of use.',
         'citation': 'Please see the citation information in the CITATION.cff file.',
@@ -340,21 +563,17 @@ def generate_dataset_card(dataset_id: str, config: Dict[str, Any]) -> Path:
     }
 
     # Generate dataset card content
-    try:
-        content = template.substitute(**variables)
-    except KeyError as e:
-        printer.warning(f"Missing template variable: {e}")
-        content = template.safe_substitute(**variables)
+    content = template_renderer.render("dataset-card.md.template", variables)
 
     # Write dataset card file
     output_dir = config_manager.paths.docs_dir / dataset_id
     output_dir.mkdir(exist_ok=True, parents=True)
     output_path = output_dir / "dataset-card.md"
 
-    with open(output_path, 'w') as file:
-        file.write(content)
-
-    printer.success(f"Generated dataset card: {output_path}")
+    if file_writer.write(output_path, content):
+        printer.success(f"Generated dataset card: {output_path}")
+    else:
+        printer.print(f"Unchanged dataset card: [path]{output_path}[/path]")
     return output_path
 
 
@@ -371,11 +590,6 @@ def generate_citation(dataset_id: str, config: Dict[str, Any]) -> Path:
     """
     printer.header(f"Generating citation for {dataset_id}...")
 
-    # Load template
-    template_path = config_manager.paths.templates_dir / "citation.cff.template"
-    with open(template_path, 'r') as file:
-        template = Template(file.read())
-
     # Find repository URL
     repository_url = ""
     for pub in config.get('publishing', []):
@@ -401,21 +615,17 @@ def generate_citation(dataset_id: str, config: Dict[str, Any]) -> Path:
     }
 
     # Generate citation content
-    try:
-        content = template.substitute(**variables)
-    except KeyError as e:
-        printer.warning(f"Missing template variable: {e}")
-        content = template.safe_substitute(**variables)
+    content = template_renderer.render("citation.cff.template", variables)
 
     # Write citation file
     output_dir = config_manager.paths.docs_dir / dataset_id
     output_dir.mkdir(exist_ok=True, parents=True)
     output_path = output_dir / "CITATION.cff"
 
-    with open(output_path, 'w') as file:
-        file.write(content)
-
-    printer.success(f"Generated citation: {output_path}")
+    if file_writer.write(output_path, content):
+        printer.success(f"Generated citation: {output_path}")
+    else:
+        printer.print(f"Unchanged citation: [path]{output_path}[/path]")
     return output_path
 
 
@@ -459,19 +669,31 @@ def generate_license(dataset_id: str) -> Path:
     output_dir.mkdir(exist_ok=True, parents=True)
     output_path = output_dir / "LICENSE"
 
-    with open(output_path, 'w') as file:
-        file.write(license_content)
-
-    printer.success(f"Generated license: {output_path}")
+    if file_writer.write(output_path, license_content):
+        printer.success(f"Generated license: {output_path}")
+    else:
+        printer.print(f"Unchanged license: [path]{output_path}[/path]")
     return output_path
 
 
-def generate_dataset_docs(dataset_id: str) -> None:
+# Documentation files generated for every dataset, in the order they are reported
+DOC_GENERATORS: Dict[str, Callable[[str, Dict[str, Any]], Path]] = {
+    "README": generate_readme,
+    "Dataset Card": generate_dataset_card,
+    "Citation": generate_citation,
+    "License": lambda dataset_id, config: generate_license(dataset_id),
+}
+
+
+def generate_dataset_docs(dataset_id: str) -> Dict[str, Path]:
     """
     Generate all documentation for a dataset.
     
     Args:
         dataset_id: ID of the dataset to generate documentation for
+
+    Returns:
+        Mapping of document type to the generated file path
     """
     printer.header(f"Generating documentation for dataset: {dataset_id}")
 
@@ -485,28 +707,72 @@ def generate_dataset_docs(dataset_id: str) -> None:
     config = load_dataset_config(dataset_id)
 
     # Generate documentation files
-    readme_path = generate_readme(dataset_id, config)
-    card_path = generate_dataset_card(dataset_id, config)
-    citation_path = generate_citation(dataset_id, config)
-    license_path = generate_license(dataset_id)
-
-    printer.success(f"\nDocumentation generation complete for {dataset_id}!")
-    printer.table(
-        ["Document Type", "Path"],
-        [
-            ["README", str(readme_path)],
-            ["Dataset Card", str(card_path)],
-            ["Citation", str(citation_path)],
-            ["License", str(license_path)]
-        ],
-        "Generated Files"
-    )
+    with file_writer.track() as written:
+        paths = {kind: generator(dataset_id, config) for kind, generator in DOC_GENERATORS.items()}
 
+    printer.success(f"\nDocumentation generation complete for {dataset_id}! ({written})")
+    printer.table(["Document Type", "Path"], [[kind, str(path)] for kind, path in paths.items()],
+                  "Generated Files")
+    return paths
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        printer.error("Usage: python generate-docs.py <dataset_id>")
-        printer.guide("Example", ["python generate-docs.py medium"])
+
+def generate_all_docs(dataset_ids: Optional[List[str]] = None,
+                      workers: Optional[int] = None) -> Dict[str, Dict[str, Path]]:
+    """
+    Generate the documentation of many datasets on one worker pool.
+
+    Every document of every dataset is a separate task. Threads are used
+    because generating a document is mostly reading footers and writing
+    files, and they share the compiled templates.
+
+    Args:
+        dataset_ids: Datasets to document (defaults to all configured datasets)
+        workers: Worker threads (defaults to DOCS_WORKERS)
+
+    Returns:
+        Mapping of dataset ID to its document types and paths
+
+    Exits with status 1 if any document failed.
+    """
+    dataset_ids = dataset_ids if dataset_ids is not None else dataset_catalog.ids()
+    printer.header(f"Generating documentation for {len(dataset_ids)} datasets")
+
+    config_manager.ensure_directories_exist()
+    ensure_templates_exist()
+    configs = {dataset_id: load_dataset_config(dataset_id) for dataset_id in dataset_ids}
+
+    results: Dict[str, Dict[str, Path]] = {dataset_id: {} for dataset_id in dataset_ids}
+    failures: List[str] = []
+    with file_writer.track() as written, ThreadPoolExecutor(max_workers=workers or DOCS_WORKERS) as pool:
+        futures = {pool.submit(file_writer.bind(generator), dataset_id, configs[dataset_id]): (dataset_id, kind)
+                   for dataset_id in dataset_ids for kind, generator in DOC_GENERATORS.items()}
+        for future in as_completed(futures):
+            dataset_id, kind = futures[future]
+            try:
+                results[dataset_id][kind] = future.result()
+            except Exception as e:
+                printer.error(f"Failed to generate the {kind} of {dataset_id}", e)
+                failures.append(f"{dataset_id} {kind}")
+
+    printer.table(["Dataset", "Documents"],
+                  [[dataset_id, str(len(paths))] for dataset_id, paths in results.items()],
+                  "Generated Files")
+    if failures:
+        printer.error(f"{len(failures)} document(s) failed: {', '.join(sorted(failures))}")
         sys.exit(1)
 
-    generate_dataset_docs(sys.argv[1])
+    printer.success(f"Documentation generated for {len(dataset_ids)} datasets ({written})")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate documentation for datasets")
+    parser.add_argument("ids", nargs="*", help="Dataset IDs (default: every configured dataset)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Worker threads when documenting several datasets")
+    args = parser.parse_args()
+
+    if len(args.ids) == 1:
+        generate_dataset_docs(args.ids[0])
+    else:
+        generate_all_docs(args.ids or None, args.jobs)
@@ -1,14 +1,20 @@
 #!/usr/bin/env python3
 import os
-import shutil
+import sys
 from string import Template
 
-import yaml
+# Define paths (relative to the project root, wherever the script is run from)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
-# Define paths
-DATASETS_DIR = "_datasets"
-OUTPUT_DIR = "preview"
-TEMPLATES_DIR = "assets/templates"
+from scripts.utils.catalog import dataset_catalog
+from scripts.utils.dataset_stats import load_stats
+from scripts.utils.file_writer import file_writer
+
+OUTPUT_DIR = os.path.join(PROJECT_ROOT, "preview")
+TEMPLATES_DIR = os.path.join(PROJECT_ROOT, "assets", "templates")
+IMAGES_DIR = os.path.join(PROJECT_ROOT, "assets", "images")
 
 # HTML templates
 PAGE_TEMPLATE = """<!DOCTYPE html>
@@ -393,9 +399,14 @@
 
 
 def load_dataset_config(dataset_id):
-    """Load dataset configuration from YAML file."""
-    with open(f"{DATASETS_DIR}/{dataset_id}.yml", 'r', encoding='utf-8') as file:
-        return yaml.safe_load(file)
+    """Load dataset configuration from the dataset catalog."""
+    return dataset_catalog.load(dataset_id)
+
+
+def dataset_stats(dataset):
+    """Headline stats of a dataset, computed from its processed data when available."""
+    stats = load_stats(dataset['id'])
+    return stats['display'] if stats else dataset.get('stats', [])
 
 
 def generate_stat_html(stat):
@@ -440,7 +451,7 @@ def generate_publishing_links(dataset):
 
 def generate_dataset_card(dataset):
     """Generate HTML for a dataset card."""
-    stats_html = ''.join([generate_stat_html(stat) for stat in dataset.get('stats', [])])
+    stats_html = ''.join([generate_stat_html(stat) for stat in dataset_stats(dataset)])
 
     return Template(DATASET_CARD_TEMPLATE).substitute(
         DATASET_ID=dataset['id'],
@@ -474,7 +485,7 @@ def generate_schema_row_html(field):
 
 def generate_dataset_page(dataset):
     """Generate HTML for a dataset detail page."""
-    stats_html = ''.join([generate_stat_html(stat) for stat in dataset.get('stats', [])])
+    stats_html = ''.join([generate_stat_html(stat) for stat in dataset_stats(dataset)])
     features_html = ''.join([generate_feature_html(feature) for feature in dataset.get('features', [])])
 
     schema_html = ''
@@ -496,48 +507,68 @@ def generate_dataset_page(dataset):
     )
 
 
-def main():
-    """Main execution function."""
-    print("Generating preview site...")
+def copy_images(names=None):
+    """Copy SVG images into the preview site (all of them unless names are given)."""
+    for file in names if names is not None else os.listdir(IMAGES_DIR):
+        if file.endswith(".svg") and os.path.exists(f"{IMAGES_DIR}/{file}"):
+            file_writer.copy(f"{IMAGES_DIR}/{file}", f"{OUTPUT_DIR}/assets/images/{file}")
+
+
+def list_dataset_ids():
+    """List the IDs of all configured datasets."""
+    return dataset_catalog.ids()
 
-    # Create output directory
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-    # Copy assets
-    os.makedirs(f"{OUTPUT_DIR}/assets/images", exist_ok=True)
-    for file in os.listdir("assets/images"):
-        if file.endswith(".svg"):
-            shutil.copy(f"assets/images/{file}", f"{OUTPUT_DIR}/assets/images/{file}")
+def generate_preview(dataset_ids=None):
+    """Generate detail pages for the given datasets (all if None) and rebuild the index page."""
+    selected = None if dataset_ids is None else set(dataset_ids)
 
-    # Process datasets
-    dataset_cards = []
-    for filename in os.listdir(DATASETS_DIR):
-        if filename.endswith(".yml"):
-            dataset_id = filename[:-4]  # Remove .yml extension
+    with file_writer.track() as written:
+        # Copy assets
+        if selected is None:
+            copy_images()
+        else:
+            copy_images(["logo.svg", "favicon.svg"] + [f"{dataset_id}-logo.svg" for dataset_id in selected])
+
+        # Process datasets; every dataset still gets a card on the index page
+        dataset_cards = []
+        for dataset_id in list_dataset_ids():
             try:
                 dataset = load_dataset_config(dataset_id)
 
                 # Generate dataset card for index
                 dataset_cards.append(generate_dataset_card(dataset))
 
+                if selected is not None and dataset_id not in selected:
+                    continue
+
                 # Generate dataset detail page
                 dataset_page = generate_dataset_page(dataset)
-                with open(f"{OUTPUT_DIR}/dataset-{dataset_id}.html", 'w', encoding='utf-8') as file:
-                    file.write(dataset_page)
-
-                print(f"Generated preview page for {dataset_id}")
+                if file_writer.write(f"{OUTPUT_DIR}/dataset-{dataset_id}.html", dataset_page):
+                    print(f"Generated preview page for {dataset_id}")
+                else:
+                    print(f"Unchanged preview page for {dataset_id}")
             except Exception as e:
                 print(f"Error processing {dataset_id}: {str(e)}")
 
-    # Generate index page
-    index_html = Template(PAGE_TEMPLATE).substitute(
-        DATASET_CARDS=''.join(dataset_cards)
-    )
-    with open(f"{OUTPUT_DIR}/index.html", 'w', encoding='utf-8') as file:
-        file.write(index_html)
+        # Generate index page
+        index_html = Template(PAGE_TEMPLATE).substitute(
+            DATASET_CARDS=''.join(dataset_cards)
+        )
+        file_writer.write(f"{OUTPUT_DIR}/index.html", index_html)
+
+    print(f"Preview updated: {written}")
+    return written
+
+
+def main():
+    """Main execution function."""
+    print("Generating preview site...")
+
+    generate_preview()
 
     print(f"Preview site generated in '{OUTPUT_DIR}' directory!")
-    print("Open 'preview/index.html' in your browser to view the site.")
+    print(f"Open '{OUTPUT_DIR}/index.html' in your browser to view the site.")
 
 
 if __name__ == "__main__":
@@ -10,15 +10,30 @@
 
 import os
 import sys
-from typing import Dict, Any
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+# Ensure project root is on PYTHONPATH when script executed directly
+project_root = Path(__file__).resolve().parents[1]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 import pandas as pd
 import yaml
 from scripts.utils.printer import printer
 from scripts.utils.config_manager import config_manager
+from scripts.utils.catalog import dataset_catalog
+from scripts.utils.dataset_schema import ConfigValidationError
+from scripts.utils.metrics import MetricsRecorder
+from scripts.utils.dataset_stats import STATS_FILE, compute_stats, write_stats
+from scripts.utils.profiler import PROFILE_FILE, profile_dataset, write_profile
 
 __all__ = ["load_dataset_config", "process_kaggle_source", "process_huggingface_source",
-           "normalize_dataframe", "process_dataset"]
+           "read_data_file", "normalize_dataframe", "write_processed_files", "column_separators",
+           "process_dataset"]
+
+# Rows per Parquet row group; smaller groups let readers (profiler, docs) stream the data
+ROW_GROUP_SIZE = 100_000
 
 
 def load_dataset_config(dataset_id: str) -> Dict[str, Any]:
@@ -46,8 +61,7 @@ def load_dataset_config(dataset_id: str) -> Dict[str, Any]:
         sys.exit(1)
 
     try:
-        with open(config_path, 'r') as file:
-            return yaml.safe_load(file)
+        return dataset_catalog.load(dataset_id)
     except yaml.YAMLError as e:
         printer.smart_error("dataset_config", {
             "dataset_id": dataset_id,
@@ -56,18 +70,23 @@ def load_dataset_config(dataset_id: str) -> Dict[str, Any]:
         })
         printer.error("YAML parsing error", e)
         sys.exit(1)
+    except ConfigValidationError as e:
+        printer.config_errors({dataset_id: e.errors})
+        sys.exit(1)
     except Exception as e:
         printer.error(f"Error loading dataset configuration: {config_path}", e)
         sys.exit(1)
 
 
-def process_kaggle_source(source_config: Dict[str, Any], dataset_id: str) -> pd.DataFrame:
+def process_kaggle_source(source_config: Dict[str, Any], dataset_id: str,
+                          metrics: Optional[MetricsRecorder] = None) -> pd.DataFrame:
     """
     Process a Kaggle data source.
     
     Args:
         source_config: Configuration for the Kaggle source
         dataset_id: ID of the dataset being processed
+        metrics: Optional recorder for the download and parse stages
         
     Returns:
         Pandas DataFrame containing the loaded data
@@ -77,6 +96,9 @@ def process_kaggle_source(source_config: Dict[str, Any], dataset_id: str) -> pd.
         ValueError: If the source configuration is invalid
         Exception: For errors during downloading or loading
     """
+    # Write ~/.kaggle/kaggle.json from the .env token before kaggle authenticates on import
+    config_manager.setup_kaggle_config()
+
     try:
         import kaggle
         import kagglehub
@@ -104,38 +126,40 @@ def process_kaggle_source(source_config: Dict[str, Any], dataset_id: str) -> pd.
 
     printer.header(f"Downloading dataset: {source_config['dataset']}")
 
-    try:
-        # Try using kagglehub first
-        dataset_path = kagglehub.dataset_download(source_config['dataset'])
-        printer.success(f"Downloaded to: {dataset_path}")
-    except Exception as e:
-        # Fall back to kaggle API
-        printer.warning(f"KaggleHub download failed: {str(e)}")
-        printer.print("Falling back to Kaggle API...")
-
-        # Parse username and dataset slug
-        username, dataset_slug = source_config['dataset'].split('/')
-
-        # Set download path
-        download_path = config_manager.paths.raw_data_dir / dataset_id / "kaggle"
-        download_path.mkdir(exist_ok=True, parents=True)
-
+    metrics = metrics or MetricsRecorder()
+    with metrics.stage("download (kaggle)"):
         try:
-            # Download dataset
-            kaggle.api.authenticate()
-            kaggle.api.dataset_download_files(
-                source_config['dataset'],
-                path=str(download_path),
-                unzip=True
-            )
-            dataset_path = str(download_path)
+            # Try using kagglehub first
+            dataset_path = kagglehub.dataset_download(source_config['dataset'])
             printer.success(f"Downloaded to: {dataset_path}")
-        except Exception as nested_e:
-            printer.smart_error("network", {
-                "service": "Kaggle API",
-                "message": f"Failed to download dataset: {str(nested_e)}"
-            })
-            sys.exit(1)
+        except Exception as e:
+            # Fall back to kaggle API
+            printer.warning(f"KaggleHub download failed: {str(e)}")
+            printer.print("Falling back to Kaggle API...")
+
+            # Parse username and dataset slug
+            username, dataset_slug = source_config['dataset'].split('/')
+
+            # Set download path
+            download_path = config_manager.paths.raw_data_dir / dataset_id / "kaggle"
+            download_path.mkdir(exist_ok=True, parents=True)
+
+            try:
+                # Download dataset
+                kaggle.api.authenticate()
+                kaggle.api.dataset_download_files(
+                    source_config['dataset'],
+                    path=str(download_path),
+                    unzip=True
+                )
+                dataset_path = str(download_path)
+                printer.success(f"Downloaded to: {dataset_path}")
+            except Exception as nested_e:
+                printer.smart_error("network", {
+                    "service": "Kaggle API",
+                    "message": f"Failed to download dataset: {str(nested_e)}"
+                })
+                sys.exit(1)
 
     # Load data file
     file_path = os.path.join(dataset_path, source_config['file'])
@@ -157,37 +181,60 @@ def process_kaggle_source(source_config: Dict[str, Any], dataset_id: str) -> pd.
         sys.exit(1)
 
     # Determine file format and load
-    if file_path.endswith('.csv'):
-        try:
-            df = pd.read_csv(file_path, on_bad_lines='skip')
-            printer.success(f"Loaded CSV file: {file_path} ({len(df)} rows)")
-            return df
-        except Exception as e:
-            printer.error(f"Failed to load CSV file: {file_path}", e)
-            sys.exit(1)
-    elif file_path.endswith('.parquet'):
-        try:
-            df = pd.read_parquet(file_path)
-            printer.success(f"Loaded Parquet file: {file_path} ({len(df)} rows)")
-            return df
-        except Exception as e:
-            printer.error(f"Failed to load Parquet file: {file_path}", e)
-            sys.exit(1)
-    else:
+    if not file_path.endswith(('.csv', '.parquet')):
         printer.smart_error("dataset_processing", {
             "dataset_id": dataset_id,
             "message": f"Unsupported file format: {file_path}"
         })
         sys.exit(1)
 
+    file_type = "CSV" if file_path.endswith('.csv') else "Parquet"
+    try:
+        df = read_data_file(file_path, metrics, "parse (kaggle)")
+        printer.success(f"Loaded {file_type} file: {file_path} ({len(df)} rows)")
+        return df
+    except Exception as e:
+        printer.error(f"Failed to load {file_type} file: {file_path}", e)
+        sys.exit(1)
+
 
-def process_huggingface_source(source_config: Dict[str, Any], dataset_id: str) -> pd.DataFrame:
+def read_data_file(file_path: str, metrics: Optional[MetricsRecorder] = None,
+                   stage_name: str = "parse") -> pd.DataFrame:
+    """
+    Load a CSV or Parquet data file into a DataFrame.
+
+    Args:
+        file_path: Path to a .csv or .parquet file
+        metrics: Optional recorder for the parse stage
+        stage_name: Name of the recorded stage
+
+    Returns:
+        Pandas DataFrame containing the loaded data
+
+    Raises:
+        ValueError: If the file is neither CSV nor Parquet
+    """
+    metrics = metrics or MetricsRecorder()
+    with metrics.stage(stage_name) as stage:
+        if str(file_path).endswith('.csv'):
+            df = pd.read_csv(file_path, on_bad_lines='skip')
+        elif str(file_path).endswith('.parquet'):
+            df = pd.read_parquet(file_path)
+        else:
+            raise ValueError(f"Unsupported file format: {file_path}")
+        stage.rows_out = len(df)
+    return df
+
+
+def process_huggingface_source(source_config: Dict[str, Any], dataset_id: str,
+                               metrics: Optional[MetricsRecorder] = None) -> pd.DataFrame:
     """
     Process a Hugging Face data source.
     
     Args:
         source_config: Configuration for the Hugging Face source
         dataset_id: ID of the dataset being processed
+        metrics: Optional recorder for the download and parse stages
         
     Returns:
         Pandas DataFrame containing the loaded data
@@ -219,11 +266,15 @@ def process_huggingface_source(source_config: Dict[str, Any], dataset_id: str) -
         })
         sys.exit(1)
 
+    metrics = metrics or MetricsRecorder()
     printer.header(f"Loading dataset: {source_config['dataset']}")
 
     try:
-        dataset = load_dataset(source_config['dataset'])
-        df = dataset["train"].to_pandas()
+        with metrics.stage("download (huggingface)"):
+            dataset = load_dataset(source_config['dataset'])
+        with metrics.stage("parse (huggingface)") as stage:
+            df = dataset["train"].to_pandas()
+            stage.rows_out = len(df)
         printer.success(f"Loaded Hugging Face dataset: {source_config['dataset']} ({len(df)} rows)")
         return df
     except Exception as e:
@@ -234,12 +285,15 @@ def process_huggingface_source(source_config: Dict[str, Any], dataset_id: str) -
         sys.exit(1)
 
 
-def normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+def normalize_dataframe(df: pd.DataFrame, metrics: Optional[MetricsRecorder] = None,
+                        source: Optional[str] = None) -> pd.DataFrame:
     """
     Apply common normalization to a dataframe.
     
     Args:
         df: Input DataFrame to normalize
+        metrics: Optional recorder for the normalize and dedupe stages
+        source: Source platform, used to label the recorded stages
         
     Returns:
         Normalized DataFrame with duplicates and null values removed
@@ -257,18 +311,25 @@ def normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
             text_col = potential_col
             break
 
+    metrics = metrics or MetricsRecorder()
+    suffix = f" ({source})" if source else ""
+
     if text_col:
         # Drop rows with null text values
-        null_count = df[text_col].isna().sum()
-        if null_count > 0:
-            printer.print(f"Dropping {null_count} rows with null {text_col}")
-            df = df[df[text_col].notna()]
+        with metrics.stage(f"normalize{suffix}", rows_in=len(df)) as stage:
+            null_count = df[text_col].isna().sum()
+            if null_count > 0:
+                printer.print(f"Dropping {null_count} rows with null {text_col}")
+                df = df[df[text_col].notna()]
+            stage.rows_out = len(df)
 
         # Drop duplicate rows based on the text column
-        duplicate_count = df.duplicated(subset=[text_col]).sum()
-        if duplicate_count > 0:
-            printer.print(f"Dropping {duplicate_count} duplicate rows based on {text_col}")
-            df.drop_duplicates(subset=[text_col], keep='first', inplace=True)
+        with metrics.stage(f"dedupe{suffix}", rows_in=len(df)) as stage:
+            duplicate_count = df.duplicated(subset=[text_col]).sum()
+            if duplicate_count > 0:
+                printer.print(f"Dropping {duplicate_count} duplicate rows based on {text_col}")
+                df = df.drop_duplicates(subset=[text_col], keep='first')
+            stage.rows_out = len(df)
     else:
         printer.warning("No text column found for normalization")
 
@@ -285,12 +346,62 @@ def normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def process_dataset(dataset_id: str) -> None:
+def write_processed_files(df: pd.DataFrame, output_dir: Path,
+                          metrics: Optional[MetricsRecorder] = None) -> Tuple[Path, Path]:
+    """
+    Write the processed data as parquet plus a CSV sample for inspection.
+
+    Args:
+        df: Processed DataFrame
+        output_dir: Existing directory receiving the files
+        metrics: Optional recorder for the parquet write and sample stages
+
+    Returns:
+        Tuple of (parquet path, sample path)
+    """
+    metrics = metrics or MetricsRecorder()
+
+    # Save as parquet
+    parquet_path = output_dir / "data.parquet"
+    with metrics.stage("parquet write", rows_in=len(df)) as stage:
+        df.to_parquet(str(parquet_path), index=False, row_group_size=ROW_GROUP_SIZE)
+        stage.rows_out = len(df)
+
+    # Save a sample as CSV for inspection
+    sample_size = min(1000, len(df))
+    sample_path = output_dir / "sample.csv"
+    with metrics.stage("sample", rows_in=len(df)) as stage:
+        df.sample(sample_size).to_csv(str(sample_path), index=False)
+        stage.rows_out = sample_size
+
+    return parquet_path, sample_path
+
+
+def column_separators(config: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Separators of the columns a configuration declares as delimited text.
+
+    Args:
+        config: Dataset configuration dictionary
+
+    Returns:
+        Column name to separator, e.g. {'tags': ','}
+    """
+    schema = config.get('dataset_details', {}).get('schema', [])
+    return {field['name']: field['separator'] for field in schema if field.get('separator')}
+
+
+def process_dataset(dataset_id: str, profile_workers: Optional[int] = None) -> Dict[str, Any]:
     """
     Process a dataset according to its configuration.
     
     Args:
         dataset_id: ID of the dataset to process
+        profile_workers: Worker processes profiling the columns (defaults to
+            the CPU count; batch runs pass their share of the CPUs)
+
+    Returns:
+        Dictionary of statistics about the processed dataset
         
     Raises:
         FileNotFoundError: If the configuration file doesn't exist
@@ -314,6 +425,7 @@ def process_dataset(dataset_id: str) -> None:
 
     # Process each source
     combined_df = pd.DataFrame()
+    metrics = MetricsRecorder()
 
     for source in config['sources']:
         platform = source.get('platform')
@@ -321,23 +433,25 @@ def process_dataset(dataset_id: str) -> None:
 
         try:
             if platform == 'kaggle':
-                df = process_kaggle_source(source, dataset_id)
+                df = process_kaggle_source(source, dataset_id, metrics)
             elif platform == 'huggingface':
-                df = process_huggingface_source(source, dataset_id)
+                df = process_huggingface_source(source, dataset_id, metrics)
             else:
                 printer.warning(f"Unknown platform: {platform}")
                 continue
 
             # Normalize dataframe
             printer.header(f"Normalizing data from {platform}")
-            df = normalize_dataframe(df)
+            df = normalize_dataframe(df, metrics, source=platform)
 
             # Combine dataframes
             if combined_df.empty:
                 combined_df = df
             else:
                 printer.header("Combining dataframes")
-                combined_df = pd.concat([combined_df, df], ignore_index=True)
+                with metrics.stage("concat", rows_in=len(combined_df) + len(df)) as stage:
+                    combined_df = pd.concat([combined_df, df], ignore_index=True)
+                    stage.rows_out = len(combined_df)
                 printer.print(f"Combined shape: {combined_df.shape}")
         except Exception as e:
             printer.error(f"Error processing source {platform}", e)
@@ -359,14 +473,24 @@ def process_dataset(dataset_id: str) -> None:
     try:
         output_dir.mkdir(exist_ok=True, parents=True)
 
-        # Save as parquet
-        parquet_path = output_dir / "data.parquet"
-        combined_df.to_parquet(str(parquet_path), index=False)
+        parquet_path, sample_path = write_processed_files(combined_df, output_dir, metrics)
 
-        # Save a sample as CSV for inspection
-        sample_size = min(1000, len(combined_df))
-        sample_path = output_dir / "sample.csv"
-        combined_df.sample(sample_size).to_csv(str(sample_path), index=False)
+        # Derive the published stats from the Parquet footer for docs, preview and the site
+        with metrics.stage("stats", rows_in=len(combined_df)) as stage:
+            dataset_stats = compute_stats(parquet_path, files=[parquet_path, sample_path])
+            stats_path = write_stats(output_dir / STATS_FILE, dataset_stats)
+            stage.rows_out = dataset_stats["rows"]
+
+        # Approximate per-column profiles (distinct counts, quantiles, top values) for the dataset card
+        with metrics.stage("profile", rows_in=len(combined_df)) as stage:
+            profile = profile_dataset(parquet_path, separators=column_separators(config),
+                                      workers=profile_workers)
+            profile_path = write_profile(output_dir / PROFILE_FILE, profile)
+            stage.rows_out = profile["rows"]
+
+        # Keep the stage metrics next to the data to track them over time
+        metrics_path = metrics.write(output_dir / "metrics.json", dataset_id=dataset_id,
+                                     rows=len(combined_df))
 
         # Prepare stats
         stats = {
@@ -376,22 +500,22 @@ def process_dataset(dataset_id: str) -> None:
             "Column names": ", ".join(combined_df.columns.tolist()[:5]) +
                             (", ..." if len(combined_df.columns) > 5 else ""),
             "Sample path": str(sample_path),
-            "Parquet path": str(parquet_path)
+            "Parquet path": str(parquet_path),
+            "Metrics path": str(metrics_path),
+            "Stats path": str(stats_path),
+            "Profile path": str(profile_path)
         }
 
-        # Print success message with stats
-        printer.dataset_processed(dataset_id, stats)
+        # Print success message with stats and stage metrics
+        printer.dataset_processed(dataset_id, stats, metrics)
 
-        # Update stats in configuration file suggestion
         printer.guide("Next Steps", [
             f"Run 'python meddata.py generate-docs {dataset_id}' to generate documentation",
-            f"Consider updating the dataset statistics in _datasets/{dataset_id}.yml:",
-            f"  - value: {len(combined_df)}+",
-            f"    label: Items",
-            f"  - value: {len(combined_df.columns)}",
-            f"    label: Fields"
+            f"Docs, preview and the site read the dataset statistics from {stats_path}",
         ])
 
+        return stats
+
     except PermissionError as e:
         printer.error("Permission denied when saving processed dataset", e)
         sys.exit(1)
@@ -402,8 +526,11 @@ def process_dataset(dataset_id: str) -> None:
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        printer.error("Usage: python process-dataset.py <dataset_id>")
+        printer.error("Usage: python process-dataset.py <dataset_id> [--profile-workers N]")
         printer.guide("Example", ["python process-dataset.py medium"])
         sys.exit(1)
 
-    process_dataset(sys.argv[1])
+    workers = None
+    if "--profile-workers" in sys.argv[2:]:
+        workers = int(sys.argv[sys.argv.index("--profile-workers") + 1])
+    process_dataset(sys.argv[1], workers)
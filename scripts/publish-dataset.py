@@ -3,20 +3,52 @@
 MedData Publish Dataset Script - Publishes datasets to external platforms.
 
 This script handles the publishing of processed datasets to platforms like
-Hugging Face and GitHub. It uploads both the data files and metadata files
+Hugging Face, Kaggle and GitHub. It uploads both the data files and metadata files
 (README, dataset card, citation, license) to make the dataset accessible.
 """
 from __future__ import annotations
 
 import argparse
+import base64
+import hashlib
+import json
+import os
+import shutil
+import subprocess
 import sys
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Set
+
+# Ensure project root is on PYTHONPATH when script executed directly
+project_root = Path(__file__).resolve().parents[1]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
-import yaml
 from scripts.utils.printer import printer
 from scripts.utils.config_manager import config_manager
+from scripts.utils.catalog import dataset_catalog
+from scripts.utils.dataset_schema import ConfigValidationError
+from scripts.utils.file_writer import file_writer
+from scripts.utils.manifest import (bytes_sha256, build_manifest, diff_manifests,
+                                    load_manifest, write_manifest)
+from scripts.utils.subprocess_handler import subprocess_handler
+
+__all__ = ["load_dataset_config", "publish_to_huggingface", "pack_file", "build_github_tree",
+           "publish_to_github", "build_kaggle_metadata", "publish_to_kaggle", "publish_dataset"]
+
+# GitHub rejects files over 100 MB and warns above 50 MB
+GITHUB_CHUNK_SIZE = 45 * 1024 * 1024
+
+# Documentation files copied to the root of the GitHub repository
+GITHUB_DOC_FILES = ["README.md", "dataset-card.md", "CITATION.cff", "LICENSE", "CHANGELOG.md"]
+
+# Metadata file name expected by the Kaggle API
+KAGGLE_METADATA_FILE = "dataset-metadata.json"
 
-__all__ = ["load_dataset_config", "publish_to_huggingface", "publish_to_github", "publish_dataset"]
+# Processed files that stay local (per-run stage metrics would change every version)
+LOCAL_ONLY_FILES = {"metrics.json"}
 
 
 def load_dataset_config(dataset_id: str) -> Dict[str, Any]:
@@ -38,8 +70,11 @@ def load_dataset_config(dataset_id: str) -> Dict[str, Any]:
         printer.error(f"Dataset configuration not found: {config_path}")
         sys.exit(1)
 
-    with open(config_path, 'r') as file:
-        return yaml.safe_load(file)
+    try:
+        return dataset_catalog.load(dataset_id)
+    except ConfigValidationError as e:
+        printer.config_errors({dataset_id: e.errors})
+        sys.exit(1)
 
 
 def publish_to_huggingface(dataset_id: str, repository: str, token: Optional[str] = None) -> str:
@@ -125,23 +160,165 @@ def publish_to_huggingface(dataset_id: str, repository: str, token: Optional[str
     return dataset_url
 
 
-def publish_to_github(dataset_id: str, repository: str, token: Optional[str] = None) -> str:
+def _is_local_remote(repository: str) -> bool:
+    """
+    Check whether a repository refers to a local path or explicit git URL.
+
+    Args:
+        repository: Repository string from the publishing configuration
+
+    Returns:
+        True if the repository is a path/URL rather than an 'owner/name' slug
+    """
+    return (
+        "://" in repository
+        or repository.startswith(("/", ".", "~", "git@"))
+        or Path(repository).expanduser().exists()
+    )
+
+
+def _git(work_tree: Path, *args: str, check: bool = True,
+         config: Optional[List[str]] = None) -> subprocess.CompletedProcess:
+    """
+    Run a git command inside the publish working tree.
+
+    Args:
+        work_tree: Working tree to run the command in
+        *args: Git sub-command and arguments
+        check: Whether to raise on a non-zero exit code
+        config: Optional ``-c key=value`` settings for this invocation only
+
+    Returns:
+        CompletedProcess instance with captured output
+    """
+    cmd = ["git", "-C", str(work_tree)]
+    for setting in config or []:
+        cmd.extend(["-c", setting])
+    cmd.extend(args)
+    return subprocess_handler.run(cmd, check=check, capture_output=True)
+
+
+def pack_file(source: Path, work_tree: Path, rel_path: str,
+              chunk_size: int = GITHUB_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Copy a file into the working tree, splitting it into chunks if it is large.
+
+    Files up to ``chunk_size`` bytes are stored as-is. Larger files are stored as
+    ``<rel_path>.part-NNNN`` chunks so that every blob stays below the GitHub
+    file size limit. Chunks that already hold the right bytes are not rewritten,
+    so unchanged shards never show up in the next commit.
+
+    Args:
+        source: File to pack
+        work_tree: Root of the git working tree
+        rel_path: Destination path inside the working tree (POSIX style)
+        chunk_size: Maximum size in bytes of a single stored blob
+
+    Returns:
+        Manifest entry with size, sha256 and the list of stored chunk paths
+    """
+    size = source.stat().st_size
+    digest = hashlib.sha256()
+    chunks: List[Dict[str, Any]] = []
+
+    with open(source, 'rb') as file:
+        if size <= chunk_size:
+            data = file.read()
+            digest.update(data)
+            file_writer.write(work_tree / rel_path, data)
+            chunks.append({"path": rel_path, "size": len(data), "sha256": bytes_sha256(data)})
+        else:
+            index = 0
+            for data in iter(lambda: file.read(chunk_size), b""):
+                digest.update(data)
+                chunk_path = f"{rel_path}.part-{index:04d}"
+                file_writer.write(work_tree / chunk_path, data)
+                chunks.append({"path": chunk_path, "size": len(data), "sha256": bytes_sha256(data)})
+                index += 1
+
+    return {"size": size, "sha256": digest.hexdigest(), "chunks": chunks}
+
+
+def build_github_tree(dataset_id: str, work_tree: Path,
+                      chunk_size: int = GITHUB_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Populate a git working tree with processed shards, docs and a manifest.
+
+    Layout of the working tree:
+        data/            processed files (chunked when larger than ``chunk_size``)
+        README.md, ...   documentation files from the docs directory
+        manifest.json    sizes, checksums and chunk lists for every data file
+
+    Args:
+        dataset_id: ID of the dataset to publish
+        work_tree: Root of the git working tree
+        chunk_size: Maximum size in bytes of a single stored blob
+
+    Returns:
+        The manifest written to ``manifest.json``
+    """
+    processed_dir = config_manager.paths.processed_data_dir / dataset_id
+    data_files = sorted(p for p in processed_dir.rglob("*")
+                        if p.is_file() and p.name not in LOCAL_ONLY_FILES)
+
+    manifest: Dict[str, Any] = {
+        "version": 1,
+        "dataset": dataset_id,
+        "chunk_size": chunk_size,
+        "files": {},
+    }
+    expected: Set[str] = {"manifest.json"}
+
+    for source in data_files:
+        rel_path = "data/" + source.relative_to(processed_dir).as_posix()
+        entry = pack_file(source, work_tree, rel_path, chunk_size)
+        manifest["files"][rel_path] = entry
+        expected.update(chunk["path"] for chunk in entry["chunks"])
+
+    docs_dir = config_manager.paths.docs_dir / dataset_id
+    for name in GITHUB_DOC_FILES:
+        source = docs_dir / name
+        if source.exists():
+            file_writer.copy(source, work_tree / name)
+            expected.add(name)
+
+    # Drop shards and docs that are no longer part of the dataset
+    for path in work_tree.rglob("*"):
+        if ".git" in path.relative_to(work_tree).parts or not path.is_file():
+            continue
+        if path.relative_to(work_tree).as_posix() not in expected:
+            path.unlink()
+
+    content = json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+    file_writer.write(work_tree / "manifest.json", content.encode("utf-8"))
+    return manifest
+
+
+def publish_to_github(dataset_id: str, repository: str, token: Optional[str] = None,
+                      branch: str = "main", chunk_size: int = GITHUB_CHUNK_SIZE) -> str:
     """
     Publish dataset to GitHub.
     
+    The repository contents are assembled in a local git working tree under the
+    cache directory and pushed to the remote. Large data files are split into
+    chunks below GitHub's size limit and repeat publishes only commit the shards
+    whose bytes changed.
+
     Args:
         dataset_id: ID of the dataset to publish
-        repository: GitHub repository name (e.g., 'username/repo-name')
+        repository: GitHub repository name (e.g., 'username/repo-name'), or a
+            local path / git URL to push to instead
         token: GitHub API token (if None, will use token from config)
+        branch: Branch to publish to
+        chunk_size: Maximum size in bytes of a single file in the repository
         
     Returns:
         URL of the published repository
-        
-    Note:
-        This function is a placeholder and not yet implemented
     """
+    local_remote = _is_local_remote(repository)
+
     # Use token from config if not provided
-    if token is None:
+    if token is None and not local_remote:
         token = config_manager.tokens.github
         if token is None:
             printer.error("No GitHub token provided and none found in environment")
@@ -151,14 +328,330 @@ def publish_to_github(dataset_id: str, repository: str, token: Optional[str] = N
             ])
             sys.exit(1)
 
+    # Check if processed dataset exists
+    processed_dir = config_manager.paths.processed_data_dir / dataset_id
+    if not (processed_dir / "data.parquet").exists():
+        printer.error(f"Processed dataset not found: {processed_dir / 'data.parquet'}")
+        printer.guide("Process dataset first", [f"Run 'python meddata.py process {dataset_id}' first"])
+        sys.exit(1)
+
+    if local_remote:
+        remote_url = str(Path(repository).expanduser()) if "://" not in repository else repository
+        repository_url = remote_url
+        auth_config: List[str] = []
+    else:
+        remote_url = f"https://github.com/{repository}.git"
+        repository_url = f"https://github.com/{repository}"
+        # Pass credentials per command so the token is never stored in .git/config
+        basic = base64.b64encode(f"x-access-token:{token}".encode("utf-8")).decode("ascii")
+        auth_config = [f"http.https://github.com/.extraheader=AUTHORIZATION: basic {basic}"]
+
     printer.header(f"Publishing to GitHub: {repository}")
-    printer.warning("GitHub publishing not yet implemented. Coming soon!")
-    # TODO: Implement GitHub publishing
 
-    return f"https://github.com/{repository}"
+    work_tree = config_manager.paths.cache_dir / "publish" / dataset_id / "github"
+    work_tree.mkdir(exist_ok=True, parents=True)
+
+    if not (work_tree / ".git").exists():
+        _git(work_tree, "init", "--quiet")
+        _git(work_tree, "checkout", "--quiet", "-b", branch)
+        _git(work_tree, "remote", "add", "origin", remote_url)
+        # Continue from the published history if the remote already has the branch
+        fetched = _git(work_tree, "fetch", "--quiet", "origin", branch, check=False, config=auth_config)
+        if fetched.returncode == 0:
+            _git(work_tree, "reset", "--quiet", "--mixed", "FETCH_HEAD")
+    else:
+        _git(work_tree, "remote", "set-url", "origin", remote_url)
+
+    if not _git(work_tree, "config", "user.email", check=False).stdout.strip():
+        _git(work_tree, "config", "user.name", "MedData Publisher")
+        _git(work_tree, "config", "user.email", "meddata@users.noreply.github.com")
 
+    printer.print(f"Packing dataset files into {work_tree}")
+    manifest = build_github_tree(dataset_id, work_tree, chunk_size)
 
-def publish_dataset(dataset_id: str, token: Optional[str] = None, platforms: Optional[List[str]] = None) -> None:
+    _git(work_tree, "add", "--all")
+    changed = [line for line in _git(work_tree, "diff", "--cached", "--name-only").stdout.splitlines() if line]
+
+    if changed:
+        chunked = sum(1 for entry in manifest["files"].values() if len(entry["chunks"]) > 1)
+        printer.print(f"Committing {len(changed)} changed file(s) ({chunked} chunked data file(s))")
+        _git(work_tree, "commit", "--quiet", "-m", f"Update {dataset_id} dataset ({len(changed)} files changed)")
+    else:
+        printer.print("No changes since the last publish")
+
+    # Always push: a no-op when up to date, and retries commits from a failed push
+    if _git(work_tree, "rev-parse", "--verify", "--quiet", "HEAD", check=False).returncode == 0:
+        _git(work_tree, "push", "--quiet", "origin", f"HEAD:refs/heads/{branch}", config=auth_config)
+
+    printer.success(f"Published dataset to GitHub: {repository}")
+    return repository_url
+
+
+def _kaggle_api(token: Optional[str] = None) -> Any:
+    """
+    Create an authenticated Kaggle API client.
+
+    Args:
+        token: Kaggle API key (if None, credentials come from the environment
+            or ~/.kaggle/kaggle.json)
+
+    Returns:
+        Authenticated ``KaggleApi`` instance
+
+    Exits with status 1 if a token is given without KAGGLE_USERNAME.
+    """
+    credentials: Dict[str, str] = {}
+    if token:
+        username = config_manager.get_env("KAGGLE_USERNAME")
+        if not username:
+            printer.error("KAGGLE_USERNAME is not set; a Kaggle API key only works with its username")
+            printer.guide("Set the Kaggle username", ["Add KAGGLE_USERNAME=<your Kaggle username> to .env"])
+            sys.exit(1)
+        credentials = {"KAGGLE_USERNAME": username, "KAGGLE_KEY": token}
+    else:
+        config_manager.setup_kaggle_config()
+
+    try:
+        from kaggle.api.kaggle_api_extended import KaggleApi
+    except ImportError:
+        printer.smart_error("missing_dependency", {
+            "dependency": "kaggle",
+            "message": "Kaggle library not installed. Run: pip install kaggle"
+        })
+        sys.exit(1)
+
+    api = KaggleApi()
+    # The client reads the credentials once; don't leave them in this process's environment
+    with _temporary_environ(credentials):
+        api.authenticate()
+    return api
+
+
+@contextmanager
+def _temporary_environ(values: Dict[str, str]) -> Iterator[None]:
+    """Set environment variables for the duration of a block, restoring the previous values."""
+    previous = {key: os.environ.get(key) for key in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    """
+    Place a file in the staging folder without duplicating its bytes if possible.
+
+    Args:
+        source: File to stage
+        target: Destination path in the staging folder
+    """
+    if target.exists():
+        if target.stat().st_ino == source.stat().st_ino:
+            return
+        target.unlink()
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def build_kaggle_metadata(dataset_id: str, repository: str, config: Dict[str, Any],
+                          target: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Build the dataset-metadata.json content for a Kaggle dataset.
+
+    Args:
+        dataset_id: ID of the dataset
+        repository: Kaggle dataset reference ('owner/slug')
+        config: Dataset configuration dictionary
+        target: Kaggle entry from the configuration's ``publishing`` list
+
+    Returns:
+        Metadata dictionary in the format expected by the Kaggle API
+    """
+    target = target or {}
+
+    description = config.get('description', '')
+    card_path = config_manager.paths.docs_dir / dataset_id / "dataset-card.md"
+    if card_path.exists():
+        description = card_path.read_text(encoding="utf-8")
+
+    # Kaggle only accepts its own column type names
+    type_map = {"object": "string", "string": "string", "bool": "boolean",
+                "datetime64[ns]": "datetime"}
+    fields = []
+    for field in config.get('dataset_details', {}).get('schema', []):
+        field_type = str(field.get('type', 'string'))
+        fields.append({
+            "name": field['name'],
+            "description": field.get('description', ''),
+            "type": type_map.get(field_type, "numeric" if field_type.startswith(("int", "float")) else "string"),
+        })
+
+    metadata: Dict[str, Any] = {
+        "title": config['name'][:50],
+        "id": repository,
+        "licenses": [{"name": target.get('license', "other")}],
+        "description": description,
+        "keywords": target.get('keywords', []),
+        "resources": [{
+            "path": "data.parquet",
+            "description": f"Processed {config['name']}",
+            "schema": {"fields": fields},
+        }],
+    }
+
+    # Kaggle rejects subtitles outside 20-80 characters, so only send valid ones
+    subtitle = config.get('description', '')
+    if 20 <= len(subtitle) <= 80:
+        metadata["subtitle"] = subtitle
+
+    return metadata
+
+
+def _upload_concurrently(api: Any, max_workers: int) -> None:
+    """
+    Replace the Kaggle client's sequential file upload loop with a thread pool.
+
+    The Kaggle client uploads every file of a version one after another. This
+    swaps its ``upload_files`` for a version that uploads the files of the
+    staging folder concurrently and keeps the resulting file order stable.
+
+    Args:
+        api: Authenticated ``KaggleApi`` instance
+        max_workers: Maximum number of concurrent uploads
+    """
+    if not (hasattr(api, "upload_files") and hasattr(api, "_upload_file_or_folder")):
+        # Unknown client version - keep its own sequential upload loop
+        printer.warning("Kaggle client has no per-file upload hook, uploading files sequentially")
+        return
+
+    def upload_files(request, resources, folder, blob_type, upload_context, quiet=False, dir_mode='skip'):
+        names = sorted(name for name in os.listdir(folder) if name != KAGGLE_METADATA_FILE)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(names)))) as pool:
+            uploads = pool.map(
+                lambda name: api._upload_file_or_folder(folder, name, blob_type, upload_context,
+                                                        dir_mode, quiet, resources),
+                names
+            )
+            request.files.extend(upload for upload in uploads if upload is not None)
+
+    api.upload_files = upload_files
+
+
+def _kaggle_dataset_exists(api: Any, repository: str) -> bool:
+    """
+    Check whether a Kaggle dataset exists.
+
+    Args:
+        api: Authenticated ``KaggleApi`` instance
+        repository: Kaggle dataset reference (e.g., 'username/dataset-slug')
+
+    Returns:
+        True if the dataset exists, False if Kaggle reports it as not found
+
+    Raises:
+        Exception: Any other API error (authentication, network, quota)
+    """
+    try:
+        api.dataset_status(repository)
+    except Exception as e:
+        # Older clients raise ApiException(status=404), newer ones requests' HTTPError
+        status = getattr(e, "status", None) or getattr(getattr(e, "response", None), "status_code", None)
+        if status == 404:
+            return False
+        raise
+    return True
+
+
+def publish_to_kaggle(dataset_id: str, repository: str, token: Optional[str] = None,
+                      config: Optional[Dict[str, Any]] = None, target: Optional[Dict[str, Any]] = None,
+                      max_workers: int = 4) -> str:
+    """
+    Publish dataset to Kaggle as a new dataset version.
+
+    The processed files and a generated dataset-metadata.json are staged in the
+    cache directory and compared against the manifest of the previous publish:
+
+    - nothing changed: no API call is made
+    - only metadata changed: the metadata is updated without a new version
+    - data files changed: a new version is created, uploading files concurrently
+
+    Args:
+        dataset_id: ID of the dataset to publish
+        repository: Kaggle dataset reference (e.g., 'username/dataset-slug')
+        token: Kaggle API key (if None, will use credentials from config)
+        config: Dataset configuration dictionary (loaded if not provided)
+        target: Kaggle entry from the configuration's ``publishing`` list
+        max_workers: Maximum number of concurrent file uploads
+
+    Returns:
+        URL of the published dataset
+    """
+    config = config or load_dataset_config(dataset_id)
+    processed_dir = config_manager.paths.processed_data_dir / dataset_id
+    if not (processed_dir / "data.parquet").exists():
+        printer.error(f"Processed dataset not found: {processed_dir / 'data.parquet'}")
+        printer.guide("Process dataset first", [f"Run 'python meddata.py process {dataset_id}' first"])
+        sys.exit(1)
+
+    printer.header(f"Publishing to Kaggle: {repository}")
+
+    # Stage data files and metadata; the state manifest lives outside the folder
+    publish_dir = config_manager.paths.cache_dir / "publish" / dataset_id
+    folder = publish_dir / "kaggle"
+    folder.mkdir(exist_ok=True, parents=True)
+    state_path = publish_dir / "kaggle-manifest.json"
+
+    data_files = sorted(p for p in processed_dir.iterdir()
+                        if p.is_file() and p.name not in LOCAL_ONLY_FILES)
+    for stale in folder.iterdir():
+        if stale.name != KAGGLE_METADATA_FILE and stale.name not in {p.name for p in data_files}:
+            stale.unlink()
+    for source in data_files:
+        _link_or_copy(source, folder / source.name)
+
+    metadata = build_kaggle_metadata(dataset_id, repository, config, target)
+    metadata_bytes = (json.dumps(metadata, indent=2, sort_keys=True) + "\n").encode("utf-8")
+    file_writer.write(folder / KAGGLE_METADATA_FILE, metadata_bytes)
+
+    manifest = build_manifest(folder, [p for p in folder.iterdir() if p.is_file()], dataset=repository)
+    previous = load_manifest(state_path)
+    changed, removed = diff_manifests(previous, manifest)
+    changed_data = [path for path in changed if path != KAGGLE_METADATA_FILE]
+    dataset_url = f"https://www.kaggle.com/datasets/{repository}"
+
+    if not changed and not removed and previous.get("dataset") == repository:
+        printer.print("No changes since the last Kaggle publish")
+        return dataset_url
+
+    api = _kaggle_api(token)
+    _upload_concurrently(api, max_workers)
+
+    if not _kaggle_dataset_exists(api, repository):
+        printer.print(f"Creating Kaggle dataset with {len(data_files)} file(s)")
+        api.dataset_create_new(str(folder), public=target.get('public', True) if target else True,
+                               quiet=True, dir_mode='skip')
+    elif changed_data or removed:
+        notes = "Updated " + ", ".join(changed_data + [f"removed {path}" for path in removed])
+        printer.print(f"Creating new Kaggle version: {notes}")
+        api.dataset_create_version(str(folder), notes, quiet=True, dir_mode='skip')
+    else:
+        printer.print("Only metadata changed, updating without a new version")
+        api.dataset_metadata_update(repository, str(folder))
+
+    write_manifest(state_path, manifest)
+    printer.success(f"Published dataset to Kaggle: {repository}")
+    return dataset_url
+
+
+def publish_dataset(dataset_id: str, token: Optional[str] = None,
+                    platforms: Optional[List[str]] = None) -> Dict[str, str]:
     """
     Publish dataset to specified platforms.
     
@@ -166,6 +659,9 @@ def publish_dataset(dataset_id: str, token: Optional[str] = None, platforms: Opt
         dataset_id: ID of the dataset to publish
         token: API token for authentication (if None, will use token from config)
         platforms: Optional list of platforms to publish to. If None, publish to all configured platforms.
+
+    Returns:
+        Mapping of platform name to the published URL
     """
     # Load dataset configuration
     config = load_dataset_config(dataset_id)
@@ -209,6 +705,11 @@ def publish_dataset(dataset_id: str, token: Optional[str] = None, platforms: Opt
                 published = True
                 published_platforms.append(platform)
                 published_urls.append(url)
+            elif platform == 'kaggle':
+                url = publish_to_kaggle(dataset_id, repository, platform_token, config=config, target=pub)
+                published = True
+                published_platforms.append(platform)
+                published_urls.append(url)
             else:
                 printer.warning(f"Publishing to {platform} not implemented yet")
         except Exception as e:
@@ -219,12 +720,14 @@ def publish_dataset(dataset_id: str, token: Optional[str] = None, platforms: Opt
     else:
         printer.dataset_published(dataset_id, published_platforms, published_urls)
 
+    return dict(zip(published_platforms, published_urls))
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Publish dataset to platforms")
     parser.add_argument("dataset_id", help="Dataset ID (e.g., 'medium')")
     parser.add_argument("--token", help="API token for publishing (if not provided, will use token from .env)")
-    parser.add_argument("--platforms", nargs="+", help="Specific platforms to publish to (e.g., huggingface github)")
+    parser.add_argument("--platforms", nargs="+", help="Specific platforms to publish to (e.g., huggingface kaggle github)")
 
     args = parser.parse_args()
     publish_dataset(args.dataset_id, args.token, args.platforms)
@@ -0,0 +1,145 @@
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).parent / "generate-assets.py"
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_script():
+    spec = importlib.util.spec_from_file_location("generate_assets_script", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def dataset_config(dataset_id, primary="#6366f1"):
+    return {"id": dataset_id, "logo": {"text": dataset_id[0].upper(), "colors": {"primary": primary}}}
+
+
+@pytest.fixture
+def assets_env(tmp_path, mocker):
+    module = load_script()
+    templates = tmp_path / "assets" / "templates"
+    templates.mkdir(parents=True)
+    for name in ("dataset-logo.svg", "favicon.svg"):
+        (templates / name).write_bytes((PROJECT_ROOT / "assets" / "templates" / name).read_bytes())
+
+    mock_config = mocker.patch.object(module, "config_manager")
+    mock_config.paths.project_root = tmp_path
+    mock_config.paths.cache_dir = tmp_path / ".meddata"
+    mocker.patch.object(module, "printer")
+    mocker.patch.object(module, "RASTER_SIZES", (16, 32))
+
+    configs = {dataset_id: dataset_config(dataset_id) for dataset_id in ("devto", "medium", "pubmed")}
+    catalog = mocker.patch.object(module, "dataset_catalog")
+    catalog.validate.return_value = {}
+    catalog.items.side_effect = lambda: iter(list(configs.items()))
+    catalog.load.side_effect = lambda dataset_id: configs[dataset_id]
+    return module, configs, tmp_path / "assets" / "images"
+
+
+def test_second_run_is_a_no_op(assets_env):
+    module, configs, images = assets_env
+    generated = module.main()
+    assert sorted(generated) == ["devto-logo.svg", "favicon.svg", "logo.svg", "medium-logo.svg", "pubmed-logo.svg"]
+    assert "#6366f1" in (images / "medium-logo.svg").read_text()
+
+    files = [path for path in images.rglob("*") if path.is_file()]
+    for path in files:
+        os.utime(path, (1_000_000, 1_000_000))
+    assert module.main() == {}
+    assert {path.stat().st_mtime for path in files} == {1_000_000}
+
+
+def test_only_changed_or_missing_logos_are_regenerated(assets_env):
+    module, configs, images = assets_env
+    module.main()
+
+    configs["medium"]["logo"]["colors"]["primary"] = "#ff0000"
+    (images / "devto-logo.svg").unlink()
+    assert sorted(module.main()) == ["devto-logo.svg", "medium-logo.svg"]
+    assert "#ff0000" in (images / "medium-logo.svg").read_text()
+
+    assert sorted(module.main(force=True)) == sorted(path.name for path in images.glob("*.svg"))
+
+
+def test_dataset_ids_are_honoured(assets_env):
+    module, configs, images = assets_env
+    assert list(module.main(["medium"])) == ["medium-logo.svg"]
+    assert sorted(path.name for path in images.rglob("*.*")) == ["medium-logo-16.png", "medium-logo-32.png",
+                                                                 "medium-logo.svg"]
+
+
+def test_template_change_regenerates_every_logo(assets_env, tmp_path):
+    module, configs, images = assets_env
+    module.main()
+
+    template = tmp_path / "assets" / "templates" / "dataset-logo.svg"
+    template.write_text(template.read_text() + "<!-- v2 -->\n")
+    assert sorted(module.main()) == ["devto-logo.svg", "medium-logo.svg", "pubmed-logo.svg"]
+
+
+def test_logos_are_rasterized_once(assets_env, tmp_path, mocker):
+    module, configs, images = assets_env
+    module.main()
+    assert (images / "png" / "pubmed-logo-32.png").read_bytes().startswith(b"\x89PNG")
+    assert (images / "favicon.ico").read_bytes()[:4] == b"\x00\x00\x01\x00"
+
+    # Missing renders come back from the content-hash cache without rendering
+    render = mocker.patch("scripts.utils.rasterizer.render_file")
+    (images / "png" / "pubmed-logo-32.png").unlink()
+    (images / "favicon.ico").unlink()
+    assert module.main() == {}
+    assert (images / "png" / "pubmed-logo-32.png").exists() and (images / "favicon.ico").exists()
+    render.assert_not_called()
+
+
+def test_raster_run_catches_up_after_no_raster(assets_env):
+    module, configs, images = assets_env
+    module.main()
+    old_render = (images / "png" / "medium-logo-32.png").read_bytes()
+
+    configs["medium"]["logo"]["colors"]["primary"] = "#ff0000"
+    assert list(module.main(raster=False)) == ["medium-logo.svg"]
+    assert (images / "png" / "medium-logo-32.png").read_bytes() == old_render
+
+    # The SVG is now up to date, but its renders still show the old colour
+    assert module.main() == {}
+    assert (images / "png" / "medium-logo-32.png").read_bytes() != old_render
+
+
+def test_failed_render_only_fails_its_own_logo(assets_env):
+    module, configs, images = assets_env
+    configs["medium"]["logo"]["text"] = "É"
+    with pytest.raises(SystemExit) as excinfo:
+        module.main()
+    assert excinfo.value.code == 1
+    assert not (images / "png" / "medium-logo-32.png").exists()
+    assert (images / "png" / "pubmed-logo-32.png").exists() and (images / "favicon.ico").exists()
+
+    # Only the failing logo is regenerated next time
+    fingerprints = module._load_fingerprints()
+    assert "medium-logo.svg" not in fingerprints and "pubmed-logo.svg" in fingerprints
+
+
+def test_unknown_dataset_fails(assets_env):
+    module, configs, images = assets_env
+    with pytest.raises(SystemExit) as excinfo:
+        module.main(["medium", "missing"])
+    assert excinfo.value.code == 1
+    # The datasets that could be loaded are still generated
+    assert (images / "medium-logo.svg").exists()
+
+
+def test_stale_renders_are_pruned_from_the_cache(assets_env, tmp_path):
+    module, configs, images = assets_env
+    module.main()
+    cache = tmp_path / ".meddata" / "raster"
+    count = len(list(cache.iterdir()))
+
+    configs["medium"]["logo"]["colors"]["primary"] = "#ff0000"
+    module.main()
+    assert len(list(cache.iterdir())) == count
@@ -0,0 +1,130 @@
+import importlib.util
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from scripts.utils.parquet_footer import read_footer
+
+SCRIPT_PATH = Path(__file__).parent / "generate-docs.py"
+
+
+def load_script():
+    spec = importlib.util.spec_from_file_location("generate_docs_script", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def docs_env(tmp_path, mocker):
+    module = load_script()
+    mock_config = mocker.patch.object(module, "config_manager")
+    mock_config.paths.processed_data_dir = tmp_path / "_data" / "processed"
+    mock_config.paths.cache_dir = tmp_path / ".meddata"
+    mock_config.paths.docs_dir = tmp_path / "docs"
+    mock_config.paths.templates_dir = tmp_path / "templates"
+    mocker.patch("scripts.utils.templates.config_manager", mock_config)
+    mocker.patch.object(module, "printer")
+
+    processed = tmp_path / "_data" / "processed" / "demo"
+    processed.mkdir(parents=True)
+    pd.DataFrame({
+        "title": [f"Title {i}" for i in range(5000)],
+        "text": ["word " * 100] * 5000,
+        "claps": range(5000),
+    }).to_parquet(processed / "data.parquet", row_group_size=1000)
+    return module, read_footer(processed / "data.parquet")
+
+
+def test_describe_fields_uses_footer_and_config(docs_env):
+    module, footer = docs_env
+    config = {"dataset_details": {"schema": [{"name": "title", "description": "Article | title"}]}}
+    table = module.describe_fields(footer, config).splitlines()
+    assert table[2:] == [
+        "| `title` | object | Article \\| title |",
+        "| `text` | object |  |",
+        "| `claps` | int64 |  |",
+    ]
+
+
+def test_describe_splits_prefers_manifest_size(docs_env, tmp_path):
+    module, footer = docs_env
+    assert module.describe_splits("demo", footer).splitlines()[2].startswith("| train | 5,000 | ")
+
+    manifest = tmp_path / ".meddata" / "publish" / "demo" / "github" / "manifest.json"
+    manifest.parent.mkdir(parents=True)
+    manifest.write_text(json.dumps({"files": {"data/data.parquet": {"size": 3 * 1024 * 1024}}}))
+    assert module.describe_splits("demo", footer).splitlines()[2] == "| train | 5,000 | 3.0 MB |"
+
+
+def test_describe_instances_reads_first_rows_truncated(docs_env):
+    module, footer = docs_env
+    description = module.describe_instances(footer, rows=2)
+    examples = json.loads(description.split("```json\n")[1].split("\n```")[0])
+    assert [example["title"] for example in examples] == ["Title 0", "Title 1"]
+    assert examples[0]["text"] == ("word " * 40).rstrip() + "..."
+    assert examples[0]["claps"] == 0
+
+
+def test_generate_all_docs_renders_loops_and_skips_unchanged(docs_env, tmp_path, mocker):
+    module, _ = docs_env
+    configs = {
+        dataset_id: {"name": dataset_id.title(), "description": "Articles", "publishing": [],
+                     "features": [{"title": "Clean", "description": "Deduplicated"},
+                                  {"title": "Fresh", "description": "Updated monthly"}]}
+        for dataset_id in ["demo", "other"]
+    }
+    mocker.patch.object(module, "load_dataset_config", side_effect=configs.__getitem__)
+
+    results = module.generate_all_docs(["demo", "other"], workers=4)
+    assert set(results) == {"demo", "other"}
+    assert all(len(paths) == 4 for paths in results.values())
+
+    readme = (tmp_path / "docs" / "demo" / "README.md").read_text()
+    assert "- **Clean**: Deduplicated\n- **Fresh**: Updated monthly\n" in readme
+    assert "{%" not in readme and "{{" not in readme
+    assert "| `claps` | int64 |" in (tmp_path / "docs" / "demo" / "dataset-card.md").read_text()
+    assert any((tmp_path / ".meddata" / "templates").iterdir())
+
+    mtimes = {path: path.stat().st_mtime_ns for path in (tmp_path / "docs").rglob("*")}
+    for path in mtimes:
+        os.utime(path, ns=(0, 0))
+    module.generate_all_docs(["demo", "other"])
+    # Nothing changed, so no file was rewritten (the README's date comes from the processed data)
+    assert all(path.stat().st_mtime_ns == 0 for path in mtimes if path.is_file())
+
+
+def test_existing_card_template_gets_new_sections(docs_env, tmp_path):
+    module, _ = docs_env
+    template = tmp_path / "templates" / "dataset-card.md.template"
+    template.parent.mkdir(parents=True)
+    template.write_text("# {{ name }}\n\n#### Data Fields\n\n{{ data_fields }}\n\n#### Data Splits\n\n{{ data_splits }}\n")
+
+    module.ensure_templates_exist()
+    content = template.read_text()
+    assert ("{{ data_fields }}\n\n#### Column Profiles\n\n{{ column_profiles }}\n\n#### Data Splits\n"
+            in content)
+
+    # Migrated (or locally edited) templates are left alone
+    template.write_text(content.replace("#### Column Profiles", "#### Profiles"))
+    module.ensure_templates_exist()
+    assert "#### Profiles\n\n{{ column_profiles }}" in template.read_text()
+
+
+def test_describe_instances_closes_the_file(docs_env, mocker):
+    module, footer = docs_env
+    import pyarrow.parquet as pq
+    close = mocker.spy(pq.ParquetFile, "close")
+    module.describe_instances(footer)
+    close.assert_called_once()
+
+
+def test_data_updated_comes_from_the_processed_data(docs_env, tmp_path):
+    module, _ = docs_env
+    os.utime(tmp_path / "_data" / "processed" / "demo" / "data.parquet", (0, 1_700_000_000))
+    expected = module.datetime.fromtimestamp(1_700_000_000).strftime("%Y-%m-%d")
+    assert module.data_updated("demo") == expected
+    assert module.data_updated("missing") == "Unknown"
@@ -0,0 +1,193 @@
+import importlib.util
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).parent / "publish-dataset.py"
+
+
+def load_script():
+    spec = importlib.util.spec_from_file_location("publish_dataset_script", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def git(*args, cwd=None):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+
+@pytest.fixture
+def publish_env(tmp_path, mocker):
+    module = load_script()
+    mock_config = mocker.patch.object(module, "config_manager")
+    mock_config.paths.processed_data_dir = tmp_path / "_data" / "processed"
+    mock_config.paths.docs_dir = tmp_path / "docs"
+    mock_config.paths.cache_dir = tmp_path / ".meddata"
+    mocker.patch.object(module, "printer")
+
+    processed = tmp_path / "_data" / "processed" / "demo"
+    processed.mkdir(parents=True)
+    (processed / "data.parquet").write_bytes(os.urandom(2500))
+    (processed / "sample.csv").write_text("id,text\n1,hello\n")
+
+    docs = tmp_path / "docs" / "demo"
+    docs.mkdir(parents=True)
+    (docs / "README.md").write_text("# Demo\n")
+    (docs / "LICENSE").write_text("MIT\n")
+
+    remote = tmp_path / "remote.git"
+    git("init", "--bare", "--quiet", str(remote))
+    return module, processed, remote
+
+
+def test_pack_file_splits_large_files(tmp_path):
+    module = load_script()
+    source = tmp_path / "big.bin"
+    source.write_bytes(os.urandom(2500))
+
+    entry = module.pack_file(source, tmp_path / "tree", "data/big.bin", chunk_size=1000)
+
+    assert [c["path"] for c in entry["chunks"]] == [
+        "data/big.bin.part-0000", "data/big.bin.part-0001", "data/big.bin.part-0002"]
+    joined = b"".join((tmp_path / "tree" / c["path"]).read_bytes() for c in entry["chunks"])
+    assert joined == source.read_bytes()
+    assert entry["size"] == 2500
+
+
+def test_publish_to_github_local_bare_remote(publish_env, tmp_path):
+    module, processed, remote = publish_env
+
+    url = module.publish_to_github("demo", str(remote), chunk_size=1000)
+    assert url == str(remote)
+
+    files = git("--git-dir", str(remote), "ls-tree", "-r", "--name-only", "main").split()
+    assert "manifest.json" in files
+    assert "README.md" in files
+    assert "data/data.parquet.part-0002" in files
+    assert "data/sample.csv" in files
+
+    manifest = json.loads(git("--git-dir", str(remote), "show", "main:manifest.json"))
+    assert len(manifest["files"]["data/data.parquet"]["chunks"]) == 3
+
+
+def test_publish_to_github_is_incremental(publish_env):
+    module, processed, remote = publish_env
+    module.publish_to_github("demo", str(remote), chunk_size=1000)
+
+    # Re-publishing unchanged data creates no new commit
+    module.publish_to_github("demo", str(remote), chunk_size=1000)
+    assert git("--git-dir", str(remote), "rev-list", "--count", "main").strip() == "1"
+
+    # Changing bytes in the last chunk only commits that shard and the manifest
+    data = bytearray((processed / "data.parquet").read_bytes())
+    data[-1] ^= 0xFF
+    (processed / "data.parquet").write_bytes(bytes(data))
+    module.publish_to_github("demo", str(remote), chunk_size=1000)
+
+    changed = git("--git-dir", str(remote), "diff", "--name-only", "main~1", "main").split()
+    assert sorted(changed) == ["data/data.parquet.part-0002", "manifest.json"]
+
+
+@pytest.fixture
+def kaggle_env(publish_env, mocker):
+    module, processed, _ = publish_env
+    api = mocker.MagicMock()
+    mocker.patch.object(module, "_kaggle_api", return_value=api)
+    config = {
+        "id": "demo",
+        "name": "Demo Articles",
+        "description": "A demo collection of articles for tests",
+        "dataset_details": {"schema": [
+            {"name": "text", "type": "object", "description": "Body"},
+            {"name": "claps", "type": "float64", "description": "Claps"},
+        ]},
+    }
+    return module, processed, api, config
+
+
+def test_build_kaggle_metadata(kaggle_env):
+    module, _, _, config = kaggle_env
+    metadata = module.build_kaggle_metadata("demo", "owner/demo", config)
+
+    assert metadata["id"] == "owner/demo"
+    assert metadata["subtitle"] == config["description"]
+    fields = metadata["resources"][0]["schema"]["fields"]
+    assert [f["type"] for f in fields] == ["string", "numeric"]
+
+
+def test_publish_to_kaggle_versions_only_on_change(kaggle_env, tmp_path):
+    module, processed, api, config = kaggle_env
+
+    module.publish_to_kaggle("demo", "owner/demo", "key", config=config)
+    folder = tmp_path / ".meddata" / "publish" / "demo" / "kaggle"
+    assert (folder / "dataset-metadata.json").exists()
+    api.dataset_create_version.assert_called_once()
+
+    # Unchanged files: no API calls at all
+    api.reset_mock()
+    module.publish_to_kaggle("demo", "owner/demo", "key", config=config)
+    api.dataset_status.assert_not_called()
+    api.dataset_create_version.assert_not_called()
+
+    # Metadata-only change updates metadata without a new version
+    config["name"] = "Demo Articles v2"
+    module.publish_to_kaggle("demo", "owner/demo", "key", config=config)
+    api.dataset_metadata_update.assert_called_once()
+    api.dataset_create_version.assert_not_called()
+
+    # Changed data creates a version naming only the changed file
+    (processed / "sample.csv").write_text("id,text\n1,changed\n")
+    module.publish_to_kaggle("demo", "owner/demo", "key", config=config)
+    notes = api.dataset_create_version.call_args[0][1]
+    assert "sample.csv" in notes and "data.parquet" not in notes
+
+
+class NotFound(Exception):
+    status = 404
+
+
+def test_publish_to_kaggle_creates_only_missing_datasets(kaggle_env):
+    module, _, api, config = kaggle_env
+
+    api.dataset_status.side_effect = NotFound("not found")
+    module.publish_to_kaggle("demo", "owner/demo", "key", config=config)
+    api.dataset_create_new.assert_called_once()
+
+    # Authentication or network errors are not mistaken for a missing dataset
+    api.reset_mock()
+    api.dataset_status.side_effect = PermissionError("401 Unauthorized")
+    config["name"] = "Demo Articles v2"
+    with pytest.raises(PermissionError):
+        module.publish_to_kaggle("demo", "owner/demo", "key", config=config)
+    api.dataset_create_new.assert_not_called()
+
+
+def test_upload_concurrently_needs_the_client_hook(kaggle_env, mocker):
+    module, _, _, _ = kaggle_env
+    api = mocker.Mock(spec=["upload_files"])
+    original = api.upload_files
+    module._upload_concurrently(api, 4)
+    assert api.upload_files is original
+
+
+def test_kaggle_api_credentials_are_not_left_in_the_environment(publish_env, mocker, monkeypatch):
+    module, _, _ = publish_env
+    monkeypatch.delenv("KAGGLE_KEY", raising=False)
+    module.config_manager.get_env.return_value = None
+    with pytest.raises(SystemExit):
+        module._kaggle_api("key")
+
+    seen = {}
+    client = mocker.MagicMock()
+    client.return_value.authenticate.side_effect = lambda: seen.update(
+        username=os.environ.get("KAGGLE_USERNAME"), key=os.environ.get("KAGGLE_KEY"))
+    mocker.patch.dict("sys.modules", {"kaggle": mocker.MagicMock(), "kaggle.api": mocker.MagicMock(),
+                                      "kaggle.api.kaggle_api_extended": mocker.MagicMock(KaggleApi=client)})
+    module.config_manager.get_env.return_value = "owner"
+    module._kaggle_api("key")
+    assert seen == {"username": "owner", "key": "key"}
+    assert "KAGGLE_KEY" not in os.environ
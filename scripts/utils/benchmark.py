@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+MedData Benchmark Module - Benchmark results and baseline comparison.
+
+This module runs benchmarks of the processing pipeline, docs generation and
+asset generation, each in a fresh process so that memory measurements don't
+depend on what ran before. Stage metrics become benchmark results (throughput
+in items per second and peak memory growth), which are stored as JSON - either
+as a baseline or keyed by git commit - and compared against later runs to flag
+performance regressions.
+"""
+from __future__ import annotations
+
+import gc
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from scripts.utils.config_manager import config_manager
+from scripts.utils.dispatcher import script_dispatcher
+from scripts.utils.metrics import MetricsRecorder, format_bytes
+from scripts.utils.subprocess_handler import subprocess_handler
+
+__all__ = ["BenchmarkResult", "run_isolated", "run_pipeline_benchmark", "run_docs_benchmark",
+           "run_assets_benchmark", "results_from_metrics", "best_of", "load_baseline", "save_baseline",
+           "compare_results", "result_rows", "current_commit", "commit_results_path", "find_commit_results",
+           "RESULT_COLUMNS"]
+
+# Allowed slowdown / memory growth relative to the baseline
+DEFAULT_TOLERANCE = 0.25
+
+# Memory deltas this small are dominated by allocator noise
+MEMORY_SLACK = 16 * 1024 * 1024
+
+# Stages faster than this are too noisy to judge throughput
+MIN_TIMED_SECONDS = 0.05
+
+# Arrow's default jemalloc pool returns memory on a timer, which makes peak RSS
+# readings of the same run differ by hundreds of MB; the system allocator doesn't
+BENCHMARK_ENV = {"ARROW_DEFAULT_MEMORY_POOL": "system"}
+
+RESULT_COLUMNS = ["Benchmark", "Stage", "Items", "Time", "Items/sec", "Peak RSS delta", "vs baseline"]
+
+# How far back in history to look for stored results to compare against
+MAX_ANCESTORS = 200
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Measurement of one stage of one benchmark.
+
+    Attributes:
+        benchmark: Benchmark name (e.g. 'medium-100000-csv')
+        stage: Stage name
+        rows: Rows (or documents, images) processed by the stage
+        seconds: Wall time in seconds
+        peak_rss_delta: Growth of peak resident memory in bytes, if known
+    """
+    benchmark: str
+    stage: str
+    rows: Optional[int]
+    seconds: float
+    peak_rss_delta: Optional[int] = None
+
+    @property
+    def rows_per_sec(self) -> Optional[float]:
+        """Throughput of the stage, if it processed any items."""
+        if not self.rows or self.seconds <= 0:
+            return None
+        return self.rows / self.seconds
+
+    @property
+    def key(self) -> str:
+        """Identifier used in baselines."""
+        return f"{self.benchmark}/{self.stage}"
+
+
+def _silence_worker() -> None:
+    """Send a benchmark process's console output to the null device."""
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+
+
+def run_isolated(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Call a function in a freshly spawned process and return its result.
+
+    The process runs with BENCHMARK_ENV added to the environment, and its
+    standard output is discarded so progress messages of the benchmarked
+    functions don't flood the report. Exceptions still reach the caller.
+
+    Args:
+        func: Module-level function to call
+        *args: Picklable arguments
+
+    Returns:
+        Whatever the function returns
+    """
+    saved = {key: os.environ.get(key) for key in BENCHMARK_ENV}
+    os.environ.update(BENCHMARK_ENV)
+    try:
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_silence_worker) as pool:
+            return pool.submit(func, *args).result()
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def run_pipeline_benchmark(source: Union[str, Path], name: str) -> List[BenchmarkResult]:
+    """
+    Benchmark processing of one source file with the process-dataset functions.
+
+    Args:
+        source: CSV or Parquet source file
+        name: Benchmark name
+
+    Returns:
+        Results for the ingest, normalize, dedupe, parquet write and sample stages
+    """
+    process = script_dispatcher.load(config_manager.paths.project_root / "scripts" / "process-dataset.py")
+
+    gc.collect()
+    metrics = MetricsRecorder()
+    df = process.read_data_file(str(source), metrics, "ingest")
+    df = process.normalize_dataframe(df, metrics)
+    with tempfile.TemporaryDirectory(prefix="meddata-bench-") as output_dir:
+        process.write_processed_files(df, Path(output_dir), metrics)
+
+    return results_from_metrics(name, metrics)
+
+
+def _sandbox_outputs(root: Path) -> None:
+    """
+    Point docs, template and asset output at a scratch directory for this process.
+
+    Only meant for benchmark processes: the templates are copied into ``root``
+    and the global paths are replaced, so the project's docs, templates,
+    images and caches are never touched. Dataset configs are still read from
+    the project.
+    """
+    paths = config_manager.paths
+    shutil.copytree(paths.project_root / "assets" / "templates", root / "assets" / "templates")
+    if paths.templates_dir.is_dir():
+        shutil.copytree(paths.templates_dir, root / "templates")
+    config_manager.paths = replace(paths, project_root=root, docs_dir=root / "docs",
+                                   templates_dir=root / "templates", cache_dir=root / ".meddata")
+
+
+def run_docs_benchmark(iterations: int, name: str) -> List[BenchmarkResult]:
+    """
+    Benchmark generating the documentation of every configured dataset.
+
+    Args:
+        iterations: How many times the docs of each dataset are generated
+        name: Benchmark name
+
+    Returns:
+        Result of the 'docs' stage, counting generated documentation sets
+    """
+    from scripts.utils.catalog import dataset_catalog
+
+    docs = script_dispatcher.load(config_manager.paths.project_root / "scripts" / "generate-docs.py")
+    dataset_ids = [dataset_id for dataset_id, _config in dataset_catalog.items()]
+
+    with tempfile.TemporaryDirectory(prefix="meddata-bench-") as root:
+        _sandbox_outputs(Path(root))
+        gc.collect()
+        metrics = MetricsRecorder()
+        with metrics.stage("docs", rows_in=len(dataset_ids) * iterations):
+            for _ in range(iterations):
+                for dataset_id in dataset_ids:
+                    docs.generate_dataset_docs(dataset_id)
+
+    return results_from_metrics(name, metrics)
+
+
+def run_assets_benchmark(iterations: int, name: str) -> List[BenchmarkResult]:
+    """
+    Benchmark generating the logos of every configured dataset and the site icons.
+
+    Args:
+        iterations: How many times the assets are generated
+        name: Benchmark name
+
+    Returns:
+        Result of the 'assets' stage, counting generated images
+    """
+    from scripts.utils.catalog import dataset_catalog
+
+    assets = script_dispatcher.load(config_manager.paths.project_root / "scripts" / "generate-assets.py")
+    configs = [config for _dataset_id, config in dataset_catalog.items()]
+
+    with tempfile.TemporaryDirectory(prefix="meddata-bench-") as root:
+        _sandbox_outputs(Path(root))
+        (Path(root) / "assets" / "images").mkdir(parents=True)
+        gc.collect()
+        metrics = MetricsRecorder()
+        with metrics.stage("assets", rows_in=(len(configs) + 2) * iterations):
+            for _ in range(iterations):
+                for config in configs:
+                    assets.generate_svg_logo(config)
+                assets.generate_favicon()
+                assets.generate_logo()
+
+    return results_from_metrics(name, metrics)
+
+
+def results_from_metrics(benchmark: str, metrics: MetricsRecorder) -> List[BenchmarkResult]:
+    """
+    Convert recorded stages into benchmark results.
+
+    Args:
+        benchmark: Benchmark name
+        metrics: Recorder holding the measured stages
+
+    Returns:
+        One result per stage
+    """
+    return [
+        BenchmarkResult(benchmark, stage.name,
+                        stage.rows_in if stage.rows_in is not None else stage.rows_out,
+                        stage.wall_time, stage.peak_rss_delta)
+        for stage in metrics.stages
+    ]
+
+
+def best_of(runs: List[List[BenchmarkResult]]) -> List[BenchmarkResult]:
+    """
+    Combine repeated runs of a benchmark, keeping the best reading of each stage.
+
+    The fastest time and the smallest memory growth are the ones least
+    disturbed by other activity on the machine.
+
+    Args:
+        runs: Results of each repetition, in the same stage order
+
+    Returns:
+        One result per stage
+    """
+    best = []
+    for repeats in zip(*runs):
+        memory = [r.peak_rss_delta for r in repeats if r.peak_rss_delta is not None]
+        best.append(BenchmarkResult(repeats[0].benchmark, repeats[0].stage, repeats[0].rows,
+                                    min(r.seconds for r in repeats), min(memory) if memory else None))
+    return best
+
+
+def load_baseline(path: Union[str, Path]) -> Dict[str, Dict[str, Any]]:
+    """
+    Load a stored baseline.
+
+    Args:
+        path: Baseline JSON file
+
+    Returns:
+        Mapping of result key to stored measurements (empty if there is no baseline)
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            return json.load(file).get("results", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def save_baseline(path: Union[str, Path], results: List[BenchmarkResult], **metadata: Any) -> Path:
+    """
+    Store results as the baseline, keeping entries of benchmarks that weren't run.
+
+    Args:
+        path: Baseline JSON file
+        results: Results to store
+        **metadata: Extra top-level fields (e.g. the git commit)
+
+    Returns:
+        Path to the baseline file
+    """
+    path = Path(path)
+    baseline = load_baseline(path)
+    for result in results:
+        baseline[result.key] = dict(asdict(result), rows_per_sec=result.rows_per_sec)
+
+    path.parent.mkdir(exist_ok=True, parents=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        json.dump(dict(metadata, version=1, results=baseline), file, indent=2, sort_keys=True)
+        file.write("\n")
+    os.replace(tmp_path, path)
+    return path
+
+
+def _check(result: BenchmarkResult, stored: Dict[str, Any], tolerance: float,
+           memory_tolerance: float) -> List[str]:
+    """List the ways a result regressed against its stored measurement."""
+    problems = []
+    rate, base_rate = result.rows_per_sec, stored.get("rows_per_sec")
+    timed = max(result.seconds, stored.get("seconds", 0.0)) >= MIN_TIMED_SECONDS
+    if timed and rate is not None and base_rate and rate < base_rate * (1 - tolerance):
+        problems.append(f"throughput {rate:,.0f} rows/s is {1 - rate / base_rate:.0%} below "
+                        f"baseline {base_rate:,.0f} rows/s")
+
+    memory, base_memory = result.peak_rss_delta, stored.get("peak_rss_delta")
+    if memory is not None and base_memory is not None \
+            and memory > base_memory * (1 + memory_tolerance) + MEMORY_SLACK:
+        problems.append(f"peak memory {format_bytes(memory)} exceeds baseline {format_bytes(base_memory)}")
+    return problems
+
+
+def compare_results(results: List[BenchmarkResult], baseline: Dict[str, Dict[str, Any]],
+                    tolerance: float = DEFAULT_TOLERANCE,
+                    memory_tolerance: Optional[float] = None) -> List[str]:
+    """
+    Compare results against a baseline.
+
+    Args:
+        results: Results of the current run
+        baseline: Stored baseline from load_baseline
+        tolerance: Allowed relative throughput drop (0.25 = 25%)
+        memory_tolerance: Allowed relative memory growth (defaults to tolerance)
+
+    Returns:
+        One message per regression; empty if nothing regressed
+    """
+    if memory_tolerance is None:
+        memory_tolerance = tolerance
+    regressions = []
+    for result in results:
+        stored = baseline.get(result.key)
+        if stored:
+            problems = _check(result, stored, tolerance, memory_tolerance)
+            regressions.extend(f"{result.key}: {problem}" for problem in problems)
+    return regressions
+
+
+def result_rows(results: List[BenchmarkResult], baseline: Dict[str, Dict[str, Any]]) -> List[List[str]]:
+    """
+    Format results as table rows matching RESULT_COLUMNS.
+
+    Args:
+        results: Results to format
+        baseline: Stored baseline for the 'vs baseline' column
+
+    Returns:
+        Table rows
+    """
+    rows = []
+    for result in results:
+        rate = result.rows_per_sec
+        base_rate = baseline.get(result.key, {}).get("rows_per_sec")
+        change = f"{rate / base_rate - 1:+.0%}" if rate and base_rate else ""
+        rows.append([
+            result.benchmark,
+            result.stage,
+            "" if result.rows is None else f"{result.rows:,}",
+            f"{result.seconds:.3f}s",
+            "" if rate is None else f"{rate:,.0f}",
+            format_bytes(result.peak_rss_delta),
+            change,
+        ])
+    return rows
+
+
+def _git(*args: str) -> Optional[str]:
+    """Run a git command in the project root and return its output, or None if it fails."""
+    stdout, _stderr, code = subprocess_handler.run_and_get_output(
+        ["git", "-C", str(config_manager.paths.project_root), *args])
+    return stdout.strip() if code == 0 else None
+
+
+def current_commit() -> Optional[str]:
+    """
+    Identify the checked-out code for storing results.
+
+    Returns:
+        The HEAD commit hash, suffixed with '-dirty' if tracked files have
+        uncommitted changes, or None outside a git checkout
+    """
+    commit = _git("rev-parse", "HEAD")
+    if not commit:
+        return None
+    if _git("status", "--porcelain", "--untracked-files=no"):
+        return f"{commit}-dirty"
+    return commit
+
+
+def commit_results_path(results_dir: Union[str, Path], commit: str) -> Path:
+    """
+    Path of the stored results for a commit.
+
+    Args:
+        results_dir: Directory holding one JSON file per commit
+        commit: Commit key from current_commit
+
+    Returns:
+        Path to the commit's results file
+    """
+    return Path(results_dir) / f"{commit}.json"
+
+
+def find_commit_results(results_dir: Union[str, Path], ref: Optional[str] = None,
+                        exclude: Optional[str] = None) -> Optional[str]:
+    """
+    Find the commit whose stored results a run should be compared against.
+
+    Args:
+        results_dir: Directory holding one JSON file per commit
+        ref: Git revision to compare against (any form git understands); if
+            omitted, the nearest commit in HEAD's history with stored results
+        exclude: Commit key to skip (the run being compared)
+
+    Returns:
+        Commit key with stored results, or None if there is none
+    """
+    if ref:
+        commit = _git("rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}")
+        candidates = [commit] if commit else []
+    else:
+        history = _git("rev-list", f"--max-count={MAX_ANCESTORS}", "HEAD") or ""
+        candidates = history.split()
+
+    for commit in candidates:
+        if commit != exclude and commit_results_path(results_dir, commit).exists():
+            return commit
+    return None
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+MedData Catalog Module - Central, cached index of dataset configurations.
+
+This module parses the ``_datasets/*.yml`` configuration files once and keeps
+the parsed objects keyed by path, modification time and size. The cache lives
+in memory for the lifetime of the process and is optionally pickled under the
+cache directory, so later runs only re-parse configs that actually changed.
+The pickle is rewritten at most once per pass over the configs (or once at
+exit for individual loads) and drops configs whose files were deleted.
+Configs are parsed with libyaml when available and validated against the
+dataset schema before they are handed out.
+"""
+from __future__ import annotations
+
+import atexit
+import copy
+import os
+import pickle
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import yaml
+
+from scripts.utils.config_manager import config_manager
+from scripts.utils.dataset_schema import ConfigValidationError, DatasetConfig, validate_config
+
+__all__ = ["DatasetCatalog", "dataset_catalog"]
+
+# Bump when the cached representation changes to invalidate old pickles
+CACHE_VERSION = 1
+CACHE_FILE = "catalog.pickle"
+
+# The libyaml loader is several times faster than the pure-Python one
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# (mtime_ns, size, parsed config) per config path
+_CacheEntry = Tuple[int, int, Dict[str, Any]]
+
+
+class DatasetCatalog:
+    """
+    Loads dataset configurations, re-parsing a file only when it changes.
+
+    Callers receive deep copies of the cached configs so that modifying a
+    returned dictionary never leaks into later loads.
+
+    Attributes:
+        persist: Whether parsed configs are pickled to the cache directory
+    """
+
+    def __init__(self, datasets_dir: Optional[Union[str, Path]] = None,
+                 cache_dir: Optional[Union[str, Path]] = None,
+                 persist: bool = True) -> None:
+        """
+        Initialize the DatasetCatalog.
+
+        Args:
+            datasets_dir: Directory of dataset configs (defaults to the configured datasets_dir)
+            cache_dir: Directory for the pickled cache (defaults to the configured cache_dir)
+            persist: Whether to keep the parsed configs on disk between runs
+        """
+        self._datasets_dir = Path(datasets_dir) if datasets_dir else None
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self.persist = persist
+        self._entries: Dict[str, _CacheEntry] = {}
+        self._disk_loaded = False
+        self._dirty = False
+        self._flush_at_exit = False
+        self._lock = threading.RLock()
+
+    @property
+    def datasets_dir(self) -> Path:
+        """Directory containing the dataset configuration files."""
+        return self._datasets_dir or config_manager.paths.datasets_dir
+
+    @property
+    def cache_path(self) -> Path:
+        """File the parsed configs are pickled to."""
+        return (self._cache_dir or config_manager.paths.cache_dir) / CACHE_FILE
+
+    def config_path(self, dataset_id: str) -> Path:
+        """
+        Get the configuration file path of a dataset.
+
+        Args:
+            dataset_id: ID of the dataset
+
+        Returns:
+            Path to the dataset's YAML file
+        """
+        return self.datasets_dir / f"{dataset_id}.yml"
+
+    def ids(self) -> List[str]:
+        """
+        List all configured datasets.
+
+        Returns:
+            Sorted dataset IDs
+        """
+        return sorted(path.stem for path in self.datasets_dir.glob("*.yml"))
+
+    def load(self, dataset_id: str, validate: bool = True) -> DatasetConfig:
+        """
+        Load a dataset configuration.
+
+        Args:
+            dataset_id: ID of the dataset to load
+            validate: Whether to check the config against the dataset schema
+
+        Returns:
+            Dictionary containing the dataset configuration
+
+        Raises:
+            FileNotFoundError: If the configuration file doesn't exist
+            yaml.YAMLError: If the configuration file is not valid YAML
+            ConfigValidationError: If the configuration doesn't match the schema
+        """
+        path = self.config_path(dataset_id)
+        with self._lock:
+            config, parsed = self._get(path)
+            if parsed and self.persist and not self._flush_at_exit:
+                # Batch commands load many configs; pickle them all once at exit
+                atexit.register(self.flush)
+                self._flush_at_exit = True
+
+        if validate:
+            errors = validate_config(config, dataset_id)
+            if errors:
+                raise ConfigValidationError(str(path), errors)
+        return copy.deepcopy(config)
+
+    def validate(self) -> Dict[str, List[str]]:
+        """
+        Validate every dataset configuration in one pass.
+
+        Returns:
+            Mapping of dataset ID to its errors, for invalid configs only
+        """
+        problems: Dict[str, List[str]] = {}
+        with self._lock:
+            for dataset_id in self.ids():
+                try:
+                    config, _parsed = self._get(self.config_path(dataset_id))
+                except yaml.YAMLError as e:
+                    problems[dataset_id] = [f"invalid YAML: {e}"]
+                    continue
+                except OSError as e:
+                    problems[dataset_id] = [f"cannot read file: {e}"]
+                    continue
+                errors = validate_config(config, dataset_id)
+                if errors:
+                    problems[dataset_id] = errors
+            self.flush()
+        return problems
+
+    def items(self) -> Iterator[Tuple[str, DatasetConfig]]:
+        """
+        Iterate over all dataset configurations.
+
+        Configs that cannot be read, parsed or validated are skipped; use
+        ``validate`` or ``load`` to get their errors.
+
+        Yields:
+            Tuples of (dataset_id, config)
+        """
+        configs = []
+        with self._lock:
+            for dataset_id in self.ids():
+                try:
+                    config, _parsed = self._get(self.config_path(dataset_id))
+                except (OSError, yaml.YAMLError):
+                    continue
+                if not validate_config(config, dataset_id):
+                    configs.append((dataset_id, config))
+            self.flush()
+
+        for dataset_id, config in configs:
+            yield dataset_id, copy.deepcopy(config)
+
+    def flush(self) -> None:
+        """Pickle the cache if configs were parsed or dropped since it was last saved."""
+        with self._lock:
+            if self._dirty:
+                self._save()
+                self._dirty = False
+
+    def clear(self) -> None:
+        """Drop all cached configs from memory."""
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, path: Path) -> Tuple[Dict[str, Any], bool]:
+        """
+        Return the parsed config for a path, parsing it only when it changed.
+
+        Returns:
+            Tuple of (config, whether the file had to be parsed)
+        """
+        self._load_disk_cache()
+        stat = path.stat()
+        key = str(path.resolve())
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2], False
+
+        with open(path, 'r', encoding='utf-8') as file:
+            config = yaml.load(file, Loader=SafeLoader)
+        self._entries[key] = (stat.st_mtime_ns, stat.st_size, config)
+        self._dirty = True
+        return config, True
+
+    def _load_disk_cache(self) -> None:
+        """Merge the pickled cache into memory once, ignoring unreadable caches."""
+        if self._disk_loaded or not self.persist:
+            return
+        self._disk_loaded = True
+        try:
+            with open(self.cache_path, 'rb') as file:
+                version, entries = pickle.load(file)
+        except (OSError, pickle.PickleError, EOFError, ValueError, TypeError, AttributeError):
+            return
+        if version == CACHE_VERSION:
+            for key, entry in entries.items():
+                # Configs deleted since the cache was written are dropped on the next save
+                if os.path.exists(key):
+                    self._entries.setdefault(key, entry)
+                else:
+                    self._dirty = True
+
+    def _save(self) -> None:
+        """Atomically pickle the cache so concurrent processes never read a partial file."""
+        if not self.persist:
+            return
+        self._entries = {key: entry for key, entry in self._entries.items() if os.path.exists(key)}
+        cache_path = self.cache_path
+        try:
+            cache_path.parent.mkdir(exist_ok=True, parents=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=f".{CACHE_FILE}.")
+            with os.fdopen(fd, 'wb') as file:
+                pickle.dump((CACHE_VERSION, self._entries), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # The on-disk cache is only an optimisation
+            pass
+
+
+# Create global instance for easy imports
+dataset_catalog = DatasetCatalog()
@@ -11,7 +11,7 @@
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Any, Dict, Optional, Union
 
 __all__ = ["ConfigManager", "config_manager"]
 
@@ -44,6 +44,7 @@ class PathConfig:
         raw_data_dir: Directory containing raw data files
         processed_data_dir: Directory containing processed data files
         docs_dir: Directory containing documentation files
+        cache_dir: Directory for local build state (publish staging, caches)
     """
     project_root: Path
     datasets_dir: Path
@@ -52,6 +53,7 @@ class PathConfig:
     raw_data_dir: Path
     processed_data_dir: Path
     docs_dir: Path
+    cache_dir: Path
 
 
 class ConfigManager:
@@ -64,7 +66,7 @@ class ConfigManager:
     Attributes:
         tokens: Configuration for API tokens
         paths: Configuration for file paths
-        env_vars: Dictionary of all loaded environment variables
+        env_vars: Dictionary of variables loaded from the .env file
     """
 
     def __init__(self, env_file: Optional[Union[str, Path]] = None, debug: bool = False) -> None:
@@ -87,7 +89,8 @@ def __init__(self, env_file: Optional[Union[str, Path]] = None, debug: bool = Fa
             data_dir=self.project_root / "_data",
             raw_data_dir=self.project_root / "_data" / "raw",
             processed_data_dir=self.project_root / "_data" / "processed",
-            docs_dir=self.project_root / "docs"
+            docs_dir=self.project_root / "docs",
+            cache_dir=self.project_root / ".meddata"
         )
 
         # Load environment variables
@@ -100,10 +103,6 @@ def __init__(self, env_file: Optional[Union[str, Path]] = None, debug: bool = Fa
             github=self.get_env("GITHUB_TOKEN")
         )
 
-        # Set up Kaggle configuration if token is available
-        if self.tokens.kaggle:
-            self._setup_kaggle_config()
-
     def _load_env_vars(self, env_file: Optional[Union[str, Path]] = None) -> None:
         """
         Load environment variables from .env file.
@@ -145,11 +144,6 @@ def _load_env_vars(self, env_file: Optional[Union[str, Path]] = None) -> None:
                         self.env_vars[key] = value
                         os.environ[key] = value
 
-        # Also load existing environment variables into our dict
-        for key, value in os.environ.items():
-            if key not in self.env_vars:
-                self.env_vars[key] = value
-
     def get_env(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """
         Get an environment variable.
@@ -161,10 +155,17 @@ def get_env(self, key: str, default: Optional[str] = None) -> Optional[str]:
         Returns:
             Value of the environment variable or default
         """
-        return self.env_vars.get(key, default)
+        if key in self.env_vars:
+            return self.env_vars[key]
+        return os.environ.get(key, default)
+
+    def setup_kaggle_config(self) -> None:
+        """
+        Write ~/.kaggle/kaggle.json from the configured token if it doesn't exist.
 
-    def _setup_kaggle_config(self) -> None:
-        """Set up Kaggle configuration if token is available."""
+        Called by the Kaggle code paths right before the Kaggle API is used, so
+        commands that never talk to Kaggle don't touch the home directory.
+        """
         if not self.tokens.kaggle:
             return
 
@@ -212,5 +213,26 @@ def ensure_directories_exist(self) -> None:
         self.paths.docs_dir.mkdir(exist_ok=True, parents=True)
 
 
-# Create global instance for easy imports
-config_manager = ConfigManager()
+class _LazyConfigManager:
+    """
+    Proxy for the global ConfigManager that creates it on first attribute access.
+
+    Importing this module stays cheap: the .env file is only read once a
+    command actually needs a path, token or environment setting.
+    """
+
+    def __init__(self) -> None:
+        self._instance: Optional[ConfigManager] = None
+
+    def _get_instance(self) -> ConfigManager:
+        """Return the wrapped ConfigManager, creating it if needed."""
+        if self._instance is None:
+            self._instance = ConfigManager()
+        return self._instance
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get_instance(), name)
+
+
+# Create global instance for easy imports (initialised lazily)
+config_manager: ConfigManager = _LazyConfigManager()  # type: ignore[assignment]
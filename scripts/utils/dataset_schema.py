@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+MedData Dataset Schema - Typed model and validator for dataset configurations.
+
+This module describes the structure of ``_datasets/*.yml`` as TypedDicts, so
+scripts keep working with plain dictionaries while type checkers know the
+shape of each field. The same TypedDicts are compiled once into a tree of
+small validator functions that check a parsed config and collect every error
+instead of stopping at the first one.
+"""
+from __future__ import annotations
+
+from datetime import date
+from typing import (Any, Callable, Dict, List, Literal, Optional, TypedDict, Union,
+                    get_args, get_origin, get_type_hints)
+
+__all__ = ["DatasetConfig", "ConfigValidationError", "validate_config"]
+
+
+class LogoColors(TypedDict, total=False):
+    """Logo gradient colors."""
+    primary: str
+    secondary: str
+
+
+class LogoConfig(TypedDict, total=False):
+    """Logo settings used by generate-assets."""
+    text: str
+    background: str
+    colors: LogoColors
+
+
+class _StatRequired(TypedDict):
+    value: Union[str, int, float]
+    label: str
+
+
+class StatConfig(_StatRequired, total=False):
+    """Headline number shown on dataset cards."""
+
+
+class _SourceRequired(TypedDict):
+    platform: Literal["kaggle", "huggingface"]
+
+
+class SourceConfig(_SourceRequired, total=False):
+    """Upstream data source processed by process-dataset."""
+    dataset: str
+    url: str
+    file: str
+
+
+class _PublishingRequired(TypedDict):
+    platform: Literal["huggingface", "github", "kaggle"]
+
+
+class PublishingConfig(_PublishingRequired, total=False):
+    """Publishing target used by publish-dataset."""
+    repository: str
+    url: str
+    license: str
+    keywords: List[str]
+    public: bool
+
+
+class FeatureConfig(TypedDict, total=False):
+    """Feature highlight shown on the dataset page."""
+    icon: str
+    title: str
+    description: str
+
+
+class _SchemaFieldRequired(TypedDict):
+    name: str
+
+
+class SchemaField(_SchemaFieldRequired, total=False):
+    """Column of the processed dataset."""
+    type: str
+    description: str
+    separator: str
+
+
+class _SplitRequired(TypedDict):
+    name: str
+
+
+class SplitConfig(_SplitRequired, total=False):
+    """Named split of the dataset."""
+    records: Union[str, int]
+
+
+class DatasetDetails(TypedDict, total=False):
+    """Detailed description of the processed files."""
+    size: str
+    file_format: str
+    splits: List[SplitConfig]
+    schema: List[SchemaField]
+    preprocessing: List[str]
+
+
+class _DatasetConfigRequired(TypedDict):
+    id: str
+    name: str
+    description: str
+    status: Literal["published", "development"]
+
+
+class DatasetConfig(_DatasetConfigRequired, total=False):
+    """A dataset configuration as stored in ``_datasets/<id>.yml``."""
+    release_date: Union[date, str]
+    expected_update: str
+    logo: LogoConfig
+    stats: List[StatConfig]
+    sources: List[SourceConfig]
+    publishing: List[PublishingConfig]
+    features: List[FeatureConfig]
+    dataset_details: DatasetDetails
+
+
+class ConfigValidationError(ValueError):
+    """
+    Raised when a dataset configuration doesn't match the schema.
+
+    Attributes:
+        errors: Every problem found, as ``"<field path>: <message>"`` strings
+    """
+
+    def __init__(self, source: str, errors: List[str]) -> None:
+        self.errors = errors
+        super().__init__(f"{source}: {len(errors)} validation error(s): " + "; ".join(errors))
+
+
+# A compiled validator appends errors for `value` found at `path`
+_Validator = Callable[[Any, str, List[str]], None]
+
+_TYPE_NAMES = {str: "string", int: "integer", float: "number", bool: "boolean",
+               date: "date", dict: "mapping", list: "list"}
+
+_compiled: Dict[Any, _Validator] = {}
+
+
+def _describe(value: Any) -> str:
+    """Name the YAML type of a parsed value for error messages."""
+    if value is None:
+        return "null"
+    return _TYPE_NAMES.get(type(value), type(value).__name__)
+
+
+def _compile_scalar(expected: type) -> _Validator:
+    # bool is a subclass of int, and YAML ints are fine where floats are expected
+    if expected is float:
+        def check(value: Any) -> bool:
+            return isinstance(value, (int, float)) and not isinstance(value, bool)
+    elif expected is int:
+        def check(value: Any) -> bool:
+            return isinstance(value, int) and not isinstance(value, bool)
+    else:
+        def check(value: Any) -> bool:
+            return isinstance(value, expected)
+
+    name = _TYPE_NAMES.get(expected, expected.__name__)
+
+    def validate(value: Any, path: str, errors: List[str]) -> None:
+        if not check(value):
+            errors.append(f"{path}: expected {name}, got {_describe(value)}")
+    return validate
+
+
+def _compile_typeddict(model: Any) -> _Validator:
+    hints = get_type_hints(model)
+    required = frozenset(model.__required_keys__)
+    fields = {key: _compile(hint) for key, hint in hints.items()}
+
+    def validate(value: Any, path: str, errors: List[str]) -> None:
+        if not isinstance(value, dict):
+            errors.append(f"{path or '<root>'}: expected mapping, got {_describe(value)}")
+            return
+        prefix = f"{path}." if path else ""
+        for key in sorted(required - value.keys()):
+            errors.append(f"{prefix}{key}: missing required field")
+        for key, item in value.items():
+            field_validator = fields.get(key)
+            if field_validator is not None:
+                field_validator(item, f"{prefix}{key}", errors)
+    return validate
+
+
+def _compile(hint: Any) -> _Validator:
+    """
+    Compile a type hint into a validator, reusing previously compiled ones.
+
+    Args:
+        hint: Type hint from the config model
+
+    Returns:
+        Function appending an error message for every mismatch
+    """
+    if hint in _compiled:
+        return _compiled[hint]
+
+    origin = get_origin(hint)
+    if isinstance(hint, type) and issubclass(hint, dict) and hasattr(hint, "__required_keys__"):
+        validator = _compile_typeddict(hint)
+
+    elif origin is list:
+        item_validator = _compile(get_args(hint)[0])
+
+        def validator(value: Any, path: str, errors: List[str]) -> None:
+            if not isinstance(value, list):
+                errors.append(f"{path}: expected list, got {_describe(value)}")
+                return
+            for index, item in enumerate(value):
+                item_validator(item, f"{path}[{index}]", errors)
+
+    elif origin is Literal:
+        choices = get_args(hint)
+
+        def validator(value: Any, path: str, errors: List[str]) -> None:
+            if value not in choices:
+                errors.append(f"{path}: expected one of {', '.join(map(str, choices))}, got {value!r}")
+
+    elif origin is Union:
+        options = [_compile(option) for option in get_args(hint)]
+        names = " or ".join(_TYPE_NAMES.get(option, getattr(option, "__name__", str(option)))
+                            for option in get_args(hint))
+
+        def validator(value: Any, path: str, errors: List[str]) -> None:
+            for option in options:
+                option_errors: List[str] = []
+                option(value, path, option_errors)
+                if not option_errors:
+                    return
+            errors.append(f"{path}: expected {names}, got {_describe(value)}")
+
+    else:
+        validator = _compile_scalar(hint)
+
+    _compiled[hint] = validator
+    return validator
+
+
+def validate_config(config: Any, dataset_id: Optional[str] = None) -> List[str]:
+    """
+    Validate a parsed dataset configuration against the schema.
+
+    Args:
+        config: Parsed YAML document
+        dataset_id: Expected dataset ID (the config file name), if known
+
+    Returns:
+        List of every validation error; empty if the config is valid
+    """
+    errors: List[str] = []
+    _compile(DatasetConfig)(config, "", errors)
+    if dataset_id is not None and isinstance(config, dict) and isinstance(config.get("id"), str) \
+            and config["id"] != dataset_id:
+        errors.append(f"id: '{config['id']}' does not match the file name '{dataset_id}.yml'")
+    return errors
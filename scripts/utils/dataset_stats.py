@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+MedData Dataset Stats Module - Machine-readable statistics of processed datasets.
+
+This module derives a dataset's statistics from the footer of its processed
+Parquet file: rows, columns, row groups, file sizes and per-column null
+rates from the column chunk statistics. No data pages are read, so it costs
+milliseconds regardless of the dataset's size. The result is written to
+``stats.json`` next to the processed data, where the docs generator, the
+preview and the Jekyll site (as ``site.data.processed[<id>].stats``) read it
+instead of hand-maintained values.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from scripts.utils.config_manager import config_manager
+from scripts.utils.file_writer import file_writer
+from scripts.utils.metrics import format_bytes
+from scripts.utils.parquet_footer import ParquetFooter, read_footer
+
+__all__ = ["STATS_FILE", "compute_stats", "write_stats", "load_stats", "display_stats", "format_count",
+           "size_category"]
+
+STATS_FILE = "stats.json"
+
+# Hugging Face size_categories, by upper bound on the number of rows
+_SIZE_CATEGORIES = [
+    (1_000, "n<1K"),
+    (10_000, "1K<n<10K"),
+    (100_000, "10K<n<100K"),
+    (1_000_000, "100K<n<1M"),
+    (10_000_000, "1M<n<10M"),
+    (100_000_000, "10M<n<100M"),
+    (1_000_000_000, "100M<n<1B"),
+]
+
+
+def size_category(rows: int) -> str:
+    """
+    Hugging Face size category of a dataset.
+
+    Args:
+        rows: Number of rows
+
+    Returns:
+        Category such as '10K<n<100K'
+    """
+    for bound, category in _SIZE_CATEGORIES:
+        if rows < bound:
+            return category
+    return "n>1B"
+
+
+def format_count(count: int) -> str:
+    """
+    Abbreviate a count the way dataset stats are written.
+
+    The count is rounded down, so '444K+' means 444,000 to 444,999, which is
+    what ``parquet_footer.check_stats`` expects.
+
+    Args:
+        count: Count to abbreviate
+
+    Returns:
+        The count itself below 1,000, otherwise e.g. '444K+' or '1.2M+'
+    """
+    if count < 1_000:
+        return str(count)
+    for unit, suffix in ((1_000_000_000, "B"), (1_000_000, "M"), (1_000, "K")):
+        if count >= unit:
+            whole = count // unit
+            if whole < 10 and unit > 1_000:
+                tenths = count * 10 // unit
+                return f"{tenths // 10}.{tenths % 10}{suffix}+" if tenths % 10 else f"{whole}{suffix}+"
+            return f"{whole}{suffix}+"
+    return str(count)
+
+
+def _column_stats(footer: ParquetFooter) -> List[Dict[str, Any]]:
+    """Null counts and sizes of each column, summed over the row groups."""
+    metadata = footer.metadata
+    names = list(footer.columns)
+    nulls: Dict[str, Optional[int]] = {name: 0 for name in names}
+    compressed = {name: 0 for name in names}
+    uncompressed = {name: 0 for name in names}
+
+    for index in range(metadata.num_row_groups):
+        row_group = metadata.row_group(index)
+        for column_index in range(row_group.num_columns):
+            column = row_group.column(column_index)
+            # Nested columns have dotted paths; attribute them to their top-level field
+            name = column.path_in_schema.split(".")[0]
+            if name not in nulls:
+                continue
+            compressed[name] += column.total_compressed_size
+            uncompressed[name] += column.total_uncompressed_size
+            statistics = column.statistics
+            if nulls[name] is None or statistics is None or not statistics.has_null_count:
+                nulls[name] = None
+            else:
+                nulls[name] += statistics.null_count
+
+    rows = footer.num_rows
+    fields = []
+    for name in names:
+        null_count = nulls[name]
+        fields.append({
+            "name": name,
+            "type": footer.columns[name],
+            "null_count": null_count,
+            "null_rate": None if null_count is None else (round(null_count / rows, 6) if rows else 0.0),
+            "compressed_bytes": compressed[name],
+            "uncompressed_bytes": uncompressed[name],
+        })
+    return fields
+
+
+def display_stats(stats: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Headline stats in the ``{value, label}`` form used by configurations and the site.
+
+    Args:
+        stats: Stats as returned by compute_stats
+
+    Returns:
+        Stats for rows, fields, size and (if null counts are known) completeness
+    """
+    display = [
+        {"value": format_count(stats["rows"]), "label": "Rows"},
+        {"value": stats["columns"], "label": "Fields"},
+        {"value": format_bytes(stats["total_bytes"]), "label": "Size"},
+    ]
+    null_counts = [field["null_count"] for field in stats["fields"]]
+    cells = stats["rows"] * stats["columns"]
+    if cells and None not in null_counts:
+        complete = 1 - sum(null_counts) / cells
+        display.append({"value": f"{complete:.0%}" if complete in (0, 1) else f"{complete:.1%}",
+                        "label": "Complete"})
+    return display
+
+
+def compute_stats(parquet_path: Union[str, Path], files: Optional[Iterable[Union[str, Path]]] = None) -> Dict[str, Any]:
+    """
+    Compute a dataset's statistics from its Parquet footer.
+
+    Args:
+        parquet_path: Processed Parquet file
+        files: Files whose sizes are reported (defaults to the Parquet file)
+
+    Returns:
+        Dictionary with rows, columns, row_groups, size_category, files
+        (name to bytes), total_bytes, fields (per-column type, null count,
+        null rate and sizes) and display (headline stats)
+
+    Raises:
+        FileNotFoundError: If the Parquet file doesn't exist
+        ParquetFooterError: If its footer is unreadable or inconsistent
+    """
+    footer = read_footer(parquet_path)
+    sizes = {Path(path).name: Path(path).stat().st_size for path in (files or [footer.path])}
+
+    stats: Dict[str, Any] = {
+        "rows": footer.num_rows,
+        "columns": len(footer.columns),
+        "row_groups": footer.num_row_groups,
+        "size_category": size_category(footer.num_rows),
+        "files": sizes,
+        "total_bytes": sum(sizes.values()),
+        "fields": _column_stats(footer),
+    }
+    stats["display"] = display_stats(stats)
+    return stats
+
+
+def write_stats(path: Union[str, Path], stats: Dict[str, Any]) -> Path:
+    """
+    Write stats to a JSON file atomically, leaving it alone if unchanged.
+
+    Args:
+        path: Destination file
+        stats: Stats as returned by compute_stats
+
+    Returns:
+        Path to the written file
+    """
+    path = Path(path)
+    file_writer.write(path, json.dumps(stats, indent=2) + "\n")
+    return path
+
+
+def load_stats(dataset_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Load the stats written when a dataset was last processed.
+
+    Args:
+        dataset_id: ID of the dataset
+
+    Returns:
+        The stats, or None if the dataset hasn't been processed (or the file
+        is unreadable)
+    """
+    path = config_manager.paths.processed_data_dir / dataset_id / STATS_FILE
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            stats = json.load(file)
+    except (OSError, ValueError):
+        return None
+    return stats if isinstance(stats, dict) and "rows" in stats else None
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+MedData Script Dispatcher - In-process execution of MedData scripts.
+
+This module loads the scripts in the ``scripts/`` directory as Python modules
+and calls their entry functions directly, so commands share the already
+imported libraries and configuration of the running interpreter instead of
+starting a new Python process per command.
+"""
+from __future__ import annotations
+
+import importlib.util
+import subprocess
+import sys
+import threading
+import traceback
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Union
+
+__all__ = ["ScriptDispatcher", "script_dispatcher"]
+
+
+class ScriptDispatcher:
+    """
+    Loads script files as modules and calls their functions in-process.
+
+    Script file names contain hyphens (e.g. ``process-dataset.py``) and cannot
+    be imported with a regular import statement, so they are loaded from their
+    file path. Loaded modules are cached for the lifetime of the process.
+
+    Failures are reported the same way as subprocess execution: a script that
+    calls ``sys.exit`` with a non-zero status, or raises an exception, raises
+    ``subprocess.CalledProcessError`` (after printing the traceback to stderr,
+    as a failing child process would), so callers can switch between both
+    execution modes without changing their error handling.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the ScriptDispatcher with an empty module cache."""
+        self._modules: Dict[Path, ModuleType] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _module_name(script_path: Path) -> str:
+        """Build a valid, unique module name for a script file."""
+        return "meddata_scripts." + script_path.stem.replace("-", "_")
+
+    def load(self, script_path: Union[str, Path]) -> ModuleType:
+        """
+        Load a script as a module, reusing a previously loaded instance.
+
+        Args:
+            script_path: Path to the Python script
+
+        Returns:
+            The loaded module
+
+        Raises:
+            FileNotFoundError: If the script doesn't exist
+        """
+        script_path = Path(script_path).resolve()
+        with self._lock:
+            module = self._modules.get(script_path)
+            if module is not None:
+                return module
+
+            if not script_path.exists():
+                raise FileNotFoundError(f"Script not found: {script_path}")
+
+            name = self._module_name(script_path)
+            spec = importlib.util.spec_from_file_location(name, script_path)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                sys.modules.pop(name, None)
+                raise
+
+            self._modules[script_path] = module
+            return module
+
+    def call(self, script_path: Union[str, Path], function: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Call a function defined in a script.
+
+        Args:
+            script_path: Path to the Python script
+            function: Name of the function to call
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            Whatever the function returns
+
+        Raises:
+            subprocess.CalledProcessError: If the script exits with a non-zero
+                status or raises an exception
+        """
+        module = self.load(script_path)
+        command = [str(script_path), function] + [str(arg) for arg in args]
+        try:
+            return getattr(module, function)(*args, **kwargs)
+        except SystemExit as e:
+            if e.code in (None, 0):
+                return None
+            returncode = e.code if isinstance(e.code, int) else 1
+            raise subprocess.CalledProcessError(returncode, command) from e
+        except subprocess.CalledProcessError:
+            raise
+        except Exception as e:
+            traceback.print_exc()
+            raise subprocess.CalledProcessError(1, command) from e
+
+
+# Create global instance for easy imports
+script_dispatcher = ScriptDispatcher()
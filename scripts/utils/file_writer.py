@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+MedData File Writer Module - Atomic writes that skip unchanged files.
+
+This module provides a FileWriter used by every generator (docs, assets,
+preview, publish working trees, stats and profiles) to write its outputs.
+A file whose content hash already matches is left alone, keeping its mtime,
+so Jekyll's incremental build, git and the publish steps don't see it as
+modified. Changed files are written to a temporary file in the same
+directory and renamed over the destination, so readers never see a partly
+written file. Writes can be tracked to report how many files a run
+actually changed; tracking follows the current context (thread or task), so
+stages running side by side each count only their own files. A global
+writer instance is provided for use throughout the application.
+"""
+from __future__ import annotations
+
+import contextvars
+import functools
+import os
+import secrets
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator, List, Tuple, TypeVar, Union
+
+from scripts.utils.manifest import bytes_sha256, file_sha256
+
+__all__ = ["WriteSummary", "FileWriter", "file_writer"]
+
+_T = TypeVar("_T")
+
+
+def _create_temp(path: Path) -> Tuple[int, str]:
+    """
+    Create a temporary file next to a destination.
+
+    Unlike mkstemp (always 0o600), the file gets the permissions open() gives
+    new files under the current umask.
+
+    Args:
+        path: Destination the temporary file will be renamed to
+
+    Returns:
+        Open file descriptor and name of the temporary file
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        tmp_name = str(path.parent / f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(tmp_name, flags, 0o666), tmp_name
+        except FileExistsError:
+            continue
+
+
+@dataclass(eq=False)
+class WriteSummary:
+    """
+    Files written while a summary was being tracked.
+
+    Attributes:
+        changed: Files that were created or rewritten
+        unchanged: Files that already had the content
+    """
+    changed: List[Path] = field(default_factory=list)
+    unchanged: List[Path] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        """Number of files written or checked."""
+        return len(self.changed) + len(self.unchanged)
+
+    def __str__(self) -> str:
+        return f"{len(self.changed)} of {self.total} files changed"
+
+
+class FileWriter:
+    """
+    Writes files atomically, skipping those that already have the content.
+
+    Writing is thread-safe. A write is recorded in the summaries tracked in
+    its own context: new threads start untracked, and work handed to a pool
+    is only counted if it is wrapped with ``bind``.
+    """
+
+    def __init__(self):
+        self._summaries: contextvars.ContextVar[Tuple[WriteSummary, ...]] = contextvars.ContextVar(
+            f"file_writer_summaries_{id(self)}", default=())
+
+    @staticmethod
+    def is_current(path: Path, data: bytes) -> bool:
+        """
+        Check whether a file already holds exactly the given bytes.
+
+        The sizes are compared first, so only files of the same size are hashed.
+
+        Args:
+            path: File to check
+            data: Expected content
+
+        Returns:
+            True if the file exists with that content
+        """
+        try:
+            if path.stat().st_size != len(data):
+                return False
+            return file_sha256(path) == bytes_sha256(data)
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+
+    def _record(self, path: Path, changed: bool) -> None:
+        # list.append is atomic, so summaries shared with bound pool tasks need no lock
+        for summary in self._summaries.get():
+            (summary.changed if changed else summary.unchanged).append(path)
+
+    def write(self, path: Union[str, Path], content: Union[str, bytes], encoding: str = "utf-8",
+              report: bool = True) -> bool:
+        """
+        Write a file unless it already has exactly that content.
+
+        The content goes to a temporary file next to the destination, which
+        is then renamed over it. An existing file's permissions are kept.
+
+        Args:
+            path: Destination file (parent directories are created)
+            content: Text or bytes to write
+            encoding: Encoding of text content
+            report: Whether the write counts in tracked summaries (False for
+                cache files, which aren't outputs of the run)
+
+        Returns:
+            True if the file was written, False if it was already up to date
+        """
+        path = Path(path)
+        data = content.encode(encoding) if isinstance(content, str) else content
+        if self.is_current(path, data):
+            if report:
+                self._record(path, False)
+            return False
+
+        path.parent.mkdir(exist_ok=True, parents=True)
+        try:
+            mode = path.stat().st_mode & 0o7777
+        except FileNotFoundError:
+            mode = None
+        fd, tmp_name = _create_temp(path)
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(data)
+            if mode is not None:
+                os.chmod(tmp_name, mode)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except FileNotFoundError:
+                pass
+            raise
+
+        if report:
+            self._record(path, True)
+        return True
+
+    def copy(self, source: Union[str, Path], destination: Union[str, Path]) -> bool:
+        """
+        Copy a file unless the destination already has its content.
+
+        Args:
+            source: File to copy
+            destination: Destination file
+
+        Returns:
+            True if the destination was written, False if it was already up to date
+
+        Raises:
+            FileNotFoundError: If the source doesn't exist
+        """
+        return self.write(destination, Path(source).read_bytes())
+
+    @contextmanager
+    def track(self) -> Iterator[WriteSummary]:
+        """
+        Track the files written within a block.
+
+        Yields:
+            Summary that fills up as files are written
+        """
+        summary = WriteSummary()
+        token = self._summaries.set(self._summaries.get() + (summary,))
+        try:
+            yield summary
+        finally:
+            self._summaries.reset(token)
+
+    def bind(self, func: Callable[..., _T]) -> Callable[..., _T]:
+        """
+        Bind a function to the summaries tracked in the current context.
+
+        Threads don't inherit the context they were started from, so work
+        submitted to a pool within ``track`` must be bound to be counted.
+        Bind once per task: each call takes its own copy of the context.
+
+        Args:
+            func: Function to run on another thread
+
+        Returns:
+            Function running ``func`` in a copy of the current context
+        """
+        return functools.partial(contextvars.copy_context().run, func)
+
+
+# Create a global instance for easy import
+file_writer = FileWriter()
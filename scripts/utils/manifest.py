@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+MedData Manifest Module - Content manifests for dataset files.
+
+This module provides helpers for describing a set of files by size and
+SHA-256 digest, persisting that description as JSON, comparing two
+manifests to find out which files changed between publishes, and checking
+files on disk against a manifest.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+__all__ = ["file_sha256", "bytes_sha256", "build_manifest", "load_manifest",
+           "write_manifest", "diff_manifests", "verify_manifest"]
+
+# Read files in 1 MiB blocks when hashing
+HASH_BLOCK_SIZE = 1024 * 1024
+
+MANIFEST_VERSION = 1
+
+
+def file_sha256(path: Union[str, Path]) -> str:
+    """
+    Compute the SHA-256 digest of a file without loading it into memory.
+
+    Args:
+        path: Path to the file to hash
+
+    Returns:
+        Hex encoded SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def bytes_sha256(data: bytes) -> str:
+    """
+    Compute the SHA-256 digest of an in-memory buffer.
+
+    Args:
+        data: Bytes to hash
+
+    Returns:
+        Hex encoded SHA-256 digest
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def build_manifest(root: Union[str, Path], files: Iterable[Union[str, Path]],
+                   **metadata: Any) -> Dict[str, Any]:
+    """
+    Build a manifest describing files relative to a root directory.
+
+    Args:
+        root: Directory the manifest paths are relative to
+        files: Files to include in the manifest
+        **metadata: Extra top-level fields to store alongside the files
+
+    Returns:
+        Manifest dictionary with a ``files`` mapping of relative path to
+        ``{"size": ..., "sha256": ...}``
+    """
+    root = Path(root)
+    entries: Dict[str, Dict[str, Any]] = {}
+    for file in sorted(Path(f) for f in files):
+        rel_path = file.relative_to(root).as_posix()
+        entries[rel_path] = {
+            "size": file.stat().st_size,
+            "sha256": file_sha256(file),
+        }
+
+    manifest: Dict[str, Any] = {"version": MANIFEST_VERSION}
+    manifest.update(metadata)
+    manifest["files"] = entries
+    return manifest
+
+
+def load_manifest(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Load a manifest from disk.
+
+    Args:
+        path: Path to the manifest JSON file
+
+    Returns:
+        Manifest dictionary, or an empty manifest if the file doesn't exist
+        or cannot be parsed
+    """
+    path = Path(path)
+    if not path.exists():
+        return {"version": MANIFEST_VERSION, "files": {}}
+
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        return {"version": MANIFEST_VERSION, "files": {}}
+
+    manifest.setdefault("files", {})
+    return manifest
+
+
+def write_manifest(path: Union[str, Path], manifest: Dict[str, Any]) -> Path:
+    """
+    Write a manifest to disk as stable, human-readable JSON.
+
+    Args:
+        path: Destination path for the manifest
+        manifest: Manifest dictionary to write
+
+    Returns:
+        Path to the written manifest
+    """
+    path = Path(path)
+    path.parent.mkdir(exist_ok=True, parents=True)
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+        file.write("\n")
+    return path
+
+
+def diff_manifests(old: Dict[str, Any], new: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+    """
+    Compare two manifests.
+
+    Args:
+        old: Previously published manifest
+        new: Manifest of the current files
+
+    Returns:
+        Tuple of (changed_or_added_paths, removed_paths)
+    """
+    old_files = old.get("files", {})
+    new_files = new.get("files", {})
+
+    changed = [path for path, entry in new_files.items()
+               if old_files.get(path, {}).get("sha256") != entry.get("sha256")]
+    removed = [path for path in old_files if path not in new_files]
+    return sorted(changed), sorted(removed)
+
+
+def verify_manifest(root: Union[str, Path], manifest: Dict[str, Any]) -> List[str]:
+    """
+    Check the files on disk against a manifest.
+
+    Entries with a ``chunks`` list (as written for GitHub) are verified chunk
+    by chunk; other entries are verified as whole files. Sizes are compared
+    first, so files are only hashed when their size is right.
+
+    Args:
+        root: Directory the manifest paths are relative to
+        manifest: Manifest to verify against
+
+    Returns:
+        One message per missing or mismatching file; empty if all files match
+    """
+    root = Path(root)
+    problems = []
+    for rel_path, entry in sorted(manifest.get("files", {}).items()):
+        for part in entry.get("chunks") or [dict(entry, path=rel_path)]:
+            path = root / part["path"]
+            if not path.is_file():
+                problems.append(f"{part['path']}: missing")
+            elif path.stat().st_size != part.get("size"):
+                problems.append(f"{part['path']}: size {path.stat().st_size:,} bytes, "
+                                f"expected {part.get('size', 0):,}")
+            elif file_sha256(path) != part.get("sha256"):
+                problems.append(f"{part['path']}: checksum mismatch")
+    return problems
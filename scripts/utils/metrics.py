@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+MedData Metrics Module - Per-stage timing and memory instrumentation.
+
+This module records how long each stage of a job takes (wall and CPU time),
+how much its peak resident memory grows and how many rows go in and out.
+Stages are measured with a context manager and the collected metrics can be
+rendered as a summary or written to JSON to track them over time.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:  # Windows
+    HAS_RESOURCE = False
+
+__all__ = ["StageMetrics", "MetricsRecorder", "format_bytes"]
+
+_PROC_STATUS = "/proc/self/status"
+_PROC_CLEAR_REFS = "/proc/self/clear_refs"
+
+
+def format_bytes(size: Optional[float]) -> str:
+    """
+    Format a byte count for humans.
+
+    Args:
+        size: Number of bytes (None if unknown)
+
+    Returns:
+        Size such as '12.3 MB', or 'n/a'
+    """
+    if size is None:
+        return "n/a"
+    if abs(size) < 1024:
+        return f"{int(size)} B"
+    for unit in ["KB", "MB"]:
+        size /= 1024
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+    return f"{size / 1024:.1f} GB"
+
+
+def _read_proc_status_kb(field: str) -> Optional[int]:
+    """Read a memory field (in kB) from /proc/self/status, if available."""
+    try:
+        with open(_PROC_STATUS, 'r', encoding='ascii') as file:
+            for line in file:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _reset_peak_rss() -> bool:
+    """Reset the kernel's peak RSS counter (Linux only); return whether it worked."""
+    try:
+        with open(_PROC_CLEAR_REFS, 'w', encoding='ascii') as file:
+            file.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss() -> Optional[int]:
+    """Peak resident set size of this process in bytes."""
+    peak = _read_proc_status_kb("VmHWM")
+    if peak is not None or not HAS_RESOURCE:
+        return peak
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+@dataclass
+class StageMetrics:
+    """
+    Measurements for one stage.
+
+    Attributes:
+        name: Stage name
+        wall_time: Elapsed wall time in seconds
+        cpu_time: CPU time (user + system) spent by this process in seconds
+        peak_rss_delta: Growth of peak resident memory during the stage in bytes
+        rows_in: Rows entering the stage, if applicable
+        rows_out: Rows leaving the stage, if applicable
+    """
+    name: str
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    peak_rss_delta: Optional[int] = None
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+
+
+class MetricsRecorder:
+    """
+    Collects StageMetrics for a sequence of stages.
+
+    Example:
+        >>> recorder = MetricsRecorder()
+        >>> with recorder.stage("normalize", rows_in=len(df)) as stage:
+        ...     df = normalize(df)
+        ...     stage.rows_out = len(df)
+
+    On Linux the kernel's peak RSS counter is reset at the start of every
+    stage, so each stage reports its own peak above the memory it started
+    with. Elsewhere the growth of the process-wide peak is reported.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the MetricsRecorder with no stages."""
+        self.stages: List[StageMetrics] = []
+
+    @contextmanager
+    def stage(self, name: str, rows_in: Optional[int] = None) -> Iterator[StageMetrics]:
+        """
+        Measure a stage.
+
+        The metrics are recorded even if the stage raises.
+
+        Args:
+            name: Stage name
+            rows_in: Rows entering the stage
+
+        Yields:
+            The StageMetrics being recorded; set ``rows_out`` on it
+        """
+        metrics = StageMetrics(name, rows_in=rows_in)
+        if _reset_peak_rss():
+            baseline = _read_proc_status_kb("VmRSS")
+        else:
+            baseline = _peak_rss()
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        try:
+            yield metrics
+        finally:
+            metrics.wall_time = time.perf_counter() - wall_start
+            metrics.cpu_time = time.process_time() - cpu_start
+            peak = _peak_rss()
+            if peak is not None and baseline is not None:
+                metrics.peak_rss_delta = max(0, peak - baseline)
+            self.stages.append(metrics)
+
+    def total(self) -> StageMetrics:
+        """
+        Sum the recorded stages.
+
+        Returns:
+            StageMetrics named 'total' with summed times and the largest memory growth
+        """
+        deltas = [s.peak_rss_delta for s in self.stages if s.peak_rss_delta is not None]
+        return StageMetrics(
+            name="total",
+            wall_time=sum(s.wall_time for s in self.stages),
+            cpu_time=sum(s.cpu_time for s in self.stages),
+            peak_rss_delta=max(deltas) if deltas else None,
+        )
+
+    def rows(self) -> List[List[str]]:
+        """
+        Format the recorded stages as table rows.
+
+        Returns:
+            Rows of [stage, wall time, CPU time, peak RSS delta, rows in, rows out]
+        """
+        def count(value: Optional[int]) -> str:
+            return "" if value is None else f"{value:,}"
+
+        return [
+            [s.name, f"{s.wall_time:.2f}s", f"{s.cpu_time:.2f}s", format_bytes(s.peak_rss_delta),
+             count(s.rows_in), count(s.rows_out)]
+            for s in self.stages + [self.total()]
+        ]
+
+    def to_dict(self, **metadata: Any) -> Dict[str, Any]:
+        """
+        Convert the metrics to a JSON-serialisable dictionary.
+
+        Args:
+            **metadata: Extra top-level fields (e.g. the dataset ID)
+
+        Returns:
+            Dictionary with metadata, a timestamp, the stages and their total
+        """
+        data: Dict[str, Any] = dict(metadata)
+        data["recorded_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        data["stages"] = [asdict(s) for s in self.stages]
+        data["total"] = asdict(self.total())
+        return data
+
+    def write(self, path: Union[str, Path], **metadata: Any) -> Path:
+        """
+        Write the metrics to a JSON file.
+
+        Args:
+            path: Destination file
+            **metadata: Extra top-level fields (e.g. the dataset ID)
+
+        Returns:
+            Path to the written file
+        """
+        path = Path(path)
+        path.parent.mkdir(exist_ok=True, parents=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(self.to_dict(**metadata), file, indent=2)
+            file.write("\n")
+        os.replace(tmp_path, path)
+        return path
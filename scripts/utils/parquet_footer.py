@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+MedData Parquet Footer Module - Integrity checks from Parquet metadata alone.
+
+This module reads only the footer of a Parquet file (memory-mapped, without
+touching the data pages) to get its row count, row groups and schema, checks
+that every column chunk the footer points at lies inside the file, and
+compares the result with what a dataset configuration claims about it
+(``dataset_details.schema`` and the headline ``stats``). A truncated or
+overwritten file is detected in milliseconds instead of midway through a
+publish.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+__all__ = ["ParquetFooter", "ParquetFooterError", "read_footer", "compare_schema", "parse_count",
+           "check_stats"]
+
+# Suffixes used for abbreviated counts in dataset stats ("444K+")
+_COUNT_UNITS = {"": 1, "K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
+_COUNT_PATTERN = re.compile(r"^\s*([\d,]+(?:\.\d+)?)\s*([KMB]?)\s*(\+?)\s*$", re.IGNORECASE)
+
+# Stat labels that count columns rather than rows
+_COLUMN_LABELS = {"fields", "columns", "features"}
+
+# Type names in configs that mean the same as the pandas dtype of the column
+_TYPE_ALIASES = {"str": "object", "string": "object", "text": "object"}
+
+
+class ParquetFooterError(ValueError):
+    """Raised when a Parquet file's footer is missing, unreadable or inconsistent."""
+
+
+@dataclass
+class ParquetFooter:
+    """
+    Summary of a Parquet file's footer.
+
+    Attributes:
+        path: Parquet file
+        size: File size in bytes
+        num_rows: Rows in the file
+        num_row_groups: Row groups in the file
+        columns: Column name to pandas dtype name (e.g. 'object', 'int64')
+        metadata: The underlying pyarrow FileMetaData
+    """
+    path: Path
+    size: int
+    num_rows: int
+    num_row_groups: int
+    columns: Dict[str, str]
+    metadata: Any
+
+
+def _dtype_name(arrow_type: Any) -> str:
+    """Name of the pandas dtype an Arrow type becomes (falls back to the Arrow name)."""
+    import numpy as np
+
+    try:
+        return str(np.dtype(arrow_type.to_pandas_dtype()))
+    except (NotImplementedError, TypeError, ValueError):
+        return str(arrow_type)
+
+
+def read_footer(path: Union[str, Path]) -> ParquetFooter:
+    """
+    Read and sanity-check the footer of a Parquet file without reading its data.
+
+    Args:
+        path: Parquet file
+
+    Returns:
+        Summary of the footer
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ParquetFooterError: If the footer can't be read, or describes row
+            groups or column chunks that don't fit the file
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = Path(path)
+    size = path.stat().st_size
+    try:
+        metadata = pq.read_metadata(path, memory_map=True)
+        schema = metadata.schema.to_arrow_schema()
+    except (pa.ArrowException, OSError) as e:
+        raise ParquetFooterError(f"{path.name}: unreadable Parquet footer ({e})") from e
+
+    # Everything the footer points at must end before the footer itself
+    data_end = size - metadata.serialized_size - 8
+    rows_in_groups = 0
+    for index in range(metadata.num_row_groups):
+        row_group = metadata.row_group(index)
+        rows_in_groups += row_group.num_rows
+        for column_index in range(row_group.num_columns):
+            column = row_group.column(column_index)
+            start = column.data_page_offset
+            if column.has_dictionary_page and column.dictionary_page_offset:
+                start = min(start, column.dictionary_page_offset)
+            if start < 4 or start + column.total_compressed_size > data_end:
+                raise ParquetFooterError(
+                    f"{path.name}: row group {index} column '{column.path_in_schema}' lies outside "
+                    f"the file's data ({start + column.total_compressed_size:,} > {data_end:,} bytes)")
+
+    if rows_in_groups != metadata.num_rows:
+        raise ParquetFooterError(f"{path.name}: row groups hold {rows_in_groups:,} rows but the footer "
+                                 f"declares {metadata.num_rows:,}")
+
+    return ParquetFooter(
+        path=path,
+        size=size,
+        num_rows=metadata.num_rows,
+        num_row_groups=metadata.num_row_groups,
+        columns={field.name: _dtype_name(field.type) for field in schema},
+        metadata=metadata,
+    )
+
+
+def compare_schema(footer: ParquetFooter, schema: List[Mapping[str, Any]]) -> List[str]:
+    """
+    Compare a file's columns with a configuration's ``dataset_details.schema``.
+
+    Args:
+        footer: Footer of the processed file
+        schema: Schema fields from the configuration
+
+    Returns:
+        One message per difference; empty if they agree
+    """
+    problems = []
+    declared = {field["name"]: field.get("type") for field in schema}
+    missing = [name for name in declared if name not in footer.columns]
+    extra = [name for name in footer.columns if name not in declared]
+    if missing:
+        problems.append(f"columns in the config but not in the data: {', '.join(missing)}")
+    if extra:
+        problems.append(f"columns in the data but not in the config: {', '.join(extra)}")
+
+    for name, declared_type in declared.items():
+        actual = footer.columns.get(name)
+        if actual is None or not declared_type:
+            continue
+        expected = _TYPE_ALIASES.get(str(declared_type).lower(), str(declared_type))
+        if expected != actual:
+            problems.append(f"column '{name}' is {actual} but the config says {declared_type}")
+    return problems
+
+
+def parse_count(value: Any) -> Optional[Tuple[int, int, bool]]:
+    """
+    Parse a count as written in dataset stats.
+
+    Args:
+        value: Stat value such as 444, '12,500', '444K+' or '1.2M'
+
+    Returns:
+        Tuple of (count, unit, at_least), e.g. (444000, 1000, True) for
+        '444K+', or None if the value isn't a count (e.g. '100%')
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value), 1, False
+    match = _COUNT_PATTERN.match(str(value))
+    if not match:
+        return None
+    number, suffix, plus = match.groups()
+    unit = _COUNT_UNITS[suffix.upper()]
+    return int(float(number.replace(",", "")) * unit), unit, bool(plus)
+
+
+def check_stats(footer: ParquetFooter, stats: List[Mapping[str, Any]]) -> List[str]:
+    """
+    Compare the row and column counts claimed by a configuration's ``stats``.
+
+    The first count-like stat is taken as the number of rows. Abbreviated
+    counts must round down to the same value ('444K+' holds 444,000 to
+    444,999 rows), so stale stats are reported as well as overstated ones.
+    Stats labelled 'Fields' or 'Columns' are lower bounds on the columns.
+
+    Args:
+        footer: Footer of the processed file
+        stats: Stats from the configuration
+
+    Returns:
+        One message per mismatch; empty if the stats agree
+    """
+    problems = []
+    rows_checked = False
+    for stat in stats:
+        parsed = parse_count(stat.get("value"))
+        if parsed is None:
+            continue
+        count, unit, at_least = parsed
+        label = str(stat.get("label", ""))
+
+        if label.lower() in _COLUMN_LABELS:
+            if len(footer.columns) < count:
+                problems.append(f"stats claim {stat['value']} {label} but the data has "
+                                f"{len(footer.columns)} columns")
+            continue
+        if rows_checked:
+            continue
+        rows_checked = True
+
+        rows = footer.num_rows
+        if at_least and unit > 1:
+            ok = count <= rows < count + unit
+        elif at_least:
+            ok = rows >= count
+        else:
+            ok = abs(rows - count) < unit
+        if not ok:
+            problems.append(f"stats claim {stat['value']} {label} but the data has {rows:,} rows")
+    return problems
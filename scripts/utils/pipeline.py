@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+MedData Pipeline Module - Incremental, dependency-ordered stage execution.
+
+This module provides a small make-style build runner. Each stage declares the
+files it reads and writes and the stages it depends on. Stages whose input
+fingerprint hasn't changed since their last successful run (and whose outputs
+still exist) are skipped, and stages without pending dependencies run in
+parallel.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+__all__ = ["Stage", "StageResult", "Pipeline"]
+
+
+@dataclass
+class Stage:
+    """
+    A single unit of work in a pipeline.
+
+    Attributes:
+        name: Unique stage name
+        action: Callable doing the work; raising or calling sys.exit fails the stage
+        inputs: Files or directories the stage reads
+        outputs: Files the stage produces
+        deps: Names of stages that must finish successfully first
+    """
+    name: str
+    action: Callable[[], Any]
+    inputs: List[Path] = field(default_factory=list)
+    outputs: List[Path] = field(default_factory=list)
+    deps: List[str] = field(default_factory=list)
+
+
+@dataclass
+class StageResult:
+    """
+    Outcome of running a stage.
+
+    Attributes:
+        name: Stage name
+        status: One of 'ran', 'skipped', 'failed' or 'blocked'
+        elapsed: Wall time spent in the stage in seconds
+        error: Error description for failed or blocked stages
+    """
+    name: str
+    status: str
+    elapsed: float = 0.0
+    error: str = ""
+
+
+def _iter_files(path: Path) -> Iterator[Path]:
+    """Yield a file, or every file below a directory, in a stable order."""
+    if path.is_dir():
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                yield Path(root) / name
+    elif path.exists():
+        yield path
+
+
+class Pipeline:
+    """
+    Runs stages in dependency order, skipping stages whose inputs are unchanged.
+
+    Fingerprints are computed from the path, size and modification time of every
+    input file, like make. They are stored in a JSON state file after each
+    successful stage so that later runs can skip work.
+    """
+
+    def __init__(self, state_path: Union[str, Path]) -> None:
+        """
+        Initialize the Pipeline.
+
+        Args:
+            state_path: JSON file storing the input fingerprints of past runs
+        """
+        self.state_path = Path(state_path)
+        self.stages: Dict[str, Stage] = {}
+
+    def add(self, stage: Stage) -> Stage:
+        """
+        Add a stage to the pipeline.
+
+        Args:
+            stage: Stage to add
+
+        Returns:
+            The added stage
+
+        Raises:
+            ValueError: If a stage with the same name exists or a dependency is unknown
+        """
+        if stage.name in self.stages:
+            raise ValueError(f"Duplicate stage: {stage.name}")
+        for dep in stage.deps:
+            if dep not in self.stages:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dep}'")
+        self.stages[stage.name] = stage
+        return stage
+
+    @staticmethod
+    def fingerprint(stage: Stage) -> str:
+        """
+        Compute the input fingerprint of a stage.
+
+        Args:
+            stage: Stage to fingerprint
+
+        Returns:
+            Hex digest covering the stage name and the stat of all its inputs
+        """
+        digest = hashlib.sha256(stage.name.encode("utf-8"))
+        for path in stage.inputs:
+            digest.update(f"\0{path}".encode("utf-8"))
+            if not path.exists():
+                digest.update(b"\0missing")
+                continue
+            for file in _iter_files(path):
+                stat = file.stat()
+                digest.update(f"\0{file}\0{stat.st_size}\0{stat.st_mtime_ns}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _load_state(self) -> Dict[str, str]:
+        """Load stored fingerprints, ignoring a missing or corrupt state file."""
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self, state: Dict[str, str]) -> None:
+        """Persist stage fingerprints."""
+        self.state_path.parent.mkdir(exist_ok=True, parents=True)
+        with open(self.state_path, 'w', encoding='utf-8') as file:
+            json.dump(state, file, indent=2, sort_keys=True)
+
+    def _run_stage(self, stage: Stage, previous: Optional[str], force: bool) -> tuple[StageResult, Optional[str]]:
+        """
+        Run a single stage unless it is up to date.
+
+        Returns:
+            Tuple of the stage result and the fingerprint to store (None on failure)
+        """
+        fingerprint = self.fingerprint(stage)
+        up_to_date = (
+            not force
+            and previous == fingerprint
+            and all(output.exists() for output in stage.outputs)
+        )
+        if up_to_date:
+            return StageResult(stage.name, "skipped"), fingerprint
+
+        start = time.perf_counter()
+        try:
+            stage.action()
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                return StageResult(stage.name, "failed", time.perf_counter() - start,
+                                   f"exited with status {e.code}"), None
+        except Exception as e:
+            return StageResult(stage.name, "failed", time.perf_counter() - start,
+                               f"{type(e).__name__}: {e}"), None
+
+        # Fingerprint again: the stage may have touched its own inputs
+        return StageResult(stage.name, "ran", time.perf_counter() - start), self.fingerprint(stage)
+
+    def run(self, max_workers: Optional[int] = None, force: bool = False,
+            on_result: Optional[Callable[[StageResult], None]] = None) -> Dict[str, StageResult]:
+        """
+        Run all stages, in parallel where dependencies allow.
+
+        Args:
+            max_workers: Maximum number of stages running at once
+            force: Run every stage even if its inputs are unchanged
+            on_result: Optional callback invoked as each stage finishes
+
+        Returns:
+            Mapping of stage name to its result, in declaration order
+        """
+        state = self._load_state()
+        results: Dict[str, StageResult] = {}
+        pending = dict(self.stages)
+        running: Dict[Future, str] = {}
+
+        def finish(result: StageResult) -> None:
+            results[result.name] = result
+            if on_result:
+                on_result(result)
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(self.stages) or 1) as pool:
+            while pending or running:
+                for name, stage in list(pending.items()):
+                    dep_results = [results.get(dep) for dep in stage.deps]
+                    if any(r is not None and r.status in ("failed", "blocked") for r in dep_results):
+                        del pending[name]
+                        failed = [r.name for r in dep_results if r and r.status in ("failed", "blocked")]
+                        finish(StageResult(name, "blocked", error=f"dependency failed: {', '.join(failed)}"))
+                    elif all(r is not None for r in dep_results):
+                        del pending[name]
+                        running[pool.submit(self._run_stage, stage, state.get(name), force)] = name
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    result, fingerprint = future.result()
+                    if fingerprint is None:
+                        state.pop(name, None)
+                    else:
+                        state[name] = fingerprint
+                    self._save_state(state)
+                    finish(result)
+
+        return {name: results[name] for name in self.stages}
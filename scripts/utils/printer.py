@@ -4,21 +4,57 @@
 
 This module provides a robust printing utility that enhances terminal output
 using the rich library. It supports various message formats and displays
-helpful, informative error messages.
+helpful, informative error messages. For batch jobs and other tooling it can
+instead emit newline-delimited JSON events (``log_format = "json"``).
 """
 from __future__ import annotations
 
+import atexit
+import importlib.util
+import json
 import os
 import platform
+import re
 import sys
 import textwrap
+import threading
+import time
 from datetime import datetime
 from types import TracebackType
-from typing import Any, Dict, List, Optional, Union, Type, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, Type, TypeVar
 
-from typing_extensions import Literal
+if TYPE_CHECKING:
+    from scripts.utils.metrics import MetricsRecorder
+
+# rich takes a noticeable share of CLI startup, so it is only imported the
+# first time a printer actually renders rich output (see _load_rich)
+HAS_RICH = importlib.util.find_spec("rich") is not None
+_RICH_LOADED = False
+
+__all__ = ["printer", "Printer"]
+
+MessageType = Literal["info", "success", "warning", "error", "guide", "header"]
+LogFormat = Literal["text", "json"]
+ErrorType = Literal[
+    "missing_file", "permission", "network", "missing_dependency", "dataset_config", "dataset_processing"]
+
+# Type variable for the progress context
+T = TypeVar('T', bound='Progress')
+
+# Environment variable carrying the log format to script subprocesses
+LOG_FORMAT_ENV = "MEDDATA_LOG_FORMAT"
+
+# Rich console markup such as [path]...[/path], stripped from JSON events
+_MARKUP_RE = re.compile(r"\[/?[a-z_ ]+\]")
+
+
+def _load_rich() -> None:
+    """Import the rich classes used by the Printer into the module namespace."""
+    global _RICH_LOADED, Console, Panel, Table, Syntax, Markdown, Progress, SpinnerColumn, TextColumn
+    global install_rich_traceback, Theme
+    if _RICH_LOADED:
+        return
 
-try:
     from rich.console import Console
     from rich.panel import Panel
     from rich.table import Table
@@ -28,33 +64,67 @@
     from rich.traceback import install as install_rich_traceback
     from rich.theme import Theme
 
-    HAS_RICH = True
-except ImportError:
-    HAS_RICH = False
+    _RICH_LOADED = True
 
-__all__ = ["printer", "Printer"]
 
-MessageType = Literal["info", "success", "warning", "error", "guide", "header"]
-ErrorType = Literal[
-    "missing_file", "permission", "network", "missing_dependency", "dataset_config", "dataset_processing"]
+class _EventWriter:
+    """
+    Buffered writer for newline-delimited JSON events.
 
-# Type variable for the progress context
-T = TypeVar('T', bound='Progress')
+    Events are collected in memory and written to stdout in large chunks, so
+    logging from hot loops costs a list append rather than a write syscall.
+    The buffer is flushed when it grows past ``buffer_size``, on request and
+    at interpreter exit.
+    """
+
+    def __init__(self, buffer_size: int = 64 * 1024) -> None:
+        self.buffer_size = buffer_size
+        self._chunks: List[str] = []
+        self._size = 0
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def write(self, line: str, flush: bool = False) -> None:
+        """Queue one line, flushing if requested or the buffer is full."""
+        with self._lock:
+            self._chunks.append(line)
+            self._size += len(line)
+            if flush or self._size >= self.buffer_size:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Write all queued lines to stdout."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._chunks:
+            return
+        data = "".join(self._chunks)
+        self._chunks.clear()
+        self._size = 0
+        # Resolve stdout at flush time so redirections are honoured
+        try:
+            sys.stdout.write(data)
+            sys.stdout.flush()
+        except (OSError, ValueError):
+            pass
 
 
 # Return a simple context manager when rich is not available
 class DummyProgress:
-    def __init__(self, description):
+    def __init__(self, description, output=print):
         self.description = description
+        self._output = output
 
     def __enter__(self) -> 'DummyProgress':
-        print(f"{self.description}...")
+        self._output(f"{self.description}...")
         return self
 
     def __exit__(self, exc_type: Optional[Type[BaseException]],
                  exc_val: Optional[BaseException],
                  exc_tb: Optional[TracebackType]) -> None:
-        print("Done!")
+        self._output("Done!")
 
     @staticmethod
     def add_task(description: str, total: Optional[int] = None) -> int:
@@ -62,7 +132,8 @@ def add_task(description: str, total: Optional[int] = None) -> int:
 
     def update(self, task_id: int, advance: int = 1,
                description: Optional[str] = None) -> None:
-        pass
+        if description:
+            self._output(description)
 
 
 class Printer:
@@ -75,7 +146,9 @@ class Printer:
     Attributes:
         debug_mode (bool): Whether debug mode is enabled for more detailed output
         use_rich (bool): Whether rich formatting is available and enabled
-        console (Optional[Console]): Rich console instance if available
+        console (Optional[Console]): Rich console instance if available, created on first use
+        log_format (str): 'text' for human-readable output or 'json' for
+            newline-delimited JSON events
     """
 
     # ASCII art for MEDDATA logo
@@ -105,33 +178,76 @@ class Printer:
         "date": "magenta",
     }
 
-    def __init__(self, use_rich: bool = True, debug: bool = False) -> None:
+    def __init__(self, use_rich: bool = True, debug: bool = False,
+                 log_format: Optional[LogFormat] = None) -> None:
         """
         Initialize the Printer.
         
         Args:
             use_rich: Whether to use rich formatting (if available)
             debug: Enable debug mode for more detailed output
+            log_format: 'text' or 'json' (defaults to $MEDDATA_LOG_FORMAT, then 'text')
         """
         self.debug_mode: bool = debug
-        self.use_rich: bool = use_rich and HAS_RICH
+        self._use_rich: bool = use_rich and HAS_RICH
+        self._console: Optional[Console] = None
+        self.log_format: LogFormat = log_format or os.environ.get(LOG_FORMAT_ENV, "text")  # type: ignore[assignment]
+        self._writer: Optional[_EventWriter] = None
 
-        if self.use_rich:
+        # Handle character encoding issues
+        self._setup_encoding()
+
+    @property
+    def use_rich(self) -> bool:
+        """Whether rich output is enabled; imports rich the first time it is."""
+        if self._use_rich:
+            _load_rich()
+        return self._use_rich
+
+    @use_rich.setter
+    def use_rich(self, value: bool) -> None:
+        self._use_rich = value and HAS_RICH
+
+    @property
+    def console(self) -> Optional[Console]:
+        """Rich console, created on first use (None when rich is disabled)."""
+        if self._console is None and self.use_rich:
             # Setup rich with our custom theme
-            custom_theme = Theme(self.MEDDATA_THEME)
-            self.console: Optional[Console] = Console(theme=custom_theme)
+            self._console = Console(theme=Theme(self.MEDDATA_THEME))
 
             # Install rich traceback handler for better error display
-            if debug:
-                install_rich_traceback(show_locals=True)
-            else:
-                install_rich_traceback(show_locals=False)
-        else:
-            # Fallback mode if rich is not available
-            self.console: Optional[Console] = None
+            install_rich_traceback(show_locals=self.debug_mode)
+        return self._console
 
-        # Handle character encoding issues
-        self._setup_encoding()
+    @property
+    def json_mode(self) -> bool:
+        """Whether output is emitted as newline-delimited JSON events."""
+        return self.log_format == "json"
+
+    def _emit(self, event: str, flush: bool = False, **fields: Any) -> None:
+        """
+        Queue a JSON event on the buffered event writer.
+
+        Args:
+            event: Event name
+            flush: Write the buffer out immediately
+            **fields: Event payload; values that aren't JSON types are stringified
+        """
+        if self._writer is None:
+            self._writer = _EventWriter()
+        record = {"ts": round(time.time(), 3), "event": event}
+        record.update(fields)
+        self._writer.write(json.dumps(record, ensure_ascii=False, default=str) + "\n", flush=flush)
+
+    def flush(self) -> None:
+        """Write out any buffered JSON events."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    @staticmethod
+    def _strip_markup(text: str) -> str:
+        """Remove rich console markup from a message."""
+        return _MARKUP_RE.sub("", text)
 
     @staticmethod
     def _setup_encoding() -> None:
@@ -183,7 +299,9 @@ def print(self, message: str, msg_type: MessageType = "info") -> None:
             message: The message to print
             msg_type: Message type (info, success, warning, error, guide, header)
         """
-        if self.use_rich:
+        if self.json_mode:
+            self._emit(msg_type, flush=msg_type == "error", message=self._strip_markup(message))
+        elif self.use_rich:
             self.console.print(message, style=msg_type)
         else:
             print(self._format_plain(message, msg_type))
@@ -196,7 +314,9 @@ def header(self, message: str, width: int = 80) -> None:
             message: The header message
             width: Width of the header panel
         """
-        if self.use_rich:
+        if self.json_mode:
+            self._emit("header", message=message)
+        elif self.use_rich:
             self.console.print(Panel(message, width=width, style="header"))
         else:
             print("\n" + "=" * width)
@@ -229,7 +349,10 @@ def error(self, message: str, exception: Optional[Exception] = None) -> None:
             message: The error message
             exception: Optional exception to display
         """
-        if self.use_rich:
+        if self.json_mode:
+            self._emit("error", flush=True, message=self._strip_markup(message),
+                       exception=str(exception) if exception else None)
+        elif self.use_rich:
             self.console.print(Panel(
                 f"{message}\n\n" +
                 (f"[italic]{str(exception)}[/italic]" if exception else ""),
@@ -254,7 +377,9 @@ def guide(self, title: str, steps: List[str]) -> None:
             title: Guide title
             steps: List of steps to display
         """
-        if self.use_rich:
+        if self.json_mode:
+            self._emit("guide", title=title, steps=[self._strip_markup(step) for step in steps])
+        elif self.use_rich:
             guide_content = "\n".join(f"{i + 1}. {step}" for i, step in enumerate(steps))
             self.console.print(Panel(
                 guide_content,
@@ -275,7 +400,9 @@ def code(self, code: str, language: str = "python") -> None:
             code: The code to display
             language: Programming language for syntax highlighting
         """
-        if self.use_rich:
+        if self.json_mode:
+            self._emit("code", code=code, language=language)
+        elif self.use_rich:
             self.console.print(Syntax(code, language, theme="monokai"))
         else:
             print("\n--- Code ---")
@@ -290,7 +417,9 @@ def file_path(self, path: str, exists: bool = True) -> None:
             path: The file path to display
             exists: Whether the file exists
         """
-        if self.use_rich:
+        if self.json_mode:
+            self._emit("file", path=str(path), exists=exists)
+        elif self.use_rich:
             icon = "✓" if exists else "✗"
             self.console.print(f"{icon} [path]{path}[/path]")
         else:
@@ -306,7 +435,9 @@ def table(self, columns: List[str], rows: List[List[str]], title: Optional[str]
             rows: Row data
             title: Optional table title
         """
-        if self.use_rich:
+        if self.json_mode:
+            self._emit("table", title=title, columns=columns, rows=rows)
+        elif self.use_rich:
             table = Table(title=title)
             for column in columns:
                 table.add_column(column)
@@ -343,6 +474,8 @@ def progress_context(self, description: str = "Processing") -> Union[Progress, '
             A progress context manager (when rich is available)
             or a dummy context manager (when rich is not available)
         """
+        if self.json_mode:
+            return DummyProgress(description, output=lambda message: self._emit("progress", message=message))
         if self.use_rich:
             return Progress(
                 SpinnerColumn(),
@@ -361,7 +494,9 @@ def dataset_created(self, dataset_id: str, config_path: str) -> None:
             dataset_id: ID of the created dataset
             config_path: Path to the dataset configuration file
         """
-        if self.use_rich:
+        if self.json_mode:
+            self._emit("dataset_created", dataset_id=dataset_id, config_path=str(config_path))
+        elif self.use_rich:
             self.console.print(Panel(
                 f"[success]Dataset [bold]{dataset_id}[/bold] created successfully![/success]\n\n"
                 f"Configuration file: [path]{config_path}[/path]",
@@ -397,15 +532,22 @@ def dataset_created(self, dataset_id: str, config_path: str) -> None:
             print(f"5. Run 'python meddata.py process {dataset_id}' to process your dataset")
             print(f"6. Run 'python meddata.py docs {dataset_id}' to generate documentation")
 
-    def dataset_processed(self, dataset_id: str, stats: Dict[str, Any]) -> None:
+    def dataset_processed(self, dataset_id: str, stats: Dict[str, Any],
+                          metrics: Optional[MetricsRecorder] = None) -> None:
         """
         Print a success message for dataset processing with statistics.
         
         Args:
             dataset_id: ID of the processed dataset
             stats: Dictionary containing dataset statistics
+            metrics: Optional per-stage timing and memory metrics
         """
-        if self.use_rich:
+        metrics_columns = ["Stage", "Wall time", "CPU time", "Peak RSS delta", "Rows in", "Rows out"]
+
+        if self.json_mode:
+            self._emit("dataset_processed", dataset_id=dataset_id, stats=stats,
+                       metrics=metrics.to_dict()["stages"] if metrics else None)
+        elif self.use_rich:
             # Format stats into a table
             stats_table = Table(show_header=True)
             stats_table.add_column("Metric")
@@ -422,12 +564,23 @@ def dataset_processed(self, dataset_id: str, stats: Dict[str, Any]) -> None:
             ))
 
             self.console.print(Panel(stats_table, title="Dataset Statistics"))
+
+            if metrics:
+                metrics_table = Table(show_header=True)
+                for column in metrics_columns:
+                    metrics_table.add_column(column, justify="left" if column == "Stage" else "right")
+                for row in metrics.rows():
+                    metrics_table.add_row(*row)
+                self.console.print(Panel(metrics_table, title="Stage Metrics"))
         else:
             print(f"\n[SUCCESS] Dataset '{dataset_id}' processed successfully!")
             print("\nDataset Statistics:")
             for key, value in stats.items():
                 print(f"  {key}: {value}")
 
+            if metrics:
+                self.table(metrics_columns, metrics.rows(), title="Stage Metrics")
+
     def dataset_published(self, dataset_id: str, platforms: List[str], urls: List[str]) -> None:
         """
         Print a success message for dataset publishing with platform URLs.
@@ -437,7 +590,9 @@ def dataset_published(self, dataset_id: str, platforms: List[str], urls: List[st
             platforms: List of platforms the dataset was published to
             urls: List of URLs where the dataset can be accessed
         """
-        if self.use_rich:
+        if self.json_mode:
+            self._emit("dataset_published", dataset_id=dataset_id, urls=dict(zip(platforms, urls)))
+        elif self.use_rich:
             # Create a table of platforms and URLs
             urls_table = Table(show_header=True)
             urls_table.add_column("Platform")
@@ -460,8 +615,39 @@ def dataset_published(self, dataset_id: str, platforms: List[str], urls: List[st
             for platform, url in zip(platforms, urls):
                 print(f"  {platform}: {url}")
 
+    def config_errors(self, problems: Dict[str, List[str]]) -> None:
+        """
+        Print every dataset configuration error as one table.
+
+        Args:
+            problems: Mapping of dataset ID to its validation errors
+        """
+        rows = []
+        for dataset_id, errors in sorted(problems.items()):
+            for error in errors:
+                field, _, message = error.partition(": ")
+                rows.append([dataset_id, field, message])
+        self.table(["Dataset", "Field", "Problem"], rows, title="Invalid dataset configuration")
+
+    def timing(self, name: str, seconds: float, **details: Any) -> None:
+        """
+        Report how long an operation took.
+
+        Args:
+            name: Name of the timed operation (e.g. a pipeline stage)
+            seconds: Elapsed wall time in seconds
+            **details: Extra context such as the dataset or stage status
+        """
+        if self.json_mode:
+            self._emit("timing", name=name, seconds=round(seconds, 6), **details)
+            return
+        extra = ", ".join(f"{key}={value}" for key, value in details.items())
+        self.print(f"{name}: {seconds:.2f}s" + (f" ({extra})" if extra else ""), "info")
+
     def logo(self) -> None:
         """Display the MEDDATA ASCII logo."""
+        if self.json_mode:
+            return
         if self.use_rich:
             self.console.print(self.MEDDATA_ASCII, style="primary")
         else:
@@ -472,7 +658,9 @@ def timestamp(self) -> None:
         now = datetime.now()
         timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
 
-        if self.use_rich:
+        if self.json_mode:
+            self._emit("timestamp", timestamp=timestamp)
+        elif self.use_rich:
             self.console.print(f"[date]{timestamp}[/date]")
         else:
             print(timestamp)
@@ -553,7 +741,11 @@ def smart_error(self, error_type: ErrorType, context: Optional[Dict[str, Any]] =
         else:
             title, message, solutions = error_templates[error_type]
 
-        if self.use_rich:
+        if self.json_mode:
+            self._emit("error", flush=True, error_type=error_type, title=title,
+                       message=self._strip_markup(message),
+                       solutions=[self._strip_markup(solution) for solution in solutions])
+        elif self.use_rich:
             self.console.print(Panel(
                 f"{message}\n\n[guide]Possible solutions:[/guide]",
                 title=f"[danger]{title}",
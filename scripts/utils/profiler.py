@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""
+MedData Profiler Module - Approximate column profiles of processed datasets.
+
+This module streams the row groups of a processed Parquet file and keeps a
+small, mergeable sketch per column instead of materializing the dataset:
+
+- HyperLogLog for the number of distinct values (about 1% error)
+- A log-bucketed quantile sketch for numeric columns (1% relative error)
+- Misra-Gries heavy-hitter counters for the most frequent short values
+
+Row groups are split across worker processes, each returning its sketches,
+which are merged in the parent. Memory is bounded by one row group per
+worker plus the sketches, whatever the size of the dataset. Columns stored as
+delimited text (e.g. comma-separated tags) are profiled per item when their
+separator is given.
+"""
+from __future__ import annotations
+
+import json
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from scripts.utils.config_manager import config_manager
+from scripts.utils.file_writer import file_writer
+from scripts.utils.parquet_footer import read_footer
+
+__all__ = ["PROFILE_FILE", "HyperLogLog", "QuantileSketch", "HeavyHitters", "ColumnSketch", "profile_dataset",
+           "write_profile", "load_profile"]
+
+PROFILE_FILE = "profile.json"
+
+# Quantiles reported for numeric columns
+QUANTILES = (0.25, 0.5, 0.75, 0.9, 0.99)
+
+# Longer values are free text rather than categories and are left out of the top values
+MAX_TOP_VALUE_LENGTH = 100
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct-value counter over 64-bit hashes.
+
+    Attributes:
+        precision: Bits of the hash selecting a register (2**precision registers)
+        registers: Highest rank seen per register
+    """
+
+    def __init__(self, precision: int = 14):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        """
+        Add 64-bit hashes of values.
+
+        Args:
+            hashes: Array of uint64 hashes
+        """
+        if not len(hashes):
+            return
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        width = 64 - self.precision
+        index = (hashes >> np.uint64(width)).astype(np.intp)
+        rest = hashes & np.uint64((1 << width) - 1)
+        # frexp gives the bit length of the remaining bits (0 for 0)
+        _, bit_length = np.frexp(rest.astype(np.float64))
+        rank = (width - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def update(self, values: pd.Series) -> None:
+        """
+        Add the values of a Series.
+
+        Args:
+            values: Non-null values
+        """
+        # Hashing the raw values skips the factorizing hash_pandas_object does, which costs more than it saves
+        # on mostly unique text
+        array = values.to_numpy(dtype=np.float64 if pd.api.types.is_float_dtype(values) else object)
+        self.add_hashes(pd.util.hash_array(array, categorize=False))
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Merge another counter of the same precision into this one."""
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> int:
+        """
+        Estimate the number of distinct values added.
+
+        Returns:
+            Approximate distinct count
+        """
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate while many registers are empty
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with bounded relative error.
+
+    Values are counted in logarithmically sized buckets, so every quantile is
+    within ``relative_accuracy`` of a value at that rank.
+
+    Attributes:
+        relative_accuracy: Maximum relative error of a quantile
+        count: Values added
+        total: Sum of the values added
+        minimum: Smallest value added
+        maximum: Largest value added
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self._zeros = 0
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def _add_buckets(self, store: Dict[int, int], values: np.ndarray) -> None:
+        keys, counts = np.unique(np.ceil(np.log(values) / self._log_gamma).astype(np.int64), return_counts=True)
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            store[key] = store.get(key, 0) + count
+
+    def update(self, values: np.ndarray) -> None:
+        """
+        Add numeric values; NaN and infinite values are ignored.
+
+        Args:
+            values: Array of numbers
+        """
+        values = np.asarray(values, dtype=np.float64)
+        values = values[np.isfinite(values)]
+        if not len(values):
+            return
+        self.count += len(values)
+        self.total += float(values.sum())
+        self.minimum = min(self.minimum, float(values.min()))
+        self.maximum = max(self.maximum, float(values.max()))
+        tiny = np.finfo(np.float64).tiny
+        self._zeros += int(np.count_nonzero(np.abs(values) < tiny))
+        self._add_buckets(self._positive, values[values >= tiny])
+        self._add_buckets(self._negative, -values[values <= -tiny])
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Merge another sketch of the same accuracy into this one."""
+        for store, other_store in ((self._positive, other._positive), (self._negative, other._negative)):
+            for key, count in other_store.items():
+                store[key] = store.get(key, 0) + count
+        self._zeros += other._zeros
+        self.count += other.count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Approximate quantile.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            The value at that quantile, or None if the sketch is empty
+        """
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        # Walk the buckets from the most negative value to the largest
+        buckets = [(key, count, -1) for key, count in sorted(self._negative.items(), reverse=True)]
+        buckets.append((0, self._zeros, 0))
+        buckets += [(key, count, 1) for key, count in sorted(self._positive.items())]
+        for key, count, sign in buckets:
+            seen += count
+            if count and seen > rank:
+                value = sign * 2 * self._gamma ** key / (self._gamma + 1)
+                return min(max(value, self.minimum), self.maximum)
+        return self.maximum
+
+
+class HeavyHitters:
+    """
+    Misra-Gries summary of the most frequent values.
+
+    Every value occurring more than ``error`` times is kept, and each kept
+    count is at most ``error`` below the true count.
+
+    Attributes:
+        capacity: Values kept
+        counts: Kept values and their (under)counts
+        error: Upper bound on how much any count is underestimated
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = capacity
+        self.counts: Dict[Any, int] = {}
+        self.error = 0
+
+    def _prune(self, counts: pd.Series) -> None:
+        counts = counts.sort_values(ascending=False, kind="stable")
+        if len(counts) > self.capacity:
+            threshold = int(counts.iloc[self.capacity])
+            counts = counts.iloc[:self.capacity] - threshold
+            counts = counts[counts > 0]
+            self.error += threshold
+        self.counts = dict(zip(counts.index.tolist(), counts.astype(int).tolist()))
+
+    def update(self, values: pd.Series) -> None:
+        """
+        Count the values of a Series.
+
+        Args:
+            values: Non-null values
+        """
+        if not len(values):
+            return
+        batch = HeavyHitters(self.capacity)
+        batch._prune(values.value_counts(sort=False))
+        self.merge(batch)
+
+    def merge(self, other: "HeavyHitters") -> None:
+        """Merge another summary into this one."""
+        combined = pd.Series(self.counts, dtype="int64").add(pd.Series(other.counts, dtype="int64"), fill_value=0)
+        self.error += other.error
+        self._prune(combined.astype("int64"))
+
+    def top(self, k: int) -> List[Dict[str, Any]]:
+        """
+        Most frequent values.
+
+        Args:
+            k: Number of values
+
+        Returns:
+            Up to k dictionaries with 'value' and 'count', most frequent first
+        """
+        ranked = sorted(self.counts.items(), key=lambda item: (-item[1], str(item[0])))[:k]
+        return [{"value": value, "count": count} for value, count in ranked]
+
+
+@dataclass
+class ColumnSketch:
+    """
+    Sketches of one column.
+
+    Attributes:
+        name: Column name
+        separator: Separator of items stored as delimited text, if any
+        rows: Rows seen
+        nulls: Null (or, for delimited columns, empty) rows
+        items: Values seen (items for delimited columns)
+        distinct: Distinct value counter
+        quantiles: Quantile sketch, for numeric columns
+        top: Heavy hitters, for non-numeric columns
+    """
+    name: str
+    separator: Optional[str] = None
+    rows: int = 0
+    nulls: int = 0
+    items: int = 0
+    distinct: HyperLogLog = field(default_factory=HyperLogLog)
+    quantiles: Optional[QuantileSketch] = None
+    top: Optional[HeavyHitters] = None
+
+    def update(self, series: pd.Series) -> None:
+        """
+        Add a batch of the column.
+
+        Args:
+            series: The column's values in one row group
+        """
+        self.rows += len(series)
+        values = series.dropna()
+        self.nulls += len(series) - len(values)
+
+        numeric = pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values)
+        if numeric:
+            # Rows with nulls turn integer columns into floats; hash them alike in every row group
+            values = values.astype(np.float64)
+            self.quantiles = self.quantiles or QuantileSketch()
+            self.quantiles.update(values.to_numpy())
+        else:
+            values = values.astype(str)
+            if self.separator:
+                items = values.reset_index(drop=True).str.split(self.separator).explode().str.strip()
+                items = items[items != ""]
+                # Rows holding no items (empty or only separators) count as nulls
+                self.nulls += len(values) - items.index.nunique()
+                values = items
+            self.top = self.top or HeavyHitters()
+            self.top.update(values[values.str.len() <= MAX_TOP_VALUE_LENGTH])
+
+        self.items += len(values)
+        self.distinct.update(values)
+
+    def merge(self, other: "ColumnSketch") -> None:
+        """Merge the sketches of the same column from other row groups."""
+        self.rows += other.rows
+        self.nulls += other.nulls
+        self.items += other.items
+        self.distinct.merge(other.distinct)
+        for attribute in ("quantiles", "top"):
+            mine, theirs = getattr(self, attribute), getattr(other, attribute)
+            if mine is None:
+                setattr(self, attribute, theirs)
+            elif theirs is not None:
+                mine.merge(theirs)
+
+    def summary(self, dtype: Optional[str] = None, top_k: int = 10) -> Dict[str, Any]:
+        """
+        JSON-serializable profile of the column.
+
+        Args:
+            dtype: Type of the column in the file
+            top_k: Most frequent values to report
+
+        Returns:
+            Dictionary with rows, nulls, distinct and, depending on the column,
+            min, max, mean and quantiles, or the top values
+        """
+        profile: Dict[str, Any] = {
+            "name": self.name,
+            "type": dtype,
+            "rows": self.rows,
+            "nulls": self.nulls,
+            "distinct": min(self.distinct.estimate(), self.items),
+        }
+        if self.separator:
+            profile["separator"] = self.separator
+            profile["items"] = self.items
+        if self.quantiles is not None and self.quantiles.count:
+            sketch = self.quantiles
+            profile.update({
+                "min": sketch.minimum,
+                "max": sketch.maximum,
+                "mean": sketch.total / sketch.count,
+                "quantiles": {f"p{round(q * 100)}": sketch.quantile(q) for q in QUANTILES},
+            })
+        if self.top is not None:
+            profile["top"] = self.top.top(top_k)
+        return profile
+
+
+def _profile_row_groups(path: str, row_groups: Sequence[int], columns: Optional[List[str]],
+                        separators: Mapping[str, str]) -> Dict[str, ColumnSketch]:
+    """Sketch the given row groups of a file (run in a worker process)."""
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path, memory_map=True)
+    sketches: Dict[str, ColumnSketch] = {}
+    for index in row_groups:
+        frame = parquet_file.read_row_group(index, columns=columns).to_pandas()
+        for name in frame.columns:
+            if name not in sketches:
+                sketches[name] = ColumnSketch(name, separator=separators.get(name))
+            sketches[name].update(frame[name])
+    return sketches
+
+
+def profile_dataset(path: Union[str, Path],
+                    columns: Optional[List[str]] = None,
+                    separators: Optional[Mapping[str, str]] = None,
+                    workers: Optional[int] = None,
+                    top_k: int = 10) -> Dict[str, Any]:
+    """
+    Profile every column of a Parquet file, streaming its row groups.
+
+    Args:
+        path: Parquet file
+        columns: Columns to profile (defaults to all)
+        separators: Column name to the separator of items stored as
+            delimited text (e.g. {'tags': ','})
+        workers: Worker processes (defaults to the CPU count, capped at the
+            number of row groups; 1 profiles in this process)
+        top_k: Most frequent values to report per column
+
+    Returns:
+        Dictionary with rows, row_groups and columns (one profile per column,
+        see ColumnSketch.summary)
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ParquetFooterError: If its footer is unreadable or inconsistent
+    """
+    footer = read_footer(path)
+    separators = dict(separators or {})
+    columns = list(columns) if columns is not None else None
+    row_groups = list(range(footer.num_row_groups))
+    workers = max(1, min(workers or os.cpu_count() or 1, len(row_groups)))
+
+    if workers == 1:
+        parts = [_profile_row_groups(str(footer.path), row_groups, columns, separators)]
+    else:
+        # Strided assignment balances row groups of different sizes across workers
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = [pool.submit(_profile_row_groups, str(footer.path), row_groups[offset::workers], columns,
+                                   separators)
+                       for offset in range(workers)]
+            parts = [future.result() for future in futures]
+
+    sketches: Dict[str, ColumnSketch] = {}
+    for part in parts:
+        for name, sketch in part.items():
+            if name in sketches:
+                sketches[name].merge(sketch)
+            else:
+                sketches[name] = sketch
+
+    names = columns if columns is not None else list(footer.columns)
+    return {
+        "rows": footer.num_rows,
+        "row_groups": footer.num_row_groups,
+        "columns": [sketches.get(name, ColumnSketch(name)).summary(footer.columns.get(name), top_k)
+                    for name in names],
+    }
+
+
+def write_profile(path: Union[str, Path], profile: Dict[str, Any]) -> Path:
+    """
+    Write a profile to a JSON file atomically, leaving it alone if unchanged.
+
+    Args:
+        path: Destination file
+        profile: Profile as returned by profile_dataset
+
+    Returns:
+        Path to the written file
+    """
+    path = Path(path)
+    file_writer.write(path, json.dumps(profile, indent=2, default=str) + "\n")
+    return path
+
+
+def load_profile(dataset_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Load the profile written when a dataset was last processed.
+
+    Args:
+        dataset_id: ID of the dataset
+
+    Returns:
+        The profile, or None if there is none (or the file is unreadable)
+    """
+    path = config_manager.paths.processed_data_dir / dataset_id / PROFILE_FILE
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            profile = json.load(file)
+    except (OSError, ValueError):
+        return None
+    return profile if isinstance(profile, dict) and "columns" in profile else None
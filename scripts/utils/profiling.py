@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+MedData Profiling Module - Optional CPU and memory profiling of commands.
+
+This module wraps a unit of work in cProfile (``cpu``) or tracemalloc
+(``memory``), saves the raw profile under the profiles directory and prints a
+table of the top functions by cumulative time or the top allocation sites.
+
+Scripts launched in a subprocess are profiled by running them through this
+module, which executes the script as ``__main__`` inside the profiler:
+
+    python scripts/utils/profiling.py cpu scripts/process-dataset.py medium
+"""
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+import runpy
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Union
+
+# Ensure project root is on PYTHONPATH when executed directly
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from scripts.utils.config_manager import config_manager
+from scripts.utils.metrics import format_bytes
+from scripts.utils.printer import printer
+
+__all__ = ["PROFILE_MODES", "Profiler", "profiled"]
+
+PROFILE_MODES = ("cpu", "memory")
+
+# Rows shown in the summary table
+TOP_N = 15
+
+# Frames of the profiler itself, hidden from memory summaries
+_IGNORED_ALLOCATIONS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+def _short_path(filename: str) -> str:
+    """Show a file relative to the project root or its import path entry."""
+    if filename.startswith("<"):
+        return filename
+    path = Path(filename).resolve()
+    roots = [project_root] + sorted((Path(p).resolve() for p in sys.path if p),
+                                    key=lambda root: len(root.parts), reverse=True)
+    for root in roots:
+        try:
+            return path.relative_to(root).as_posix()
+        except ValueError:
+            continue
+    return filename
+
+
+class Profiler:
+    """
+    Profiles a block of code with cProfile or tracemalloc.
+
+    Attributes:
+        mode: 'cpu' or 'memory'
+        label: Name used for the saved profile file
+        output_dir: Directory receiving the profile files
+        path: Path of the saved profile, once stopped
+    """
+
+    def __init__(self, mode: str, label: str, output_dir: Optional[Union[str, Path]] = None) -> None:
+        """
+        Initialize the Profiler.
+
+        Args:
+            mode: 'cpu' for cProfile or 'memory' for tracemalloc
+            label: Name used for the saved profile file (e.g. the command)
+            output_dir: Directory for profile files (defaults to <cache_dir>/profiles)
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode: {mode} (expected one of {', '.join(PROFILE_MODES)})")
+        self.mode = mode
+        self.label = label
+        self.output_dir = Path(output_dir) if output_dir else config_manager.paths.cache_dir / "profiles"
+        self.path: Optional[Path] = None
+        self._profile: Optional[cProfile.Profile] = None
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._peak = 0
+
+    def start(self) -> None:
+        """Start collecting."""
+        if self.mode == "cpu":
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            tracemalloc.start()
+
+    def stop(self) -> Path:
+        """
+        Stop collecting and save the raw profile.
+
+        Returns:
+            Path to the saved ``.prof`` (cpu) or ``.snapshot`` (memory) file
+        """
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        safe_label = "".join(c if c.isalnum() or c in "-_." else "_" for c in self.label)
+        self.output_dir.mkdir(exist_ok=True, parents=True)
+
+        if self.mode == "cpu":
+            self._profile.disable()
+            self.path = self.output_dir / f"{safe_label}-{stamp}-{os.getpid()}.prof"
+            self._profile.dump_stats(str(self.path))
+        else:
+            self._snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED_ALLOCATIONS)
+            self._peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            self.path = self.output_dir / f"{safe_label}-{stamp}-{os.getpid()}.snapshot"
+            self._snapshot.dump(str(self.path))
+        return self.path
+
+    def summary(self, limit: int = TOP_N) -> tuple[List[str], List[List[str]], str]:
+        """
+        Summarize the collected profile.
+
+        Args:
+            limit: Number of rows to include
+
+        Returns:
+            Tuple of (columns, rows, title) for ``printer.table``
+        """
+        if self.mode == "cpu":
+            stats = pstats.Stats(self._profile).sort_stats(pstats.SortKey.CUMULATIVE)
+            rows = []
+            for func in stats.fcn_list[:limit]:
+                primitive_calls, calls, total_time, cumulative_time, _callers = stats.stats[func]
+                filename, line, name = func
+                location = name if filename == "~" else f"{name} ({_short_path(filename)}:{line})"
+                call_count = str(calls) if calls == primitive_calls else f"{calls}/{primitive_calls}"
+                rows.append([location, call_count, f"{total_time:.3f}s", f"{cumulative_time:.3f}s"])
+            title = f"{self.label}: top functions by cumulative time ({stats.total_tt:.2f}s total)"
+            return ["Function", "Calls", "Own time", "Cumulative"], rows, title
+
+        rows = []
+        for stat in self._snapshot.statistics("lineno")[:limit]:
+            frame = stat.traceback[0]
+            rows.append([f"{_short_path(frame.filename)}:{frame.lineno}",
+                         format_bytes(stat.size), f"{stat.count:,}"])
+        title = f"{self.label}: top allocation sites still held at exit (peak {format_bytes(self._peak)})"
+        return ["Location", "Size", "Blocks"], rows, title
+
+    def report(self, limit: int = TOP_N) -> None:
+        """
+        Print the summary table and where the raw profile was saved.
+
+        Args:
+            limit: Number of rows to include
+        """
+        columns, rows, title = self.summary(limit)
+        printer.table(columns, rows, title=title)
+        printer.print(f"Profile saved to [path]{self.path}[/path]")
+        if self.mode == "cpu":
+            printer.print(f"Inspect it with: python -m pstats {self.path}")
+
+
+@contextmanager
+def profiled(mode: Optional[str], label: str) -> Iterator[Optional[Profiler]]:
+    """
+    Profile the enclosed block if a mode is given.
+
+    The profile is saved and summarized even if the block raises or exits.
+
+    Args:
+        mode: 'cpu', 'memory' or None to disable profiling
+        label: Name used for the saved profile file
+
+    Yields:
+        The active Profiler, or None when profiling is disabled
+    """
+    if not mode:
+        yield None
+        return
+
+    profiler = Profiler(mode, label)
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        profiler.report()
+
+
+def main() -> int:
+    """
+    Run a script as ``__main__`` under the profiler.
+
+    Usage: python scripts/utils/profiling.py {cpu,memory} <script> [args...]
+
+    Returns:
+        Exit code (0 for success, non-zero for error)
+    """
+    if len(sys.argv) < 3 or sys.argv[1] not in PROFILE_MODES:
+        printer.error(f"Usage: python scripts/utils/profiling.py {{{','.join(PROFILE_MODES)}}} <script> [args...]")
+        return 2
+
+    mode, script = sys.argv[1], sys.argv[2]
+    sys.argv = [script] + sys.argv[3:]
+    with profiled(mode, Path(script).stem):
+        runpy.run_path(script, run_name="__main__")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
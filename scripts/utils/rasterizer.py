@@ -0,0 +1,983 @@
+#!/usr/bin/env python3
+"""
+MedData Rasterizer Module - Pure-Python SVG to PNG and ICO rendering.
+
+This module renders the subset of SVG used by the logo and favicon templates
+into RGBA pixels with numpy: rect, circle, ellipse, line, polyline, polygon
+and path shapes (including curves and arcs), solid colours, linear and radial
+gradients, opacity, translate/scale transforms and text. Edges are
+anti-aliased by supersampling. Text is drawn with a built-in stroke font of
+capitals, digits, '-' and '.' (lower case is drawn as capitals; any other
+character raises SVGRenderError), which is enough for logo initials. PNG and ICO files are encoded with zlib, so no native
+library, network or GPU is needed.
+
+Rendered files are cached under ``.meddata/raster`` by a hash of the SVG,
+the sizes and the renderer version, so an unchanged logo is never rendered
+twice; renders that miss the cache run on a process pool. ``prune_cache``
+removes renders that no current job uses.
+"""
+from __future__ import annotations
+
+import hashlib
+import math
+import multiprocessing
+import os
+import re
+import struct
+import xml.etree.ElementTree as ET
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from scripts.utils.config_manager import config_manager
+from scripts.utils.file_writer import file_writer
+
+__all__ = ["SVGRenderError", "RasterizeError", "RasterJob", "render_svg", "encode_png", "encode_ico", "render_file",
+           "rasterize", "prune_cache"]
+
+# Bumped whenever rendering changes, so cached images are re-rendered
+RENDERER_VERSION = 1
+
+# Largest supersampled canvas side; smaller images get up to 4x4 samples per pixel
+MAX_SUPERSAMPLED = 1024
+
+# Line segments per curve when flattening paths
+CURVE_SEGMENTS = 16
+
+# Largest image an ICO entry can hold
+MAX_ICO_SIZE = 256
+
+_NAMED_COLORS = {
+    "black": (0, 0, 0), "white": (255, 255, 255), "red": (255, 0, 0), "green": (0, 128, 0),
+    "blue": (0, 0, 255), "yellow": (255, 255, 0), "orange": (255, 165, 0), "purple": (128, 0, 128),
+    "gray": (128, 128, 128), "grey": (128, 128, 128), "silver": (192, 192, 192), "navy": (0, 0, 128),
+    "teal": (0, 128, 128), "maroon": (128, 0, 0), "lime": (0, 255, 0), "aqua": (0, 255, 255),
+    "cyan": (0, 255, 255), "fuchsia": (255, 0, 255), "magenta": (255, 0, 255), "olive": (128, 128, 0),
+}
+
+# Presentation attributes passed down from parent elements
+_INHERITED = ("fill", "stroke", "stroke-width", "fill-opacity", "stroke-opacity", "fill-rule",
+              "stroke-linecap", "font-size", "font-weight", "text-anchor", "visibility")
+
+# Elements that are never drawn directly
+_SKIPPED = {"defs", "linearGradient", "radialGradient", "title", "desc", "metadata", "clipPath",
+            "mask", "style", "symbol", "pattern", "filter"}
+
+# Stroke font: polylines on a 4 x 6 grid, y pointing down with the baseline at 6
+_GLYPH_O = [[(1, 0), (3, 0), (4, 1), (4, 5), (3, 6), (1, 6), (0, 5), (0, 1), (1, 0)]]
+_GLYPH_P = [[(0, 6), (0, 0), (3, 0), (4, 1), (4, 2), (3, 3), (0, 3)]]
+_GLYPHS: Dict[str, List[List[Tuple[float, float]]]] = {
+    "A": [[(0, 6), (2, 0), (4, 6)], [(0.7, 4), (3.3, 4)]],
+    "B": [[(0, 3), (0, 0), (3, 0), (4, 1), (4, 2), (3, 3), (0, 3), (0, 6), (3, 6), (4, 5), (4, 4), (3, 3)]],
+    "C": [[(4, 1), (3, 0), (1, 0), (0, 1), (0, 5), (1, 6), (3, 6), (4, 5)]],
+    "D": [[(0, 0), (0, 6), (2.5, 6), (4, 4.5), (4, 1.5), (2.5, 0), (0, 0)]],
+    "E": [[(4, 0), (0, 0), (0, 6), (4, 6)], [(0, 3), (3, 3)]],
+    "F": [[(4, 0), (0, 0), (0, 6)], [(0, 3), (3, 3)]],
+    "G": [[(4, 1), (3, 0), (1, 0), (0, 1), (0, 5), (1, 6), (3, 6), (4, 5), (4, 3), (2, 3)]],
+    "H": [[(0, 0), (0, 6)], [(4, 0), (4, 6)], [(0, 3), (4, 3)]],
+    "I": [[(1, 0), (3, 0)], [(2, 0), (2, 6)], [(1, 6), (3, 6)]],
+    "J": [[(4, 0), (4, 5), (3, 6), (1, 6), (0, 5)]],
+    "K": [[(0, 0), (0, 6)], [(4, 0), (0, 4)], [(1.5, 2.5), (4, 6)]],
+    "L": [[(0, 0), (0, 6), (4, 6)]],
+    "M": [[(0, 6), (0, 0), (2, 3), (4, 0), (4, 6)]],
+    "N": [[(0, 6), (0, 0), (4, 6), (4, 0)]],
+    "O": _GLYPH_O,
+    "P": _GLYPH_P,
+    "Q": _GLYPH_O + [[(2.5, 4.5), (4, 6)]],
+    "R": _GLYPH_P + [[(2, 3), (4, 6)]],
+    "S": [[(4, 1), (3, 0), (1, 0), (0, 1), (0, 2), (1, 3), (3, 3), (4, 4), (4, 5), (3, 6), (1, 6), (0, 5)]],
+    "T": [[(0, 0), (4, 0)], [(2, 0), (2, 6)]],
+    "U": [[(0, 0), (0, 5), (1, 6), (3, 6), (4, 5), (4, 0)]],
+    "V": [[(0, 0), (2, 6), (4, 0)]],
+    "W": [[(0, 0), (1, 6), (2, 3), (3, 6), (4, 0)]],
+    "X": [[(0, 0), (4, 6)], [(4, 0), (0, 6)]],
+    "Y": [[(0, 0), (2, 3), (4, 0)], [(2, 3), (2, 6)]],
+    "Z": [[(0, 0), (4, 0), (0, 6), (4, 6)]],
+    "0": _GLYPH_O + [[(3.5, 0.5), (0.5, 5.5)]],
+    "1": [[(1, 1), (2, 0), (2, 6)], [(1, 6), (3, 6)]],
+    "2": [[(0, 1), (1, 0), (3, 0), (4, 1), (4, 2), (0, 6), (4, 6)]],
+    "3": [[(0, 1), (1, 0), (3, 0), (4, 1), (4, 2), (3, 3), (4, 4), (4, 5), (3, 6), (1, 6), (0, 5)],
+          [(1.5, 3), (3, 3)]],
+    "4": [[(3, 6), (3, 0), (0, 4), (4, 4)]],
+    "5": [[(4, 0), (0, 0), (0, 3), (3, 3), (4, 4), (4, 5), (3, 6), (0, 6)]],
+    "6": [[(4, 1), (3, 0), (1, 0), (0, 1), (0, 5), (1, 6), (3, 6), (4, 5), (4, 4), (3, 3), (0, 3)]],
+    "7": [[(0, 0), (4, 0), (1.5, 6)]],
+    "8": [[(3, 3), (1, 3), (0, 4), (0, 5), (1, 6), (3, 6), (4, 5), (4, 4), (3, 3), (4, 2), (4, 1), (3, 0),
+           (1, 0), (0, 1), (0, 2), (1, 3)]],
+    "9": [[(4, 3), (1, 3), (0, 2), (0, 1), (1, 0), (3, 0), (4, 1), (4, 5), (3, 6), (1, 6), (0, 5)]],
+    "-": [[(0.5, 3), (3.5, 3)]],
+    ".": [[(2, 6), (2, 6)]],
+    " ": [],
+}
+
+_NUMBER = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_TRANSFORM = re.compile(r"(\w+)\s*\(([^)]*)\)")
+
+# Axis-aligned transform to device pixels: (scale_x, scale_y, translate_x, translate_y)
+_Transform = Tuple[float, float, float, float]
+_Subpath = Tuple[np.ndarray, bool]
+_BBox = Tuple[float, float, float, float]
+
+
+class SVGRenderError(ValueError):
+    """Raised when an SVG can't be parsed or uses features the renderer doesn't support."""
+
+
+class RasterizeError(Exception):
+    """
+    Raised by rasterize when some jobs failed, after the others were written.
+
+    Attributes:
+        results: The successful jobs, as rasterize would have returned them
+        failures: Mapping of each failed job's target to its error
+    """
+
+    def __init__(self, results: Dict[Path, bool], failures: Dict[Path, Exception]):
+        super().__init__(f"{len(failures)} renders failed: "
+                         + "; ".join(f"{target.name}: {error}" for target, error in failures.items()))
+        self.results = results
+        self.failures = failures
+
+
+@dataclass(frozen=True)
+class RasterJob:
+    """
+    An SVG to render, as a PNG of one size or an ICO holding several sizes.
+
+    Attributes:
+        source: SVG file
+        target: Output file; its suffix (.png or .ico) selects the format
+        sizes: Pixel sizes (one for a PNG)
+    """
+    source: Path
+    target: Path
+    sizes: Tuple[int, ...]
+
+    @property
+    def format(self) -> str:
+        """Output format, 'png' or 'ico'."""
+        return self.target.suffix.lstrip(".").lower()
+
+
+def _local(tag: str) -> str:
+    """Tag name without its XML namespace."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _numbers(value: str) -> List[float]:
+    return [float(number) for number in _NUMBER.findall(value)]
+
+
+def _length(value: Optional[str], default: float = 0.0, reference: float = 1.0) -> float:
+    """Parse a length or number, with percentages relative to ``reference``."""
+    if value is None or not value.strip():
+        return default
+    value = value.strip()
+    if value.endswith("%"):
+        return float(value[:-1]) * reference / 100
+    match = _NUMBER.match(value)
+    if not match:
+        raise SVGRenderError(f"invalid length: {value!r}")
+    return float(match.group())
+
+
+def _parse_color(value: str) -> Optional[Tuple[float, float, float]]:
+    """Parse a colour into RGB components between 0 and 1 (None if not a colour)."""
+    value = value.strip().lower()
+    if value.startswith("#"):
+        digits = value[1:]
+        if len(digits) == 3:
+            digits = "".join(digit * 2 for digit in digits)
+        if len(digits) == 6:
+            try:
+                return tuple(int(digits[i:i + 2], 16) / 255 for i in (0, 2, 4))
+            except ValueError:
+                return None
+        return None
+    if value.startswith("rgb(") and value.endswith(")"):
+        parts = [part.strip() for part in value[4:-1].split(",")]
+        if len(parts) == 3:
+            return tuple(min(1.0, max(0.0, _length(part, reference=255) / 255)) for part in parts)
+        return None
+    if value in _NAMED_COLORS:
+        return tuple(channel / 255 for channel in _NAMED_COLORS[value])
+    return None
+
+
+def _element_style(element: ET.Element) -> Dict[str, str]:
+    """Presentation attributes of an element, with its ``style`` attribute taking precedence."""
+    style = {key: value for key, value in element.attrib.items() if "}" not in key}
+    for declaration in element.get("style", "").split(";"):
+        if ":" in declaration:
+            key, value = declaration.split(":", 1)
+            style[key.strip()] = value.strip()
+    return style
+
+
+def _parse_transform(value: Optional[str]) -> _Transform:
+    """Parse a transform attribute limited to translations and scales."""
+    sx, sy, tx, ty = 1.0, 1.0, 0.0, 0.0
+    for name, arguments in _TRANSFORM.findall(value or ""):
+        args = _numbers(arguments)
+        if name == "translate" and args:
+            a_tx, a_ty = args[0], args[1] if len(args) > 1 else 0.0
+            a_sx = a_sy = 1.0
+        elif name == "scale" and args:
+            a_sx, a_sy = args[0], args[1] if len(args) > 1 else args[0]
+            a_tx = a_ty = 0.0
+        elif name == "matrix" and len(args) == 6 and args[1] == 0 and args[2] == 0:
+            a_sx, _, _, a_sy, a_tx, a_ty = args
+        else:
+            raise SVGRenderError(f"unsupported transform: {name}({arguments})")
+        # Later transforms apply first
+        sx, sy, tx, ty = sx * a_sx, sy * a_sy, tx + sx * a_tx, ty + sy * a_ty
+    return sx, sy, tx, ty
+
+
+def _compose(outer: _Transform, inner: _Transform) -> _Transform:
+    sx, sy, tx, ty = outer
+    return sx * inner[0], sy * inner[1], tx + sx * inner[2], ty + sy * inner[3]
+
+
+def _apply(transform: _Transform, points: np.ndarray) -> np.ndarray:
+    sx, sy, tx, ty = transform
+    return points * np.array([sx, sy]) + np.array([tx, ty])
+
+
+class _PathScanner:
+    """Reads commands, numbers and arc flags from path data."""
+
+    def __init__(self, data: str):
+        self.data = data
+        self.pos = 0
+
+    def _skip(self) -> None:
+        while self.pos < len(self.data) and self.data[self.pos] in " \t\r\n,":
+            self.pos += 1
+
+    def command(self) -> Optional[str]:
+        self._skip()
+        if self.pos < len(self.data) and self.data[self.pos].isalpha():
+            self.pos += 1
+            return self.data[self.pos - 1]
+        return None
+
+    def has_number(self) -> bool:
+        self._skip()
+        return self.pos < len(self.data) and bool(_NUMBER.match(self.data, self.pos))
+
+    def number(self) -> float:
+        self._skip()
+        match = _NUMBER.match(self.data, self.pos)
+        if not match:
+            raise SVGRenderError(f"invalid path data at {self.pos}: {self.data[self.pos:self.pos + 10]!r}")
+        self.pos = match.end()
+        return float(match.group())
+
+    def flag(self) -> bool:
+        self._skip()
+        if self.pos < len(self.data) and self.data[self.pos] in "01":
+            self.pos += 1
+            return self.data[self.pos - 1] == "1"
+        raise SVGRenderError(f"invalid arc flag at {self.pos}")
+
+
+def _cubic(p0, p1, p2, p3) -> List[Tuple[float, float]]:
+    points = []
+    for step in range(1, CURVE_SEGMENTS + 1):
+        t = step / CURVE_SEGMENTS
+        u = 1 - t
+        points.append((u ** 3 * p0[0] + 3 * u * u * t * p1[0] + 3 * u * t * t * p2[0] + t ** 3 * p3[0],
+                       u ** 3 * p0[1] + 3 * u * u * t * p1[1] + 3 * u * t * t * p2[1] + t ** 3 * p3[1]))
+    return points
+
+
+def _quadratic(p0, p1, p2) -> List[Tuple[float, float]]:
+    points = []
+    for step in range(1, CURVE_SEGMENTS + 1):
+        t = step / CURVE_SEGMENTS
+        u = 1 - t
+        points.append((u * u * p0[0] + 2 * u * t * p1[0] + t * t * p2[0],
+                       u * u * p0[1] + 2 * u * t * p1[1] + t * t * p2[1]))
+    return points
+
+
+def _arc(start, rx: float, ry: float, rotation: float, large: bool, sweep: bool,
+         end) -> List[Tuple[float, float]]:
+    """Flatten an elliptical arc (SVG endpoint parameterization)."""
+    (x1, y1), (x2, y2) = start, end
+    rx, ry = abs(rx), abs(ry)
+    if rx == 0 or ry == 0 or (x1, y1) == (x2, y2):
+        return [end]
+    cos, sin = math.cos(math.radians(rotation)), math.sin(math.radians(rotation))
+    dx, dy = (x1 - x2) / 2, (y1 - y2) / 2
+    x1p, y1p = cos * dx + sin * dy, -sin * dx + cos * dy
+    radii_scale = x1p ** 2 / rx ** 2 + y1p ** 2 / ry ** 2
+    if radii_scale > 1:
+        rx, ry = rx * math.sqrt(radii_scale), ry * math.sqrt(radii_scale)
+    numerator = rx ** 2 * ry ** 2 - rx ** 2 * y1p ** 2 - ry ** 2 * x1p ** 2
+    denominator = rx ** 2 * y1p ** 2 + ry ** 2 * x1p ** 2
+    coefficient = math.sqrt(max(0.0, numerator / denominator)) * (-1 if large == sweep else 1)
+    cxp, cyp = coefficient * rx * y1p / ry, -coefficient * ry * x1p / rx
+    cx = cos * cxp - sin * cyp + (x1 + x2) / 2
+    cy = sin * cxp + cos * cyp + (y1 + y2) / 2
+
+    def angle(ux, uy, vx, vy):
+        return math.atan2(ux * vy - uy * vx, ux * vx + uy * vy)
+
+    start_angle = angle(1, 0, (x1p - cxp) / rx, (y1p - cyp) / ry)
+    delta = angle((x1p - cxp) / rx, (y1p - cyp) / ry, (-x1p - cxp) / rx, (-y1p - cyp) / ry)
+    if not sweep and delta > 0:
+        delta -= 2 * math.pi
+    elif sweep and delta < 0:
+        delta += 2 * math.pi
+
+    segments = max(4, math.ceil(abs(delta) / (math.pi / CURVE_SEGMENTS)))
+    points = []
+    for step in range(1, segments + 1):
+        theta = start_angle + delta * step / segments
+        x, y = rx * math.cos(theta), ry * math.sin(theta)
+        points.append((cos * x - sin * y + cx, sin * x + cos * y + cy))
+    points[-1] = end
+    return points
+
+
+def _parse_path(data: str) -> List[Tuple[List[Tuple[float, float]], bool]]:
+    """Flatten path data into subpaths of points and whether each is closed."""
+    scanner = _PathScanner(data)
+    subpaths: List[Tuple[List[Tuple[float, float]], bool]] = []
+    points: List[Tuple[float, float]] = []
+    current = start = (0.0, 0.0)
+    control: Optional[Tuple[float, float]] = None
+    previous = ""
+
+    def finish(closed: bool) -> None:
+        nonlocal points
+        if points:
+            subpaths.append((points, closed))
+        points = []
+
+    command = scanner.command()
+    if command not in ("M", "m"):
+        raise SVGRenderError("path data must start with a moveto")
+    while command:
+        relative = command.islower()
+        kind = command.upper()
+        first = True
+        while True:
+            ox, oy = current if relative else (0.0, 0.0)
+            if kind not in ("M", "Z") and not points:
+                # Drawing after a closepath starts a new subpath at its start
+                points.append(current)
+            if kind == "Z":
+                if points:
+                    finish(True)
+                current = start
+            elif kind == "M":
+                point = (ox + scanner.number(), oy + scanner.number())
+                if first:
+                    finish(False)
+                    start = point
+                points.append(point)
+                current = point
+            elif kind == "L":
+                current = (ox + scanner.number(), oy + scanner.number())
+                points.append(current)
+            elif kind == "H":
+                current = ((ox if relative else 0.0) + scanner.number(), current[1])
+                points.append(current)
+            elif kind == "V":
+                current = (current[0], (oy if relative else 0.0) + scanner.number())
+                points.append(current)
+            elif kind in ("C", "S"):
+                if kind == "C":
+                    c1 = (ox + scanner.number(), oy + scanner.number())
+                elif previous in ("C", "S") and control:
+                    c1 = (2 * current[0] - control[0], 2 * current[1] - control[1])
+                else:
+                    c1 = current
+                c2 = (ox + scanner.number(), oy + scanner.number())
+                end = (ox + scanner.number(), oy + scanner.number())
+                points.extend(_cubic(current, c1, c2, end))
+                control, current = c2, end
+            elif kind in ("Q", "T"):
+                if kind == "Q":
+                    c1 = (ox + scanner.number(), oy + scanner.number())
+                elif previous in ("Q", "T") and control:
+                    c1 = (2 * current[0] - control[0], 2 * current[1] - control[1])
+                else:
+                    c1 = current
+                end = (ox + scanner.number(), oy + scanner.number())
+                points.extend(_quadratic(current, c1, end))
+                control, current = c1, end
+            elif kind == "A":
+                rx, ry, rotation = scanner.number(), scanner.number(), scanner.number()
+                large, sweep = scanner.flag(), scanner.flag()
+                end = (ox + scanner.number(), oy + scanner.number())
+                points.extend(_arc(current, rx, ry, rotation, large, sweep, end))
+                current = end
+            else:
+                raise SVGRenderError(f"unsupported path command: {command}")
+
+            previous = kind
+            first = False
+            # Further coordinate pairs after a moveto are implicit linetos
+            if kind == "M":
+                kind = "L"
+            if kind == "Z" or not scanner.has_number():
+                break
+        command = scanner.command()
+        if command is None and scanner.pos < len(scanner.data.rstrip()):
+            raise SVGRenderError(f"invalid path data at {scanner.pos}")
+    finish(False)
+    return subpaths
+
+
+def _ellipse_points(cx: float, cy: float, rx: float, ry: float, segments: int = 64) -> np.ndarray:
+    angles = np.linspace(0, 2 * np.pi, segments, endpoint=False)
+    return np.stack([cx + rx * np.cos(angles), cy + ry * np.sin(angles)], axis=1)
+
+
+def _rounded_rect_points(x: float, y: float, width: float, height: float, rx: float, ry: float) -> np.ndarray:
+    points = []
+    for cx, cy, start in ((x + width - rx, y + ry, -90), (x + width - rx, y + height - ry, 0),
+                          (x + rx, y + height - ry, 90), (x + rx, y + ry, 180)):
+        angles = np.radians(np.linspace(start, start + 90, CURVE_SEGMENTS // 2 + 1))
+        points.extend(zip(cx + rx * np.cos(angles), cy + ry * np.sin(angles)))
+    return np.asarray(points)
+
+
+def _polygon_mask(subpaths: Sequence[_Subpath], x: np.ndarray, y: np.ndarray, evenodd: bool) -> np.ndarray:
+    """Pixels inside closed polygons, by counting edge crossings to their left."""
+    ys = y[:, 0]
+    winding = np.zeros((y.shape[0], x.shape[1]), dtype=np.int32)
+    for points, _ in subpaths:
+        if len(points) < 3:
+            continue
+        for (x0, y0), (x1, y1) in zip(points, np.roll(points, -1, axis=0)):
+            if y0 == y1:
+                continue
+            rows = (ys >= min(y0, y1)) & (ys < max(y0, y1))
+            if not rows.any():
+                continue
+            crossing = x0 + (ys[rows] - y0) * (x1 - x0) / (y1 - y0)
+            winding[rows] += np.where(x < crossing[:, None], 1 if y1 > y0 else -1, 0)
+    return (winding % 2 == 1) if evenodd else (winding != 0)
+
+
+def _stroke_mask(subpaths: Sequence[_Subpath], x: np.ndarray, y: np.ndarray, half_width: float,
+                 round_caps: bool) -> np.ndarray:
+    """Pixels within half the stroke width of the polylines (round joins)."""
+    distance = np.full((y.shape[0], x.shape[1]), np.inf)
+    for points, closed in subpaths:
+        segments = list(zip(points[:-1], points[1:]))
+        if closed and len(points) > 1:
+            segments.append((points[-1], points[0]))
+        if not segments:
+            segments = [(points[0], points[0])]
+        for index, ((x0, y0), (x1, y1)) in enumerate(segments):
+            dx, dy = x1 - x0, y1 - y0
+            length2 = dx * dx + dy * dy
+            t = ((x - x0) * dx + (y - y0) * dy) / length2 if length2 else np.zeros_like(x + y)
+            clipped = np.clip(t, 0, 1)
+            squared = (x - x0 - clipped * dx) ** 2 + (y - y0 - clipped * dy) ** 2
+            if not closed and not round_caps and length2:
+                # Butt caps end the stroke flush with the first and last points
+                if index == 0:
+                    squared = np.where(t < 0, np.inf, squared)
+                if index == len(segments) - 1:
+                    squared = np.where(t > 1, np.inf, squared)
+            distance = np.minimum(distance, squared)
+    return distance <= half_width * half_width
+
+
+class _Paint:
+    """Solid colour or gradient in device coordinates."""
+
+    def __init__(self, rgba: Optional[Tuple[float, float, float, float]] = None, gradient: Optional[Dict] = None):
+        self.rgba = rgba
+        self.gradient = gradient
+
+    def colors(self, x: np.ndarray, y: np.ndarray, bbox: _BBox) -> np.ndarray:
+        if self.gradient is None:
+            return np.asarray(self.rgba)
+        gradient = self.gradient
+        coords = gradient["coords"]
+        if not gradient["user_space"]:
+            bx0, by0, bx1, by1 = bbox
+            width, height = max(bx1 - bx0, 1e-9), max(by1 - by0, 1e-9)
+            coords = [bx0 + c * width if i % 2 == 0 else by0 + c * height for i, c in enumerate(coords)]
+            if gradient["kind"] == "radial":
+                coords[2] = gradient["coords"][2] * math.hypot(width, height) / math.sqrt(2)
+        if gradient["kind"] == "linear":
+            gx1, gy1, gx2, gy2 = coords
+            length2 = (gx2 - gx1) ** 2 + (gy2 - gy1) ** 2 or 1e-9
+            t = ((x - gx1) * (gx2 - gx1) + (y - gy1) * (gy2 - gy1)) / length2
+        else:
+            cx, cy, r = coords[0], coords[1], coords[2]
+            t = np.hypot(x - cx, y - cy) / max(r, 1e-9)
+        t = np.clip(t, 0, 1)
+        offsets, colors = gradient["stops"]
+        return np.stack([np.interp(t, offsets, colors[:, channel]) for channel in range(4)], axis=-1)
+
+
+class _Renderer:
+    """Draws an SVG document onto a supersampled premultiplied RGBA canvas."""
+
+    def __init__(self, root: ET.Element, pixels: int):
+        self.root = root
+        self.canvas = np.zeros((pixels, pixels, 4), dtype=np.float64)
+        self.gradients = {element.get("id"): element for element in root.iter()
+                          if _local(element.tag) in ("linearGradient", "radialGradient") and element.get("id")}
+
+    def _gradient(self, element: ET.Element, transform: _Transform, opacity: float) -> Optional[_Paint]:
+        stops = []
+        for stop in element:
+            if _local(stop.tag) != "stop":
+                continue
+            style = _element_style(stop)
+            rgb = _parse_color(style.get("stop-color", "black")) or (0.0, 0.0, 0.0)
+            alpha = _length(style.get("stop-opacity"), 1.0) * opacity
+            offset = min(1.0, max(0.0, _length(style.get("offset"), 0.0)))
+            stops.append((offset, (*rgb, alpha)))
+        if not stops:
+            return None
+        if len(stops) == 1:
+            return _Paint(rgba=stops[0][1])
+        offsets = np.maximum.accumulate([offset for offset, _ in stops])
+        colors = np.asarray([color for _, color in stops])
+
+        user_space = element.get("gradientUnits") == "userSpaceOnUse"
+        if _local(element.tag) == "linearGradient":
+            kind = "linear"
+            coords = [_length(element.get("x1"), 0.0), _length(element.get("y1"), 0.0),
+                      _length(element.get("x2"), 1.0 if not user_space else 0.0, 1.0),
+                      _length(element.get("y2"), 0.0)]
+            if user_space:
+                (x1, y1), (x2, y2) = _apply(transform, np.asarray([coords[:2], coords[2:]]))
+                coords = [x1, y1, x2, y2]
+        else:
+            kind = "radial"
+            coords = [_length(element.get("cx"), 0.5), _length(element.get("cy"), 0.5),
+                      _length(element.get("r"), 0.5)]
+            if user_space:
+                (cx, cy), = _apply(transform, np.asarray([coords[:2]]))
+                coords = [cx, cy, coords[2] * math.sqrt(abs(transform[0] * transform[1]))]
+        return _Paint(gradient={"kind": kind, "coords": coords, "user_space": user_space,
+                                "stops": (offsets, colors)})
+
+    def _paint(self, value: Optional[str], transform: _Transform, opacity: float) -> Optional[_Paint]:
+        if value is None or value.strip() in ("", "none", "transparent"):
+            return None
+        value = value.strip()
+        if value.startswith("url("):
+            reference = value[4:value.index(")")].strip().strip("'\"").lstrip("#")
+            element = self.gradients.get(reference)
+            if element is None:
+                # Fallback colour after the reference, if any
+                return self._paint(value[value.index(")") + 1:] or None, transform, opacity)
+            return self._gradient(element, transform, opacity)
+        if value == "currentColor":
+            value = "black"
+        rgb = _parse_color(value)
+        if rgb is None:
+            raise SVGRenderError(f"unsupported paint: {value!r}")
+        return _Paint(rgba=(*rgb, opacity))
+
+    def _composite(self, bbox: _BBox, inside: Callable[[np.ndarray, np.ndarray], np.ndarray],
+                   paint: _Paint) -> None:
+        height, width = self.canvas.shape[:2]
+        x0, y0 = max(0, math.floor(bbox[0])), max(0, math.floor(bbox[1]))
+        x1, y1 = min(width, math.ceil(bbox[2]) + 1), min(height, math.ceil(bbox[3]) + 1)
+        if x0 >= x1 or y0 >= y1:
+            return
+        x = (np.arange(x0, x1) + 0.5)[None, :]
+        y = (np.arange(y0, y1) + 0.5)[:, None]
+        mask = inside(x, y)
+        if not mask.any():
+            return
+        colors = np.broadcast_to(paint.colors(x, y, bbox), mask.shape + (4,))
+        alpha = mask * colors[..., 3]
+        target = self.canvas[y0:y1, x0:x1]
+        target[..., :3] = colors[..., :3] * alpha[..., None] + target[..., :3] * (1 - alpha[..., None])
+        target[..., 3] = alpha + target[..., 3] * (1 - alpha)
+
+    def _draw(self, style: Dict[str, str], transform: _Transform, opacity: float, bbox: _BBox,
+              fill: Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]],
+              outline: Sequence[_Subpath], round_caps: bool = False) -> None:
+        """Fill and stroke a shape whose geometry is already in device coordinates."""
+        fill_paint = self._paint(style.get("fill", "black"), transform,
+                                 opacity * _length(style.get("fill-opacity"), 1.0))
+        if fill is not None and fill_paint is not None:
+            self._composite(bbox, fill, fill_paint)
+
+        stroke_paint = self._paint(style.get("stroke"), transform,
+                                   opacity * _length(style.get("stroke-opacity"), 1.0))
+        half_width = _length(style.get("stroke-width"), 1.0) * math.sqrt(abs(transform[0] * transform[1])) / 2
+        if stroke_paint is None or half_width <= 0 or not len(outline):
+            return
+        round_caps = round_caps or style.get("stroke-linecap") in ("round", "square")
+        stroke_bbox = (bbox[0] - half_width, bbox[1] - half_width, bbox[2] + half_width, bbox[3] + half_width)
+        self._composite(stroke_bbox, lambda x, y: _stroke_mask(outline, x, y, half_width, round_caps),
+                        stroke_paint)
+
+    def _shape(self, tag: str, element: ET.Element, style: Dict[str, str], transform: _Transform,
+               opacity: float) -> None:
+        get = element.get
+        sx, sy, tx, ty = transform
+        fill: Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]] = None
+
+        if tag == "circle" or tag == "ellipse":
+            rx = _length(get("r") if tag == "circle" else get("rx"))
+            ry = _length(get("r") if tag == "circle" else get("ry"))
+            if rx <= 0 or ry <= 0:
+                return
+            points = _apply(transform, _ellipse_points(_length(get("cx")), _length(get("cy")), rx, ry))
+            cx, cy = _length(get("cx")) * sx + tx, _length(get("cy")) * sy + ty
+            drx, dry = abs(rx * sx), abs(ry * sy)
+            outline = [(points, True)]
+            fill = lambda x, y: ((x - cx) / drx) ** 2 + ((y - cy) / dry) ** 2 <= 1  # noqa: E731
+        elif tag == "rect":
+            x, y = _length(get("x")), _length(get("y"))
+            width, height = _length(get("width")), _length(get("height"))
+            if width <= 0 or height <= 0:
+                return
+            rx = get("rx") if get("rx") is not None else get("ry")
+            ry = get("ry") if get("ry") is not None else get("rx")
+            rx, ry = min(_length(rx), width / 2), min(_length(ry), height / 2)
+            if rx > 0 and ry > 0:
+                points = _apply(transform, _rounded_rect_points(x, y, width, height, rx, ry))
+            else:
+                points = _apply(transform, np.asarray([(x, y), (x + width, y), (x + width, y + height),
+                                                       (x, y + height)]))
+            outline = [(points, True)]
+            if rx > 0 and ry > 0:
+                fill = lambda px, py: _polygon_mask(outline, px, py, False)  # noqa: E731
+            else:
+                left, top = points.min(axis=0)
+                right, bottom = points.max(axis=0)
+                fill = lambda px, py: (px >= left) & (px < right) & (py >= top) & (py < bottom)  # noqa: E731
+        elif tag == "line":
+            points = _apply(transform, np.asarray([(_length(get("x1")), _length(get("y1"))),
+                                                   (_length(get("x2")), _length(get("y2")))]))
+            outline = [(points, False)]
+        elif tag in ("polyline", "polygon"):
+            coordinates = _numbers(get("points", ""))
+            if len(coordinates) < 4:
+                return
+            points = _apply(transform, np.asarray(coordinates[:len(coordinates) // 2 * 2]).reshape(-1, 2))
+            outline = [(points, tag == "polygon")]
+        else:  # path
+            outline = [(_apply(transform, np.asarray(points)), closed)
+                       for points, closed in _parse_path(get("d", ""))]
+            if not outline:
+                return
+
+        if fill is None and tag != "line":
+            evenodd = style.get("fill-rule") == "evenodd"
+            fill = lambda x, y: _polygon_mask(outline, x, y, evenodd)  # noqa: E731
+        stacked = np.concatenate([points for points, _ in outline])
+        bbox = (*stacked.min(axis=0), *stacked.max(axis=0))
+        self._draw(style, transform, opacity, bbox, fill, outline)
+
+    def _text(self, element: ET.Element, style: Dict[str, str], transform: _Transform, opacity: float) -> None:
+        text = " ".join("".join(element.itertext()).split()).upper()
+        if not text:
+            return
+        missing = sorted({char for char in text if char not in _GLYPHS})
+        if missing:
+            raise SVGRenderError(f"text {text!r} has characters the built-in font can't draw: "
+                                 f"{''.join(missing)!r}")
+        size = _length(style.get("font-size"), 16.0)
+        unit = size * 0.7 / 6
+        advance = 5.5 * unit
+        width = len(text) * advance - 1.5 * unit
+        x, y = _length(element.get("x")), _length(element.get("y"))
+        anchor = style.get("text-anchor", "start")
+        if anchor == "middle":
+            x -= width / 2
+        elif anchor == "end":
+            x -= width
+
+        strokes = []
+        for index, char in enumerate(text):
+            for polyline in _GLYPHS[char]:
+                points = np.asarray([(x + index * advance + gx * unit, y - (6 - gy) * unit) for gx, gy in polyline])
+                strokes.append((_apply(transform, points), False))
+        if not strokes:
+            return
+        weight = style.get("font-weight", "normal")
+        bold = weight == "bold" or weight == "bolder" or (weight.isdigit() and int(weight) >= 600)
+        glyph_style = {"fill": "none", "stroke": style.get("fill", "black"),
+                       "stroke-opacity": style.get("fill-opacity", "1"),
+                       "stroke-width": str(size * (0.17 if bold else 0.11))}
+        stacked = np.concatenate([points for points, _ in strokes])
+        bbox = (*stacked.min(axis=0), *stacked.max(axis=0))
+        self._draw(glyph_style, transform, opacity, bbox, None, strokes, round_caps=True)
+
+    def render(self, element: ET.Element, style: Dict[str, str], transform: _Transform, opacity: float) -> None:
+        for child in element:
+            tag = _local(child.tag) if isinstance(child.tag, str) else ""
+            if not tag or tag in _SKIPPED:
+                continue
+            own = _element_style(child)
+            if own.get("display") == "none":
+                continue
+            child_style = {key: value for key, value in style.items() if key in _INHERITED}
+            child_style.update(own)
+            child_transform = _compose(transform, _parse_transform(child.get("transform")))
+            child_opacity = opacity * _length(own.get("opacity"), 1.0)
+            if tag in ("g", "a", "switch"):
+                self.render(child, child_style, child_transform, child_opacity)
+            elif child_style.get("visibility") in ("hidden", "collapse"):
+                continue
+            elif tag in ("rect", "circle", "ellipse", "line", "polyline", "polygon", "path"):
+                self._shape(tag, child, child_style, child_transform, child_opacity)
+            elif tag == "text":
+                self._text(child, child_style, child_transform, child_opacity)
+
+
+def render_svg(svg: Union[str, bytes], size: int) -> np.ndarray:
+    """
+    Render an SVG document to a square image.
+
+    The view box is scaled to fit the image and centred, like the default
+    ``preserveAspectRatio``.
+
+    Args:
+        svg: SVG document
+        size: Width and height in pixels
+
+    Returns:
+        Array of shape (size, size, 4) with 8-bit straight-alpha RGBA pixels
+
+    Raises:
+        SVGRenderError: If the document isn't SVG or uses unsupported features
+    """
+    if size < 1:
+        raise ValueError(f"Image size must be positive: {size}")
+    try:
+        root = ET.fromstring(svg)
+    except ET.ParseError as e:
+        raise SVGRenderError(f"invalid SVG: {e}") from e
+    if _local(root.tag) != "svg":
+        raise SVGRenderError(f"not an SVG document: <{_local(root.tag)}>")
+
+    view_box = _numbers(root.get("viewBox", ""))
+    if len(view_box) != 4:
+        width, height = _length(root.get("width"), 0.0), _length(root.get("height"), 0.0)
+        if width <= 0 or height <= 0:
+            raise SVGRenderError("SVG has neither a viewBox nor a width and height")
+        view_box = [0.0, 0.0, width, height]
+    vx, vy, vw, vh = view_box
+    if vw <= 0 or vh <= 0:
+        raise SVGRenderError(f"invalid viewBox: {root.get('viewBox')}")
+
+    samples = max(1, min(4, MAX_SUPERSAMPLED // size))
+    pixels = size * samples
+    scale = min(pixels / vw, pixels / vh)
+    transform = (scale, scale, (pixels - vw * scale) / 2 - vx * scale, (pixels - vh * scale) / 2 - vy * scale)
+    transform = _compose(transform, _parse_transform(root.get("transform")))
+
+    renderer = _Renderer(root, pixels)
+    style = _element_style(root)
+    renderer.render(root, style, transform, _length(style.get("opacity"), 1.0))
+
+    # Average the samples of each pixel, then undo the alpha premultiplication
+    canvas = renderer.canvas.reshape(size, samples, size, samples, 4).mean(axis=(1, 3))
+    alpha = canvas[..., 3:]
+    rgb = np.divide(canvas[..., :3], alpha, out=np.zeros_like(canvas[..., :3]), where=alpha > 0)
+    image = np.concatenate([rgb, alpha], axis=-1)
+    return np.clip(np.rint(image * 255), 0, 255).astype(np.uint8)
+
+
+def encode_png(pixels: np.ndarray) -> bytes:
+    """
+    Encode RGBA pixels as a PNG file.
+
+    Args:
+        pixels: Array of shape (height, width, 4) with 8-bit RGBA pixels
+
+    Returns:
+        PNG file content
+    """
+    height, width = pixels.shape[:2]
+    # Every scanline starts with its filter type; the Up filter suits flat logo artwork
+    rows = pixels.reshape(height, width * 4).astype(np.int16)
+    filtered = np.empty((height, width * 4 + 1), dtype=np.uint8)
+    filtered[:, 0] = 2
+    filtered[:, 1:] = (rows - np.vstack([np.zeros((1, width * 4), dtype=np.int16), rows[:-1]])) & 0xFF
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(filtered.tobytes(), 9))
+            + chunk(b"IEND", b""))
+
+
+def encode_ico(images: Sequence[np.ndarray]) -> bytes:
+    """
+    Encode RGBA images as an ICO file with PNG-compressed entries.
+
+    Args:
+        images: Arrays of shape (size, size, 4), at most 256 pixels square
+
+    Returns:
+        ICO file content
+
+    Raises:
+        ValueError: If there are no images or one is larger than 256 pixels
+    """
+    if not images:
+        raise ValueError("An ICO file needs at least one image")
+    pngs = []
+    for image in images:
+        height, width = image.shape[:2]
+        if width > MAX_ICO_SIZE or height > MAX_ICO_SIZE:
+            raise ValueError(f"ICO images can't be larger than {MAX_ICO_SIZE} pixels: {width}x{height}")
+        pngs.append((width, height, encode_png(image)))
+
+    header = struct.pack("<HHH", 0, 1, len(pngs))
+    offset = len(header) + 16 * len(pngs)
+    entries = b""
+    for width, height, png in pngs:
+        # A size of 0 means 256
+        entries += struct.pack("<BBBBHHII", width % 256, height % 256, 0, 0, 1, 32, len(png), offset)
+        offset += len(png)
+    return header + entries + b"".join(png for _, _, png in pngs)
+
+
+def render_file(svg: bytes, sizes: Sequence[int], image_format: str) -> bytes:
+    """
+    Render an SVG document to a PNG or ICO file.
+
+    Args:
+        svg: SVG document
+        sizes: Pixel sizes (only the first is used for a PNG)
+        image_format: 'png' or 'ico'
+
+    Returns:
+        File content
+
+    Raises:
+        SVGRenderError: If the SVG can't be rendered
+        ValueError: If the format is unknown
+    """
+    if image_format == "png":
+        return encode_png(render_svg(svg, sizes[0]))
+    if image_format == "ico":
+        return encode_ico([render_svg(svg, size) for size in sizes])
+    raise ValueError(f"Unknown image format: {image_format}")
+
+
+def _cache_key(svg: bytes, job: RasterJob) -> str:
+    """Hash of everything an output depends on."""
+    digest = hashlib.sha256(f"{RENDERER_VERSION}\0{job.format}\0{','.join(map(str, job.sizes))}\0".encode("utf-8"))
+    digest.update(svg)
+    return digest.hexdigest()
+
+
+def rasterize(jobs: Iterable[RasterJob], workers: Optional[int] = None,
+              cache_dir: Optional[Union[str, Path]] = None) -> Dict[Path, bool]:
+    """
+    Render SVG files to PNG and ICO files, reusing cached renders.
+
+    Outputs are cached by a hash of the SVG, the sizes and the renderer
+    version; jobs that hit the cache only copy the cached file (and leave an
+    identical target alone). Jobs with identical inputs are rendered once.
+    A job that fails doesn't stop the others: every successful render is
+    written before the failures are raised together.
+
+    Args:
+        jobs: Renders to produce
+        workers: Worker processes (defaults to the CPU count, capped at the
+            number of renders; 1 renders in this process)
+        cache_dir: Cache directory (defaults to ``.meddata/raster``)
+
+    Returns:
+        Mapping of each target to True if it was rendered, False if it came
+        from the cache
+
+    Raises:
+        RasterizeError: If any source SVG can't be read or rendered
+    """
+    cache_dir = Path(cache_dir) if cache_dir else config_manager.paths.cache_dir / "raster"
+    results: Dict[Path, bool] = {}
+    failures: Dict[Path, Exception] = {}
+    pending: Dict[str, Tuple[bytes, RasterJob, List[RasterJob]]] = {}
+
+    for job in jobs:
+        try:
+            svg = job.source.read_bytes()
+        except OSError as e:
+            failures[job.target] = e
+            continue
+        key = _cache_key(svg, job)
+        cached = cache_dir / f"{key}.{job.format}"
+        if key not in pending and cached.exists():
+            file_writer.write(job.target, cached.read_bytes())
+            results[job.target] = False
+        else:
+            pending.setdefault(key, (svg, job, []))[2].append(job)
+
+    rendered: Dict[str, Union[bytes, Exception]] = {}
+    workers = max(1, min(workers or os.cpu_count() or 1, len(pending)))
+    if workers == 1:
+        for key, (svg, job, _) in pending.items():
+            try:
+                rendered[key] = render_file(svg, job.sizes, job.format)
+            except Exception as e:
+                rendered[key] = e
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = {key: pool.submit(render_file, svg, job.sizes, job.format)
+                       for key, (svg, job, _) in pending.items()}
+            for key, future in futures.items():
+                try:
+                    rendered[key] = future.result()
+                except Exception as e:
+                    rendered[key] = e
+
+    for key, (_, job, targets) in pending.items():
+        data = rendered[key]
+        if isinstance(data, Exception):
+            failures.update((target_job.target, data) for target_job in targets)
+            continue
+        file_writer.write(cache_dir / f"{key}.{job.format}", data, report=False)
+        for target_job in targets:
+            file_writer.write(target_job.target, data)
+            results[target_job.target] = True
+
+    if failures:
+        raise RasterizeError(results, failures)
+    return results
+
+
+def prune_cache(jobs: Iterable[RasterJob], cache_dir: Optional[Union[str, Path]] = None) -> int:
+    """
+    Remove cached renders that none of the given jobs would use.
+
+    Args:
+        jobs: Every render that is still wanted
+        cache_dir: Cache directory (defaults to ``.meddata/raster``)
+
+    Returns:
+        Number of cached files removed
+
+    Raises:
+        FileNotFoundError: If a source SVG doesn't exist
+    """
+    cache_dir = Path(cache_dir) if cache_dir else config_manager.paths.cache_dir / "raster"
+    live = {f"{_cache_key(job.source.read_bytes(), job)}.{job.format}" for job in jobs}
+    removed = 0
+    for path in [*cache_dir.glob("*.png"), *cache_dir.glob("*.ico")]:
+        if path.name not in live:
+            path.unlink(missing_ok=True)
+            removed += 1
+    return removed
@@ -7,16 +7,152 @@
 """
 from __future__ import annotations
 
+import codecs
+import io
 import os
 import platform
+import selectors
 import shlex
 import subprocess
 import sys
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Tuple, Callable
+from typing import IO, TYPE_CHECKING, Deque, Dict, List, Mapping, Optional, Union, Tuple, Callable
+
+if TYPE_CHECKING:
+    import asyncio
 
 __all__ = ["SubprocessHandler", "subprocess_handler"]
 
+# Bytes read from a pipe per system call while streaming
+READ_SIZE = 64 * 1024
+
+# Longest partial line held back; longer lines reach the callback in pieces
+MAX_LINE_LENGTH = 64 * 1024
+
+# Characters of each stream kept for the CompletedProcess while streaming
+MAX_RETAINED_OUTPUT = 4 * 1024 * 1024
+
+
+class _LineStream:
+    """
+    Turns the raw output of one pipe into lines for a callback.
+
+    Output is decoded incrementally (with universal newlines, like text mode),
+    so multi-byte characters and line endings split across reads are handled.
+    Memory stays bounded: a partial line is passed on once it reaches
+    ``max_line`` characters, and only the last ``retain`` characters of output
+    are kept for the result.
+    """
+
+    def __init__(self, encoding: str, callback: Optional[Callable[[str], None]],
+                 retain: int = MAX_RETAINED_OUTPUT, max_line: int = MAX_LINE_LENGTH) -> None:
+        """
+        Initialize the _LineStream.
+
+        Args:
+            encoding: Encoding of the pipe's output
+            callback: Called with every line, including its newline
+            retain: Number of trailing characters to keep
+            max_line: Longest partial line to hold back
+        """
+        self._decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(encoding)(errors="replace"), translate=True)
+        self._callback = callback
+        self._retain = retain
+        self._max_line = max_line
+        self._partial = ""
+        self._retained: Deque[str] = deque()
+        self._retained_size = 0
+
+    def feed(self, data: bytes, final: bool = False) -> None:
+        """
+        Process a chunk of output.
+
+        Args:
+            data: Bytes read from the pipe
+            final: Whether the pipe reached end of file
+        """
+        *lines, self._partial = (self._partial + self._decoder.decode(data, final=final)).split("\n")
+        for line in lines:
+            self._emit(line + "\n")
+        if self._partial and (final or len(self._partial) >= self._max_line):
+            self._emit(self._partial)
+            self._partial = ""
+
+    def _emit(self, line: str) -> None:
+        """Keep a line and pass it to the callback."""
+        self._retained.append(line)
+        self._retained_size += len(line)
+        while self._retained_size > self._retain and len(self._retained) > 1:
+            self._retained_size -= len(self._retained.popleft())
+        if self._callback:
+            self._callback(line)
+
+    @property
+    def text(self) -> str:
+        """The retained output."""
+        return "".join(self._retained)
+
+
+async def _drain_async(reader: asyncio.StreamReader, stream: _LineStream) -> None:
+    """Feed everything an asyncio pipe produces into a stream until end of file."""
+    while True:
+        data = await reader.read(READ_SIZE)
+        if not data:
+            stream.feed(b"", final=True)
+            return
+        stream.feed(data)
+
+
+def _print_prefixed(name: str, line: str, is_stderr: bool) -> None:
+    """Default output callback of run_many: echo a line tagged with its command name."""
+    target = sys.stderr if is_stderr else sys.stdout
+    target.write(f"[{name}] {line}" if line.endswith("\n") else f"[{name}] {line}\n")
+    target.flush()
+
+
+def _drain(pipes: Dict[IO[bytes], _LineStream]) -> None:
+    """
+    Read pipes until all of them are closed, handling data as soon as it arrives.
+
+    Pipes are multiplexed with selectors, so a child writing heavily to one
+    stream can't stall behind a blocking read of the other. Windows can't
+    select on pipes, so there each pipe is read by its own thread instead.
+
+    Args:
+        pipes: Unbuffered pipes and the streams receiving their output
+    """
+    if os.name == "nt":
+        lock = threading.Lock()
+
+        def pump(pipe: IO[bytes], stream: _LineStream) -> None:
+            for data in iter(lambda: pipe.read(READ_SIZE), b""):
+                with lock:
+                    stream.feed(data)
+            with lock:
+                stream.feed(b"", final=True)
+
+        threads = [threading.Thread(target=pump, args=item, daemon=True) for item in pipes.items()]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return
+
+    with selectors.DefaultSelector() as selector:
+        for pipe, stream in pipes.items():
+            selector.register(pipe, selectors.EVENT_READ, stream)
+        while selector.get_map():
+            for key, _events in selector.select():
+                data = os.read(key.fd, READ_SIZE)
+                if data:
+                    key.data.feed(data)
+                else:
+                    selector.unregister(key.fileobj)
+                    key.data.feed(b"", final=True)
+
 
 class SubprocessHandler:
     """
@@ -66,9 +202,14 @@ def run(self,
             cwd: Optional[Union[str, Path]] = None,
             env: Optional[Dict[str, str]] = None,
             shell: bool = False,
-            callback: Optional[Callable[[str], None]] = None) -> subprocess.CompletedProcess:
+            callback: Optional[Callable[[str], None]] = None,
+            stderr_callback: Optional[Callable[[str], None]] = None) -> subprocess.CompletedProcess:
         """
         Run a command in a subprocess with proper encoding and error handling.
+
+        With a callback, stdout and stderr are streamed line by line while the
+        command runs, and the returned CompletedProcess holds the last
+        MAX_RETAINED_OUTPUT characters of each stream.
         
         Args:
             cmd: Command to run (string or list of arguments)
@@ -77,7 +218,8 @@ def run(self,
             cwd: Working directory for the command
             env: Environment variables for the command
             shell: Whether to use shell execution mode
-            callback: Optional callback function for real-time output processing
+            callback: Optional callback receiving each output line as it arrives
+            stderr_callback: Optional callback for stderr lines (defaults to callback)
         
         Returns:
             CompletedProcess instance containing command result
@@ -111,58 +253,35 @@ def run(self,
             merged_env.update(env)
 
         # Callback handling requires different approach than capture_output
-        if callback and not capture_output:
+        if (callback or stderr_callback) and not capture_output:
             process = subprocess.Popen(
                 cmd_list,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
+                bufsize=0,
                 shell=shell,
                 cwd=cwd,
                 env=merged_env,
-                text=True,
-                encoding=encoding,
                 **shell_args
             )
+            stdout = _LineStream(encoding, callback)
+            stderr = _LineStream(encoding, stderr_callback or callback)
 
-            stdout_lines = []
-            stderr_lines = []
-
-            # Process output in real-time
-            while True:
-                stdout_line = process.stdout.readline()
-                stderr_line = process.stderr.readline()
-
-                if stdout_line:
-                    stdout_lines.append(stdout_line)
-                    if callback:
-                        callback(stdout_line)
-
-                if stderr_line:
-                    stderr_lines.append(stderr_line)
-                    if callback:
-                        callback(stderr_line)
-
-                # Check if process has finished
-                if process.poll() is not None:
-                    # Get remaining output
-                    for line in process.stdout:
-                        stdout_lines.append(line)
-                        if callback:
-                            callback(line)
-
-                    for line in process.stderr:
-                        stderr_lines.append(line)
-                        if callback:
-                            callback(line)
-
-                    break
+            # Process output in real-time from both pipes
+            with process:
+                try:
+                    _drain({process.stdout: stdout, process.stderr: stderr})
+                    process.wait()
+                except BaseException:
+                    process.kill()
+                    raise
 
             # Create CompletedProcess for consistent return
             result = subprocess.CompletedProcess(
                 args=cmd_list,
                 returncode=process.returncode,
-                stdout="".join(stdout_lines),
-                stderr="".join(stderr_lines)
+                stdout=stdout.text,
+                stderr=stderr.text
             )
 
             if check and process.returncode != 0:
@@ -188,6 +307,119 @@ def run(self,
                 **shell_args
             )
 
+    def run_many(self,
+                 commands: Mapping[str, Union[str, List[str]]],
+                 max_concurrency: Optional[int] = None,
+                 fail_fast: bool = False,
+                 cwd: Optional[Union[str, Path]] = None,
+                 env: Optional[Dict[str, str]] = None,
+                 callback: Optional[Callable[[str, str, bool], None]] = None
+                 ) -> Dict[str, subprocess.CompletedProcess]:
+        """
+        Run many commands concurrently and wait for all of them.
+
+        Blocking wrapper around run_many_async; it can't be called from a
+        running event loop.
+
+        Args:
+            commands: Mapping of a short name to the command to run
+            max_concurrency: Most commands running at once (defaults to the number of CPUs)
+            fail_fast: Stop everything else as soon as one command fails
+            cwd: Working directory for the commands
+            env: Environment variables added for the commands
+            callback: Called as ``callback(name, line, is_stderr)`` for each output
+                line; by default lines are echoed prefixed with ``[name]``
+
+        Returns:
+            CompletedProcess per name, in the order of ``commands``
+        """
+        import asyncio  # Only needed when running commands concurrently
+
+        return asyncio.run(self.run_many_async(commands, max_concurrency, fail_fast, cwd, env, callback))
+
+    async def run_many_async(self,
+                             commands: Mapping[str, Union[str, List[str]]],
+                             max_concurrency: Optional[int] = None,
+                             fail_fast: bool = False,
+                             cwd: Optional[Union[str, Path]] = None,
+                             env: Optional[Dict[str, str]] = None,
+                             callback: Optional[Callable[[str, str, bool], None]] = None
+                             ) -> Dict[str, subprocess.CompletedProcess]:
+        """
+        Run many commands concurrently on the running event loop.
+
+        Output of every command is streamed line by line while it runs. With
+        ``fail_fast``, the first failure kills the running commands (their
+        return code is then negative) and skips the ones not yet started
+        (return code None). No exception is raised for failures; check the
+        return codes.
+
+        Args:
+            commands: Mapping of a short name to the command to run
+            max_concurrency: Most commands running at once (defaults to the number of CPUs)
+            fail_fast: Stop everything else as soon as one command fails
+            cwd: Working directory for the commands
+            env: Environment variables added for the commands
+            callback: Called as ``callback(name, line, is_stderr)`` for each output
+                line; by default lines are echoed prefixed with ``[name]``
+
+        Returns:
+            CompletedProcess per name, in the order of ``commands``; stdout and
+            stderr hold the last MAX_RETAINED_OUTPUT characters of each stream
+        """
+        import asyncio
+
+        encoding = self._get_encoding()
+        callback = callback or _print_prefixed
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or os.cpu_count() or 1))
+        merged_env = dict(os.environ, **env) if env else None
+        results: Dict[str, subprocess.CompletedProcess] = {}
+
+        async def run_one(name: str, cmd: Union[str, List[str]]) -> Optional[int]:
+            cmd_list = shlex.split(cmd) if isinstance(cmd, str) else list(cmd)
+            async with semaphore:
+                if self.debug_mode:
+                    print(f"Running command [{name}]: {' '.join(cmd_list)}")
+                stdout = _LineStream(encoding, lambda line: callback(name, line, False))
+                stderr = _LineStream(encoding, lambda line: callback(name, line, True))
+                process = await asyncio.create_subprocess_exec(
+                    *cmd_list, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+                    cwd=cwd, env=merged_env)
+                try:
+                    await asyncio.gather(_drain_async(process.stdout, stdout),
+                                         _drain_async(process.stderr, stderr))
+                    await process.wait()
+                except asyncio.CancelledError:
+                    if process.returncode is None:
+                        process.kill()
+                    await process.wait()
+                    raise
+                finally:
+                    results[name] = subprocess.CompletedProcess(cmd_list, process.returncode,
+                                                                stdout.text, stderr.text)
+            return process.returncode
+
+        tasks = {asyncio.ensure_future(run_one(name, cmd)): name for name, cmd in commands.items()}
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if fail_fast and any(task.cancelled() or task.exception() or task.result() != 0
+                                     for task in done):
+                    break
+        finally:
+            # Stop what is left (after a failure, or if we were cancelled ourselves)
+            for task in tasks:
+                task.cancel()
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for name, outcome in zip(tasks.values(), outcomes):
+            if isinstance(outcome, Exception) and name not in results:
+                # The command couldn't be started (e.g. the executable doesn't exist)
+                results[name] = subprocess.CompletedProcess(commands[name], 127, "", str(outcome))
+        return {name: results.get(name, subprocess.CompletedProcess(cmd, None, "", ""))
+                for name, cmd in commands.items()}
+
     def run_python_script(self,
                           script_path: Union[str, Path],
                           args: List[str] = None,
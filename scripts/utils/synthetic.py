@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+MedData Synthetic Data Module - Medium- and Dev.to-shaped article generator.
+
+This module generates offline stand-ins for the raw sources of the Medium and
+Dev.to datasets, with the same columns as their configured schemas, text
+lengths drawn from a log-normal distribution and a configurable share of
+duplicate and empty articles. Every field is derived from a counter-based hash
+of the row number, so output is deterministic for a seed, chunks can be
+generated independently and memory stays flat from 1K to millions of rows.
+"""
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["ArticleProfile", "PROFILES", "generate_articles", "write_articles", "ensure_source"]
+
+# Bump when generated data changes so cached source files are regenerated
+GENERATOR_VERSION = 1
+
+_WORDS = (
+    "data", "model", "python", "learning", "system", "design", "code", "team", "product", "user",
+    "build", "test", "deploy", "cloud", "service", "api", "query", "network", "layer", "feature",
+    "train", "memory", "cache", "latency", "stream", "event", "pipeline", "graph", "vector", "index",
+    "simple", "better", "faster", "modern", "practical", "complete", "hidden", "real", "small", "large",
+    "the", "a", "of", "to", "and", "in", "is", "for", "that", "with", "on", "as", "it", "this", "you",
+    "we", "how", "why", "what", "when", "your", "our", "from", "by", "about", "into", "more", "most",
+    "startup", "founder", "market", "growth", "story", "life", "lesson", "habit", "writing", "career",
+    "javascript", "react", "rust", "golang", "docker", "kubernetes", "linux", "database", "security",
+    "function", "class", "object", "string", "number", "error", "debug", "refactor", "review", "commit",
+)
+_TAGS = (
+    "programming", "python", "javascript", "webdev", "data-science", "machine-learning", "startup",
+    "productivity", "technology", "design", "career", "tutorial", "beginners", "devops", "react",
+    "rust", "ai", "writing", "life-lessons", "security", "cloud", "database", "opensource", "go",
+)
+_FIRST_NAMES = ("Alex", "Sam", "Maria", "Yuki", "Omar", "Lena", "Ravi", "Chen", "Fatima", "Noah",
+                "Ines", "Tom", "Aisha", "Jonas", "Priya", "Leo", "Sara", "Ivan", "Nadia", "Ken")
+_LAST_NAMES = ("Smith", "Garcia", "Tanaka", "Hassan", "Novak", "Patel", "Wang", "Ali", "Brown", "Silva",
+               "Kim", "Rossi", "Ahmed", "Muller", "Khan", "Lopez", "Sato", "Ivanova", "Cohen", "Okafor")
+_PUBLICATIONS = ("towards-data-science", "better-programming", "the-startup", "hackernoon",
+                 "level-up-coding", "javascript-in-plain-english", "analytics-vidhya", "ux-collective")
+
+# Size of the shared word corpus text is sliced from
+_CORPUS_WORDS = 400_000
+_CHARS_PER_WORD = 6
+_MAX_WORDS = 12_000
+
+# Dates are spread uniformly over 2015-01-01 .. 2023-12-31
+_EPOCH_START = 1420070400
+_EPOCH_SPAN = 283_996_800
+
+
+@dataclass(frozen=True)
+class ArticleProfile:
+    """
+    Shape of a synthetic dataset.
+
+    Attributes:
+        median_words: Median article length in words
+        sigma: Spread of the log-normal article length
+        duplicate_rate: Share of rows repeating an earlier article
+        null_rate: Share of rows without text
+        text_column: Column holding the article text
+    """
+    median_words: int
+    sigma: float
+    duplicate_rate: float
+    null_rate: float
+    text_column: str
+
+
+PROFILES: Dict[str, ArticleProfile] = {
+    "medium": ArticleProfile(median_words=900, sigma=0.6, duplicate_rate=0.08, null_rate=0.002,
+                             text_column="text"),
+    "devto": ArticleProfile(median_words=650, sigma=0.7, duplicate_rate=0.03, null_rate=0.001,
+                            text_column="body"),
+}
+
+
+def _mix(values: np.ndarray, salt: int) -> np.ndarray:
+    """Hash uint64 values with splitmix64, keyed by a salt."""
+    with np.errstate(over="ignore"):
+        x = values.astype(np.uint64) * np.uint64(0x9E3779B97F4A7C15) + np.uint64(salt * 0xBF58476D1CE4E5B9 % 2 ** 64)
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return x ^ (x >> np.uint64(31))
+
+
+def _uniform(values: np.ndarray, salt: int) -> np.ndarray:
+    """Deterministic uniform floats in [0, 1) per value."""
+    return (_mix(values, salt) >> np.uint64(11)).astype(np.float64) * (1.0 / 2 ** 53)
+
+
+def _pick(values: np.ndarray, salt: int, choices: tuple) -> List[str]:
+    """Deterministically pick one of ``choices`` per value."""
+    return [choices[i] for i in (_mix(values, salt) % np.uint64(len(choices))).astype(np.int64).tolist()]
+
+
+class _Corpus:
+    """Word soup that article text is sliced from, aligned to word starts."""
+
+    def __init__(self, seed: int) -> None:
+        rng = np.random.default_rng(seed)
+        words = np.array(_WORDS)[rng.integers(0, len(_WORDS), _CORPUS_WORDS)]
+        # Sentence breaks every ~15 words make the text look like prose
+        breaks = rng.random(_CORPUS_WORDS) < 1 / 15
+        words = np.where(breaks, np.char.add(words, "."), words)
+        self.text = " ".join(words.tolist())
+        starts = np.flatnonzero(np.frombuffer(self.text.encode("ascii"), dtype=np.uint8) == ord(" ")) + 1
+        self.starts = np.concatenate([[0], starts])
+
+    def slices(self, content: np.ndarray, lengths: np.ndarray) -> List[str]:
+        """Two corpus slices per article, so texts of different articles never collide."""
+        first = lengths // 2
+        limit = len(self.starts) - (_MAX_WORDS // 2 + 1)
+        a = self.starts[(_mix(content, 11) % np.uint64(limit)).astype(np.int64)]
+        b = self.starts[(_mix(content, 12) % np.uint64(limit)).astype(np.int64)]
+        text = self.text
+        return [text[x:x + m] + " " + text[y:y + n - m]
+                for x, y, m, n in zip(a.tolist(), b.tolist(), first.tolist(), lengths.tolist())]
+
+
+    def phrases(self, content: np.ndarray, salt: int, min_words: int, max_words: int) -> List[str]:
+        """Capitalized runs of ``min_words`` to ``max_words`` words, for titles and subtitles."""
+        counts = min_words + (_mix(content, salt) % np.uint64(max_words - min_words + 1)).astype(np.int64)
+        first = (_mix(content, salt + 1) % np.uint64(len(self.starts) - max_words - 1)).astype(np.int64)
+        begin = self.starts[first]
+        end = self.starts[first + counts] - 1
+        text = self.text
+        return [text[x:y].replace(".", "").capitalize() for x, y in zip(begin.tolist(), end.tolist())]
+
+
+_corpora: Dict[int, _Corpus] = {}
+
+
+def _corpus(seed: int) -> _Corpus:
+    if seed not in _corpora:
+        _corpora[seed] = _Corpus(seed)
+    return _corpora[seed]
+
+
+def _content_ids(rows: np.ndarray, duplicate_rate: float) -> np.ndarray:
+    """
+    Map rows to the article they contain.
+
+    A duplicate row repeats the article of a random earlier row; chains of
+    duplicates are followed back to the row that introduced the article.
+    """
+    def is_duplicate(ids: np.ndarray) -> np.ndarray:
+        return (ids > 0) & (_uniform(ids, 1) < duplicate_rate)
+
+    def source(ids: np.ndarray) -> np.ndarray:
+        return (_uniform(ids, 2) * ids).astype(np.int64)
+
+    content = rows.copy()
+    pending = is_duplicate(content)
+    while pending.any():
+        content[pending] = source(content[pending])
+        pending[pending] = is_duplicate(content[pending])
+    return content
+
+
+def _word_counts(content: np.ndarray, profile: ArticleProfile) -> np.ndarray:
+    """Log-normal article lengths in words (Box-Muller on hashed uniforms)."""
+    u1 = np.maximum(_uniform(content, 3), 1e-12)
+    u2 = _uniform(content, 4)
+    normal = np.sqrt(-2 * np.log(u1)) * np.cos(2 * np.pi * u2)
+    words = np.exp(np.log(profile.median_words) + profile.sigma * normal)
+    return np.clip(words, 30, _MAX_WORDS).astype(np.int64)
+
+
+def _tags(content: np.ndarray, separator: str) -> List[str]:
+    counts = 1 + (_mix(content, 30) % np.uint64(4)).astype(np.int64)
+    picks = np.stack([(_mix(content, 31 + k) % np.uint64(len(_TAGS))).astype(np.int64) for k in range(4)], axis=1)
+    return [separator.join(dict.fromkeys(_TAGS[i] for i in row[:n]))
+            for row, n in zip(picks.tolist(), counts.tolist())]
+
+
+def _dates(content: np.ndarray, salt: int) -> np.ndarray:
+    """Timestamps (datetime64[s]) spread uniformly over 2015-2023."""
+    seconds = _EPOCH_START + (_uniform(content, salt) * _EPOCH_SPAN).astype(np.int64)
+    return seconds.astype("datetime64[s]")
+
+
+def _later(content: np.ndarray, dates: np.ndarray, salt: int, max_seconds: int) -> np.ndarray:
+    """Timestamps up to ``max_seconds`` after ``dates``."""
+    return dates + (_uniform(content, salt) * max_seconds).astype("timedelta64[s]")
+
+
+def _format_dates(dates: np.ndarray, iso: bool) -> List[str]:
+    """Format timestamps as '2020-09-05T02:58:44Z' (iso) or '2020-09-05 02:58:44'."""
+    text = np.datetime_as_string(dates, unit="s").tolist()
+    if iso:
+        return [stamp + "Z" for stamp in text]
+    return [stamp.replace("T", " ") for stamp in text]
+
+
+def _readable_dates(dates: np.ndarray) -> List[str]:
+    """Format timestamps like Dev.to's readable dates ('Sep 5')."""
+    months = dates.astype("datetime64[M]")
+    days = (dates.astype("datetime64[D]") - months).astype(np.int64) + 1
+    names = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+    return [f"{names[month]} {day}" for month, day in
+            zip((months.astype(np.int64) % 12).tolist(), days.tolist())]
+
+
+def _counts(content: np.ndarray, salt: int, median: float) -> np.ndarray:
+    """Heavy-tailed engagement counts."""
+    return np.floor(median * (1 / np.maximum(1 - _uniform(content, salt), 1e-6) - 1)).astype(np.int64)
+
+
+def _medium_chunk(corpus: _Corpus, content: np.ndarray, text: List[Optional[str]],
+                  words: np.ndarray) -> pd.DataFrame:
+    post_ids = [f"{h:012x}" for h in (_mix(content, 40) >> np.uint64(16)).tolist()]
+    titles = corpus.phrases(content, 41, 3, 10)
+    slugs = [title.lower().replace(" ", "-") for title in titles]
+    publications = _pick(content, 42, _PUBLICATIONS + ("",) * 4)
+    created = _dates(content, 43)
+    created_text = _format_dates(created, iso=False)
+    names = [f"{first} {last}" for first, last in zip(_pick(content, 45, _FIRST_NAMES),
+                                                      _pick(content, 46, _LAST_NAMES))]
+    has_collection = _uniform(content, 47) < 0.4
+    return pd.DataFrame({
+        "postId": post_ids,
+        "title": titles,
+        "subTitle": corpus.phrases(content, 48, 6, 14),
+        "text": text,
+        "url": [f"https://medium.com/{pub or '@' + name.split()[0].lower()}/{slug}-{post_id}"
+                for pub, name, slug, post_id in zip(publications, names, slugs, post_ids)],
+        "author": names,
+        "publicationname": publications,
+        "createdDate": created_text,
+        "firstPublishedDate": created_text,
+        "latestPublishedDate": _format_dates(_later(content, created, 44, 86400 * 30), iso=False),
+        "totalClapCount": _counts(content, 49, 40),
+        "readingTime": np.round(words / 265, 2),
+        "recommends": _counts(content, 50, 5),
+        "responsesCreatedCount": _counts(content, 51, 1),
+        "wordCount": words,
+        "tags": _tags(content, ","),
+        "language": np.where(_uniform(content, 52) < 0.97, "en", "es"),
+        "uniqueSlug": [f"{slug}-{post_id}" for slug, post_id in zip(slugs, post_ids)],
+        "collectionId": [f"{h:012x}" if has else "" for h, has in
+                         zip((_mix(content, 53) >> np.uint64(16)).tolist(), has_collection.tolist())],
+    })
+
+
+def _devto_chunk(corpus: _Corpus, content: np.ndarray, text: List[Optional[str]],
+                 words: np.ndarray) -> pd.DataFrame:
+    titles = corpus.phrases(content, 60, 3, 10)
+    users = [f"{first}{last}".lower() for first, last in zip(_pick(content, 61, _FIRST_NAMES),
+                                                           _pick(content, 62, _LAST_NAMES))]
+    slugs = [f"{title.lower().replace(' ', '-')}-{h:04x}"
+             for title, h in zip(titles, (_mix(content, 63) >> np.uint64(48)).tolist())]
+    paths = [f"/{user}/{slug}" for user, slug in zip(users, slugs)]
+    urls = [f"https://dev.to{path}" for path in paths]
+    created = _dates(content, 64)
+    published = _later(content, created, 65, 3600)
+    published_text = _format_dates(published, iso=True)
+    edited = _uniform(content, 66) < 0.3
+    reactions = _counts(content, 67, 8)
+    tags = _tags(content, ", ")
+    has_cover = _uniform(content, 68) < 0.6
+    return pd.DataFrame({
+        "id": content + 100_000,
+        "type_of": "article",
+        "title": titles,
+        "description": corpus.phrases(content, 69, 8, 20),
+        "slug": slugs,
+        "path": paths,
+        "url": urls,
+        "canonical_url": urls,
+        "comments_count": _counts(content, 70, 1),
+        "public_reactions_count": reactions,
+        "positive_reactions_count": reactions,
+        "reading_time_minutes": np.maximum(1, words // 265),
+        "published_at": published_text,
+        "created_at": _format_dates(created, iso=True),
+        "edited_at": [stamp if was_edited else None for stamp, was_edited in
+                      zip(published_text, edited.tolist())],
+        "readable_publish_date": _readable_dates(published),
+        "published_timestamp": published_text,
+        "tags": tags,
+        "tag_list": [t.replace(" ", "") for t in tags],
+        "user": users,
+        "organization": np.where(_uniform(content, 71) < 0.1, "the-practical-dev", None),
+        "language": np.where(_uniform(content, 72) < 0.95, "en", "pt"),
+        "cover_image": [f"https://dev-to-uploads.s3.amazonaws.com/{slug}.png" if has else None
+                        for slug, has in zip(slugs, has_cover.tolist())],
+        "social_image": [f"https://dev.to/social_previews/article/{slug}.png" for slug in slugs],
+        "body": text,
+    })
+
+
+_CHUNK_BUILDERS = {"medium": _medium_chunk, "devto": _devto_chunk}
+
+
+def generate_articles(kind: str,
+                      rows: int,
+                      seed: int = 0,
+                      duplicate_rate: Optional[float] = None,
+                      null_rate: Optional[float] = None,
+                      chunk_size: int = 100_000) -> Iterator[pd.DataFrame]:
+    """
+    Generate a synthetic raw dataset in chunks.
+
+    Args:
+        kind: 'medium' or 'devto'
+        rows: Total number of rows
+        seed: Seed for the generated text
+        duplicate_rate: Share of duplicate rows (defaults to the profile's rate)
+        null_rate: Share of rows without text (defaults to the profile's rate)
+        chunk_size: Rows per yielded DataFrame
+
+    Yields:
+        DataFrames with the source's columns, ``chunk_size`` rows at a time
+
+    Raises:
+        ValueError: If the kind is unknown
+    """
+    if kind not in PROFILES:
+        raise ValueError(f"Unknown dataset kind: {kind} (expected one of {', '.join(PROFILES)})")
+    profile = PROFILES[kind]
+    duplicate_rate = profile.duplicate_rate if duplicate_rate is None else duplicate_rate
+    null_rate = profile.null_rate if null_rate is None else null_rate
+    corpus = _corpus(seed)
+
+    for start in range(0, rows, chunk_size):
+        row_ids = np.arange(start, min(start + chunk_size, rows), dtype=np.int64)
+        content = _content_ids(row_ids, duplicate_rate) + seed * 2 ** 40
+        words = _word_counts(content, profile)
+        text: List[Optional[str]] = corpus.slices(content, words * _CHARS_PER_WORD)
+        # Empty articles are original rows, so duplicates always carry text
+        empty = (content == row_ids + seed * 2 ** 40) & (_uniform(row_ids, 5) < null_rate)
+        for index in np.flatnonzero(empty).tolist():
+            text[index] = None
+        yield _CHUNK_BUILDERS[kind](corpus, content, text, words)
+
+
+def write_articles(kind: str, rows: int, path: Union[str, Path], seed: int = 0, **kwargs) -> Path:
+    """
+    Write a synthetic raw dataset to a CSV or Parquet file.
+
+    Args:
+        kind: 'medium' or 'devto'
+        rows: Total number of rows
+        path: Destination ending in .csv or .parquet
+        seed: Seed for the generated text
+        **kwargs: Further options for generate_articles
+
+    Returns:
+        Path to the written file
+
+    Raises:
+        ValueError: If the file extension is not supported
+    """
+    path = Path(path)
+    if path.suffix not in (".csv", ".parquet"):
+        raise ValueError(f"Unsupported file format: {path}")
+    path.parent.mkdir(exist_ok=True, parents=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+    try:
+        if path.suffix == ".csv":
+            for index, chunk in enumerate(generate_articles(kind, rows, seed, **kwargs)):
+                chunk.to_csv(tmp_path, mode="w" if index == 0 else "a", header=index == 0, index=False)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            writer = None
+            try:
+                for chunk in generate_articles(kind, rows, seed, **kwargs):
+                    if writer is None:
+                        # Columns that happen to be all-null in the first chunk are strings
+                        schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+                        schema = pa.schema([pa.field(f.name, pa.string()) if pa.types.is_null(f.type) else f
+                                            for f in schema])
+                        writer = pq.ParquetWriter(str(tmp_path), schema)
+                    writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            finally:
+                if writer is not None:
+                    writer.close()
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return path
+
+
+def ensure_source(kind: str, rows: int, data_dir: Union[str, Path], file_format: str = "csv",
+                  seed: int = 0) -> Path:
+    """
+    Return a cached synthetic source file, generating it on first use.
+
+    Args:
+        kind: 'medium' or 'devto'
+        rows: Total number of rows
+        data_dir: Directory holding generated sources
+        file_format: 'csv' or 'parquet'
+        seed: Seed for the generated text
+
+    Returns:
+        Path to the source file
+    """
+    path = Path(data_dir) / f"{kind}-{rows}-s{seed}-v{GENERATOR_VERSION}.{file_format}"
+    if not path.exists():
+        write_articles(kind, rows, path, seed)
+    return path
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+MedData Templates Module - Jinja2 rendering of documentation templates.
+
+This module provides a TemplateRenderer that loads templates from the
+templates directory with Jinja2, so the ``{{ }}`` expressions and
+``{% for %}`` loops in them are rendered. Compiled templates are kept in
+memory (re-checked against the file's mtime) and their bytecode is cached
+under ``.meddata/templates``, so a new process skips parsing and compiling
+them. Cache entries are keyed by template name and checked against the
+template's source, so there is one entry per template, and entries of
+templates that no longer exist are removed. A global renderer instance is
+provided for use throughout the application.
+"""
+from __future__ import annotations
+
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional
+
+import jinja2
+
+from scripts.utils.config_manager import config_manager
+from scripts.utils.printer import printer
+
+__all__ = ["TemplateRenderer", "template_renderer"]
+
+
+class _WarningUndefined(jinja2.Undefined):
+    """Undefined variable that renders as an empty string with a warning."""
+
+    def __str__(self) -> str:
+        printer.warning(f"Missing template variable: {self._undefined_name}")
+        return ""
+
+
+class _TemplateBytecodeCache(jinja2.FileSystemBytecodeCache):
+    """
+    Bytecode cache keyed by template name only.
+
+    Jinja2 keys entries by the template's full path as well, so every
+    templates directory (such as a benchmark's temporary copy) leaves its own
+    entries behind. Jinja2 already discards an entry whose source checksum
+    doesn't match, so the name alone is a safe key.
+    """
+
+    def get_cache_key(self, name: str, filename: Optional[str] = None) -> str:
+        return hashlib.sha1(name.encode("utf-8")).hexdigest()
+
+    def prune(self, names: Iterable[str]) -> None:
+        """
+        Remove cached bytecode of templates other than the given ones.
+
+        Args:
+            names: Names of the templates that exist
+        """
+        keep = {self.pattern % self.get_cache_key(name) for name in names}
+        for path in Path(self.directory).glob(self.pattern % "*"):
+            if path.name not in keep:
+                path.unlink(missing_ok=True)
+
+
+class TemplateRenderer:
+    """
+    Renders templates from the templates directory with Jinja2.
+
+    The environment is created on first use and recreated if the templates
+    directory changes (e.g. when the paths are redirected for a benchmark).
+    Rendering is thread-safe.
+    """
+
+    def __init__(self):
+        self._environment: Optional[jinja2.Environment] = None
+        self._templates_dir: Optional[Path] = None
+        self._lock = threading.Lock()
+
+    def _create_environment(self, templates_dir: Path) -> jinja2.Environment:
+        cache_dir = config_manager.paths.cache_dir / "templates"
+        cache_dir.mkdir(exist_ok=True, parents=True)
+        loader = jinja2.FileSystemLoader(str(templates_dir))
+        bytecode_cache = _TemplateBytecodeCache(str(cache_dir))
+        bytecode_cache.prune(loader.list_templates())
+        return jinja2.Environment(
+            loader=loader,
+            bytecode_cache=bytecode_cache,
+            undefined=_WarningUndefined,
+            keep_trailing_newline=True,
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=True,
+        )
+
+    @property
+    def environment(self) -> jinja2.Environment:
+        """Jinja2 environment for the current templates directory."""
+        templates_dir = config_manager.paths.templates_dir
+        with self._lock:
+            if self._environment is None or self._templates_dir != templates_dir:
+                self._environment = self._create_environment(templates_dir)
+                self._templates_dir = templates_dir
+            return self._environment
+
+    def render(self, template: str, variables: Mapping[str, Any]) -> str:
+        """
+        Render a template.
+
+        Args:
+            template: Template file name relative to the templates directory
+            variables: Template variables
+
+        Returns:
+            The rendered text
+
+        Raises:
+            jinja2.TemplateNotFound: If the template doesn't exist
+            jinja2.TemplateSyntaxError: If the template is invalid
+        """
+        return self.environment.get_template(template).render(variables)
+
+
+# Create a global instance for easy import
+template_renderer = TemplateRenderer()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Tests for benchmark results and baseline comparison.
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from scripts.utils import benchmark
+from scripts.utils.benchmark import (BenchmarkResult, best_of, commit_results_path, compare_results,
+                                     current_commit, find_commit_results, load_baseline, result_rows,
+                                     results_from_metrics, run_assets_benchmark, run_docs_benchmark,
+                                     run_pipeline_benchmark, save_baseline)
+from scripts.utils.catalog import CACHE_FILE
+from scripts.utils.config_manager import config_manager
+from scripts.utils.metrics import MetricsRecorder
+from scripts.utils.synthetic import write_articles
+
+MB = 1024 * 1024
+
+
+class TestBaseline(unittest.TestCase):
+    """Test cases for storing and comparing baselines."""
+
+    def setUp(self):
+        """Create a temporary baseline path."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "baseline.json"
+        self.baseline_results = [
+            BenchmarkResult("medium-1000-csv", "ingest", 1000, 1.0, 100 * MB),
+            BenchmarkResult("medium-1000-csv", "dedupe", 1000, 0.5, 50 * MB),
+        ]
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def test_save_and_load(self):
+        """Test that saved results are loaded back by key and merged with older ones."""
+        save_baseline(self.path, self.baseline_results)
+        save_baseline(self.path, [BenchmarkResult("devto-1000-csv", "ingest", 1000, 2.0, 10 * MB)])
+
+        baseline = load_baseline(self.path)
+        self.assertEqual(sorted(baseline), ["devto-1000-csv/ingest", "medium-1000-csv/dedupe",
+                                            "medium-1000-csv/ingest"])
+        self.assertEqual(baseline["medium-1000-csv/ingest"]["rows_per_sec"], 1000.0)
+
+    def test_missing_baseline(self):
+        """Test that a missing baseline loads as empty."""
+        self.assertEqual(load_baseline(self.path), {})
+
+    def test_compare_within_tolerance(self):
+        """Test that small differences are not regressions."""
+        save_baseline(self.path, self.baseline_results)
+        current = [BenchmarkResult("medium-1000-csv", "ingest", 1000, 1.2, 110 * MB)]
+        self.assertEqual(compare_results(current, load_baseline(self.path), tolerance=0.25), [])
+
+    def test_compare_flags_regressions(self):
+        """Test that slowdowns and memory growth beyond the tolerance are reported."""
+        save_baseline(self.path, self.baseline_results)
+        current = [
+            BenchmarkResult("medium-1000-csv", "ingest", 1000, 2.0, 100 * MB),
+            BenchmarkResult("medium-1000-csv", "dedupe", 1000, 0.5, 200 * MB),
+            BenchmarkResult("medium-5000-csv", "ingest", 5000, 9.0, 900 * MB),
+        ]
+        regressions = compare_results(current, load_baseline(self.path), tolerance=0.25)
+
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith("medium-1000-csv/ingest: throughput"))
+        self.assertTrue(regressions[1].startswith("medium-1000-csv/dedupe: peak memory"))
+
+    def test_compare_ignores_noise(self):
+        """Test that very fast stages and small memory deltas don't fail the comparison."""
+        baseline = {"x/normalize": {"rows_per_sec": 100000.0, "seconds": 0.01, "peak_rss_delta": 1 * MB}}
+        current = [BenchmarkResult("x", "normalize", 1000, 0.03, 8 * MB)]
+        self.assertEqual(compare_results(current, baseline), [])
+
+    def test_compare_separate_memory_tolerance(self):
+        """Test that memory growth is judged by its own tolerance when given."""
+        save_baseline(self.path, self.baseline_results)
+        current = [BenchmarkResult("medium-1000-csv", "ingest", 1000, 1.2, 200 * MB)]
+        self.assertEqual(compare_results(current, load_baseline(self.path), 0.25, memory_tolerance=1.5), [])
+        self.assertEqual(len(compare_results(current, load_baseline(self.path), 0.25)), 1)
+
+    def test_save_metadata(self):
+        """Test that extra fields are stored next to the results."""
+        save_baseline(self.path, self.baseline_results, commit="abc123")
+        with open(self.path, encoding="utf-8") as file:
+            self.assertEqual(json.load(file)["commit"], "abc123")
+
+    def test_best_of(self):
+        """Test that repeated runs keep the fastest time and smallest memory growth."""
+        runs = [
+            [BenchmarkResult("x", "ingest", 10, 2.0, 5 * MB)],
+            [BenchmarkResult("x", "ingest", 10, 1.0, 7 * MB)],
+        ]
+        best = best_of(runs)
+        self.assertEqual((best[0].seconds, best[0].peak_rss_delta), (1.0, 5 * MB))
+
+    def test_result_rows(self):
+        """Test that rows show throughput and the change against the baseline."""
+        baseline = {"x/ingest": {"rows_per_sec": 1000.0}}
+        rows = result_rows([BenchmarkResult("x", "ingest", 1000, 0.5, None)], baseline)
+        self.assertEqual(rows, [["x", "ingest", "1,000", "0.500s", "2,000", "n/a", "+100%"]])
+
+
+class TestRunPipelineBenchmark(unittest.TestCase):
+    """Test cases for the pipeline benchmark itself."""
+
+    def test_results_from_metrics(self):
+        """Test that stage metrics become results keyed by benchmark and stage."""
+        metrics = MetricsRecorder()
+        with metrics.stage("ingest") as stage:
+            stage.rows_out = 10
+        results = results_from_metrics("demo", metrics)
+        self.assertEqual([(r.key, r.rows) for r in results], [("demo/ingest", 10)])
+
+    def test_runs_process_dataset_stages(self):
+        """Test that a small synthetic source goes through every processing stage."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = write_articles("medium", 300, Path(tmp_dir) / "medium.csv", duplicate_rate=0.2)
+            results = run_pipeline_benchmark(source, "medium-300-csv")
+
+        stages = {r.stage: r for r in results}
+        self.assertEqual(list(stages), ["ingest", "normalize", "dedupe", "parquet write", "sample"])
+        self.assertEqual(stages["ingest"].rows, 300)
+        self.assertLess(stages["parquet write"].rows, 300)
+
+    def _sandboxed_run(self, func):
+        """Run a docs/assets benchmark in-process without keeping its path changes or touching the cache."""
+        cache_dir = config_manager.paths.cache_dir
+
+        def cached_files():
+            # The catalog of the project's dataset configs may be saved before the sandbox is set up
+            return sorted(path for path in cache_dir.rglob("*") if path.name != CACHE_FILE)
+
+        before = cached_files()
+        with mock.patch.object(config_manager, "paths", config_manager.paths):
+            project_root = config_manager.paths.project_root
+            results = func(2, "demo")
+            self.assertNotEqual(config_manager.paths.project_root, project_root)
+            self.assertNotEqual(config_manager.paths.cache_dir, cache_dir)
+        self.assertEqual(config_manager.paths.project_root, project_root)
+        self.assertEqual(cached_files(), before)
+        return results
+
+    def test_docs_benchmark(self):
+        """Test that docs are generated for every dataset, away from the project docs."""
+        docs_dir = config_manager.paths.docs_dir
+        before = sorted(docs_dir.rglob("*")) if docs_dir.exists() else []
+        results = self._sandboxed_run(run_docs_benchmark)
+
+        self.assertEqual([r.key for r in results], ["demo/docs"])
+        self.assertGreater(results[0].rows, 0)
+        self.assertEqual(sorted(docs_dir.rglob("*")) if docs_dir.exists() else [], before)
+
+    def test_assets_benchmark(self):
+        """Test that logos and icons are generated away from the project images."""
+        images = config_manager.paths.project_root / "assets" / "images"
+        before = {path: path.stat().st_mtime_ns for path in images.iterdir()}
+        results = self._sandboxed_run(run_assets_benchmark)
+
+        self.assertEqual([r.key for r in results], ["demo/assets"])
+        self.assertEqual({path: path.stat().st_mtime_ns for path in images.iterdir()}, before)
+
+
+class TestCommitResults(unittest.TestCase):
+    """Test cases for results keyed by git commit."""
+
+    def setUp(self):
+        """Create a results directory with results for one commit."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.results_dir = Path(self.tmp_dir.name)
+        save_baseline(commit_results_path(self.results_dir, "bbb"), [BenchmarkResult("x", "ingest", 1, 1.0)])
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def _git(self, outputs):
+        """Patch git with canned output per sub-command."""
+        return mock.patch.object(benchmark, "_git", side_effect=lambda *args: outputs.get(args[0]))
+
+    def test_current_commit(self):
+        """Test that uncommitted changes mark the commit as dirty."""
+        with self._git({"rev-parse": "aaa", "status": ""}):
+            self.assertEqual(current_commit(), "aaa")
+        with self._git({"rev-parse": "aaa", "status": " M meddata.py"}):
+            self.assertEqual(current_commit(), "aaa-dirty")
+        with self._git({}):
+            self.assertIsNone(current_commit())
+
+    def test_find_nearest_ancestor(self):
+        """Test that the nearest commit with results is chosen, skipping the current run."""
+        with self._git({"rev-list": "aaa\nbbb\nccc"}):
+            self.assertEqual(find_commit_results(self.results_dir), "bbb")
+            self.assertIsNone(find_commit_results(self.results_dir, exclude="bbb"))
+
+    def test_find_explicit_ref(self):
+        """Test that an explicit revision is resolved and must have results."""
+        with self._git({"rev-parse": "bbb"}):
+            self.assertEqual(find_commit_results(self.results_dir, "v1.0"), "bbb")
+        with self._git({"rev-parse": "ccc"}):
+            self.assertIsNone(find_commit_results(self.results_dir, "v0.9"))
+
+
+if __name__ == "__main__":
+    unittest.main()
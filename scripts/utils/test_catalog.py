@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Tests for the DatasetCatalog class.
+"""
+
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+from scripts.utils.catalog import DatasetCatalog
+from scripts.utils.dataset_schema import ConfigValidationError
+
+
+class TestDatasetCatalog(unittest.TestCase):
+    """Test cases for the DatasetCatalog class."""
+
+    def setUp(self):
+        """Create a temporary datasets directory with two configs."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        self.datasets_dir = self.root / "_datasets"
+        self.cache_dir = self.root / ".meddata"
+        self.datasets_dir.mkdir()
+        (self.datasets_dir / "medium.yml").write_text(
+            "id: medium\nname: Medium\ndescription: Articles\nstatus: published\n")
+        (self.datasets_dir / "devto.yml").write_text(
+            "id: devto\nname: Dev.to\ndescription: Posts\nstatus: development\n")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def _catalog(self, persist=True):
+        return DatasetCatalog(self.datasets_dir, self.cache_dir, persist=persist)
+
+    def test_load_parses_once(self):
+        """Test that unchanged configs are served from the in-memory cache."""
+        catalog = self._catalog(persist=False)
+        with patch("scripts.utils.catalog.yaml.load", wraps=yaml.load) as yaml_load:
+            self.assertEqual(catalog.load("medium")["name"], "Medium")
+            catalog.load("medium")
+            self.assertEqual(yaml_load.call_count, 1)
+
+    def test_changed_file_is_reparsed(self):
+        """Test that a change in size or mtime invalidates the cached config."""
+        catalog = self._catalog(persist=False)
+        catalog.load("medium")
+        (self.datasets_dir / "medium.yml").write_text(
+            "id: medium\nname: Medium Articles\ndescription: Articles\nstatus: published\n")
+        self.assertEqual(catalog.load("medium")["name"], "Medium Articles")
+
+    def test_returned_configs_are_copies(self):
+        """Test that mutating a returned config doesn't affect the cache."""
+        catalog = self._catalog(persist=False)
+        catalog.load("medium")["name"] = "Mutated"
+        self.assertEqual(catalog.load("medium")["name"], "Medium")
+
+    def test_items_skips_invalid_configs(self):
+        """Test that items yields every readable config in ID order."""
+        (self.datasets_dir / "broken.yml").write_text("id: [unclosed\n")
+        catalog = self._catalog(persist=False)
+        self.assertEqual([dataset_id for dataset_id, _ in catalog.items()], ["devto", "medium"])
+        with self.assertRaises(yaml.YAMLError):
+            catalog.load("broken")
+
+    def test_validate_reports_every_invalid_config(self):
+        """Test that validate collects problems of all configs in one pass."""
+        (self.datasets_dir / "medium.yml").write_text("id: medium\nname: Medium\n")
+        (self.datasets_dir / "broken.yml").write_text("id: [unclosed\n")
+        problems = self._catalog(persist=False).validate()
+
+        self.assertEqual(sorted(problems), ["broken", "medium"])
+        self.assertTrue(problems["broken"][0].startswith("invalid YAML"))
+        self.assertIn("status: missing required field", problems["medium"])
+
+    def test_load_raises_on_invalid_config(self):
+        """Test that loading an invalid config fails before any work starts."""
+        (self.datasets_dir / "medium.yml").write_text("id: medium\nname: Medium\nstatus: published\n")
+        catalog = self._catalog(persist=False)
+        with self.assertRaises(ConfigValidationError) as context:
+            catalog.load("medium")
+        self.assertIn("description: missing required field", context.exception.errors)
+        self.assertEqual(catalog.load("medium", validate=False)["name"], "Medium")
+
+    def test_missing_config_raises(self):
+        """Test that loading an unknown dataset raises FileNotFoundError."""
+        with self.assertRaises(FileNotFoundError):
+            self._catalog(persist=False).load("missing")
+
+    def test_disk_cache_is_reused(self):
+        """Test that a new catalog reuses configs pickled by a previous one."""
+        list(self._catalog().items())
+        self.assertTrue((self.cache_dir / "catalog.pickle").exists())
+
+        with patch("scripts.utils.catalog.yaml.load") as yaml_load:
+            configs = dict(self._catalog().items())
+            yaml_load.assert_not_called()
+        self.assertEqual(configs["devto"]["name"], "Dev.to")
+
+    def test_cache_is_saved_once_per_pass(self):
+        """Test that a cold pass pickles the cache once, and single loads defer it to exit."""
+        catalog = self._catalog()
+        with patch.object(catalog, "_save", wraps=catalog._save) as save:
+            list(catalog.items())
+            catalog.validate()
+            self.assertEqual(save.call_count, 1)
+
+        catalog = self._catalog()
+        (self.cache_dir / "catalog.pickle").unlink()
+        with patch("scripts.utils.catalog.atexit.register") as register:
+            catalog.load("devto")
+            catalog.load("medium")
+        register.assert_called_once_with(catalog.flush)
+        self.assertFalse((self.cache_dir / "catalog.pickle").exists())
+        catalog.flush()
+        self.assertTrue((self.cache_dir / "catalog.pickle").exists())
+
+    def test_deleted_configs_are_dropped_from_the_cache(self):
+        """Test that entries of deleted config files don't outlive them on disk."""
+        list(self._catalog().items())
+        (self.datasets_dir / "devto.yml").unlink()
+        list(self._catalog().items())
+
+        with open(self.cache_dir / "catalog.pickle", "rb") as file:
+            _version, entries = pickle.load(file)
+        self.assertEqual([Path(key).name for key in entries], ["medium.yml"])
+
+    def test_corrupt_disk_cache_is_ignored(self):
+        """Test that an unreadable cache file falls back to parsing."""
+        self.cache_dir.mkdir()
+        (self.cache_dir / "catalog.pickle").write_bytes(b"not a pickle")
+        self.assertEqual(self._catalog().load("devto")["id"], "devto")
+
+
+if __name__ == "__main__":
+    unittest.main()
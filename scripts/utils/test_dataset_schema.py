@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for the dataset config schema validator.
+"""
+
+import unittest
+from datetime import date
+from pathlib import Path
+
+import yaml
+
+from scripts.utils.dataset_schema import validate_config
+
+DATASETS_DIR = Path(__file__).resolve().parents[2] / "_datasets"
+
+
+class TestValidateConfig(unittest.TestCase):
+    """Test cases for validate_config."""
+
+    def setUp(self):
+        """Create a minimal valid config."""
+        self.config = {
+            "id": "demo",
+            "name": "Demo",
+            "description": "A demo dataset",
+            "status": "development",
+            "release_date": date(2024, 1, 15),
+            "stats": [{"value": 100, "label": "Items"}],
+            "publishing": [{"platform": "github", "repository": "owner/demo"}],
+        }
+
+    def test_valid_config(self):
+        """Test that a valid config has no errors."""
+        self.assertEqual(validate_config(self.config, "demo"), [])
+
+    def test_repository_configs_are_valid(self):
+        """Test that every config shipped in _datasets/ matches the schema."""
+        for path in DATASETS_DIR.glob("*.yml"):
+            with open(path, 'r', encoding='utf-8') as file:
+                config = yaml.safe_load(file)
+            self.assertEqual(validate_config(config, path.stem), [], path.name)
+
+    def test_reports_every_error(self):
+        """Test that all problems are collected, with their field paths."""
+        del self.config["name"]
+        self.config["status"] = "draft"
+        self.config["stats"].append({"value": True})
+        self.config["publishing"][0]["platform"] = "gitlab"
+
+        errors = validate_config(self.config, "other")
+
+        self.assertEqual(errors, [
+            "name: missing required field",
+            "status: expected one of published, development, got 'draft'",
+            "stats[1].label: missing required field",
+            "stats[1].value: expected string or integer or number, got boolean",
+            "publishing[0].platform: expected one of huggingface, github, kaggle, got 'gitlab'",
+            "id: 'demo' does not match the file name 'other.yml'",
+        ])
+
+    def test_non_mapping_document(self):
+        """Test that an empty or scalar document is reported."""
+        self.assertEqual(validate_config(None), ["<root>: expected mapping, got null"])
+
+    def test_unknown_fields_are_allowed(self):
+        """Test that extra keys don't fail validation."""
+        self.config["extra"] = {"anything": 1}
+        self.assertEqual(validate_config(self.config), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for dataset stats computed from Parquet metadata.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+from scripts.utils.dataset_stats import (STATS_FILE, compute_stats, format_count, load_stats, size_category,
+                                         write_stats)
+from scripts.utils.parquet_footer import check_stats, read_footer
+
+
+class TestComputeStats(unittest.TestCase):
+    """Test cases for computing stats from a processed file."""
+
+    def setUp(self):
+        """Write a Parquet file with nulls spread over several row groups."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        self.path = self.root / "data.parquet"
+        df = pd.DataFrame({
+            "title": [f"t{i}" if i % 4 else None for i in range(1000)],
+            "claps": range(1000),
+        })
+        df.to_parquet(self.path, row_group_size=300)
+        self.sample = self.root / "sample.csv"
+        df.head(10).to_csv(self.sample, index=False)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def test_counts_and_null_rates(self):
+        """Test that rows, columns and per-column nulls come from the footer."""
+        stats = compute_stats(self.path)
+        self.assertEqual((stats["rows"], stats["columns"], stats["row_groups"]), (1000, 2, 4))
+        self.assertEqual(stats["size_category"], "1K<n<10K")
+        fields = {field["name"]: field for field in stats["fields"]}
+        self.assertEqual((fields["title"]["null_count"], fields["title"]["null_rate"]), (250, 0.25))
+        self.assertEqual((fields["claps"]["null_count"], fields["claps"]["type"]), (0, "int64"))
+        self.assertGreater(fields["title"]["compressed_bytes"], 0)
+
+    def test_file_sizes(self):
+        """Test that the sizes of the listed files are reported."""
+        stats = compute_stats(self.path, files=[self.path, self.sample])
+        self.assertEqual(stats["files"], {"data.parquet": self.path.stat().st_size,
+                                          "sample.csv": self.sample.stat().st_size})
+        self.assertEqual(stats["total_bytes"], sum(stats["files"].values()))
+
+    def test_display_stats_agree_with_the_data(self):
+        """Test that the headline stats pass the footer check used by doctor."""
+        stats = compute_stats(self.path)
+        labels = [stat["label"] for stat in stats["display"]]
+        self.assertEqual(labels, ["Rows", "Fields", "Size", "Complete"])
+        self.assertEqual(stats["display"][-1]["value"], "87.5%")
+        self.assertEqual(check_stats(read_footer(self.path), stats["display"]), [])
+
+    def test_write_and_load(self):
+        """Test that written stats are loaded back for the dataset."""
+        write_stats(self.root / "medium" / STATS_FILE, compute_stats(self.path))
+        with mock.patch("scripts.utils.dataset_stats.config_manager") as config:
+            config.paths.processed_data_dir = self.root
+            self.assertEqual(load_stats("medium")["rows"], 1000)
+            self.assertIsNone(load_stats("devto"))
+            (self.root / "medium" / STATS_FILE).write_text("{not json")
+            self.assertIsNone(load_stats("medium"))
+
+
+class TestFormatting(unittest.TestCase):
+    """Test cases for abbreviating counts and size categories."""
+
+    def test_format_count(self):
+        """Test that counts are rounded down to their abbreviation."""
+        self.assertEqual(format_count(999), "999")
+        self.assertEqual(format_count(444_999), "444K+")
+        self.assertEqual(format_count(1_290_000), "1.2M+")
+        self.assertEqual(format_count(5_000_000), "5M+")
+
+    def test_size_category(self):
+        """Test the Hugging Face size category boundaries."""
+        self.assertEqual(size_category(999), "n<1K")
+        self.assertEqual(size_category(444_000), "100K<n<1M")
+        self.assertEqual(size_category(2_000_000_000), "n>1B")
+
+
+if __name__ == "__main__":
+    unittest.main()
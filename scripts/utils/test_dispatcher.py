@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for the ScriptDispatcher class.
+"""
+
+import contextlib
+import io
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.utils.dispatcher import ScriptDispatcher
+
+
+class TestScriptDispatcher(unittest.TestCase):
+    """Test cases for the ScriptDispatcher class."""
+
+    def setUp(self):
+        """Create a temporary hyphenated script to dispatch to."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.script = Path(self.tmp_dir.name) / "sample-script.py"
+        self.script.write_text(
+            "import sys\n"
+            "LOADS = []\n"
+            "LOADS.append(1)\n"
+            "def add(a, b):\n"
+            "    return a + b\n"
+            "def fail(code):\n"
+            "    sys.exit(code)\n"
+            "def crash():\n"
+            "    raise KeyError('missing')\n"
+        )
+        self.dispatcher = ScriptDispatcher()
+
+    def tearDown(self):
+        """Remove the temporary script."""
+        self.tmp_dir.cleanup()
+
+    def test_call_returns_result(self):
+        """Entry function results are returned as Python objects."""
+        self.assertEqual(self.dispatcher.call(self.script, "add", 2, 3), 5)
+
+    def test_module_is_loaded_once(self):
+        """Repeated calls reuse the loaded module."""
+        self.dispatcher.call(self.script, "add", 1, 1)
+        module = self.dispatcher.load(self.script)
+        self.dispatcher.call(self.script, "add", 1, 1)
+        self.assertEqual(module.LOADS, [1])
+
+    def test_non_zero_exit_raises_called_process_error(self):
+        """sys.exit(1) inside a script surfaces as CalledProcessError."""
+        with self.assertRaises(subprocess.CalledProcessError) as ctx:
+            self.dispatcher.call(self.script, "fail", 2)
+        self.assertEqual(ctx.exception.returncode, 2)
+
+    def test_exception_raises_called_process_error(self):
+        """An exception inside a script surfaces as CalledProcessError with its traceback."""
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr), self.assertRaises(subprocess.CalledProcessError) as ctx:
+            self.dispatcher.call(self.script, "crash")
+        self.assertEqual(ctx.exception.returncode, 1)
+        self.assertIsInstance(ctx.exception.__cause__, KeyError)
+        self.assertIn("KeyError: 'missing'", stderr.getvalue())
+
+    def test_zero_exit_returns_none(self):
+        """sys.exit(0) inside a script is treated as success."""
+        self.assertIsNone(self.dispatcher.call(self.script, "fail", 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for atomic writes that skip unchanged files.
+"""
+
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+from scripts.utils.file_writer import FileWriter
+
+
+class TestFileWriter(unittest.TestCase):
+    """Test cases for writing and copying files."""
+
+    def setUp(self):
+        """Create a writer and a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        self.writer = FileWriter()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def test_unchanged_file_is_left_alone(self):
+        """Test that rewriting the same content keeps the file's mtime."""
+        path = self.root / "docs" / "README.md"
+        self.assertTrue(self.writer.write(path, "# Medium\n"))
+        os.utime(path, (1_000_000, 1_000_000))
+
+        self.assertFalse(self.writer.write(path, "# Medium\n"))
+        self.assertEqual(path.stat().st_mtime, 1_000_000)
+        self.assertTrue(self.writer.write(path, "# DevTo\n\n"))
+        self.assertEqual(path.read_text(encoding="utf-8"), "# DevTo\n\n")
+
+    def test_same_size_content_is_compared(self):
+        """Test that a file of the same size but different bytes is rewritten."""
+        path = self.root / "data.bin"
+        self.writer.write(path, b"aaaa")
+        self.assertTrue(self.writer.write(path, b"abcd"))
+        self.assertEqual(path.read_bytes(), b"abcd")
+
+    def test_replace_keeps_mode_and_leaves_no_temp_files(self):
+        """Test that the renamed file keeps the permissions of the one it replaces."""
+        path = self.root / "run.sh"
+        self.writer.write(path, "echo one\n")
+        path.chmod(0o750)
+        self.writer.write(path, "echo two\n")
+        self.assertEqual(path.stat().st_mode & 0o777, 0o750)
+        self.assertEqual([p.name for p in self.root.iterdir()], ["run.sh"])
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions")
+    def test_new_file_follows_the_current_umask(self):
+        """Test that a new file gets the permissions open() would give it."""
+        old_umask = os.umask(0o027)
+        try:
+            self.writer.write(self.root / "stats.json", "{}\n")
+        finally:
+            os.umask(old_umask)
+        self.assertEqual((self.root / "stats.json").stat().st_mode & 0o777, 0o640)
+
+    def test_failed_write_keeps_the_old_file(self):
+        """Test that a failed rename leaves the destination intact and cleans up."""
+        path = self.root / "stats.json"
+        self.writer.write(path, "{}\n")
+        with mock.patch("scripts.utils.file_writer.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.writer.write(path, '{"rows": 1}\n')
+        self.assertEqual(path.read_text(), "{}\n")
+        self.assertEqual([p.name for p in self.root.iterdir()], ["stats.json"])
+
+    def test_copy(self):
+        """Test that copies are skipped when the destination already matches."""
+        source = self.root / "favicon.svg"
+        source.write_text("<svg/>")
+        target = self.root / "images" / "favicon.svg"
+        self.assertTrue(self.writer.copy(source, target))
+        self.assertFalse(self.writer.copy(source, target))
+        self.assertEqual(target.read_text(), "<svg/>")
+
+    def test_track_counts_changed_files(self):
+        """Test that tracked summaries count changed and unchanged files."""
+        self.writer.write(self.root / "a.txt", "a")
+        with self.writer.track() as outer:
+            self.writer.write(self.root / "a.txt", "a")
+            with self.writer.track() as inner:
+                self.writer.write(self.root / "b.txt", "b")
+        self.writer.write(self.root / "c.txt", "c")
+
+        self.assertEqual(str(outer), "1 of 2 files changed")
+        self.assertEqual(outer.changed, [self.root / "b.txt"])
+        self.assertEqual(outer.unchanged, [self.root / "a.txt"])
+        self.assertEqual(str(inner), "1 of 1 files changed")
+
+    def test_track_is_per_context(self):
+        """Test that writes on other threads are only counted when bound to the summary."""
+        with self.writer.track() as own, ThreadPoolExecutor(max_workers=2) as pool:
+            # A concurrent stage tracking its own writes
+            other = pool.submit(self._tracked_write, self.root / "other.txt").result()
+            pool.submit(self.writer.bind(self.writer.write), self.root / "bound.txt", "b").result()
+            self.writer.write(self.root / "cache.bin", b"c", report=False)
+
+        self.assertEqual(own.changed, [self.root / "bound.txt"])
+        self.assertEqual(other.changed, [self.root / "other.txt"])
+
+    def _tracked_write(self, path):
+        with self.writer.track() as summary:
+            self.writer.write(path, "o")
+        return summary
+
+
+if __name__ == "__main__":
+    unittest.main()
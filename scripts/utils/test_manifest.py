@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Tests for file manifests.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.utils.manifest import build_manifest, bytes_sha256, diff_manifests, verify_manifest
+
+
+class TestManifest(unittest.TestCase):
+    """Test cases for building, diffing and verifying manifests."""
+
+    def setUp(self):
+        """Create a directory with two files."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        (self.root / "a.txt").write_bytes(b"alpha")
+        (self.root / "b.txt").write_bytes(b"beta")
+        self.manifest = build_manifest(self.root, [self.root / "a.txt", self.root / "b.txt"])
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def test_diff(self):
+        """Test that changed and removed files are found."""
+        (self.root / "a.txt").write_bytes(b"ALPHA")
+        new = build_manifest(self.root, [self.root / "a.txt"])
+        self.assertEqual(diff_manifests(self.manifest, new), (["a.txt"], ["b.txt"]))
+
+    def test_verify_files(self):
+        """Test that missing, resized and modified files are reported."""
+        self.assertEqual(verify_manifest(self.root, self.manifest), [])
+
+        (self.root / "a.txt").write_bytes(b"alphA")
+        (self.root / "b.txt").unlink()
+        self.assertEqual(verify_manifest(self.root, self.manifest),
+                         ["a.txt: checksum mismatch", "b.txt: missing"])
+
+        (self.root / "a.txt").write_bytes(b"alphabet")
+        self.assertEqual(verify_manifest(self.root, self.manifest)[0], "a.txt: size 8 bytes, expected 5")
+
+    def test_verify_chunks(self):
+        """Test that chunked entries are verified chunk by chunk."""
+        (self.root / "data.bin.part-0000").write_bytes(b"abc")
+        (self.root / "data.bin.part-0001").write_bytes(b"xyz")
+        manifest = {"files": {"data.bin": {"size": 6, "sha256": bytes_sha256(b"abcdef"), "chunks": [
+            {"path": "data.bin.part-0000", "size": 3, "sha256": bytes_sha256(b"abc")},
+            {"path": "data.bin.part-0001", "size": 3, "sha256": bytes_sha256(b"def")},
+        ]}}}
+        self.assertEqual(verify_manifest(self.root, manifest), ["data.bin.part-0001: checksum mismatch"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the MetricsRecorder class.
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.utils.metrics import MetricsRecorder, format_bytes
+
+
+class TestMetricsRecorder(unittest.TestCase):
+    """Test cases for the MetricsRecorder class."""
+
+    def test_stage_records_times_and_rows(self):
+        """Test that a stage records its timings and row counts."""
+        recorder = MetricsRecorder()
+        with recorder.stage("normalize", rows_in=10) as stage:
+            sum(range(10000))
+            stage.rows_out = 8
+
+        self.assertEqual(len(recorder.stages), 1)
+        metrics = recorder.stages[0]
+        self.assertEqual(metrics.name, "normalize")
+        self.assertEqual((metrics.rows_in, metrics.rows_out), (10, 8))
+        self.assertGreater(metrics.wall_time, 0)
+        self.assertGreaterEqual(metrics.cpu_time, 0)
+
+    def test_stage_measures_memory_growth(self):
+        """Test that allocating inside a stage shows up as peak RSS growth."""
+        recorder = MetricsRecorder()
+        with recorder.stage("allocate"):
+            block = bytearray(64 * 1024 * 1024)
+            block[::4096] = b"x" * len(block[::4096])
+            del block
+
+        delta = recorder.stages[0].peak_rss_delta
+        if delta is None:
+            self.skipTest("peak RSS not available on this platform")
+        self.assertGreater(delta, 32 * 1024 * 1024)
+
+    def test_stage_recorded_on_error(self):
+        """Test that failing stages are still recorded."""
+        recorder = MetricsRecorder()
+        with self.assertRaises(ValueError):
+            with recorder.stage("parse"):
+                raise ValueError("bad file")
+        self.assertEqual([s.name for s in recorder.stages], ["parse"])
+
+    def test_total_and_rows(self):
+        """Test the summed total and the formatted table rows."""
+        recorder = MetricsRecorder()
+        with recorder.stage("download"):
+            pass
+        with recorder.stage("dedupe", rows_in=1500) as stage:
+            stage.rows_out = 1200
+
+        total = recorder.total()
+        self.assertAlmostEqual(total.wall_time, sum(s.wall_time for s in recorder.stages))
+
+        rows = recorder.rows()
+        self.assertEqual([row[0] for row in rows], ["download", "dedupe", "total"])
+        self.assertEqual(rows[1][4:], ["1,500", "1,200"])
+        self.assertEqual(rows[0][4:], ["", ""])
+
+    def test_write(self):
+        """Test that metrics are written as JSON with metadata."""
+        recorder = MetricsRecorder()
+        with recorder.stage("sample", rows_in=5) as stage:
+            stage.rows_out = 5
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = recorder.write(Path(tmp_dir) / "demo" / "metrics.json", dataset_id="demo")
+            data = json.loads(path.read_text(encoding="utf-8"))
+            self.assertEqual(list(Path(tmp_dir, "demo").iterdir()), [path])
+
+        self.assertEqual(data["dataset_id"], "demo")
+        self.assertIn("recorded_at", data)
+        self.assertEqual(data["stages"][0]["name"], "sample")
+        self.assertEqual(data["stages"][0]["rows_out"], 5)
+        self.assertEqual(data["total"]["name"], "total")
+
+    def test_format_bytes(self):
+        """Test human readable byte sizes."""
+        self.assertEqual(format_bytes(None), "n/a")
+        self.assertEqual(format_bytes(512), "512 B")
+        self.assertEqual(format_bytes(1536), "1.5 KB")
+        self.assertEqual(format_bytes(3 * 1024 ** 3), "3.0 GB")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for Parquet footer integrity checks.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from scripts.utils.parquet_footer import (ParquetFooterError, check_stats, compare_schema, parse_count,
+                                          read_footer)
+
+
+class TestReadFooter(unittest.TestCase):
+    """Test cases for reading and checking footers."""
+
+    def setUp(self):
+        """Write a Parquet file with several row groups."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "data.parquet"
+        df = pd.DataFrame({"title": [f"t{i}" for i in range(1000)], "claps": range(1000)})
+        df.to_parquet(self.path, row_group_size=300)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def test_reads_counts_and_columns(self):
+        """Test that row count, row groups and column types come from the footer."""
+        footer = read_footer(self.path)
+        self.assertEqual((footer.num_rows, footer.num_row_groups), (1000, 4))
+        self.assertEqual(footer.columns, {"title": "object", "claps": "int64"})
+
+    def test_truncated_file(self):
+        """Test that a file cut short is rejected."""
+        self.path.write_bytes(self.path.read_bytes()[:-50])
+        with self.assertRaises(ParquetFooterError):
+            read_footer(self.path)
+
+    def test_footer_pointing_past_the_data(self):
+        """Test that a footer whose column chunks don't fit the file is rejected."""
+        data = self.path.read_bytes()
+        footer_size = int.from_bytes(data[-8:-4], "little")
+        # Drop the last data page while keeping the footer intact
+        self.path.write_bytes(data[:-footer_size - 8 - 200] + data[-footer_size - 8:])
+        with self.assertRaises(ParquetFooterError):
+            read_footer(self.path)
+
+    def test_missing_file(self):
+        """Test that a missing file raises FileNotFoundError."""
+        with self.assertRaises(FileNotFoundError):
+            read_footer(Path(self.tmp_dir.name) / "missing.parquet")
+
+
+class TestConfigComparison(unittest.TestCase):
+    """Test cases for comparing footers with dataset configurations."""
+
+    def setUp(self):
+        """Write a small Parquet file."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        path = Path(self.tmp_dir.name) / "data.parquet"
+        pd.DataFrame({"title": ["a"] * 444_593, "claps": 1}).to_parquet(path)
+        self.footer = read_footer(path)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def test_compare_schema(self):
+        """Test that missing, extra and retyped columns are reported."""
+        self.assertEqual(compare_schema(self.footer, [{"name": "title", "type": "string"},
+                                                      {"name": "claps", "type": "int64"}]), [])
+        problems = compare_schema(self.footer, [{"name": "title"}, {"name": "claps", "type": "object"},
+                                                {"name": "url", "type": "object"}])
+        self.assertEqual(problems, ["columns in the config but not in the data: url",
+                                    "column 'claps' is int64 but the config says object"])
+
+    def test_parse_count(self):
+        """Test parsing of abbreviated counts."""
+        self.assertEqual(parse_count("444K+"), (444_000, 1000, True))
+        self.assertEqual(parse_count("1.5M"), (1_500_000, 1_000_000, False))
+        self.assertEqual(parse_count("12,500"), (12_500, 1, False))
+        self.assertEqual(parse_count(20), (20, 1, False))
+        self.assertIsNone(parse_count("100%"))
+
+    def test_check_stats(self):
+        """Test that row stats must match the data and column stats are lower bounds."""
+        good = [{"value": "444K+", "label": "Articles"}, {"value": "2", "label": "Fields"},
+                {"value": "100%", "label": "Unique Entries"}]
+        self.assertEqual(check_stats(self.footer, good), [])
+
+        stale = [{"value": "400K+", "label": "Articles"}, {"value": "20+", "label": "Fields"}]
+        self.assertEqual(check_stats(self.footer, stale), [
+            "stats claim 400K+ Articles but the data has 444,593 rows",
+            "stats claim 20+ Fields but the data has 2 columns",
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the Pipeline class.
+"""
+
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from scripts.utils.pipeline import Pipeline, Stage
+
+
+class TestPipeline(unittest.TestCase):
+    """Test cases for the Pipeline class."""
+
+    def setUp(self):
+        """Create a temporary directory with one input file."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        self.source = self.root / "source.txt"
+        self.source.write_text("v1")
+        self.calls = []
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def _copy_stage(self, name, output, deps=(), inputs=None):
+        def action():
+            self.calls.append(name)
+            output.write_text(self.source.read_text())
+        return Stage(name, action, inputs=inputs or [self.source], outputs=[output], deps=list(deps))
+
+    def _pipeline(self):
+        pipeline = Pipeline(self.root / "state.json")
+        first = self.root / "first.txt"
+        pipeline.add(self._copy_stage("first", first))
+        pipeline.add(self._copy_stage("second", self.root / "second.txt", deps=["first"], inputs=[first]))
+        return pipeline
+
+    def test_unchanged_inputs_are_skipped(self):
+        """A second run with the same inputs skips every stage."""
+        self._pipeline().run()
+        results = self._pipeline().run()
+        self.assertEqual(self.calls, ["first", "second"])
+        self.assertEqual({r.status for r in results.values()}, {"skipped"})
+
+    def test_changed_input_reruns_dependents(self):
+        """Changing an input re-runs the stage and the stages depending on it."""
+        self._pipeline().run()
+        time.sleep(0.01)
+        self.source.write_text("version two")
+        results = self._pipeline().run()
+        self.assertEqual(self.calls, ["first", "second", "first", "second"])
+        self.assertEqual(results["second"].status, "ran")
+
+    def test_missing_output_reruns_stage(self):
+        """A stage whose output was deleted runs again."""
+        self._pipeline().run()
+        (self.root / "second.txt").unlink()
+        self._pipeline().run()
+        self.assertEqual(self.calls, ["first", "second", "second"])
+
+    def test_failure_blocks_dependents(self):
+        """A failing stage blocks its dependents and isn't recorded as done."""
+        pipeline = Pipeline(self.root / "state.json")
+        pipeline.add(Stage("broken", lambda: sys.exit(1), inputs=[self.source]))
+        pipeline.add(Stage("after", lambda: self.calls.append("after"), deps=["broken"]))
+        results = pipeline.run()
+        self.assertEqual(results["broken"].status, "failed")
+        self.assertEqual(results["after"].status, "blocked")
+        self.assertEqual(self.calls, [])
+
+    def test_independent_stages_run_in_parallel(self):
+        """Stages without dependencies between them overlap."""
+        barrier = threading.Barrier(2, timeout=5)
+        pipeline = Pipeline(self.root / "state.json")
+        pipeline.add(Stage("a", barrier.wait))
+        pipeline.add(Stage("b", barrier.wait))
+        results = pipeline.run(max_workers=2)
+        self.assertEqual({r.status for r in results.values()}, {"ran"})
+
+    def test_unknown_dependency_is_rejected(self):
+        """Dependencies must be declared before the stages using them."""
+        pipeline = Pipeline(self.root / "state.json")
+        with self.assertRaises(ValueError):
+            pipeline.add(Stage("a", lambda: None, deps=["missing"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,10 +4,14 @@
 Simple tests to ensure the Printer functionality works as expected.
 """
 
+import json
+import os
 import unittest
 from contextlib import redirect_stdout
 from io import StringIO
-from scripts.utils.printer import Printer, HAS_RICH
+from unittest.mock import patch
+from scripts.utils.metrics import MetricsRecorder
+from scripts.utils.printer import Printer, HAS_RICH, LOG_FORMAT_ENV
 
 
 class TestPrinter(unittest.TestCase):
@@ -87,6 +91,21 @@ def test_dataset_processed(self):
         self.assertIn("rows: 100", output)
         self.assertIn("columns: 5", output)
 
+    def test_dataset_processed_with_metrics(self):
+        """Test that stage metrics are rendered in the processing summary."""
+        metrics = MetricsRecorder()
+        with metrics.stage("dedupe", rows_in=100) as stage:
+            stage.rows_out = 90
+
+        with redirect_stdout(self.stdout):
+            self.printer.dataset_processed("test", {"rows": 90}, metrics)
+
+        output = self.stdout.getvalue()
+        self.assertIn("Stage Metrics", output)
+        self.assertIn("dedupe", output)
+        self.assertIn("100", output)
+        self.assertIn("total", output)
+
     def test_fallback_when_rich_unavailable(self):
         """Test that the printer works even when rich is unavailable."""
         # Create a printer that thinks rich is not available
@@ -106,5 +125,54 @@ def test_fallback_when_rich_unavailable(self):
             setattr(Printer, 'HAS_RICH', original_has_rich)
 
 
+
+class TestJsonPrinter(unittest.TestCase):
+    """Test cases for the JSON event output mode."""
+
+    def setUp(self):
+        """Set up a printer emitting JSON events."""
+        self.printer = Printer(log_format="json")
+        self.stdout = StringIO()
+
+    def events(self):
+        """Parse the captured newline-delimited events."""
+        return [json.loads(line) for line in self.stdout.getvalue().splitlines()]
+
+    def test_events(self):
+        """Test that messages, stats and timings become JSON events."""
+        with redirect_stdout(self.stdout):
+            self.printer.header("Processing dataset: demo")
+            self.printer.success("Saved [path]data.parquet[/path]")
+            self.printer.dataset_processed("demo", {"Total rows": 10})
+            self.printer.timing("normalize", 1.5, dataset="demo")
+            self.printer.flush()
+
+        events = self.events()
+        self.assertEqual([e["event"] for e in events], ["header", "success", "dataset_processed", "timing"])
+        self.assertEqual(events[1]["message"], "Saved data.parquet")
+        self.assertEqual(events[2]["stats"], {"Total rows": 10})
+        self.assertEqual(events[3], {"ts": events[3]["ts"], "event": "timing", "name": "normalize",
+                                     "seconds": 1.5, "dataset": "demo"})
+
+    def test_events_are_buffered(self):
+        """Test that events are held until flushed, except for errors."""
+        with redirect_stdout(self.stdout):
+            self.printer.print("quiet")
+            self.assertEqual(self.stdout.getvalue(), "")
+
+            self.printer.error("failed", ValueError("boom"))
+            events = self.events()
+
+        self.assertEqual([e["event"] for e in events], ["info", "error"])
+        self.assertEqual(events[1]["exception"], "boom")
+
+    def test_log_format_from_environment(self):
+        """Test that subprocesses pick up the log format from the environment."""
+        with patch.dict(os.environ, {LOG_FORMAT_ENV: "json"}):
+            self.assertTrue(Printer().json_mode)
+        with patch.dict(os.environ, {LOG_FORMAT_ENV: ""}):
+            self.assertFalse(Printer().json_mode)
+
+
 if __name__ == "__main__":
     unittest.main()
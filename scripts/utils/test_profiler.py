@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming column profiler and its sketches.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from scripts.utils.profiler import HeavyHitters, HyperLogLog, QuantileSketch, profile_dataset
+
+
+class TestSketches(unittest.TestCase):
+    """Test cases for the mergeable sketches."""
+
+    def test_hyperloglog_estimate_and_merge(self):
+        """Test that distinct counts are within a few percent and merge as a union."""
+        first, second = HyperLogLog(), HyperLogLog()
+        first.update(pd.Series([f"value-{i}" for i in range(60_000)]))
+        second.update(pd.Series([f"value-{i}" for i in range(30_000, 90_000)]))
+        self.assertAlmostEqual(first.estimate(), 60_000, delta=60_000 * 0.03)
+
+        first.merge(second)
+        self.assertAlmostEqual(first.estimate(), 90_000, delta=90_000 * 0.03)
+
+    def test_hyperloglog_small_counts(self):
+        """Test that small distinct counts are close to exact."""
+        counter = HyperLogLog()
+        counter.update(pd.Series(["a", "b", "c", "a"] * 100))
+        self.assertEqual(counter.estimate(), 3)
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test that merged quantiles stay within the sketch's relative error."""
+        values = np.random.default_rng(0).lognormal(3, 1.5, 100_000)
+        values[:1000] = 0
+        values[1000:2000] *= -1
+        first, second = QuantileSketch(), QuantileSketch()
+        first.update(values[:50_000])
+        second.update(values[50_000:])
+        first.merge(second)
+
+        for q in (0.005, 0.25, 0.5, 0.9, 0.99):
+            exact = np.quantile(values, q, method="lower")
+            self.assertLessEqual(abs(first.quantile(q) - exact), abs(exact) * 0.011 + 1e-9, q)
+        self.assertEqual((first.minimum, first.maximum), (values.min(), values.max()))
+
+    def test_heavy_hitters(self):
+        """Test that frequent values survive pruning with bounded undercounts."""
+        values = ["common"] * 500 + ["frequent"] * 300 + [f"rare-{i}" for i in range(2000)]
+        first, second = HeavyHitters(capacity=8), HeavyHitters(capacity=8)
+        first.update(pd.Series(values[::2]))
+        second.update(pd.Series(values[1::2]))
+        first.merge(second)
+
+        top = first.top(2)
+        self.assertEqual([item["value"] for item in top], ["common", "frequent"])
+        self.assertGreaterEqual(top[0]["count"], 500 - first.error)
+
+
+class TestProfileDataset(unittest.TestCase):
+    """Test cases for profiling a Parquet file."""
+
+    def setUp(self):
+        """Write a Parquet file with several row groups."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "data.parquet"
+        rows = 4000
+        pd.DataFrame({
+            "claps": [i % 100 if i % 10 else None for i in range(rows)],
+            "publication": [["towards-data-science", "hackernoon", None][i % 3] for i in range(rows)],
+            "tags": [["python,data", "python, rust", ""][i % 3] for i in range(rows)],
+            "title": [f"title {i}" for i in range(rows)],
+        }).to_parquet(self.path, row_group_size=1000)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def test_profiles_columns(self):
+        """Test the profile of numeric, categorical, delimited and text columns."""
+        profile = profile_dataset(self.path, separators={"tags": ","}, workers=1)
+        columns = {column["name"]: column for column in profile["columns"]}
+        self.assertEqual((profile["rows"], profile["row_groups"]), (4000, 4))
+
+        claps = columns["claps"]
+        self.assertEqual((claps["nulls"], claps["distinct"], claps["min"], claps["max"]), (400, 90, 1.0, 99.0))
+        self.assertAlmostEqual(claps["quantiles"]["p50"], 49, delta=0.5)
+
+        publication = columns["publication"]
+        self.assertEqual(publication["nulls"], 1333)
+        self.assertEqual([item["value"] for item in publication["top"]], ["towards-data-science", "hackernoon"])
+
+        tags = columns["tags"]
+        self.assertEqual((tags["nulls"], tags["distinct"], tags["items"]), (1333, 3, 2667 * 2))
+        self.assertEqual(tags["top"][0], {"value": "python", "count": 2667})
+
+        self.assertAlmostEqual(columns["title"]["distinct"], 4000, delta=40)
+
+    def test_parallel_matches_serial(self):
+        """Test that profiling row groups in worker processes gives the same result."""
+        serial = profile_dataset(self.path, separators={"tags": ","}, workers=1)
+        parallel = profile_dataset(self.path, separators={"tags": ","}, workers=2)
+        self.assertEqual(serial, parallel)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for the Profiler class.
+"""
+
+import pstats
+import sys
+import tempfile
+import tracemalloc
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.utils import profiling
+from scripts.utils.profiling import Profiler
+
+
+def _busy_function():
+    return sum(i * i for i in range(20000))
+
+
+class TestProfiler(unittest.TestCase):
+    """Test cases for the Profiler class."""
+
+    def setUp(self):
+        """Create a temporary profiles directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.tmp_dir.name)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def test_cpu_profile(self):
+        """Test that a CPU profile is saved and summarized by cumulative time."""
+        profiler = Profiler("cpu", "process", self.output_dir)
+        profiler.start()
+        _busy_function()
+        path = profiler.stop()
+
+        self.assertEqual(path.parent, self.output_dir)
+        self.assertTrue(path.name.startswith("process-") and path.suffix == ".prof")
+        self.assertIn("_busy_function", str(pstats.Stats(str(path)).stats))
+
+        columns, rows, title = profiler.summary()
+        self.assertEqual(columns, ["Function", "Calls", "Own time", "Cumulative"])
+        self.assertIn("cumulative time", title)
+        self.assertTrue(any("_busy_function" in row[0] for row in rows))
+        cumulative = [float(row[3].rstrip("s")) for row in rows]
+        self.assertEqual(cumulative, sorted(cumulative, reverse=True))
+
+    def test_memory_profile(self):
+        """Test that a memory snapshot is saved and summarized by allocation site."""
+        profiler = Profiler("memory", "docs", self.output_dir)
+        profiler.start()
+        retained = [bytearray(1024) for _ in range(2000)]
+        path = profiler.stop()
+
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(path.suffix, ".snapshot")
+        self.assertTrue(tracemalloc.Snapshot.load(str(path)).traces)
+
+        columns, rows, title = profiler.summary()
+        self.assertEqual(columns, ["Location", "Size", "Blocks"])
+        self.assertIn("peak", title)
+        self.assertIn("test_profiling.py", rows[0][0])
+        del retained
+
+    def test_unknown_mode(self):
+        """Test that unknown modes are rejected."""
+        with self.assertRaises(ValueError):
+            Profiler("gpu", "process", self.output_dir)
+
+    def test_profiled_reports_on_exit(self):
+        """Test that the context manager saves and reports even when the block exits."""
+        with patch.object(profiling, "printer") as mock_printer, \
+                patch.object(profiling, "Profiler") as mock_profiler:
+            mock_profiler.side_effect = lambda mode, label: Profiler(mode, label, self.output_dir)
+            with self.assertRaises(SystemExit):
+                with profiling.profiled("cpu", "validate"):
+                    raise SystemExit(1)
+
+        mock_printer.table.assert_called_once()
+        self.assertEqual(len(list(self.output_dir.glob("validate-*.prof"))), 1)
+
+    def test_profiled_disabled(self):
+        """Test that no profiler is created without a mode."""
+        with profiling.profiled(None, "validate") as profiler:
+            self.assertIsNone(profiler)
+
+    def test_main_runs_script(self):
+        """Test that the runner executes a script as __main__ under the profiler."""
+        script = self.output_dir / "script.py"
+        marker = self.output_dir / "marker.txt"
+        script.write_text("import sys\n"
+                          "if __name__ == '__main__':\n"
+                          "    open(sys.argv[1], 'w').write('ran')\n")
+
+        argv = ["profiling.py", "cpu", str(script), str(marker)]
+        with patch.object(sys, "argv", argv), patch.object(profiling, "printer"), \
+                patch.object(profiling, "Profiler") as mock_profiler:
+            mock_profiler.side_effect = lambda mode, label: Profiler(mode, label, self.output_dir)
+            self.assertEqual(profiling.main(), 0)
+
+        self.assertEqual(marker.read_text(), "ran")
+        self.assertEqual(len(list(self.output_dir.glob("script-*.prof"))), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
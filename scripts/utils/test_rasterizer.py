@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Tests for the pure-Python SVG rasterizer.
+"""
+
+import struct
+import tempfile
+import unittest
+import zlib
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+from scripts.utils.rasterizer import (RasterJob, RasterizeError, SVGRenderError, encode_ico, encode_png, prune_cache, rasterize,
+                                      render_file, render_svg)
+
+SVG = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 32 32">{}</svg>"""
+
+
+def decode_png(data):
+    """Decode an 8-bit RGBA PNG written by encode_png."""
+    width, height = struct.unpack(">II", data[16:24])
+    position, idat = 8, b""
+    while position < len(data):
+        length, kind = struct.unpack(">I4s", data[position:position + 8])
+        if kind == b"IDAT":
+            idat += data[position + 8:position + 8 + length]
+        position += 12 + length
+    rows = np.frombuffer(zlib.decompress(idat), dtype=np.uint8).reshape(height, width * 4 + 1)
+    pixels = np.zeros((height, width * 4), dtype=np.uint8)
+    for index, row in enumerate(rows):
+        previous = pixels[index - 1] if index else np.zeros(width * 4, dtype=np.uint8)
+        pixels[index] = row[1:] + previous if row[0] == 2 else row[1:]
+    return pixels.reshape(height, width, 4)
+
+
+class TestRenderSvg(unittest.TestCase):
+    """Test cases for rendering SVG shapes to pixels."""
+
+    def test_shapes_and_colours(self):
+        """Test that fills cover the right pixels and the background stays transparent."""
+        pixels = render_svg(SVG.format('<rect x="0" y="0" width="16" height="32" fill="#ff0000"/>'
+                                       '<circle cx="24" cy="16" r="6" fill="blue" opacity="0.5"/>'), 32)
+        self.assertEqual(pixels[16, 4].tolist(), [255, 0, 0, 255])
+        self.assertEqual(pixels[16, 24].tolist(), [0, 0, 255, 128])
+        self.assertEqual(pixels[2, 30].tolist(), [0, 0, 0, 0])
+
+    def test_paths_strokes_and_gradients(self):
+        """Test a filled path, a stroked line and a user-space linear gradient."""
+        pixels = render_svg(SVG.format(
+            '<defs><linearGradient id="g" x1="0" y1="0" x2="32" y2="0" gradientUnits="userSpaceOnUse">'
+            '<stop offset="0%" stop-color="#000000"/><stop offset="100%" stop-color="#ffffff"/>'
+            '</linearGradient></defs>'
+            '<path d="M0 0h32v8H0z" fill="url(#g)"/>'
+            '<path d="M4 20h24" stroke="#00ff00" stroke-width="4"/>'), 32)
+        self.assertLess(pixels[4, 0, 0], 10)
+        self.assertGreater(pixels[4, 31, 0], 245)
+        self.assertEqual(pixels[20, 16].tolist(), [0, 255, 0, 255])
+        # Butt caps end the line at its end points
+        self.assertEqual(pixels[20, 1, 3], 0)
+
+    def test_text_and_anti_aliasing(self):
+        """Test that logo initials are drawn and circle edges are blended."""
+        pixels = render_svg(SVG.format('<circle cx="16" cy="16" r="15" fill="black"/>'
+                                       '<text x="16" y="22" text-anchor="middle" font-size="16" '
+                                       'font-weight="bold" fill="white">T</text>'), 64)
+        self.assertEqual(pixels[22, 32].tolist(), [255, 255, 255, 255])
+        alpha = pixels[..., 3]
+        self.assertTrue(((alpha > 0) & (alpha < 255)).any())
+
+    def test_viewbox_is_scaled_to_the_size(self):
+        """Test that the same drawing scales to any output size."""
+        svg = SVG.format('<rect x="8" y="8" width="16" height="16" fill="white"/>')
+        for size in (16, 100):
+            pixels = render_svg(svg, size)
+            self.assertEqual(pixels.shape, (size, size, 4))
+            self.assertEqual(pixels[size // 2, size // 2, 3], 255)
+            self.assertEqual(pixels[1, 1, 3], 0)
+
+    def test_unsupported_input(self):
+        """Test that invalid documents and unsupported features raise SVGRenderError."""
+        with self.assertRaises(SVGRenderError):
+            render_svg("<svg", 16)
+        with self.assertRaises(SVGRenderError):
+            render_svg("<html/>", 16)
+        with self.assertRaises(SVGRenderError):
+            render_svg(SVG.format('<rect width="4" height="4" transform="rotate(45)"/>'), 16)
+        with self.assertRaisesRegex(SVGRenderError, "'_'"):
+            render_svg(SVG.format('<text x="0" y="16">med_data</text>'), 16)
+
+
+class TestEncoding(unittest.TestCase):
+    """Test cases for the PNG and ICO encoders."""
+
+    def test_png_round_trip(self):
+        """Test that encoded pixels decode to the same values."""
+        pixels = np.random.default_rng(0).integers(0, 256, (7, 5, 4), dtype=np.uint8)
+        data = encode_png(pixels)
+        self.assertTrue(data.startswith(b"\x89PNG\r\n\x1a\n"))
+        np.testing.assert_array_equal(decode_png(data), pixels)
+
+    def test_ico_directory(self):
+        """Test that an ICO lists one PNG entry per size."""
+        data = encode_ico([np.zeros((16, 16, 4), np.uint8), np.zeros((256, 256, 4), np.uint8)])
+        self.assertEqual(struct.unpack("<HHH", data[:6]), (0, 1, 2))
+        width, height, _, _, planes, bits, size, offset = struct.unpack("<BBBBHHII", data[22:38])
+        self.assertEqual((width, height, planes, bits), (0, 0, 1, 32))
+        self.assertTrue(data[offset:offset + size].startswith(b"\x89PNG"))
+        with self.assertRaises(ValueError):
+            encode_ico([np.zeros((512, 512, 4), np.uint8)])
+
+
+class TestRasterize(unittest.TestCase):
+    """Test cases for cached rendering of jobs."""
+
+    def setUp(self):
+        """Write an SVG into a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        self.svg = self.root / "logo.svg"
+        self.svg.write_text(SVG.format('<circle cx="16" cy="16" r="12" fill="teal"/>'))
+        self.cache = self.root / "cache"
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def test_cached_renders_are_reused(self):
+        """Test that unchanged SVGs are copied from the cache instead of rendered."""
+        jobs = [RasterJob(self.svg, self.root / "out" / "logo-32.png", (32,)),
+                RasterJob(self.svg, self.root / "out" / "favicon.ico", (16, 32))]
+        first = rasterize(jobs, workers=1, cache_dir=self.cache)
+        self.assertEqual(list(first.values()), [True, True])
+        self.assertEqual((self.root / "out" / "logo-32.png").read_bytes(),
+                         render_file(self.svg.read_bytes(), (32,), "png"))
+
+        (self.root / "out" / "logo-32.png").unlink()
+        with mock.patch("scripts.utils.rasterizer.render_file") as render:
+            second = rasterize(jobs, workers=1, cache_dir=self.cache)
+        render.assert_not_called()
+        self.assertEqual(list(second.values()), [False, False])
+        self.assertTrue((self.root / "out" / "logo-32.png").exists())
+
+        self.svg.write_text(SVG.format('<circle cx="16" cy="16" r="12" fill="navy"/>'))
+        self.assertEqual(list(rasterize(jobs, workers=1, cache_dir=self.cache).values()), [True, True])
+
+    def test_prune_cache_keeps_live_renders(self):
+        """Test that cached renders no job uses any more are removed."""
+        job = RasterJob(self.svg, self.root / "logo-16.png", (16,))
+        rasterize([job], workers=1, cache_dir=self.cache)
+        self.svg.write_text(SVG.format('<circle cx="16" cy="16" r="12" fill="navy"/>'))
+        rasterize([job], workers=1, cache_dir=self.cache)
+        self.assertEqual(len(list(self.cache.iterdir())), 2)
+
+        self.assertEqual(prune_cache([job], self.cache), 1)
+        with mock.patch("scripts.utils.rasterizer.render_file") as render:
+            rasterize([job], workers=1, cache_dir=self.cache)
+        render.assert_not_called()
+
+    def test_identical_inputs_render_once(self):
+        """Test that jobs with the same SVG and size share one render."""
+        copy = self.root / "copy.svg"
+        copy.write_bytes(self.svg.read_bytes())
+        jobs = [RasterJob(self.svg, self.root / "a.png", (16,)), RasterJob(copy, self.root / "b.png", (16,))]
+        with mock.patch("scripts.utils.rasterizer.render_file", return_value=b"png") as render:
+            rasterize(jobs, workers=1, cache_dir=self.cache)
+        render.assert_called_once()
+        self.assertEqual((self.root / "b.png").read_bytes(), b"png")
+
+    def test_failed_job_does_not_stop_the_others(self):
+        """Test that good renders are written and each failure is reported for its own target."""
+        bad = self.root / "bad.svg"
+        bad.write_text(SVG.format('<text x="4" y="24" font-size="20">É</text>'))
+        jobs = [RasterJob(bad, self.root / "bad-16.png", (16,)), RasterJob(self.svg, self.root / "good-16.png", (16,)),
+                RasterJob(self.root / "missing.svg", self.root / "missing-16.png", (16,))]
+        with self.assertRaises(RasterizeError) as caught:
+            rasterize(jobs, workers=1, cache_dir=self.cache)
+
+        self.assertEqual(caught.exception.results, {self.root / "good-16.png": True})
+        self.assertIsInstance(caught.exception.failures[self.root / "bad-16.png"], SVGRenderError)
+        self.assertIsInstance(caught.exception.failures[self.root / "missing-16.png"], FileNotFoundError)
+        self.assertTrue((self.root / "good-16.png").read_bytes().startswith(b"\x89PNG"))
+        self.assertFalse((self.root / "bad-16.png").exists())
+        self.assertEqual(len(list(self.cache.iterdir())), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Tests for the SubprocessHandler class.
+"""
+
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from scripts.utils.subprocess_handler import SubprocessHandler, _LineStream
+
+
+def python(code):
+    """Build a command running a Python snippet."""
+    return [sys.executable, "-c", code]
+
+
+def wait_for(pattern, count):
+    """Snippet waiting up to 10 s until ``count`` files match a glob pattern, setting ``found``."""
+    return (f"import glob, time\n"
+            f"deadline = time.monotonic() + 10\n"
+            f"while len(glob.glob({pattern!r})) < {count} and time.monotonic() < deadline:\n"
+            f"    time.sleep(0.01)\n"
+            f"found = len(glob.glob({pattern!r})) >= {count}\n")
+
+
+class TestLineStream(unittest.TestCase):
+    """Test cases for splitting pipe output into lines."""
+
+    def setUp(self):
+        """Collect the lines passed to the callback."""
+        self.lines = []
+
+    def test_lines_split_across_reads(self):
+        """Test that lines, line endings and characters split across reads are reassembled."""
+        stream = _LineStream("utf-8", self.lines.append)
+        data = "first\r\nsecond ✓\nthird".encode("utf-8")
+        for i in range(len(data)):
+            stream.feed(data[i:i + 1])
+        stream.feed(b"", final=True)
+
+        self.assertEqual(self.lines, ["first\n", "second ✓\n", "third"])
+        self.assertEqual(stream.text, "first\nsecond ✓\nthird")
+
+    def test_long_lines_are_passed_on_in_pieces(self):
+        """Test that a partial line is not buffered beyond the limit."""
+        stream = _LineStream("utf-8", self.lines.append, max_line=4)
+        stream.feed(b"abcdefgh")
+        self.assertEqual(self.lines, ["abcdefgh"])
+        stream.feed(b"ij\n")
+        self.assertEqual(self.lines, ["abcdefgh", "ij\n"])
+
+    def test_retained_output_is_bounded(self):
+        """Test that only the tail of the output is kept."""
+        stream = _LineStream("utf-8", None, retain=10)
+        stream.feed(b"".join(b"line %d\n" % i for i in range(100)), final=True)
+        self.assertEqual(stream.text, "line 99\n")
+
+
+class TestSubprocessHandlerStreaming(unittest.TestCase):
+    """Test cases for running commands with output callbacks."""
+
+    def setUp(self):
+        """Create a handler and a directory for handshake files."""
+        self.handler = SubprocessHandler()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+
+    def tearDown(self):
+        """Remove the handshake directory."""
+        self.tmp_dir.cleanup()
+
+    def test_streams_both_pipes(self):
+        """Test that stdout and stderr lines reach their callbacks and the result."""
+        out, err = [], []
+        result = self.handler.run(
+            python("import sys\nprint('a')\nprint('b', file=sys.stderr)\nprint('c')"),
+            callback=out.append, stderr_callback=err.append)
+
+        self.assertEqual(out, ["a\n", "c\n"])
+        self.assertEqual(err, ["b\n"])
+        self.assertEqual((result.returncode, result.stdout, result.stderr), (0, "a\nc\n", "b\n"))
+
+    def test_heavy_stderr_does_not_stall_stdout(self):
+        """Test that a child flooding stderr still has its stdout read as it arrives."""
+        # The child only finishes once the parent has seen 'ready' while it was still running
+        seen = self.root / "seen"
+        code = ("import sys\n"
+                "sys.stderr.write('x' * 1_000_000)\n"
+                "sys.stderr.flush()\n"
+                "print('ready', flush=True)\n"
+                + wait_for(str(seen), 1) +
+                "print('done' if found else 'timeout')")
+        lines = []
+
+        def on_stdout(line):
+            lines.append(line.strip())
+            if line.strip() == "ready":
+                seen.touch()
+
+        result = self.handler.run(python(code), callback=on_stdout, stderr_callback=lambda line: None)
+
+        self.assertEqual(len(result.stderr), 1_000_000)
+        self.assertEqual(lines, ["ready", "done"])
+
+    def test_failure_raises_with_output(self):
+        """Test that a failing command raises with its streamed output attached."""
+        with self.assertRaises(subprocess.CalledProcessError) as context:
+            self.handler.run(python("print('partial')\nraise SystemExit(3)"), callback=lambda line: None)
+        self.assertEqual(context.exception.returncode, 3)
+        self.assertEqual(context.exception.output, "partial\n")
+
+
+class TestSubprocessHandlerRunMany(unittest.TestCase):
+    """Test cases for running commands concurrently."""
+
+    def setUp(self):
+        """Create a handler, a directory for handshake files and collect output lines."""
+        self.handler = SubprocessHandler()
+        self.lines = []
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+
+    def tearDown(self):
+        """Remove the handshake directory."""
+        self.tmp_dir.cleanup()
+
+    def collect(self, name, line, is_stderr):
+        """Output callback recording every line."""
+        self.lines.append((name, line, is_stderr))
+
+    def test_runs_concurrently_and_gathers_exit_codes(self):
+        """Test that commands overlap and every exit code is reported in order."""
+        # Each command waits until both have started, which only happens if they run at once
+        def meet(name):
+            return python(f"open({str(self.root / name)!r}, 'w').close()\n"
+                          + wait_for(str(self.root / "*"), 2) +
+                          "print('met' if found else 'alone')")
+
+        results = self.handler.run_many({"a": meet("a"), "b": meet("b"), "c": python("raise SystemExit(4)")},
+                                        max_concurrency=3, callback=self.collect)
+
+        self.assertEqual(list(results), ["a", "b", "c"])
+        self.assertEqual([r.returncode for r in results.values()], [0, 0, 4])
+        self.assertIn(("a", "met\n", False), self.lines)
+        self.assertIn(("b", "met\n", False), self.lines)
+
+    def test_caps_concurrency(self):
+        """Test that no more than max_concurrency commands run at once."""
+        # Each command marks itself running and checks whether the other one is
+        def run(name):
+            marker = self.root / f"{name}.running"
+            return python(f"import glob, os, time\n"
+                          f"open({str(marker)!r}, 'w').close()\n"
+                          f"time.sleep(0.2)\n"
+                          f"print('together' if len(glob.glob({str(self.root / '*.running')!r})) > 1 else 'alone')\n"
+                          f"os.remove({str(marker)!r})")
+
+        self.handler.run_many({"a": run("a"), "b": run("b")}, max_concurrency=1, callback=self.collect)
+        self.assertEqual(sorted(self.lines), [("a", "alone\n", False), ("b", "alone\n", False)])
+
+    def test_fail_fast_stops_the_rest(self):
+        """Test that a failure kills running commands and skips waiting ones."""
+        sleep = python("import time\ntime.sleep(10)")
+        start = time.monotonic()
+        results = self.handler.run_many(
+            {"fail": python("import sys\nprint('boom', file=sys.stderr)\nsys.exit(2)"),
+             "running": sleep, "waiting": sleep},
+            max_concurrency=2, fail_fast=True, callback=self.collect)
+
+        self.assertLess(time.monotonic() - start, 8)
+        self.assertEqual(results["fail"].returncode, 2)
+        self.assertEqual(results["fail"].stderr, "boom\n")
+        self.assertLess(results["running"].returncode, 0)
+        self.assertIsNone(results["waiting"].returncode)
+
+    def test_missing_executable(self):
+        """Test that a command that can't start is reported instead of raising."""
+        results = self.handler.run_many({"missing": ["meddata-no-such-command"]}, callback=self.collect)
+        self.assertEqual(results["missing"].returncode, 127)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for the synthetic article generator.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+import yaml
+
+from scripts.utils.synthetic import PROFILES, ensure_source, generate_articles, write_articles
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def schema_columns(dataset_id):
+    """Column names declared in a dataset's configuration."""
+    with open(PROJECT_ROOT / "_datasets" / f"{dataset_id}.yml", encoding="utf-8") as file:
+        config = yaml.safe_load(file)
+    return [field["name"] for field in config["dataset_details"]["schema"]]
+
+
+class TestGenerateArticles(unittest.TestCase):
+    """Test cases for generate_articles."""
+
+    def test_columns_match_dataset_schemas(self):
+        """Test that generated columns follow the configured schemas."""
+        medium = next(generate_articles("medium", 10))
+        self.assertEqual(list(medium.columns), schema_columns("medium"))
+
+        devto = next(generate_articles("devto", 10))
+        self.assertEqual(list(devto.columns), schema_columns("devto") + ["body"])
+
+    def test_deterministic_and_chunk_independent(self):
+        """Test that output depends only on the seed, not on chunking."""
+        whole = next(generate_articles("medium", 500, seed=3))
+        chunked = pd.concat(generate_articles("medium", 500, seed=3, chunk_size=64), ignore_index=True)
+        pd.testing.assert_frame_equal(whole, chunked)
+
+        other_seed = next(generate_articles("medium", 500, seed=4))
+        self.assertFalse(whole["text"].equals(other_seed["text"]))
+
+    def test_duplicate_and_null_rates(self):
+        """Test that duplicate and empty articles appear at the requested rates."""
+        df = next(generate_articles("devto", 20000, duplicate_rate=0.1, null_rate=0.01))
+        text = PROFILES["devto"].text_column
+
+        self.assertAlmostEqual(df[text].isna().mean(), 0.01, delta=0.005)
+        with_text = df[df[text].notna()]
+        self.assertAlmostEqual(with_text.duplicated(subset=[text]).mean(), 0.1, delta=0.02)
+        # Duplicates repeat the whole article, not just its text
+        self.assertEqual(with_text.duplicated(subset=[text]).sum(), with_text.duplicated().sum())
+
+    def test_realistic_text_lengths(self):
+        """Test that text lengths follow the profile's median."""
+        df = next(generate_articles("medium", 5000, null_rate=0))
+        words = df["text"].str.split().str.len()
+        self.assertAlmostEqual(words.median(), PROFILES["medium"].median_words, delta=150)
+        self.assertGreater(words.max(), 3 * words.median())
+
+    def test_unknown_kind(self):
+        """Test that unknown dataset kinds are rejected."""
+        with self.assertRaises(ValueError):
+            next(generate_articles("reddit", 10))
+
+
+class TestWriteArticles(unittest.TestCase):
+    """Test cases for writing synthetic sources."""
+
+    def setUp(self):
+        """Create a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def test_csv_and_parquet_round_trip(self):
+        """Test that both formats hold every generated row."""
+        csv_path = write_articles("devto", 250, self.root / "devto.csv", chunk_size=100)
+        parquet_path = write_articles("devto", 250, self.root / "devto.parquet", chunk_size=100)
+
+        from_csv = pd.read_csv(csv_path)
+        from_parquet = pd.read_parquet(parquet_path)
+        self.assertEqual(len(from_csv), 250)
+        self.assertEqual(len(from_parquet), 250)
+        self.assertEqual(from_csv["slug"].tolist(), from_parquet["slug"].tolist())
+        self.assertEqual(sorted(p.name for p in self.root.iterdir()), ["devto.csv", "devto.parquet"])
+
+    def test_ensure_source_reuses_files(self):
+        """Test that generated sources are cached."""
+        path = ensure_source("medium", 50, self.root, "csv")
+        mtime = path.stat().st_mtime_ns
+        self.assertEqual(ensure_source("medium", 50, self.root, "csv"), path)
+        self.assertEqual(path.stat().st_mtime_ns, mtime)
+
+    def test_unsupported_format(self):
+        """Test that unknown file extensions are rejected."""
+        with self.assertRaises(ValueError):
+            write_articles("medium", 10, self.root / "medium.json")
+
+
+if __name__ == "__main__":
+    unittest.main()
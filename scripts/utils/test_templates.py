@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for the TemplateRenderer class.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from scripts.utils.templates import TemplateRenderer
+
+
+class TestTemplateRenderer(unittest.TestCase):
+    """Test cases for rendering templates with Jinja2."""
+
+    def setUp(self):
+        """Point the renderer at a temporary templates directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        (self.root / "templates").mkdir()
+        self.config = mock.patch("scripts.utils.templates.config_manager").start()
+        self.config.paths.templates_dir = self.root / "templates"
+        self.config.paths.cache_dir = self.root / ".meddata"
+        self.printer = mock.patch("scripts.utils.templates.printer").start()
+        self.renderer = TemplateRenderer()
+
+    def tearDown(self):
+        """Stop the patches and remove the temporary directory."""
+        mock.patch.stopall()
+        self.tmp_dir.cleanup()
+
+    def write(self, name, content):
+        """Write a template."""
+        (self.root / "templates" / name).write_text(content)
+
+    def test_renders_loops_and_attributes(self):
+        """Test that expressions, attribute access and loops are rendered."""
+        self.write("readme.md",
+                   "# {{ name }} ({{ stats.size }})\n{% for f in features %}\n- {{ f.title }}\n{% endfor %}\n")
+        content = self.renderer.render("readme.md", {"name": "Medium", "stats": {"size": "444K+"},
+                                                     "features": [{"title": "a"}, {"title": "b"}]})
+        self.assertEqual(content, "# Medium (444K+)\n- a\n- b\n")
+
+    def test_missing_variable_warns(self):
+        """Test that a missing variable renders empty with a warning."""
+        self.write("card.md", "[{{ missing }}]")
+        self.assertEqual(self.renderer.render("card.md", {}), "[]")
+        self.printer.warning.assert_called_once_with("Missing template variable: missing")
+
+    def test_bytecode_cache_and_reload(self):
+        """Test that compiled templates are cached on disk and edits are picked up."""
+        self.write("card.md", "v1")
+        self.assertEqual(self.renderer.render("card.md", {}), "v1")
+        self.assertTrue(any((self.root / ".meddata" / "templates").iterdir()))
+
+        # A new renderer (as in a new process) loads the cached bytecode
+        self.assertEqual(TemplateRenderer().render("card.md", {}), "v1")
+
+        path = self.root / "templates" / "card.md"
+        path.write_text("v2")
+        stat = path.stat()
+        os.utime(path, (stat.st_atime + 5, stat.st_mtime + 5))
+        self.assertEqual(self.renderer.render("card.md", {}), "v2")
+
+    def test_follows_templates_dir(self):
+        """Test that a changed templates directory gets a new environment."""
+        self.write("card.md", "first")
+        self.assertEqual(self.renderer.render("card.md", {}), "first")
+        other = self.root / "other"
+        other.mkdir()
+        (other / "card.md").write_text("second")
+        self.config.paths.templates_dir = other
+        self.assertEqual(self.renderer.render("card.md", {}), "second")
+
+    def test_cache_has_one_entry_per_template(self):
+        """Test that other template directories share entries and stale entries are removed."""
+        cache = self.root / ".meddata" / "templates"
+        self.write("card.md", "first")
+        self.write("old.md", "old")
+        self.renderer.render("card.md", {})
+        self.renderer.render("old.md", {})
+
+        other = self.root / "other"
+        other.mkdir()
+        (other / "card.md").write_text("second")
+        self.config.paths.templates_dir = other
+        self.assertEqual(TemplateRenderer().render("card.md", {}), "second")
+        self.assertEqual(len(list(cache.iterdir())), 1)
+
+        # The shared entry is checked against the source, not reused blindly
+        self.config.paths.templates_dir = self.root / "templates"
+        self.assertEqual(TemplateRenderer().render("card.md", {}), "first")
+
+
+if __name__ == "__main__":
+    unittest.main()
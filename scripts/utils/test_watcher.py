@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the FileWatcher class.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from scripts.utils.watcher import FileWatcher
+
+
+class TestFileWatcher(unittest.TestCase):
+    """Test cases for the FileWatcher class."""
+
+    def setUp(self):
+        """Create a temporary directory with one watched file."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        self.config = self.root / "medium.yml"
+        self.config.write_text("id: medium\n")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def _write_burst(self, delay=0.2):
+        """Write several files in quick succession from another thread."""
+        def burst():
+            time.sleep(delay)
+            self.config.write_text("id: medium\nname: Medium\n")
+            # Bump mtime explicitly so polling sees the change on coarse clocks
+            os.utime(self.config, ns=(time.time_ns(), time.time_ns() + 10**9))
+            (self.root / "devto.yml").write_text("id: devto\n")
+
+        thread = threading.Thread(target=burst)
+        thread.start()
+        return thread
+
+    def test_polling_collects_burst_into_one_batch(self):
+        """Test that the polling backend reports a burst of changes together."""
+        watcher = FileWatcher([self.root], debounce=0.3, poll_interval=0.05, force_polling=True)
+        self.assertEqual(watcher.backend, "polling")
+
+        thread = self._write_burst()
+        changed = watcher.wait_for_changes(timeout=5)
+        thread.join()
+        watcher.close()
+
+        self.assertEqual(changed, {self.config, self.root / "devto.yml"})
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "inotify is Linux only")
+    def test_inotify_collects_burst_into_one_batch(self):
+        """Test that the inotify backend reports a burst of changes together."""
+        watcher = FileWatcher([self.root], debounce=0.3)
+        if watcher.backend != "inotify":
+            watcher.close()
+            self.skipTest("inotify is not available")
+
+        thread = self._write_burst()
+        changed = watcher.wait_for_changes(timeout=5)
+        thread.join()
+        watcher.close()
+
+        self.assertEqual(changed, {self.config, self.root / "devto.yml"})
+
+    def test_timeout_without_changes(self):
+        """Test that waiting returns an empty set when nothing changes."""
+        watcher = FileWatcher([self.root], poll_interval=0.05, force_polling=True)
+        self.assertEqual(watcher.wait_for_changes(timeout=0.2), set())
+        watcher.close()
+
+    def test_missing_directories_are_ignored(self):
+        """Test that directories that don't exist are skipped."""
+        watcher = FileWatcher([self.root, self.root / "missing"], force_polling=True)
+        self.assertEqual(watcher.directories, [self.root])
+        watcher.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+MedData File Watcher - Debounced change notifications for source directories.
+
+This module watches a set of directories for file changes. On Linux it uses
+inotify through ctypes (no extra dependency); everywhere else, or when inotify
+is unavailable, it falls back to polling file modification times. Bursts of
+changes, such as an editor writing a temp file and renaming it, are debounced
+into a single batch.
+"""
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+__all__ = ["FileWatcher"]
+
+
+class _InotifyBackend:
+    """Linux inotify backend watching directories (non-recursively)."""
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    EVENT_HEADER = struct.Struct("iIII")
+
+    name = "inotify"
+
+    def __init__(self, directories: List[Path]) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self._watches: Dict[int, Path] = {}
+        for directory in directories:
+            wd = libc.inotify_add_watch(self._fd, os.fsencode(directory), self.WATCH_MASK)
+            if wd < 0:
+                os.close(self._fd)
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+            self._watches[wd] = directory
+
+    def read(self, timeout: float) -> Set[Path]:
+        """Wait up to ``timeout`` seconds and return the paths that changed."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed: Set[Path] = set()
+        offset = 0
+        while offset + self.EVENT_HEADER.size <= len(data):
+            wd, _mask, _cookie, length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if wd in self._watches and name:
+                changed.add(self._watches[wd] / os.fsdecode(name))
+        return changed
+
+    def close(self) -> None:
+        """Release the inotify file descriptor."""
+        os.close(self._fd)
+
+
+class _PollingBackend:
+    """Portable backend comparing file modification times between scans."""
+
+    name = "polling"
+
+    def __init__(self, directories: List[Path], interval: float = 1.0) -> None:
+        self._directories = directories
+        self._interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot: Dict[Path, Tuple[int, int]] = {}
+        for directory in self._directories:
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        snapshot[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    continue
+        return snapshot
+
+    def read(self, timeout: float) -> Set[Path]:
+        """Wait up to ``timeout`` seconds and return the paths that changed."""
+        time.sleep(min(timeout, self._interval))
+        snapshot = self._scan()
+        changed = {path for path in snapshot.keys() | self._snapshot.keys()
+                   if snapshot.get(path) != self._snapshot.get(path)}
+        self._snapshot = snapshot
+        return changed
+
+    def close(self) -> None:
+        """Nothing to release for the polling backend."""
+
+
+class FileWatcher:
+    """
+    Watches directories and yields debounced batches of changed files.
+
+    Attributes:
+        directories: Directories being watched
+        debounce: Quiet period in seconds that ends a batch of changes
+        backend: Name of the active backend ('inotify' or 'polling')
+    """
+
+    def __init__(self,
+                 directories: Iterable[Union[str, Path]],
+                 debounce: float = 0.3,
+                 poll_interval: float = 1.0,
+                 force_polling: bool = False) -> None:
+        """
+        Initialize the FileWatcher.
+
+        Args:
+            directories: Directories to watch (missing ones are ignored)
+            debounce: Quiet period in seconds that ends a batch of changes
+            poll_interval: Scan interval of the polling backend
+            force_polling: Use polling even where inotify is available
+        """
+        self.directories = [Path(d) for d in directories if Path(d).is_dir()]
+        self.debounce = debounce
+
+        self._backend: Union[_InotifyBackend, _PollingBackend, None] = None
+        if not force_polling and sys.platform.startswith("linux"):
+            try:
+                self._backend = _InotifyBackend(self.directories)
+            except (OSError, AttributeError):
+                self._backend = None
+        if self._backend is None:
+            self._backend = _PollingBackend(self.directories, poll_interval)
+
+    @property
+    def backend(self) -> str:
+        """Name of the active backend."""
+        return self._backend.name
+
+    def wait_for_changes(self, timeout: Optional[float] = None) -> Set[Path]:
+        """
+        Block until files change, then collect changes until things settle.
+
+        Args:
+            timeout: Maximum time to wait for the first change (None waits forever)
+
+        Returns:
+            Set of changed paths (empty if the timeout expired)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        changed: Set[Path] = set()
+        while not changed:
+            remaining = 1.0 if deadline is None else deadline - time.monotonic()
+            if remaining <= 0:
+                return set()
+            changed = self._backend.read(min(remaining, 1.0))
+
+        # Debounce: keep collecting until no new events arrive for `debounce` seconds
+        while True:
+            more = self._backend.read(self.debounce)
+            if not more:
+                return changed
+            changed |= more
+
+    def changes(self) -> Iterator[Set[Path]]:
+        """
+        Yield batches of changed paths forever.
+
+        Yields:
+            Set of paths changed in one debounced burst
+        """
+        while True:
+            yield self.wait_for_changes()
+
+    def close(self) -> None:
+        """Stop watching and release backend resources."""
+        self._backend.close()
@@ -1,12 +1,14 @@
 import pytest
 import argparse
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 from pathlib import Path
 import sys
 import os
 import subprocess
 import shutil # Added import
 
+import pandas as pd
+
 import meddata # Import the module itself
 from meddata import (
     init_dataset,
@@ -32,6 +34,11 @@ def mock_config_manager_paths(tmp_path, mocker):
     mock_config.paths.datasets_dir = tmp_path / "_datasets"
     mock_config.paths.docs_dir = tmp_path / "docs"
     mock_config.paths.processed_data_dir = tmp_path / "_data" / "processed"
+    mock_config.paths.cache_dir = tmp_path / ".meddata"
+
+    # Dataset configs are read from the temporary _datasets directory
+    from scripts.utils.catalog import DatasetCatalog
+    mocker.patch("scripts.utils.catalog.dataset_catalog", DatasetCatalog(tmp_path / "_datasets", persist=False))
     
     # Ensure these directories exist for tests that expect them
     mock_config.paths.project_root.mkdir(exist_ok=True)
@@ -68,12 +75,18 @@ def mock_config_manager_paths(tmp_path, mocker):
 @pytest.fixture(autouse=True)
 def mock_external_dependencies(mocker):
     mock_subprocess_handler = mocker.patch("meddata.subprocess_handler")
+    mock_script_dispatcher = mocker.patch("meddata.script_dispatcher")
     mock_printer = mocker.patch("meddata.printer")
-    return {"subprocess_handler": mock_subprocess_handler, "printer": mock_printer}
+    return {"subprocess_handler": mock_subprocess_handler, "script_dispatcher": mock_script_dispatcher,
+            "printer": mock_printer}
 
 
 # Helper to create a mock args object
 def create_mock_args(**kwargs):
+    # Script commands run as subprocesses unless a test opts into in-process mode
+    kwargs.setdefault("isolate", True)
+    kwargs.setdefault("profile", None)
+    kwargs.setdefault("profile_workers", None)
     args = MagicMock()
     for key, value in kwargs.items():
         setattr(args, key, value)
@@ -168,6 +181,51 @@ def test_process_dataset_success(mock_external_dependencies, tmp_path):
     mock_external_dependencies["printer"].success.assert_called_once()
 
 
+def test_process_dataset_profiled_subprocess(mock_external_dependencies, tmp_path):
+    args = create_mock_args(id="test_process_id", profile="cpu")
+    process_dataset(args)
+    mock_external_dependencies["subprocess_handler"].run_python_script.assert_called_once_with(
+        str(tmp_path / "scripts" / "utils" / "profiling.py"),
+        ["cpu", str(tmp_path / "scripts" / "process-dataset.py"), "test_process_id"],
+        check=True,
+    )
+
+
+def test_process_dataset_in_process(mock_external_dependencies, tmp_path):
+    mock_external_dependencies["script_dispatcher"].call.return_value = {"Total rows": 10}
+    args = create_mock_args(id="test_process_id", isolate=False)
+    assert process_dataset(args) == {"Total rows": 10}
+    mock_external_dependencies["script_dispatcher"].call.assert_called_once_with(
+        str(tmp_path / "scripts" / "process-dataset.py"), "process_dataset", "test_process_id"
+    )
+    mock_external_dependencies["subprocess_handler"].run_python_script.assert_not_called()
+
+
+def test_process_dataset_passes_profile_workers(mock_external_dependencies, tmp_path):
+    args = create_mock_args(id="test_process_id", isolate=False, profile_workers=2)
+    process_dataset(args)
+    mock_external_dependencies["script_dispatcher"].call.assert_called_once_with(
+        str(tmp_path / "scripts" / "process-dataset.py"), "process_dataset", "test_process_id", 2
+    )
+
+    args = create_mock_args(id="test_process_id", profile_workers=2)
+    process_dataset(args)
+    mock_external_dependencies["subprocess_handler"].run_python_script.assert_called_once_with(
+        str(tmp_path / "scripts" / "process-dataset.py"), ["test_process_id", "--profile-workers", "2"], check=True
+    )
+
+
+def test_process_dataset_in_process_failure(mock_external_dependencies):
+    mock_external_dependencies["script_dispatcher"].call.side_effect = (
+        subprocess.CalledProcessError(1, "cmd")
+    )
+    args = create_mock_args(id="fail_process_id", isolate=False)
+    with pytest.raises(SystemExit) as excinfo:
+        process_dataset(args)
+    assert excinfo.value.code == 1
+    mock_external_dependencies["printer"].error.assert_called_once()
+
+
 def test_process_dataset_failure(mock_external_dependencies):
     mock_external_dependencies["subprocess_handler"].run_python_script.side_effect = (
         subprocess.CalledProcessError(1, "cmd")
@@ -202,6 +260,15 @@ def test_publish_dataset_success_with_token_and_platforms(mock_external_dependen
     mock_external_dependencies["printer"].success.assert_called_once()
 
 
+def test_publish_dataset_in_process(mock_external_dependencies, tmp_path):
+    args = create_mock_args(id="test_publish_id", token="my_token", platforms=["github"], isolate=False)
+    publish_dataset(args)
+    mock_external_dependencies["script_dispatcher"].call.assert_called_once_with(
+        str(tmp_path / "scripts" / "publish-dataset.py"), "publish_dataset",
+        "test_publish_id", "my_token", ["github"]
+    )
+
+
 def test_publish_dataset_failure(mock_external_dependencies):
     mock_external_dependencies["subprocess_handler"].run_python_script.side_effect = (
         subprocess.CalledProcessError(1, "cmd")
@@ -272,7 +339,7 @@ def test_generate_docs_failure(mock_external_dependencies):
 
 # --- Test generate_site ---
 def test_generate_site_build_success(mock_external_dependencies):
-    args = create_mock_args(serve=False)
+    args = create_mock_args(serve=False, refresh=False)
     generate_site(args)
     mock_external_dependencies["subprocess_handler"].run.assert_called_once_with(
         ["bundle", "exec", "jekyll", "build"], check=True
@@ -281,7 +348,7 @@ def test_generate_site_build_success(mock_external_dependencies):
 
 
 def test_generate_site_serve_success(mock_external_dependencies):
-    args = create_mock_args(serve=True)
+    args = create_mock_args(serve=True, refresh=False)
     generate_site(args)
     mock_external_dependencies["subprocess_handler"].run.assert_called_once_with(
         ["bundle", "exec", "jekyll", "serve"], check=True
@@ -293,13 +360,55 @@ def test_generate_site_failure(mock_external_dependencies):
     mock_external_dependencies["subprocess_handler"].run.side_effect = (
         subprocess.CalledProcessError(1, "cmd")
     )
-    args = create_mock_args(serve=False)
+    args = create_mock_args(serve=False, refresh=False)
     with pytest.raises(SystemExit) as excinfo:
         generate_site(args)
     assert excinfo.value.code == 1
     mock_external_dependencies["printer"].error.assert_called_once()
 
 
+def test_generate_site_refresh_runs_generators_concurrently(mock_external_dependencies, mocker):
+    mocker.patch("scripts.utils.catalog.dataset_catalog").ids.return_value = ["devto", "medium"]
+    handler = mock_external_dependencies["subprocess_handler"]
+    handler.run_many.return_value = {"assets": subprocess.CompletedProcess([], 0)}
+    mock_external_dependencies["printer"].json_mode = False
+
+    generate_site(create_mock_args(serve=False, refresh=True, jobs=2))
+
+    commands = handler.run_many.call_args.args[0]
+    assert list(commands) == ["assets", "docs:devto", "docs:medium"]
+    assert commands["docs:medium"][-1] == "medium"
+    assert handler.run_many.call_args.kwargs["max_concurrency"] == 2
+    handler.run.assert_called_once_with(["bundle", "exec", "jekyll", "build"], check=True)
+
+
+def test_generate_site_refresh_serves_alongside(mock_external_dependencies, mocker):
+    mocker.patch("scripts.utils.catalog.dataset_catalog").ids.return_value = ["medium"]
+    handler = mock_external_dependencies["subprocess_handler"]
+    handler.run_many.return_value = {}
+    mock_external_dependencies["printer"].json_mode = False
+
+    generate_site(create_mock_args(serve=True, refresh=True, jobs=None))
+
+    assert handler.run_many.call_args.args[0]["jekyll"] == ["bundle", "exec", "jekyll", "serve"]
+    handler.run.assert_not_called()
+
+
+def test_generate_site_refresh_failure(mock_external_dependencies, mocker):
+    mocker.patch("scripts.utils.catalog.dataset_catalog").ids.return_value = ["medium"]
+    handler = mock_external_dependencies["subprocess_handler"]
+    handler.run_many.return_value = {"assets": subprocess.CompletedProcess([], 1),
+                                     "docs:medium": subprocess.CompletedProcess([], -9)}
+    mock_external_dependencies["printer"].json_mode = False
+
+    with pytest.raises(SystemExit) as excinfo:
+        generate_site(create_mock_args(serve=False, refresh=True, jobs=None))
+
+    assert excinfo.value.code == 1
+    mock_external_dependencies["printer"].error.assert_called_once_with("Failed: assets (exit status 1)")
+    handler.run.assert_not_called()
+
+
 # --- Test doctor_dataset ---
 def test_doctor_dataset_all_files_exist(mock_external_dependencies, tmp_path):
     dataset_id = "existing_dataset"
@@ -311,7 +420,7 @@ def test_doctor_dataset_all_files_exist(mock_external_dependencies, tmp_path):
     (dataset_dir / "LICENSE").touch()
     (dataset_dir / "CHANGELOG.md").touch()
     (tmp_path / "_data" / "processed" / dataset_id).mkdir(parents=True, exist_ok=True)
-    (tmp_path / "_data" / "processed" / dataset_id / "data.parquet").touch()
+    pd.DataFrame({"id": [1, 2]}).to_parquet(tmp_path / "_data" / "processed" / dataset_id / "data.parquet")
     (dataset_dir / ".kaggle").mkdir(parents=True, exist_ok=True)
     (dataset_dir / ".kaggle" / "README.md").touch()
 
@@ -321,6 +430,91 @@ def test_doctor_dataset_all_files_exist(mock_external_dependencies, tmp_path):
     mock_external_dependencies["printer"].error.assert_not_called()
 
 
+def _write_complete_dataset(tmp_path, dataset_id, config):
+    """Create every file doctor requires, plus a dataset config."""
+    dataset_dir = tmp_path / "dataset" / dataset_id
+    for rel in ["README.md", "dataset-card.md", "CITATION.cff", "LICENSE", "CHANGELOG.md", ".kaggle/README.md"]:
+        (dataset_dir / rel).parent.mkdir(parents=True, exist_ok=True)
+        (dataset_dir / rel).touch()
+    (tmp_path / "_datasets" / f"{dataset_id}.yml").write_text(config)
+    processed_dir = tmp_path / "_data" / "processed" / dataset_id
+    processed_dir.mkdir(parents=True, exist_ok=True)
+    return processed_dir / "data.parquet"
+
+
+DOCTOR_CONFIG = """id: {id}
+name: Demo
+description: Demo dataset
+status: development
+stats:
+  - value: 3
+    label: Articles
+dataset_details:
+  schema:
+    - name: title
+      type: object
+    - name: claps
+      type: int64
+"""
+
+
+def test_doctor_dataset_checks_parquet_footer_against_config(mock_external_dependencies, tmp_path):
+    data_parquet = _write_complete_dataset(tmp_path, "demo", DOCTOR_CONFIG.format(id="demo"))
+    pd.DataFrame({"title": ["a", "b", "c"], "claps": [1, 2, 3]}).to_parquet(data_parquet)
+
+    doctor_dataset(create_mock_args(id="demo", hf=False, kg=False, fix=False, verify=False))
+    mock_external_dependencies["printer"].success.assert_called_once()
+
+
+def test_doctor_dataset_reports_schema_and_stats_drift(mock_external_dependencies, tmp_path):
+    data_parquet = _write_complete_dataset(tmp_path, "demo", DOCTOR_CONFIG.format(id="demo"))
+    pd.DataFrame({"title": ["a", "b"], "claps": [1.5, 2.0], "tags": ["x", "y"]}).to_parquet(data_parquet)
+
+    with pytest.raises(SystemExit) as excinfo:
+        doctor_dataset(create_mock_args(id="demo", hf=False, kg=False, fix=False, verify=False))
+
+    assert excinfo.value.code == 1
+    rows = mock_external_dependencies["printer"].table.call_args.args[1]
+    problems = [row[1] for row in rows]
+    assert problems == ["schema: columns in the data but not in the config: tags",
+                        "schema: column 'claps' is float64 but the config says int64",
+                        "stats: stats claim 3 Articles but the data has 2 rows"]
+
+
+def test_doctor_dataset_detects_truncated_parquet(mock_external_dependencies, tmp_path):
+    data_parquet = _write_complete_dataset(tmp_path, "demo", DOCTOR_CONFIG.format(id="demo"))
+    pd.DataFrame({"title": ["a", "b", "c"], "claps": [1, 2, 3]}).to_parquet(data_parquet)
+    data_parquet.write_bytes(data_parquet.read_bytes()[:-100])
+
+    with pytest.raises(SystemExit):
+        doctor_dataset(create_mock_args(id="demo", hf=False, kg=False, fix=False, verify=False))
+    rows = mock_external_dependencies["printer"].table.call_args.args[1]
+    assert "unreadable Parquet footer" in rows[0][1]
+
+
+def test_doctor_dataset_verifies_publish_manifest(mock_external_dependencies, tmp_path):
+    from scripts.utils.manifest import build_manifest, write_manifest
+
+    data_parquet = _write_complete_dataset(tmp_path, "demo", DOCTOR_CONFIG.format(id="demo"))
+    pd.DataFrame({"title": ["a", "b", "c"], "claps": [1, 2, 3]}).to_parquet(data_parquet)
+    staged = tmp_path / ".meddata" / "publish" / "demo" / "kaggle"
+    staged.mkdir(parents=True)
+    shutil.copy(data_parquet, staged / "data.parquet")
+    write_manifest(staged.parent / "kaggle-manifest.json", build_manifest(staged, [staged / "data.parquet"]))
+    args = create_mock_args(id="demo", hf=False, kg=False, fix=False, verify=True)
+
+    doctor_dataset(args)
+    mock_external_dependencies["printer"].success.assert_called_once()
+
+    with open(staged / "data.parquet", "r+b") as file:
+        file.seek(10)
+        file.write(b"\x00\x01")
+    with pytest.raises(SystemExit):
+        doctor_dataset(args)
+    rows = mock_external_dependencies["printer"].table.call_args.args[1]
+    assert rows[0][1] == "kaggle-manifest.json: data.parquet: checksum mismatch"
+
+
 def test_doctor_dataset_missing_hf_files_no_fix(mock_external_dependencies, tmp_path, mocker):
     dataset_id = "missing_hf"
     dataset_dir = tmp_path / "dataset" / dataset_id
@@ -400,6 +594,48 @@ def test_doctor_dataset_missing_kg_files_with_fix(mock_external_dependencies, tm
     assert (dataset_dir / "CHANGELOG.md").exists()
 
 
+def test_required_files_are_deduplicated(tmp_path):
+    files = meddata._required_files("demo", tmp_path / "dataset" / "demo", True, True)
+    names = [path.relative_to(tmp_path).as_posix() for path in files]
+    assert len(names) == len(set(names)) == 7
+    assert names[-1] == "_data/processed/demo/data.parquet"
+
+
+def test_doctor_all_checks_every_dataset_in_one_table(mock_external_dependencies, tmp_path, mocker):
+    mocker.patch("meddata.validate_environment", return_value=True)
+    data_parquet = _write_complete_dataset(tmp_path, "ready", DOCTOR_CONFIG.format(id="ready"))
+    pd.DataFrame({"title": ["a", "b", "c"], "claps": [1, 2, 3]}).to_parquet(data_parquet)
+    (tmp_path / "_datasets" / "incomplete.yml").write_text(DOCTOR_CONFIG.format(id="incomplete"))
+    (tmp_path / "dataset" / "incomplete").mkdir(parents=True)
+    (tmp_path / "_datasets" / "lost.yml").write_text(DOCTOR_CONFIG.format(id="lost"))
+    stat = mocker.spy(meddata, "_stat_concurrently")
+
+    with patch.object(sys, "argv", ["meddata.py", "doctor", "--all", "--kg"]):
+        assert main() == 1
+
+    printer = mock_external_dependencies["printer"]
+    printer.table.assert_called_once()
+    rows = {row[0]: row for row in printer.table.call_args.args[1]}
+    assert rows["ready"][1] == "ok"
+    assert rows["incomplete"][1] == "FAILED"
+    assert rows["incomplete"][2].splitlines() == ["dataset/incomplete/.kaggle/README.md",
+                                                  "dataset/incomplete/dataset-card.md",
+                                                  "dataset/incomplete/LICENSE",
+                                                  "dataset/incomplete/CHANGELOG.md"]
+    assert rows["lost"][2] == "dataset directory"
+    assert stat.call_count == 2
+    printer.error.assert_called_once_with("2 of 3 datasets are not ready: incomplete, lost")
+
+
+def test_doctor_all_success(mock_external_dependencies, tmp_path, mocker):
+    data_parquet = _write_complete_dataset(tmp_path, "ready", DOCTOR_CONFIG.format(id="ready"))
+    pd.DataFrame({"title": ["a", "b", "c"], "claps": [1, 2, 3]}).to_parquet(data_parquet)
+    args = create_mock_args(id=None, all=True, hf=False, kg=False, fix=False, verify=False, jobs=None)
+
+    assert meddata.doctor_all(args, ["ready"]) == 0
+    mock_external_dependencies["printer"].success.assert_called_once()
+
+
 def test_doctor_dataset_not_found(mock_external_dependencies, tmp_path, mocker):
     # Remove the dataset directory to simulate it being missing
     shutil.rmtree(tmp_path / "dataset", ignore_errors=True)
@@ -521,6 +757,7 @@ def test_create_parser():
     assert "site" in subparsers_actions[0].choices
     assert "doctor" in subparsers_actions[0].choices
     assert "setup" in subparsers_actions[0].choices
+    assert "build" in subparsers_actions[0].choices
 
 
 # --- Test main ---
@@ -543,10 +780,65 @@ def test_main_init_command_success(mock_external_dependencies, mocker):
         exit_code = main()
         assert exit_code == 0
         mock_external_dependencies["printer"].logo.assert_called_once()
-        mock_external_dependencies["subprocess_handler"].run_python_script.assert_called_once()
+        mock_external_dependencies["script_dispatcher"].call.assert_called_once()
+        mock_external_dependencies["subprocess_handler"].run_python_script.assert_not_called()
         mock_external_dependencies["printer"].success.assert_called_once()
 
 
+def test_main_isolate_runs_subprocess(mock_external_dependencies, mocker):
+    mocker.patch("meddata.validate_environment", return_value=True)
+    with patch.object(
+        sys, "argv", ["meddata.py", "--isolate", "init", "test_id", "Test Name", "Test Description"]
+    ):
+        exit_code = main()
+        assert exit_code == 0
+        mock_external_dependencies["subprocess_handler"].run_python_script.assert_called_once()
+        mock_external_dependencies["script_dispatcher"].call.assert_not_called()
+
+
+def test_main_log_format_json(mock_external_dependencies, mocker, monkeypatch):
+    mocker.patch("meddata.validate_environment", return_value=True)
+    # setenv registers an undo, so the value main() exports does not leak into later tests
+    monkeypatch.setenv("MEDDATA_LOG_FORMAT", "text")
+    with patch.object(
+        sys, "argv", ["meddata.py", "--log-format", "json", "init", "test_id", "Test Name", "Test Description"]
+    ):
+        assert main() == 0
+    assert mock_external_dependencies["printer"].log_format == "json"
+    assert os.environ["MEDDATA_LOG_FORMAT"] == "json"
+
+
+def test_main_profile_wraps_command(mock_external_dependencies, mocker):
+    mocker.patch("meddata.validate_environment", return_value=True)
+    mock_profiled = mocker.patch("scripts.utils.profiling.profiled")
+    with patch.object(
+        sys, "argv", ["meddata.py", "--profile", "memory", "init", "test_id", "Test Name", "Test Description"]
+    ):
+        assert main() == 0
+    mock_profiled.assert_called_once_with("memory", "init")
+    mock_external_dependencies["script_dispatcher"].call.assert_called_once()
+
+
+def test_main_profile_wraps_batch_commands(mock_external_dependencies, mock_config_manager_paths, mocker):
+    mocker.patch("meddata.validate_environment", return_value=True)
+    mock_profiled = mocker.patch("scripts.utils.profiling.profiled")
+    (mock_config_manager_paths.paths.datasets_dir / "medium.yml").touch()
+    with patch.object(sys, "argv", ["meddata.py", "--profile", "cpu", "docs", "--all"]):
+        assert main() == 0
+    mock_profiled.assert_called_once_with("cpu", "docs-all")
+    mock_external_dependencies["script_dispatcher"].call.assert_called_once()
+
+
+def test_main_profile_isolate_profiles_only_the_child(mock_external_dependencies, mocker):
+    mocker.patch("meddata.validate_environment", return_value=True)
+    mock_profiled = mocker.patch("scripts.utils.profiling.profiled")
+    with patch.object(sys, "argv", ["meddata.py", "--isolate", "--profile", "cpu", "process", "test_id"]):
+        assert main() == 0
+    mock_profiled.assert_not_called()
+    script_args = mock_external_dependencies["subprocess_handler"].run_python_script.call_args[0][1]
+    assert script_args[0] == "cpu"
+
+
 def test_main_command_with_environment_validation_failure(mock_external_dependencies, mocker):
     # Simulate a command that requires environment validation, but it fails
     mocker.patch("meddata.validate_environment", return_value=False)
@@ -557,6 +849,7 @@ def test_main_command_with_environment_validation_failure(mock_external_dependen
         assert exit_code == 1
         mock_external_dependencies["printer"].logo.assert_called_once()
         mock_external_dependencies["subprocess_handler"].run_python_script.assert_not_called()
+        mock_external_dependencies["script_dispatcher"].call.assert_not_called()
 
 
 def test_main_setup_command_skips_environment_validation(mock_external_dependencies, mocker, tmp_path):
@@ -576,3 +869,230 @@ def test_main_setup_command_skips_environment_validation(mock_external_dependenc
         # validate_environment should not have been called for 'setup' command
         meddata.validate_environment.assert_not_called()
         mock_external_dependencies["printer"].success.assert_called_once() # setup_env success
+
+
+# --- Test build ---
+def test_build_pipeline_stages(mock_config_manager_paths, tmp_path):
+    mock_config_manager_paths.paths.cache_dir = tmp_path / ".meddata"
+    args = argparse.Namespace(id="demo", isolate=False, publish=True, token=None, platforms=None)
+    pipeline = meddata.create_build_pipeline(args)
+    assert list(pipeline.stages) == ["process", "docs", "assets", "doctor", "publish"]
+    assert pipeline.stages["doctor"].deps == ["process", "docs"]
+    assert pipeline.stages["docs"].deps == ["process"]
+    processed = mock_config_manager_paths.paths.processed_data_dir / "demo"
+    assert {processed / name for name in ("stats.json", "profile.json", "data.parquet")} <= set(
+        pipeline.stages["docs"].inputs)
+
+
+def test_build_dataset_fails_when_stage_fails(mock_external_dependencies, mock_config_manager_paths, tmp_path, mocker):
+    mock_config_manager_paths.paths.cache_dir = tmp_path / ".meddata"
+    (mock_config_manager_paths.paths.datasets_dir / "demo.yml").touch()
+    mocker.patch("meddata.process_dataset", side_effect=SystemExit(1))
+    docs = mocker.patch("meddata.generate_docs")
+    assets = mocker.patch("meddata.generate_assets")
+    doctor = mocker.patch("meddata.doctor_dataset")
+
+    args = argparse.Namespace(id="demo", isolate=False, publish=False, jobs=None, force=False)
+    with pytest.raises(SystemExit) as excinfo:
+        meddata.build_dataset(args)
+    assert excinfo.value.code == 1
+    assets.assert_called_once()
+    docs.assert_not_called()
+    doctor.assert_not_called()
+
+
+# --- Test batch mode ---
+def _batch_command(args):
+    # Module-level so it can be pickled into the worker processes
+    if args.id == "broken":
+        sys.exit(1)
+    # Written to the file descriptor, which the worker redirects to the dataset's log
+    os.write(1, f"profile_workers={args.profile_workers}\n".encode())
+
+
+def test_resolve_dataset_ids(mock_config_manager_paths):
+    for dataset_id in ["medium", "devto", "medline"]:
+        (mock_config_manager_paths.paths.datasets_dir / f"{dataset_id}.yml").touch()
+
+    assert meddata._resolve_dataset_ids(argparse.Namespace(id="medium", all=False)) is None
+    assert meddata._resolve_dataset_ids(argparse.Namespace(id="med*", all=False)) == ["medium", "medline"]
+    assert meddata._resolve_dataset_ids(argparse.Namespace(id=None, all=True)) == ["devto", "medium", "medline"]
+
+
+def test_run_batch_reports_failures(mock_external_dependencies, mock_config_manager_paths, tmp_path):
+    for dataset_id in ["good", "broken"]:
+        (mock_config_manager_paths.paths.datasets_dir / f"{dataset_id}.yml").touch()
+    mock_config_manager_paths.paths.cache_dir = tmp_path / ".meddata"
+
+    args = argparse.Namespace(command="process", func=_batch_command, id=None, all=True, jobs=2)
+    assert meddata.run_batch(args) == 1
+
+    rows = mock_external_dependencies["printer"].table.call_args[0][1]
+    assert [row[0] for row in rows] == ["broken", "good"]
+    assert rows[0][1].startswith("FAILED") and rows[1][1] == "ok"
+    # Each of the 2 workers profiles on its share of the CPUs
+    log = (tmp_path / ".meddata" / "logs" / "process" / "good.log").read_text()
+    assert f"profile_workers={max(1, (os.cpu_count() or 1) // 2)}" in log
+
+
+def test_docs_all_renders_every_dataset_in_one_script_run(mock_external_dependencies, mock_config_manager_paths,
+                                                          tmp_path, mocker):
+    mocker.patch("meddata.validate_environment", return_value=True)
+    for dataset_id in ["medium", "devto"]:
+        (mock_config_manager_paths.paths.datasets_dir / f"{dataset_id}.yml").touch()
+
+    with patch.object(sys, "argv", ["meddata.py", "docs", "--all", "--jobs", "4"]):
+        assert main() == 0
+    mock_external_dependencies["script_dispatcher"].call.assert_called_once_with(
+        str(tmp_path / "scripts" / "generate-docs.py"), "generate_all_docs", ["devto", "medium"], 4)
+
+
+def test_main_requires_id_or_all(mock_external_dependencies, mocker):
+    mocker.patch("meddata.validate_environment", return_value=True)
+    with patch.object(sys, "argv", ["meddata.py", "docs"]):
+        with pytest.raises(SystemExit) as excinfo:
+            main()
+    assert excinfo.value.code == 2
+
+
+# --- Test validate ---
+def test_validate_configs_reports_all_problems(mock_external_dependencies, mocker):
+    catalog = mocker.patch("scripts.utils.catalog.dataset_catalog")
+    catalog.ids.return_value = ["devto", "medium"]
+    catalog.validate.return_value = {"devto": ["name: missing required field"],
+                                     "medium": ["status: expected one of published, development, got 'x'"]}
+
+    with pytest.raises(SystemExit) as excinfo:
+        meddata.validate_configs(create_mock_args())
+
+    assert excinfo.value.code == 1
+    mock_external_dependencies["printer"].config_errors.assert_called_once_with(catalog.validate.return_value)
+
+
+def test_validate_configs_success(mock_external_dependencies, mocker):
+    catalog = mocker.patch("scripts.utils.catalog.dataset_catalog")
+    catalog.ids.return_value = ["medium"]
+    catalog.validate.return_value = {}
+
+    meddata.validate_configs(create_mock_args())
+
+    mock_external_dependencies["printer"].success.assert_called_once()
+
+
+# --- Test bench ---
+def test_bench_compare_in_process(mock_external_dependencies, mocker):
+    mocker.patch("meddata.validate_environment", return_value=True)
+    with patch.object(sys, "argv", ["meddata.py", "bench", "--compare", "v1.0", "--max-slowdown", "0.1"]):
+        assert main() == 0
+    mock_external_dependencies["script_dispatcher"].call.assert_called_once_with(
+        str(meddata.config_manager.paths.project_root / "scripts" / "benchmark-pipeline.py"),
+        "run_suite", "v1.0", 0.1, 0.25, 3)
+
+
+def test_bench_compare_subprocess_failure(mock_external_dependencies):
+    mock_external_dependencies["subprocess_handler"].run_python_script.side_effect = \
+        subprocess.CalledProcessError(1, "cmd")
+    args = create_mock_args(compare="", max_slowdown=0.25, max_memory_growth=0.5, repeat=1)
+
+    with pytest.raises(SystemExit) as exc_info:
+        meddata.run_benchmark_suite(args)
+
+    assert exc_info.value.code == 1
+    mock_external_dependencies["subprocess_handler"].run_python_script.assert_called_once_with(
+        str(meddata.config_manager.paths.project_root / "scripts" / "benchmark-pipeline.py"),
+        ["--suite", "--tolerance", "0.25", "--memory-tolerance", "0.5", "--repeat", "1", "--compare"],
+        check=True)
+
+
+# --- Test watch ---
+def test_plan_watch_rebuild(mock_config_manager_paths, tmp_path):
+    mock_config_manager_paths.paths.templates_dir = tmp_path / "templates"
+    (tmp_path / "_datasets" / "medium.yml").write_text("id: medium\n")
+    (tmp_path / "_datasets" / "devto.yml").write_text("id: devto\n")
+
+    plan = meddata.plan_watch_rebuild([tmp_path / "_datasets" / "medium.yml"])
+    assert plan == {"docs": {"medium"}, "logos": {"medium"}, "previews": {"medium"}, "brand": set()}
+
+    plan = meddata.plan_watch_rebuild([tmp_path / "templates" / "dataset-readme.md.template",
+                                       tmp_path / "templates" / "dataset.yml.template"])
+    assert plan["docs"] == {"medium", "devto"} and not plan["logos"]
+
+    plan = meddata.plan_watch_rebuild([tmp_path / "assets" / "templates" / "dataset-logo.svg",
+                                       tmp_path / "_datasets" / ".medium.yml.swp"])
+    assert plan["logos"] == {"medium", "devto"} and not plan["docs"]
+
+
+def test_rebuild_watched_artifacts_continues_after_failure(mock_external_dependencies, tmp_path):
+    dispatcher = mock_external_dependencies["script_dispatcher"]
+    dispatcher.call.side_effect = [subprocess.CalledProcessError(1, "docs"), None, None]
+
+    failures = meddata._rebuild_watched_artifacts(
+        {"docs": {"medium"}, "logos": set(), "previews": {"medium"}, "brand": set()})
+
+    assert failures == 1
+    dispatcher.call.assert_called_with(
+        tmp_path / "scripts" / "other" / "preview.py", "generate_preview", ["medium"])
+
+
+def test_rebuild_watched_artifacts_updates_asset_fingerprints(mock_external_dependencies, tmp_path):
+    dispatcher = mock_external_dependencies["script_dispatcher"]
+    assets_script = tmp_path / "scripts" / "generate-assets.py"
+
+    meddata._rebuild_watched_artifacts({"docs": set(), "logos": {"medium", "devto"}, "previews": set(),
+                                        "brand": set()})
+    dispatcher.call.assert_called_once_with(assets_script, "main", ["devto", "medium"])
+
+    dispatcher.reset_mock()
+    meddata._rebuild_watched_artifacts({"docs": set(), "logos": {"medium"}, "previews": set(),
+                                        "brand": {"favicon.svg", "logo.svg"}})
+    assert dispatcher.call.call_args_list[0] == call(assets_script, "main")
+
+
+# --- Test startup cost ---
+HEAVY_MODULES = ["rich", "pandas", "yaml", "datasets", "huggingface_hub", "kaggle", "asyncio"]
+
+# Budget for `import meddata` in a fresh interpreter; override on slow CI machines
+IMPORT_BUDGET_SECONDS = float(os.environ.get("MEDDATA_IMPORT_BUDGET", "0.5"))
+
+
+def _run_fresh_interpreter(code):
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).parent, capture_output=True, text=True, check=True,
+    )
+    return result.stdout.strip().splitlines()
+
+
+def test_import_does_not_load_heavy_modules():
+    lines = _run_fresh_interpreter(
+        "import sys, meddata\n"
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])\n"
+        "print(meddata.config_manager._instance is None)\n"
+    )
+    assert lines == ["[]", "True"]
+
+
+def test_help_does_not_load_heavy_modules():
+    lines = _run_fresh_interpreter(
+        "import sys, io, contextlib, meddata\n"
+        "sys.argv = ['meddata', '--help']\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        "    try:\n"
+        "        meddata.main()\n"
+        "    except SystemExit:\n"
+        "        pass\n"
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])\n"
+    )
+    assert lines == ["[]"]
+
+
+def test_import_time_budget():
+    # Best of a few runs to smooth out scheduler noise
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "import meddata\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    best = min(float(_run_fresh_interpreter(code)[-1]) for _ in range(3))
+    assert best < IMPORT_BUDGET_SECONDS, f"import meddata took {best:.3f}s (budget {IMPORT_BUDGET_SECONDS}s)"